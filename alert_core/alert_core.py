@@ -6,13 +6,20 @@ from alert_core.alert_enrichment_service import AlertEnrichmentService
 from alert_core.alert_evaluation_service import AlertEvaluationService
 from alert_core.threshold_service import ThresholdService
 from alert_core.alert_store import AlertStore
-from alert_core.alert_notifier import AlertNotifier
+from alert_core.alert_notifier import AlertNotifier, AsyncAlertNotifier
 from data.alert import NotificationType
+from data.async_data_locker import AsyncDataLocker
 from core.core_imports import log
+import asyncio
 
 class AlertCore:
+    # Upper bound on concurrent enrichments / outbound notifications
+    ENRICH_CONCURRENCY = 32
+    NOTIFY_CONCURRENCY = 4
+
     def __init__(self, data_locker, config_loader=None):
         self.data_locker = data_locker
+        self.async_locker = AsyncDataLocker(data_locker)
         def strict_config_loader():
             config = self.data_locker.system.get_var("alert_thresholds")
             if config is None:
@@ -21,11 +28,19 @@ class AlertCore:
 
         self.config_loader = config_loader or strict_config_loader
         self.repo = AlertStore(data_locker, self.config_loader)
-        self.enricher = AlertEnrichmentService(data_locker)
+        self.enricher = AlertEnrichmentService(
+            data_locker,
+            async_locker=self.async_locker,
+            max_concurrency=self.ENRICH_CONCURRENCY,
+        )
         threshold_service = ThresholdService(data_locker.db)
         self.evaluator = AlertEvaluationService(threshold_service)
         self.alert_store = AlertStore(data_locker, self.config_loader)
         self.evaluator.inject_repo(self.repo)  # ⚡️ enable DB updates
+        self.last_write_stats = {"evaluated": 0, "written": 0}
+        self.notifier_factory = lambda: AsyncAlertNotifier(
+            self.data_locker, max_concurrency=self.NOTIFY_CONCURRENCY
+        )
 
     async def create_alert(self, alert_dict: dict) -> bool:
         try:
@@ -41,13 +56,21 @@ class AlertCore:
         log.banner("🚨 Alert Evaluation Triggered")
         return await self.process_alerts()
 
-    async def evaluate_alert(self, alert):
+    async def evaluate_alert(self, alert, flush: bool = True):
+        """Enrich, evaluate and notify for a single alert.
+
+        When ``flush`` is False the DB write-back is left queued on the
+        evaluator so the caller can flush a whole cycle in one batch.
+        """
         try:
+            if flush:
+                self.evaluator.snapshot_alerts([alert])
             enriched = await self.enricher.enrich(alert)
             evaluated = self.evaluator.evaluate(enriched)
 
-            self.evaluator.update_alert_level(evaluated.id, evaluated.level)
-            self.evaluator.update_alert_evaluated_value(evaluated.id, evaluated.evaluated_value)
+            self.evaluator.queue_alert_update(evaluated)
+            if flush:
+                self.last_write_stats = self.evaluator.flush_alert_updates([evaluated.id])
 
             log.success(
                 "🧠 Alert processed",
@@ -71,22 +94,60 @@ class AlertCore:
             return alert
 
     async def evaluate_all_alerts(self):
+        """Enrich, evaluate and notify every active alert.
+
+        DB work (loading, batched prefetch, threshold lookups and the final
+        write-back) runs on the dedicated DB executor while SMS notifications
+        are sent concurrently on the event loop, bounded by
+        ``NOTIFY_CONCURRENCY``.
+        """
         log.banner("🚨 EVALUATING ALL ALERTS")
 
-        alerts = self.repo.get_active_alerts()
+        alerts = await self.async_locker.run(self.repo.get_active_alerts)
         if not alerts:
             log.warning("⚠️ No active alerts found", source="AlertCore")
             return []
 
         log.info(f"📥 Loaded {len(alerts)} active alerts", source="AlertCore")
 
-        from asyncio import gather
+        self.evaluator.snapshot_alerts(alerts)
         enriched = await self.enricher.enrich_all(alerts)
-        results = await gather(*(self.evaluate_alert(alert) for alert in enriched))
+        results = await self.async_locker.run(self._evaluate_batch, enriched)
+
+        to_notify = [a for a in results if a.notification_type == NotificationType.SMS]
+        async with self.notifier_factory() as notifier:
+            stats, *_ = await asyncio.gather(
+                self.async_locker.run(self.evaluator.flush_alert_updates),
+                *(self._notify(notifier, a) for a in to_notify),
+            )
+        self.last_write_stats = stats
+
+        log.success(
+            f"✅ Finished processing {len(results)} alerts",
+            source="AlertCore",
+            payload=self.last_write_stats,
+        )
+        return results
 
-        log.success(f"✅ Finished processing {len(results)} alerts", source="AlertCore")
+    def _evaluate_batch(self, alerts: list) -> list:
+        results = []
+        for alert in alerts:
+            try:
+                evaluated = self.evaluator.evaluate(alert)
+                self.evaluator.queue_alert_update(evaluated)
+                results.append(evaluated)
+            except Exception as e:
+                log.error("❌ Failed to evaluate alert", source="AlertCore", payload={"id": alert.id, "error": str(e)})
+                results.append(alert)
         return results
 
+    async def _notify(self, notifier, alert):
+        try:
+            return await notifier.notify(alert)
+        except Exception as notify_err:
+            log.error(f"Failed to send SMS notification: {notify_err}", source="AlertCore")
+            return False
+
     def clear_stale_alerts(self):
         log.banner("🧹 CLEARING STALE ALERTS")
 
@@ -116,14 +177,14 @@ class AlertCore:
 
         log.info(f"🧠 Enriching + Evaluating {len(alerts)} alerts", source="AlertCore")
 
+        self.evaluator.snapshot_alerts(alerts)
         enriched = await self.enricher.enrich_all(alerts)
         results = []
 
         for alert in enriched:
             try:
                 evaluated = self.evaluator.evaluate(alert)
-                self.evaluator.update_alert_level(evaluated.id, evaluated.level)
-                self.evaluator.update_alert_evaluated_value(evaluated.id, evaluated.evaluated_value)
+                self.evaluator.queue_alert_update(evaluated)
 
                 results.append(evaluated)
 
@@ -140,7 +201,13 @@ class AlertCore:
                     payload={"error": str(e)}
                 )
 
-        log.success(f"✅ Completed enrich+evaluate for {len(results)} alerts", source="AlertCore")
+        self.last_write_stats = self.evaluator.flush_alert_updates()
+
+        log.success(
+            f"✅ Completed enrich+evaluate for {len(results)} alerts",
+            source="AlertCore",
+            payload=self.last_write_stats,
+        )
         return results
 
     async def process_alerts(self):
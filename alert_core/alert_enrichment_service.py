@@ -7,21 +7,56 @@ from utils.fuzzy_wuzzy import fuzzy_match_enum
 from data.alert import AlertType
 from utils.json_manager import JsonManager  # ensure this is at the top
 import asyncio
+import copy
 import re
-from utils.travel_percent_logger import log_travel_percent_comparison
+from utils.travel_percent_logger import get_drift_recorder
 from calc_core.calculation_core import CalculationCore
 from alert_core.alert_utils import normalize_alert_fields
+from data.async_data_locker import AlertContextSnapshot
 from data.alert import AlertType
 from core.logging import log
 
 
 
 class AlertEnrichmentService:
-    def __init__(self, data_locker, system_core=None):
+    def __init__(self, data_locker, system_core=None, async_locker=None, max_concurrency: int = 32):
         self.data_locker = data_locker
         self.core = CalculationCore(data_locker)
         self.calc_services = self.core.calc_services
         self.system_core = system_core
+        # Optional AsyncDataLocker used to prefetch batch context off-loop
+        self.async_locker = async_locker
+        self.max_concurrency = max_concurrency
+
+    async def _batch_view(self, alerts):
+        """Return a shallow copy of this service bound to prefetched rows."""
+        if self.async_locker is None:
+            return self
+        try:
+            snapshot = await self.async_locker.prefetch_alert_context(alerts)
+        except Exception as e:
+            log.warning(f"⚠️ Alert context prefetch failed, using direct lookups: {e}", source="AlertEnrichment")
+            return self
+        view = copy.copy(self)
+        view.data_locker = snapshot
+        return view
+
+    async def _call(self, fn, *args):
+        """Run a blocking DataLocker read on the DB executor when one is configured."""
+        if self.async_locker is None:
+            return fn(*args)
+        return await self.async_locker.run(fn, *args)
+
+    async def _read(self, method: str, key):
+        """``data_locker.<method>(key)`` without blocking the event loop.
+
+        Rows prefetched into the batch snapshot are served inline; anything
+        else goes through :meth:`_call`.
+        """
+        source = self.data_locker
+        if isinstance(source, AlertContextSnapshot) and source.holds(method, key):
+            return getattr(source, method)(key)
+        return await self._call(getattr(source, method), key)
 
     async def enrich(self, alert):
         """
@@ -65,11 +100,41 @@ class AlertEnrichmentService:
             log.error(f"❌ Exception during enrichment of alert {alert.id}: {e}", source="AlertEnrichment")
             return alert
 
+    # Portfolio alert type -> key of ``DLPortfolioAggregateManager.get_totals``
+    PORTFOLIO_METRICS = {
+        "TotalValue": "total_value",
+        "TotalSize": "total_size",
+        "AvgLeverage": "avg_leverage",
+        "AvgTravelPercent": "avg_travel_percent",
+        "ValueToCollateralRatio": "value_to_collateral_ratio",
+        # Thresholds for TotalHeat are on the heat index scale (30/60/90)
+        "TotalHeat": "avg_heat_index",
+    }
+
     async def _enrich_portfolio(self, alert):
         try:
-            # Simplified enrichment for test environment
-            alert.evaluated_value = 0.0
-            log.debug("Portfolio enrichment stub", source="AlertEnrichment")
+            alert_type = str(getattr(alert.alert_type, "value", alert.alert_type)).split(".")[-1]
+            metric = self.PORTFOLIO_METRICS.get(alert_type)
+            if not metric:
+                log.warning(f"⚠️ Unsupported portfolio alert type: {alert_type}", source="AlertEnrichment")
+                return alert
+
+            # Single-row read of the running sums kept by positions triggers
+            totals = await self._call(self.data_locker.portfolio_aggregates.get_totals)
+            value = totals.get(metric)
+            if value is None:
+                log.debug(
+                    f"Portfolio metric {metric} undefined, leaving alert {alert.id} unchanged",
+                    source="AlertEnrichment",
+                )
+                return alert
+
+            alert.evaluated_value = round(float(value), 4)
+            log.debug(
+                f"Portfolio alert {alert.id} enriched",
+                source="AlertEnrichment",
+                payload={"metric": metric, "value": alert.evaluated_value},
+            )
             return alert
 
         except Exception as e:
@@ -101,6 +166,8 @@ class AlertEnrichmentService:
             elif alert_type_str == "travelpercentliquid":
                 log.debug(f"🧭 Routing to _enrich_travel_percent for alert {alert.id}", source="AlertEnrichment")
                 return await self._enrich_travel_percent(alert)
+            elif alert_type_str == "liquidationrisk":
+                return await self._enrich_liquidation_risk(alert)
             else:
                 log.warning(f"⚠️ Unsupported matched alert type: {alert_type_str}", source="AlertEnrichment")
                 return alert
@@ -110,10 +177,8 @@ class AlertEnrichmentService:
             return alert
 
     async def _enrich_travel_percent(self, alert):
-        from utils.travel_percent_logger import log_travel_percent_comparison
-
         try:
-            position = self.data_locker.get_position_by_reference_id(alert.position_reference_id)
+            position = await self._read("get_position_by_reference_id", alert.position_reference_id)
             if not position:
                 log.error(f"Position not found for alert {alert.id}", source="AlertEnrichment")
                 return alert
@@ -129,7 +194,7 @@ class AlertEnrichmentService:
                             source="AlertEnrichment")
                 return alert
 
-            current_price_data = self.data_locker.get_latest_price(position.get("asset_type"))
+            current_price_data = await self._read("get_latest_price", position.get("asset_type"))
             if not current_price_data:
                 alert.notes = (alert.notes or "") + " 🔸 TravelPercent defaulted due to missing market price.\n"
                 alert.evaluated_value = 0.0
@@ -146,18 +211,15 @@ class AlertEnrichmentService:
                 liquidation_price=liquidation_price
             )
 
-            # Jupiter-provided travel_percent (simulated from position data)
-            jupiter_value = 43.5#position.get("travel_percent")
-
-            log.info(f"🛰 Logging drift | Jupiter={jupiter_value}", source="TravelLogger")
-
-            if jupiter_value is not None:
-                log_travel_percent_comparison(
-                    alert_id=alert.id,
-                    jupiter_value=jupiter_value,
-                    calculated_value=travel_percent,
-                    format="csv"
-                )
+            # Drift vs the travel_percent Jupiter last reported (stored apart
+            # from the recalculated column); buffered, written in batches
+            get_drift_recorder().record(
+                position.get("id") or alert.position_reference_id,
+                position.get("jupiter_travel_percent"),
+                travel_percent,
+                alert_id=alert.id,
+                asset=position.get("asset_type"),
+            )
 
             if travel_percent is None:
                 travel_percent = 0.0
@@ -171,7 +233,7 @@ class AlertEnrichmentService:
 
             # ✅ Inject wallet
             wallet_name = position.get("wallet_name")
-            wallet = self.data_locker.get_wallet_by_name(wallet_name) if wallet_name else None
+            wallet = await self._read("get_wallet_by_name", wallet_name) if wallet_name else None
             return alert
 
         except Exception as e:
@@ -181,16 +243,19 @@ class AlertEnrichmentService:
             return alert
 
     async def _enrich_price_threshold(self, alert):
-        current_price_data = self.data_locker.get_latest_price(alert.asset)
+        # ``asset`` is not a column in the alerts table; rows read back only
+        # carry ``asset_type``.
+        asset = alert.asset or alert.asset_type
+        current_price_data = await self._read("get_latest_price", asset)
         if not current_price_data:
-            log.error(f"Current price not found for asset {alert.asset}", source="AlertEnrichment")
+            log.error(f"Current price not found for asset {asset}", source="AlertEnrichment")
             return alert
         alert.evaluated_value = current_price_data.get("current_price")
         log.success(f"✅ Enriched PriceThreshold Alert {alert.id} evaluated_value={alert.evaluated_value}", source="AlertEnrichment")
         return alert
 
     async def _enrich_profit(self, alert):
-        position = self.data_locker.get_position_by_reference_id(alert.position_reference_id)
+        position = await self._read("get_position_by_reference_id", alert.position_reference_id)
         if not position:
             log.error(f"Position not found for alert {alert.id}", source="AlertEnrichment")
             return alert
@@ -200,12 +265,12 @@ class AlertEnrichmentService:
 
         # ✅ Inject wallet metadata
         wallet_name = position.get("wallet_name")
-        wallet = self.data_locker.get_wallet_by_name(wallet_name) if wallet_name else None
+        wallet = await self._read("get_wallet_by_name", wallet_name) if wallet_name else None
         log.success(f"✅ Enriched Profit Alert {alert.id} → {pnl}", source="AlertEnrichment")
         return alert
 
     async def _enrich_heat_index(self, alert):
-        position = self.data_locker.get_position_by_reference_id(alert.position_reference_id)
+        position = await self._read("get_position_by_reference_id", alert.position_reference_id)
         if not position:
             log.error(f"Position not found for alert {alert.id}", source="AlertEnrichment")
             return alert
@@ -222,10 +287,21 @@ class AlertEnrichmentService:
 
         # ✅ Inject wallet
         wallet_name = position.get("wallet_name")
-        wallet = self.data_locker.get_wallet_by_name(wallet_name) if wallet_name else None
+        wallet = await self._read("get_wallet_by_name", wallet_name) if wallet_name else None
         alert.evaluated_value = heat
         return alert
 
+    async def _enrich_liquidation_risk(self, alert):
+        """Probability (%) of liquidation from the latest Monte Carlo run."""
+        risk = await self._call(self.data_locker.position_risk.get, alert.position_reference_id)
+        if not risk:
+            log.debug(f"No risk estimate yet for alert {alert.id}", source="AlertEnrichment")
+            return alert
+        alert.evaluated_value = round(float(risk["liquidation_probability"]) * 100, 2)
+        log.success(f"✅ Enriched LiquidationRisk Alert {alert.id} evaluated_value={alert.evaluated_value}",
+                    source="AlertEnrichment")
+        return alert
+
     async def _enrich_system(self, alert):
         """Simple system alert enrichment."""
         alert.evaluated_value = 1.0
@@ -245,7 +321,14 @@ class AlertEnrichmentService:
         # 🧠 Normalize all alerts before enriching
         alerts = [normalize_alert_fields(alert) for alert in alerts]
 
-        enriched_alerts = await asyncio.gather(*(self.enrich(alert) for alert in alerts))
+        service = await self._batch_view(alerts)
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def _bounded(alert):
+            async with semaphore:
+                return await service.enrich(alert)
+
+        enriched_alerts = await asyncio.gather(*(_bounded(alert) for alert in alerts))
 
         log.success(f"✅ Enriched {len(enriched_alerts)} alerts", source="AlertEnrichment")
         return enriched_alerts
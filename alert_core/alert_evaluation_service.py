@@ -1,5 +1,6 @@
 import sys
 import os
+import threading
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from data.alert import AlertLevel, Condition, AlertType
@@ -13,6 +14,10 @@ class AlertEvaluationService:
     def __init__(self, threshold_service: ThresholdService):
         self.threshold_service = threshold_service
         self.repo = None  # Set via inject_repo()
+        # Shared by concurrent evaluate_alert calls and the DB executor thread
+        self._lock = threading.Lock()
+        self._baseline = {}  # alert_id -> (level, evaluated_value) as persisted
+        self._pending = {}   # alert_id -> (level, evaluated_value) awaiting flush
 
     def inject_repo(self, repo):
         self.repo = repo
@@ -112,6 +117,76 @@ class AlertEvaluationService:
             alert.level = AlertLevel.NORMAL
             return alert
 
+    @staticmethod
+    def _level_str(level):
+        if level is None:
+            return None
+        return level.value if hasattr(level, "value") else str(level).capitalize()
+
+    def snapshot_alerts(self, alerts):
+        """Remember the persisted level/evaluated_value of ``alerts``.
+
+        Must be called before enrichment mutates the alert objects so that
+        :meth:`flush_alert_updates` can skip rows that did not change.
+        """
+        with self._lock:
+            for alert in alerts or []:
+                if alert is None:
+                    continue
+                self._baseline[alert.id] = (
+                    self._level_str(getattr(alert, "level", None)),
+                    getattr(alert, "evaluated_value", None),
+                )
+
+    def queue_alert_update(self, alert):
+        """Buffer the evaluated level/value of ``alert`` for the next flush."""
+        with self._lock:
+            self._pending[alert.id] = (self._level_str(alert.level), alert.evaluated_value)
+
+    def flush_alert_updates(self, alert_ids=None) -> dict:
+        """Write queued level/evaluated_value changes in a single batch.
+
+        Only rows whose level or evaluated value differ from the snapshot are
+        written.  ``alert_ids`` limits the flush to those alerts so a
+        single-alert caller never takes (or drops) rows queued by another;
+        ``None`` flushes everything.  Returns ``{"evaluated": n, "written": m}``.
+        """
+        with self._lock:
+            if alert_ids is None:
+                pending, baseline = self._pending, self._baseline
+                self._pending, self._baseline = {}, {}
+            else:
+                ids = [i for i in alert_ids if i in self._pending]
+                pending = {i: self._pending.pop(i) for i in ids}
+                baseline = {i: self._baseline.pop(i) for i in alert_ids if i in self._baseline}
+
+        rows = [
+            (level, value, alert_id)
+            for alert_id, (level, value) in pending.items()
+            if baseline.get(alert_id) != (level, value)
+        ]
+        stats = {"evaluated": len(pending), "written": 0}
+        if not rows:
+            log.info("🧮 No alert changes to write", source="AlertEvaluation", payload=stats)
+            return stats
+
+        if not self.repo:
+            log.error("❌ Alert repository not injected", source="AlertEvaluation")
+            return stats
+        try:
+            cursor = self.repo.data_locker.db.get_cursor()
+            cursor.executemany(
+                "UPDATE alerts SET level = ?, evaluated_value = ? WHERE id = ?", rows
+            )
+            self.repo.data_locker.db.commit()
+            stats["written"] = len(rows)
+            log.success("✅ Flushed alert evaluations", source="AlertEvaluation", payload=stats)
+        except Exception as e:
+            log.error("❌ Failed to flush alert evaluations", source="AlertEvaluation", payload={
+                **stats, "error": str(e)
+            })
+        return stats
+
     def update_alert_evaluated_value(self, alert_id: str, value: float):
         if not self.repo:
             log.error("❌ Alert repository not injected", source="AlertEvaluation")
@@ -1,6 +1,9 @@
 from data.alert import NotificationType
 from notifications.twilio_sms_sender import TwilioSMSSender
 from core.logging import log
+from core.cycle_metrics import record_http_call
+import asyncio
+import contextvars
 import os
 
 
@@ -28,3 +31,99 @@ class AlertNotifier:
                 return False
             return self.sms_sender.send_sms(str(phone_number), message)
         return False
+
+
+TWILIO_MESSAGES_URL = "https://api.twilio.com/2010-04-01/Accounts/{sid}/Messages.json"
+
+try:  # pragma: no cover - optional dependency
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover - httpx not installed
+    httpx = None
+
+
+class AsyncAlertNotifier:
+    """Async counterpart of :class:`AlertNotifier`.
+
+    SMS goes straight to the Twilio REST API over a shared ``httpx``
+    ``AsyncClient`` so many notifications overlap on the event loop.  When
+    httpx is unavailable the blocking :class:`TwilioSMSSender` is run on the
+    default thread pool instead.  At most ``max_concurrency`` sends are in
+    flight at once.
+    """
+
+    def __init__(self, data_locker, sms_sender=None, max_concurrency: int = 4,
+                 timeout: float = 10.0, phone_number=None):
+        self.data_locker = data_locker
+        self.sms_sender = sms_sender or TwilioSMSSender()
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.phone_number = phone_number
+        self._client = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self.phone_number is None:
+            self.phone_number = (
+                self.data_locker.system.get_var("alert_sms_number")
+                or os.getenv("ALERT_SMS_NUMBER")
+            )
+        if httpx is not None and self._uses_default_sender():
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _uses_default_sender(self) -> bool:
+        return type(self.sms_sender) is TwilioSMSSender
+
+    @staticmethod
+    def format_message(alert) -> str:
+        return (
+            f"🚨 Alert Triggered: {alert.description}\n"
+            f"Level: {alert.level}\n"
+            f"Value: {alert.evaluated_value}"
+        )
+
+    async def notify(self, alert) -> bool:
+        if alert.notification_type != NotificationType.SMS:
+            return False
+        if not self.phone_number:
+            log.error("No alert_sms_number configured", source="AlertNotifier")
+            return False
+        semaphore = self._semaphore or asyncio.Semaphore(self.max_concurrency)
+        async with semaphore:
+            message = self.format_message(alert)
+            if self._client is not None:
+                return await self._send_via_http(str(self.phone_number), message)
+            # Copied context keeps the send counted in the active cycle step
+            loop = asyncio.get_running_loop()
+            ctx = contextvars.copy_context()
+            return await loop.run_in_executor(
+                None, ctx.run, self.sms_sender.send_sms, str(self.phone_number), message
+            )
+
+    async def notify_all(self, alerts) -> list:
+        return await asyncio.gather(*(self.notify(a) for a in alerts))
+
+    async def _send_via_http(self, to_number: str, message: str) -> bool:
+        sender = self.sms_sender
+        if not all([sender.account_sid, sender.auth_token, sender.from_phone, to_number]):
+            log.error("Missing Twilio SMS configuration", source="AlertNotifier")
+            return False
+        try:
+            record_http_call()
+            resp = await self._client.post(
+                TWILIO_MESSAGES_URL.format(sid=sender.account_sid),
+                data={"From": sender.from_phone, "To": to_number, "Body": message},
+                auth=(sender.account_sid, sender.auth_token),
+            )
+            resp.raise_for_status()
+            log.info("✅ SMS sent", source="AlertNotifier", payload={"sid": resp.json().get("sid")})
+            return True
+        except Exception as e:
+            log.error(f"❌ Failed to send SMS: {e}", source="AlertNotifier")
+            return False
@@ -278,6 +278,11 @@ class AlertStore:
                         "description": "profit",
                         "trigger_value": 50.0,
                     },
+                    {
+                        "alert_type": AlertType.LIQUIDATION_RISK.value,
+                        "description": "liquidation_risk",
+                        "trigger_value": 15.0,
+                    },
                 ]
 
                 for spec in alerts:
@@ -102,6 +102,7 @@ def normalize_alert_type(alert_type_input):
             "travelpercentliquid": AlertType.TravelPercentLiquid,
             "heatindex": AlertType.HeatIndex,
             "deathnail": AlertType.DeathNail,
+            "liquidationrisk": AlertType.LiquidationRisk,
             "totalvalue": AlertType.TotalValue,
             "totalsize": AlertType.TotalSize,
             "avgleverage": AlertType.AvgLeverage,
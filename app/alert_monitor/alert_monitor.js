@@ -69,12 +69,19 @@ function renderAlerts(alerts) {
 
 async function loadAlerts() {
   try {
-    const response = await fetch('/alerts/monitor');
-    if (!response.ok) {
-      throw new Error(`Request failed: ${response.status}`);
-    }
-    const data = await response.json();
-    renderAlerts(data.alerts || []);
+    const alerts = [];
+    let cursor = null;
+    do {
+      const url = cursor ? `/alerts/monitor?cursor=${encodeURIComponent(cursor)}` : '/alerts/monitor';
+      const response = await fetch(url);
+      if (!response.ok) {
+        throw new Error(`Request failed: ${response.status}`);
+      }
+      const data = await response.json();
+      alerts.push(...(data.alerts || []));
+      cursor = data.next_cursor;
+    } while (cursor);
+    renderAlerts(alerts);
   } catch (err) {
     console.error('Error loading alerts:', err);
     listEl.innerHTML = '<div class="text-danger">Failed to load alerts.</div>';
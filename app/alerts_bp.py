@@ -22,6 +22,9 @@ from flask import (
 from jinja2 import ChoiceLoader, FileSystemLoader
 from config.config_loader import update_config as merge_config
 from utils.alert_helpers import calculate_threshold_progress
+from app.api_cache import bad_cursor, conditional_response, page_args
+from data.dl_alerts import DLAlertManager
+from data.dl_paging import select_fields
 
 APP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'app'))
 ALERT_MONITOR_DIR = os.path.join(APP_DIR, 'alert_monitor')
@@ -198,11 +201,15 @@ def monitor_page():
 
 @alerts_bp.route('/status_page', methods=['GET'])
 def alert_status_page():
-    """Render the combined alert status panel."""
+    """Render the combined alert status panel.
+
+    Accepts the same filters and optional ``limit``/``cursor`` as ``/monitor``.
+    """
     alerts = []
     try:
         dl = current_app.data_locker
-        raw_alerts = dl.alerts.get_all_alerts() or []
+        args = page_args(DLAlertManager.FILTER_COLUMNS, default_limit=None)
+        raw_alerts, _ = dl.alerts.query_alerts(args["filters"], args["after"], args["limit"])
 
         ASSET_IMAGE_MAP = {
             "BTC": "btc_logo.png",
@@ -253,12 +260,13 @@ def alert_status_page():
 
 @alerts_bp.route('/alert_matrix', methods=['GET'])
 def alert_matrix_page():
-    """Render the Alert Matrix page."""
+    """Render the Alert Matrix page (filterable like ``/monitor``)."""
     alerts = []
     hedges = []
     try:
         dl = current_app.data_locker
-        alerts = dl.alerts.get_all_alerts()
+        args = page_args(DLAlertManager.FILTER_COLUMNS, default_limit=None)
+        alerts, _ = dl.alerts.query_alerts(args["filters"], args["after"], args["limit"])
     except Exception as e:
         logger.error(f"Failed to load alerts for matrix: {e}", exc_info=True)
     # Hedging data may not be available yet; attempt if method exists
@@ -272,15 +280,28 @@ def alert_matrix_page():
 
 
 @alerts_bp.route('/monitor', methods=['GET'])
+@conditional_response("alerts", "positions")
 def monitor_data():
     """
-    API endpoint that returns all alerts for the monitor UI.
+    API endpoint that returns a page of alerts for the monitor UI.
+
+    Query params:
+      - status, class, level, type, asset, wallet: filters (comma separated values)
+      - fields: comma separated columns to return (``id`` is always included)
+      - limit: page size (default 100, max 500)
+      - cursor: ``next_cursor`` from the previous page
     """
     try:
         data_locker = current_app.data_locker
-        alert_list = data_locker.alerts.get_all_alerts()
+        args = page_args(DLAlertManager.FILTER_COLUMNS)
+        alert_list, next_cursor = data_locker.alerts.query_alerts(args["filters"], args["after"], args["limit"])
         logger.info(f"Fetched {len(alert_list)} alerts for monitor", extra={"source": "AlertsBP"})
-        return jsonify({"alerts": alert_list})
+        return jsonify({
+            "alerts": select_fields(alert_list, args["fields"]),
+            "next_cursor": next_cursor,
+        })
+    except ValueError as e:
+        return bad_cursor(e)
     except Exception as e:
         logger.error(f"Failed to load alerts for monitor: {e}", exc_info=True)
         return jsonify({"alerts": [], "error": str(e)}), 500
@@ -0,0 +1,84 @@
+"""
+Module: api_cache.py
+Description:
+    Conditional-GET and paging helpers for the JSON data endpoints.
+
+    ``conditional_response`` derives an ETag and Last-Modified header from
+    the ``DataLocker.changes`` generations of the topics a view reads.  When
+    the client's ``If-None-Match`` (or ``If-Modified-Since``) still matches,
+    the view is never called and a bodyless ``304`` is returned; while
+    nothing was written the check does not even query the counters.
+
+    Only use it on JSON APIs whose body depends on nothing but ``topics``.
+    Full HTML pages also render theme, system vars and other context, which
+    the topic generations do not cover, so a 304 would serve them stale.
+"""
+
+import time
+from datetime import datetime, timezone
+from functools import wraps
+
+from flask import current_app, jsonify, make_response, request
+
+from data.dl_paging import DEFAULT_PAGE_SIZE, clamp_limit
+
+# Changes whenever the server restarts so new code/templates invalidate old ETags
+BOOT_ID = str(time.time_ns())
+
+
+def page_args(filter_keys, default_limit=DEFAULT_PAGE_SIZE) -> dict:
+    """Read ``cursor``/``limit``/``fields`` and the allowed filters from the query string.
+
+    ``default_limit=None`` leaves the listing unpaged unless ``limit`` is given.
+    """
+    args = request.args
+    raw_limit = args.get("limit")
+    if raw_limit in (None, "") and default_limit is None:
+        limit = None
+    else:
+        limit = clamp_limit(raw_limit, default_limit or DEFAULT_PAGE_SIZE)
+    return {
+        "filters": {k: args.get(k) for k in filter_keys if args.get(k)},
+        "after": args.get("cursor") or None,
+        "limit": limit,
+        "fields": args.get("fields"),
+    }
+
+
+def bad_cursor(error):
+    return jsonify({"error": str(error)}), 400
+
+
+def _not_modified(etag: str, last_modified: float) -> bool:
+    if request.if_none_match:
+        return etag in request.if_none_match
+    since = request.if_modified_since
+    return since is not None and int(last_modified) <= since.timestamp()
+
+
+def _stamp(response, etag: str, last_modified: float):
+    response.set_etag(etag)
+    response.last_modified = datetime.fromtimestamp(int(last_modified), tz=timezone.utc)
+    # Let browsers keep the body but revalidate on every request
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def conditional_response(*topics):
+    """Serve ``304 Not Modified`` while ``topics`` are unchanged since the client's copy."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            changes = getattr(current_app.data_locker, "changes", None)
+            etag = last_modified = None
+            if changes is not None:
+                etag, last_modified = changes.validators(topics, salt=f"{request.full_path}|{BOOT_ID}")
+            if etag and _not_modified(etag, last_modified):
+                return _stamp(make_response("", 304), etag, last_modified)
+
+            response = make_response(view(*args, **kwargs))
+            if etag and response.status_code == 200:
+                _stamp(response, etag, last_modified)
+            return response
+        return wrapper
+    return decorator
@@ -13,7 +13,7 @@ from cyclone.cyclone_engine import Cyclone
 
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from dashboard.dashboard_service import get_dashboard_context
+from dashboard.dashboard_service import get_dashboard_context, build_graph_data
 from utils.fuzzy_wuzzy import fuzzy_match_key
 from core.constants import THEME_CONFIG_PATH
 from core.logging import log
@@ -146,9 +146,7 @@ def get_alert_icon(alert_type):
 @route_log_alert
 def api_graph_data():
     """Return portfolio snapshot totals for the history line chart."""
-    context = get_dashboard_context(current_app.data_locker, current_app.system_core)
-    graph = context.get("graph_data", {})
-    return jsonify(graph)
+    return jsonify(build_graph_data(current_app.data_locker))
 
 # ---------------------------------
 # API: Size Composition Pie (Real positions)
@@ -255,8 +253,8 @@ def api_dashboard_cards():
 def cyclone_market_update():
     try:
         asyncio.run(current_app.cyclone.run_market_updates())
-        # Refresh the main DataLocker connection so new data is visible
-        current_app.data_locker.db.close()
+        # Readers key off the change generations; no reconnect needed
+        current_app.data_locker.changes.poll()
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
@@ -265,7 +263,7 @@ def cyclone_market_update():
 def cyclone_sync():
     try:
         asyncio.run(current_app.cyclone.run_composite_position_pipeline())
-        current_app.data_locker.db.close()
+        current_app.data_locker.changes.poll()
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
@@ -274,7 +272,7 @@ def cyclone_sync():
 def cyclone_full_cycle():
     try:
         asyncio.run(current_app.cyclone.run_cycle())
-        current_app.data_locker.db.close()
+        current_app.data_locker.changes.poll()
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
@@ -283,7 +281,7 @@ def cyclone_full_cycle():
 def cyclone_wipe_all():
     try:
         asyncio.run(current_app.cyclone.run_clear_all_data())
-        current_app.data_locker.db.close()
+        current_app.data_locker.changes.poll()
         return jsonify({"success": True})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)})
@@ -0,0 +1,75 @@
+"""
+Module: lazy_blueprints.py
+Description:
+    Deferred blueprint registration for ``sonic_app``.
+
+    Blueprint modules pull in most of the project (positions, pricing,
+    GPT, trader, ...), so importing them at module level makes every start
+    pay for code the process may never serve, including spawned pool
+    workers that re-import ``sonic_app`` as ``__mp_main__``.  ``LazyBlueprints``
+    wraps ``app.wsgi_app`` and imports and registers the blueprints on the
+    first request instead.  Flask still accepts ``register_blueprint`` at
+    that point because the request has not been dispatched yet.
+
+    The wrapper does not import Flask itself, so it can be tested without it.
+"""
+
+import importlib
+import threading
+import time
+from typing import Callable, Iterable, Optional, Tuple
+
+from core.logging import log
+
+# (module path, blueprint attribute, url_prefix or None)
+BlueprintSpec = Tuple[str, str, Optional[str]]
+
+
+class LazyBlueprints:
+    """WSGI wrapper that registers ``specs`` on ``app`` before the first request.
+
+    ``on_loaded(app)`` runs once right after registration, for URL rules
+    that depend on blueprint endpoints.  ``load()`` may also be called
+    directly to register eagerly (CLI tools, tests).
+    """
+
+    def __init__(self, app, specs: Iterable[BlueprintSpec], on_loaded: Callable = None):
+        self.app = app
+        self.specs = tuple(specs)
+        self.on_loaded = on_loaded
+        self.loaded = False
+        self.load_ms = None
+        self._lock = threading.Lock()
+        self._wsgi_app = app.wsgi_app
+
+    def install(self) -> "LazyBlueprints":
+        self.app.wsgi_app = self
+        return self
+
+    def load(self):
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded:
+                return
+            start = time.perf_counter()
+            for module_path, attr, url_prefix in self.specs:
+                blueprint = getattr(importlib.import_module(module_path), attr)
+                if url_prefix:
+                    self.app.register_blueprint(blueprint, url_prefix=url_prefix)
+                else:
+                    self.app.register_blueprint(blueprint)
+            if self.on_loaded:
+                self.on_loaded(self.app)
+            self.load_ms = round((time.perf_counter() - start) * 1000, 3)
+            self.loaded = True
+        log.info(
+            f"Registered {len(self.specs)} blueprints in {self.load_ms:.0f} ms",
+            source="Startup",
+            payload={"blueprints": [attr for _, attr, _ in self.specs]},
+        )
+
+    def __call__(self, environ, start_response):
+        if not self.loaded:
+            self.load()
+        return self._wsgi_app(environ, start_response)
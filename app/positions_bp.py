@@ -11,8 +11,10 @@ from flask import (
 from core.logging import log
 from positions.position_core import PositionCore
 from calc_core.calculation_core import CalculationCore
-from calc_core.calc_services import CalcServices
 from utils.route_decorators import route_log_alert
+from app.api_cache import bad_cursor, conditional_response, page_args
+from data.dl_positions import DLPositionManager
+from data.dl_paging import select_fields
 
 
 positions_bp = Blueprint("positions", __name__, template_folder="../templates/positions")
@@ -63,7 +65,7 @@ def list_positions():
             pos["liqdist_alert_class"] = get_alert_class(liqd, liqd_cfg.get("low"), liqd_cfg.get("medium"), liqd_cfg.get("high"))
             pos["heat_alert_class"] = get_alert_class(heat, hi_cfg.get("low"), hi_cfg.get("medium"), hi_cfg.get("high"))
 
-        totals = CalcServices().calculate_totals(positions)
+        totals = current_app.data_locker.portfolio_aggregates.get_totals()
         times = current_app.data_locker.get_last_update_times() or {}
         pos_time = _convert_iso_to_pst(times.get("last_update_time_positions", "N/A"))
 
@@ -85,7 +87,7 @@ def positions_table():
     try:
         core = PositionCore(current_app.data_locker)
         positions = core.get_active_positions()
-        totals = CalcServices().calculate_totals(positions)
+        totals = current_app.data_locker.portfolio_aggregates.get_totals()
         return render_template("positions_table.html", positions=positions, totals=totals)
     except Exception as e:
         log.error(f"Error in positions_table: {e}")
@@ -162,24 +164,40 @@ def update_jupiter():
 
 @positions_bp.route("/api/data", methods=["GET"])
 @route_log_alert
+@conditional_response("positions", "prices")
 def positions_data_api():
+    """
+    Page of positions plus latest prices and portfolio totals.
+
+    Query params:
+      - status (default ACTIVE, ``all`` for every status), wallet, asset, type: filters
+      - fields: comma separated columns to return (``id`` is always included)
+      - limit: page size (default 100, max 500)
+      - cursor: ``next_cursor`` from the previous page
+
+    ``totals`` always cover every active position, whatever the filters.
+    """
     try:
-        core = PositionCore(current_app.data_locker)
-        positions = core.get_active_positions()
-        mini_prices = []
-        for asset in ["BTC", "ETH", "SOL"]:
-            row = current_app.data_locker.get_latest_price(asset)
-            if row:
-                mini_prices.append({
-                    "asset_type": row["asset_type"],
-                    "current_price": float(row["current_price"])
-                })
-        totals = CalcServices().calculate_totals(positions)
+        dl = current_app.data_locker
+        args = page_args(DLPositionManager.FILTER_COLUMNS)
+        filters = {"status": "ACTIVE", **args["filters"]}
+        if filters["status"].lower() == "all":
+            filters.pop("status")
+        positions, next_cursor = dl.positions.query_positions(filters, args["after"], args["limit"])
+        latest = dl.prices.get_latest_prices(["BTC", "ETH", "SOL"])
+        mini_prices = [
+            {"asset_type": row["asset_type"], "current_price": float(row["current_price"])}
+            for row in latest.values()
+        ]
+        totals = dl.portfolio_aggregates.get_totals()
         return jsonify({
             "mini_prices": mini_prices,
-            "positions": positions,
+            "positions": select_fields(positions, args["fields"]),
+            "next_cursor": next_cursor,
             "totals": totals
         })
+    except ValueError as e:
+        return bad_cursor(e)
     except Exception as e:
         log.error(f"Error in positions_data_api: {e}")
         return jsonify({"error": str(e)}), 500
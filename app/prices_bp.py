@@ -7,23 +7,24 @@ Description:
     This module handles:
       - Rendering price charts for assets (BTC, ETH, SOL, SP500) over a specified timeframe.
       - Displaying a price list and manual price updates.
-      - Triggering asynchronous price updates via PriceMonitor.
+      - Triggering price syncs through the shared price feed.
 
     It is structured similarly to our positions and alerts blueprints for consistent
     separation of concerns.
 """
 
 import logging
-import sqlite3
-import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from flask import Blueprint, request, jsonify, render_template, redirect, url_for, flash, current_app
 
 # Import configuration constants and modules
-from data.data_locker import DataLocker
-from monitor.price_monitor import PriceMonitor
-from core.core_imports import CONFIG_PATH, DB_PATH, retry_on_locked
+from prices.price_sync_service import PriceSyncService
+from prices.price_feed import get_price_feed
+from core.core_imports import DB_PATH, retry_on_locked
+from app.api_cache import bad_cursor, conditional_response, page_args
+from data.dl_paging import select_fields, split_values
+from data.dl_prices import DLPriceManager
 
 
 # ---------------------------------------------------------------------------
@@ -34,13 +35,8 @@ def _get_top_prices_for_assets(db_path, assets):
     """
     Retrieve the latest price for each asset.
     """
-    dl = current_app.data_locker
-    top_prices = []
-    for asset in assets:
-        row = dl.prices.get_latest_price(asset)
-        if row:
-            top_prices.append(row)
-    return top_prices
+    latest = current_app.data_locker.prices.get_latest_prices(assets)
+    return [latest[asset] for asset in assets if asset in latest]
 
 
 def _get_recent_prices(db_path, limit=15):
@@ -65,47 +61,75 @@ prices_bp = Blueprint("prices", __name__, template_folder="templates")
 
 # Define the asset list to include S&P500 as well as crypto assets.
 ASSETS_LIST = ["BTC", "ETH", "SOL", "SP500"]
+DEFAULT_HISTORY_PAGE = 100
 
 
 # ---------------------------------------------------------------------------
 # Price Charts Endpoint
 # ---------------------------------------------------------------------------
+# Chart width used when the client does not report one (one point per pixel)
+DEFAULT_CHART_POINTS = 800
+MAX_CHART_POINTS = 4000
+
+
+def _load_chart_history(hours: int, points: int) -> dict:
+    """Fetch downsampled price history for ``ASSETS_LIST`` in one query."""
+    end_ms = int(datetime.now().timestamp() * 1000)
+    start_ms = end_ms - int(hours * 3600 * 1000)
+    dl = current_app.data_locker
+    history = dl.prices.get_price_history(ASSETS_LIST, start_ms, end_ms, max_points=points)
+    return {"start": start_ms, "end": end_ms, "history": history}
+
+
+def _chart_params():
+    hours = max(request.args.get("hours", default=6, type=int), 1)
+    points = request.args.get("width", default=DEFAULT_CHART_POINTS, type=int)
+    points = min(max(points, 2), MAX_CHART_POINTS)
+    return hours, points
+
+
 @prices_bp.route("/charts", methods=["GET"])
 def price_charts():
     """
     Render price charts for BTC, ETH, SOL, and SP500 over a specified timeframe.
     URL Params:
       - hours: (optional, default=6) Number of hours to look back.
+
+    Only the chart shell is rendered here; the page loads its series from
+    ``/prices/api/history`` sized to the chart width, so no history is
+    queried for the HTML response.
+    """
+    hours = max(request.args.get("hours", default=6, type=int), 1)
+    return render_template("price_charts.html", assets=ASSETS_LIST, timeframe=hours)
+
+
+@prices_bp.route("/api/history", methods=["GET"])
+def price_history_api():
+    """
+    Columnar price history for the chart page.
+    URL Params:
+      - hours: look-back window (default 6)
+      - width: chart width in pixels; points per asset are capped to it
+      - encoding: ``json`` (default) for plain arrays or ``b64`` for
+        base64 little-endian Float64 arrays (``Float64Array`` in JS)
     """
     try:
-        hours = request.args.get("hours", default=6, type=int)
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        cutoff_iso = cutoff_time.isoformat()
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-        chart_data = {asset: [] for asset in ASSETS_LIST}
-        for asset in ASSETS_LIST:
-            cur.execute(
-                """
-                SELECT current_price, last_update_time
-                FROM prices
-                WHERE asset_type = ? AND last_update_time >= ?
-                ORDER BY last_update_time ASC
-                """,
-                (asset, cutoff_iso)
-            )
-            rows = cur.fetchall()
-            for row in rows:
-                iso_str = row["last_update_time"]
-                price = float(row["current_price"])
-                dt_obj = datetime.fromisoformat(iso_str)
-                epoch_ms = int(dt_obj.timestamp() * 1000)
-                chart_data[asset].append([epoch_ms, price])
-        conn.close()
-        return render_template("price_charts.html", chart_data=chart_data, timeframe=hours)
+        hours, points = _chart_params()
+        window = _load_chart_history(hours, points)
+        history = window["history"]
+        encoding = request.args.get("encoding", "json")
+        if encoding == "b64":
+            history = current_app.data_locker.prices.encode_history(history)
+        return jsonify({
+            "start": window["start"],
+            "end": window["end"],
+            "hours": hours,
+            "points": points,
+            "encoding": encoding if encoding == "b64" else "json",
+            "assets": history,
+        })
     except Exception as e:
-        logger.error("Error in price_charts: %s", e, exc_info=True)
+        logger.error("Error in price_history_api: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
 
 
@@ -160,19 +184,20 @@ def price_list():
 
 
 # ---------------------------------------------------------------------------
-# Asynchronous Price Update Endpoint
+# Price Update Endpoint
 # ---------------------------------------------------------------------------
 @prices_bp.route("/update", methods=["POST"])
 def update_prices_route():
     """
-    Triggers an asynchronous update of price data using PriceMonitor.
+    Triggers a price sync through the shared price feed.
     Expects an optional query/form parameter 'source' to indicate the origin.
     """
     try:
         source = request.args.get("source") or request.form.get("source") or "API"
-        pm = PriceMonitor(db_path=DB_PATH, config_path=CONFIG_PATH)
-        asyncio.run(pm.update_prices())
-        dl = get_locker()
+        dl = current_app.data_locker
+        sync = PriceSyncService(dl).run_full_price_sync(source=source)
+        if not sync.get("success"):
+            return jsonify({"status": "error", "message": sync.get("error")}), 502
         now = datetime.now()
         dl.set_last_update_times({
             "last_update_time_prices": now.isoformat(),
@@ -188,33 +213,51 @@ def update_prices_route():
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+@prices_bp.route("/api/feed_stats", methods=["GET"])
+def price_feed_stats():
+    """Per-provider latency/error counters and cache stats for the price feed."""
+    return jsonify(get_price_feed().stats())
+
+
 # ---------------------------------------------------------------------------
 # (Optional) API Endpoint for Price Data
 # ---------------------------------------------------------------------------
 @prices_bp.route("/api/data", methods=["GET"])
-@prices_bp.route("/api/data", methods=["GET"])
+@conditional_response("prices")
 def prices_data_api():
     """
     Provides an API endpoint that returns:
       - Mini price data for each asset (BTC, ETH, SOL, SP500)
-      - Full price list (top prices)
+      - Latest price row per asset
+      - With ``limit`` or ``cursor``: a page of price history, newest first
+
+    Query params:
+      - asset, source: filters (comma separated values)
+      - fields: comma separated columns for ``prices``/``history`` rows
+      - limit (max 500), cursor: history paging
     """
     try:
         dl = current_app.data_locker
-        mini_prices = []
-        for asset in ASSETS_LIST:
-            row = dl.prices.get_latest_price(asset)
-            if row:
-                mini_prices.append({
-                    "asset_type": row["asset_type"],
-                    "current_price": float(row["current_price"])
-                })
-        prices_list = _get_top_prices_for_assets(DB_PATH, ASSETS_LIST)
-        return jsonify({
-            "mini_prices": mini_prices,
-            "prices": prices_list
-            # Removed "totals" since not needed
-        })
+        args = page_args(DLPriceManager.FILTER_COLUMNS, default_limit=None)
+        assets = [a.upper() for a in split_values(args["filters"].get("asset"))] or ASSETS_LIST
+        latest = dl.prices.get_latest_prices(assets)
+        prices_list = [latest[a] for a in assets if a in latest]
+        payload = {
+            "mini_prices": [
+                {"asset_type": row["asset_type"], "current_price": float(row["current_price"])}
+                for row in prices_list
+            ],
+            "prices": select_fields(prices_list, args["fields"]),
+        }
+        if args["limit"] is not None or args["after"]:
+            history, next_cursor = dl.prices.query_prices(
+                args["filters"], args["after"], args["limit"] or DEFAULT_HISTORY_PAGE
+            )
+            payload["history"] = select_fields(history, args["fields"])
+            payload["next_cursor"] = next_cursor
+        return jsonify(payload)
+    except ValueError as e:
+        return bad_cursor(e)
     except Exception as e:
         logger.error("Error in prices_data_api: %s", e, exc_info=True)
         return jsonify({"error": str(e)}), 500
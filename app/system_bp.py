@@ -49,7 +49,11 @@ def get_core():
     """Return the shared SystemCore instance."""
     core = getattr(current_app, "system_core", None)
     if core is None:
-        core = SystemCore(current_app.data_locker)
+        services = getattr(current_app, "services", None)
+        if services is not None and "system_core" in services:
+            core = services.get("system_core")
+        else:
+            core = SystemCore(current_app.data_locker)
         current_app.system_core = core
     return core
 
@@ -394,6 +398,7 @@ def seed_all_thresholds():
             ("HeatIndex", "Position", "heat_index", 30, 60, 90, "ABOVE"),
             ("TravelPercentLiquid", "Position", "travel_percent_liquid", -20, -10, 0, "BELOW"),
             ("LiquidationDistance", "Position", "liquidation_distance", 10, 5, 2, "BELOW"),
+            ("LiquidationRisk", "Position", "liquidation_probability", 5, 15, 30, "ABOVE"),
             # === Market Metrics
             ("PriceThreshold", "Market", "current_price", 20000, 30000, 40000, "ABOVE"),
         ]
@@ -869,17 +874,19 @@ def api_check(api_name: str):
     return jsonify(result)
 
 
+@system_bp.route("/api/health", methods=["GET"])
+def api_health():
+    """Cached probe results and latency history; never probes."""
+    return jsonify(get_core().health.snapshot())
+
+
 @system_bp.route("/xcom_api_status", methods=["GET"])
 def xcom_api_status():
     """Return connectivity status for key XCom APIs."""
     core = get_core()
 
-    checks = {
-        "twilio": core.check_twilio_api(),
-        "chatgpt": core.check_chatgpt(),
-        "jupiter": core.check_jupiter(),
-        "github": core.check_github(),
-    }
+    # Probes run concurrently and are served from cache while fresh
+    checks = core.check_all_apis()
 
     def _format(res):
         if isinstance(res, dict):
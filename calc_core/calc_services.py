@@ -8,18 +8,33 @@ import sqlite3
 
 
 class CalcServices:
-    def __init__(self):
+    def __init__(self, modifier_store=None):
         self.color_ranges = {
             "travel_percent": [(0, 25, "green"), (25, 50, "yellow"), (50, 75, "orange"), (75, 100, "red")],
             "heat_index": [(0, 20, "blue"), (20, 40, "green"), (40, 60, "yellow"), (60, 80, "orange"), (80, 100, "red")],
             "collateral": [(0, 500, "lightgreen"), (500, 1000, "yellow"), (1000, 2000, "orange"), (2000, 10000, "red")]
         }
-        self.weights = {
+        # Shared ModifierStore (see calc_core.modifier_store); when unset the
+        # instance uses its own default weights
+        self.modifier_store = modifier_store
+        self._weights = {
             "distanceWeight": 0.6,
             "leverageWeight": 0.3,
             "collateralWeight": 0.1
         }
 
+    @property
+    def weights(self) -> dict:
+        if self.modifier_store is not None:
+            return self.modifier_store.weights
+        return self._weights
+
+    @weights.setter
+    def weights(self, value: dict):
+        # Explicit weights detach this instance from the shared store
+        self.modifier_store = None
+        self._weights = value
+
     def calculate_composite_risk_index(self, position: dict) -> Optional[float]:
         try:
             entry_price = float(position.get("entry_price", 0.0))
@@ -202,20 +217,26 @@ class CalcServices:
     # ------------------------------------------------------------------
     # Price evaluation helpers
     # ------------------------------------------------------------------
-    def value_at_price(self, position: dict, price: float) -> float:
-        """Return the position value using ``price`` as the current price."""
+    @staticmethod
+    def pnl_at_price(position: dict, price):
+        """PnL of ``position`` at ``price``.
+
+        Only arithmetic is applied to ``price``, so a numpy array of prices
+        returns an array of PnLs (used by the Monte Carlo risk engine).
+        """
         entry = float(position.get("entry_price", 0.0))
-        collateral = float(position.get("collateral", 0.0))
         size = float(position.get("size", 0.0))
         ptype = (position.get("position_type") or "LONG").upper()
 
         tokens = size / entry if entry else 0.0
         if ptype == "LONG":
-            pnl = (price - entry) * tokens
-        else:
-            pnl = (entry - price) * tokens
+            return (price - entry) * tokens
+        return (entry - price) * tokens
 
-        return round(collateral + pnl, 2)
+    def value_at_price(self, position: dict, price: float) -> float:
+        """Return the position value using ``price`` as the current price."""
+        collateral = float(position.get("collateral", 0.0))
+        return round(collateral + self.pnl_at_price(position, price), 2)
 
     def travel_percent_at_price(self, position: dict, price: float) -> float:
         """Calculate travel percent at a given ``price``."""
@@ -5,42 +5,22 @@ import json
 from datetime import datetime
 from core.logging import log
 from calc_core.calc_services import CalcServices
+from calc_core.modifier_store import ModifierStore
+from data.dl_modifiers import bump_modifier_version
 import sqlite3
 
 
 class CalculationCore:
-    def __init__(self, data_locker):
+    def __init__(self, data_locker, modifier_store=None):
         self.data_locker = data_locker
-        self.calc_services = CalcServices()
-        self.modifiers = self._load_modifiers()
+        # Weights come from the process-wide store and are only re-read from
+        # the modifiers table when they change, so construction is cheap.
+        self.modifier_store = modifier_store or ModifierStore.for_locker(data_locker)
+        self.calc_services = CalcServices(modifier_store=self.modifier_store)
 
-    def _load_modifiers(self):
-        cursor = self.data_locker.db.get_cursor()
-        if not cursor:
-            log.error("❌ DB unavailable, using default modifiers", source="CalculationCore")
-            weights = self.calc_services.weights
-            return weights
-
-        try:
-            rows = cursor.execute(
-                "SELECT key, value FROM modifiers WHERE group_name = 'heat_modifiers'"
-            ).fetchall()
-            weights = {row['key']: float(row['value']) for row in rows}
-        except Exception as e:
-            log.error(f"❌ Failed loading modifiers: {e}", source="CalculationCore")
-            weights = {}
-
-        if not weights:
-            log.warning("⚠️ No modifiers found in DB; falling back to default", source="CalculationCore")
-            weights = {
-                "distanceWeight": 0.6,
-                "leverageWeight": 0.3,
-                "collateralWeight": 0.1
-            }
-
-        self.calc_services.weights = weights  # inject into CalcServices
-        log.success("✅ Modifiers loaded into CalcServices", source="CalculationCore", payload=weights)
-        return weights
+    @property
+    def modifiers(self) -> dict:
+        return self.calc_services.weights
 
     def get_heat_index(self, position: dict) -> float:
         return self.calc_services.calculate_composite_risk_index(position)
@@ -108,8 +88,7 @@ class CalculationCore:
             ON CONFLICT(key) DO UPDATE SET value = excluded.value, last_modified = excluded.last_modified
         """, (key, value, datetime.now().isoformat()))
         self.data_locker.db.commit()
-        self.modifiers[key] = value
-        self.calc_services.weights[key] = value
+        bump_modifier_version(self.data_locker.db)
         log.success(f"✅ Modifier updated: {key} = {value}", source="CalculationCore")
 
     def export_modifiers(self) -> str:
@@ -0,0 +1,108 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import threading
+import time
+from core.logging import log
+from data.dl_modifiers import get_modifier_version, modifier_db_key
+
+DEFAULT_WEIGHTS = {
+    "distanceWeight": 0.6,
+    "leverageWeight": 0.3,
+    "collateralWeight": 0.1
+}
+
+
+class ModifierStore:
+    """Process-wide cache of heat modifier weights for one database.
+
+    Weights are read from the ``modifiers`` table once and shared by every
+    ``CalcServices`` bound to the store.  They are reloaded when the modifier
+    version is bumped (``set_modifier``/``import_modifiers`` in this process)
+    or after ``max_age`` seconds, so changes made by another process are
+    picked up too.
+    """
+
+    _stores = {}
+    _lock = threading.Lock()
+
+    def __init__(self, data_locker, max_age: float = 60.0):
+        self.data_locker = data_locker
+        self.max_age = max_age
+        self._weights = None
+        self._loaded_version = None
+        self._loaded_at = 0.0
+        self._reload_lock = threading.Lock()
+        self.loads = 0
+
+    @classmethod
+    def for_locker(cls, data_locker) -> "ModifierStore":
+        """Return the shared store for ``data_locker``'s database."""
+        key = modifier_db_key(data_locker.db)
+        with cls._lock:
+            store = cls._stores.get(key)
+            if store is None:
+                store = cls._stores[key] = cls(data_locker)
+            else:
+                # Keep a live connection; earlier lockers may have been closed
+                store.data_locker = data_locker
+            return store
+
+    @property
+    def version(self) -> int:
+        return get_modifier_version(self.data_locker.db)
+
+    @property
+    def weights(self) -> dict:
+        if (
+            self._weights is None
+            or self._loaded_version != self.version
+            or time.monotonic() - self._loaded_at > self.max_age
+        ):
+            with self._reload_lock:
+                version = self.version
+                if self._weights is None or self._loaded_version != version or (
+                    time.monotonic() - self._loaded_at > self.max_age
+                ):
+                    self._weights = self._load()
+                    self._loaded_version = version
+                    self._loaded_at = time.monotonic()
+        return self._weights
+
+    def invalidate(self):
+        self._weights = None
+
+    def _load(self) -> dict:
+        self.loads += 1
+        cursor = self.data_locker.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, using default modifiers", source="ModifierStore")
+            return dict(DEFAULT_WEIGHTS)
+
+        try:
+            rows = cursor.execute(
+                "SELECT key, value FROM modifiers WHERE group_name = 'heat_modifiers'"
+            ).fetchall()
+            weights = {row['key']: float(row['value']) for row in rows}
+        except Exception as e:
+            log.error(f"❌ Failed loading modifiers: {e}", source="ModifierStore")
+            weights = {}
+
+        if not weights:
+            log.warning("⚠️ No modifiers found in DB; falling back to default", source="ModifierStore")
+            weights = dict(DEFAULT_WEIGHTS)
+
+        log.success("✅ Modifiers loaded into shared store", source="ModifierStore", payload=weights)
+        return weights
+
+
+class StaticModifierStore:
+    """Fixed weights for code running without a database (e.g. pool workers)."""
+
+    version = 0
+
+    def __init__(self, weights: dict = None):
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+
+    def invalidate(self):
+        pass
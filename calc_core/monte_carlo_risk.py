@@ -0,0 +1,304 @@
+"""
+Monte Carlo liquidation-risk engine.
+
+Simulates joint BTC/ETH/SOL (any assets with open positions) price paths over
+a horizon and estimates, for every active position, the probability that the
+path touches its ``liquidation_price`` plus the PnL distribution at the
+horizon.
+
+Two path models:
+
+``gbm``
+    correlated geometric Brownian motion; drift and covariance of hourly log
+    returns are estimated from our own ``prices`` history (falling back to
+    ``DEFAULT_HOURLY_VOL``/``DEFAULT_CORRELATION`` when there is too little)
+``bootstrap``
+    hourly steps resampled jointly from the historical return rows, which
+    keeps the empirical cross-asset correlation and fat tails
+
+Paths are split into shards run on the shared ``core.process_pool``
+executor (spawn processes from guarded entry points such as
+``sonic_monitor``, threads elsewhere — numpy releases the GIL for the heavy
+array work); each shard only returns per-position counts/sums and its lowest
+PnLs, so merging is exact (including the 5th percentile) and cheap.  Small
+runs are simulated in-process to avoid pool overhead.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import math
+import time
+from datetime import datetime
+
+import numpy as np
+
+from core.logging import log
+from core.process_pool import get_executor, shutdown_executor
+from calc_core.calc_services import CalcServices
+
+DEFAULT_PATHS = int(os.getenv("RISK_MC_PATHS", "100000"))
+DEFAULT_HORIZON_HOURS = float(os.getenv("RISK_MC_HORIZON_HOURS", "24"))
+DEFAULT_LOOKBACK_DAYS = 30
+DEFAULT_MODEL = os.getenv("RISK_MC_MODEL", "gbm")
+DEFAULT_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+MAX_STEPS = 96
+MIN_RETURNS = 48
+TAIL_QUANTILE = 0.05
+INLINE_PATH_LIMIT = 20000
+POOL_NAME = "monte_carlo"
+HOUR_MS = 3_600_000
+
+DEFAULT_HOURLY_VOL = {"BTC": 0.0065, "ETH": 0.0085, "SOL": 0.012}
+FALLBACK_HOURLY_VOL = 0.01
+DEFAULT_CORRELATION = 0.75
+
+
+class MarketModel:
+    """Everything a shard needs to generate paths (picklable, numpy only)."""
+
+    def __init__(self, assets, spot, kind="gbm", drift=None, cov=None, returns=None, source="default"):
+        self.assets = list(assets)
+        self.spot = np.asarray(spot, dtype=float)
+        self.kind = kind
+        self.drift = np.zeros(len(self.assets)) if drift is None else np.asarray(drift, dtype=float)
+        self.cov = cov
+        self.chol = np.linalg.cholesky(cov) if cov is not None else None
+        self.returns = returns
+        self.source = source
+
+
+def hourly_returns(history: dict, assets) -> np.ndarray:
+    """Joint hourly log returns, ``(T, len(assets))``.
+
+    Each series is reduced to its last price per hour; only hours present
+    for every asset, and only consecutive hour pairs, produce a row.
+    """
+    buckets = []
+    for asset in assets:
+        series = history.get(asset) or {"t": [], "p": []}
+        hourly = {}
+        for t, p in zip(series["t"], series["p"]):
+            if p and p > 0:
+                hourly[int(t) // HOUR_MS] = p
+        buckets.append(hourly)
+    if not buckets:
+        return np.empty((0, 0))
+    common = sorted(set.intersection(*(set(b) for b in buckets)))
+    rows = []
+    for prev, cur in zip(common, common[1:]):
+        if cur - prev == 1:
+            rows.append([math.log(b[cur] / b[prev]) for b in buckets])
+    return np.asarray(rows, dtype=float).reshape(-1, len(buckets))
+
+
+def default_covariance(assets) -> np.ndarray:
+    vol = np.array([DEFAULT_HOURLY_VOL.get(a, FALLBACK_HOURLY_VOL) for a in assets])
+    corr = np.full((len(assets), len(assets)), DEFAULT_CORRELATION)
+    np.fill_diagonal(corr, 1.0)
+    return np.outer(vol, vol) * corr
+
+
+def estimate_model(assets, spot, history: dict, kind: str = "gbm") -> MarketModel:
+    returns = hourly_returns(history, assets)
+    if returns.shape[0] >= MIN_RETURNS:
+        cov = np.atleast_2d(np.cov(returns, rowvar=False))
+        # Keep Cholesky happy when an asset was flat over the window
+        cov = cov + np.eye(len(assets)) * 1e-12
+        if kind == "bootstrap":
+            return MarketModel(assets, spot, "bootstrap", returns=returns, cov=cov, source="history")
+        return MarketModel(assets, spot, "gbm", drift=returns.mean(axis=0), cov=cov, source="history")
+    if kind == "bootstrap":
+        log.warning(
+            "Too little price history to bootstrap; using default GBM",
+            source="MonteCarloRisk",
+            payload={"returns": int(returns.shape[0])},
+        )
+    return MarketModel(assets, spot, "gbm", cov=default_covariance(assets), source="default")
+
+
+def _simulate_shard(model: MarketModel, positions: list, asset_index: list, steps: int,
+                    dt: float, n_paths: int, seed: int, tail_k: int) -> dict:
+    """Simulate ``n_paths`` joint paths and score every position against them."""
+    rng = np.random.default_rng(seed)
+    n_assets = len(model.assets)
+    log_s = np.zeros((n_paths, n_assets))
+    run_min = np.zeros((n_paths, n_assets))
+    run_max = np.zeros((n_paths, n_assets))
+
+    if model.kind == "gbm":
+        drift = (model.drift - 0.5 * np.diag(model.cov)) * dt
+        scale = model.chol.T * math.sqrt(dt)
+    for _ in range(steps):
+        if model.kind == "bootstrap":
+            inc = model.returns[rng.integers(0, model.returns.shape[0], n_paths)]
+        else:
+            inc = drift + rng.standard_normal((n_paths, n_assets)) @ scale
+        log_s += inc
+        np.minimum(run_min, log_s, out=run_min)
+        np.maximum(run_max, log_s, out=run_max)
+
+    terminal = model.spot * np.exp(log_s)
+    lows = model.spot * np.exp(run_min)
+    highs = model.spot * np.exp(run_max)
+
+    n_pos = len(positions)
+    hits = np.zeros(n_pos, dtype=np.int64)
+    pnl_sum = np.zeros(n_pos)
+    keep = min(tail_k, n_paths)
+    tails = np.empty((keep, n_pos))
+    for j, (pos, a) in enumerate(zip(positions, asset_index)):
+        liq = float(pos.get("liquidation_price") or 0.0)
+        collateral = float(pos.get("collateral") or 0.0)
+        pnl = CalcServices.pnl_at_price(pos, terminal[:, a])
+        if liq > 0:
+            if (pos.get("position_type") or "LONG").upper() == "LONG":
+                hit = lows[:, a] <= liq
+            else:
+                hit = highs[:, a] >= liq
+            # A liquidated position loses its collateral, whatever happens after
+            pnl = np.where(hit, -collateral, pnl)
+            hits[j] = int(hit.sum())
+        pnl_sum[j] = pnl.sum()
+        tails[:, j] = np.partition(pnl, keep - 1)[:keep] if keep < n_paths else pnl
+
+    return {"paths": n_paths, "hits": hits, "pnl_sum": pnl_sum, "tails": tails}
+
+
+def _run_shard(args):
+    return _simulate_shard(*args)
+
+
+class MonteCarloRiskEngine:
+    def __init__(self, data_locker, paths: int = DEFAULT_PATHS, horizon_hours: float = DEFAULT_HORIZON_HOURS,
+                 model: str = DEFAULT_MODEL, lookback_days: float = DEFAULT_LOOKBACK_DAYS,
+                 workers: int = DEFAULT_WORKERS, steps: int = None, seed: int = None):
+        self.data_locker = data_locker
+        self.paths = max(1, int(paths))
+        self.horizon_hours = float(horizon_hours)
+        self.model = (model or "gbm").lower()
+        self.lookback_days = lookback_days
+        self.workers = max(0, int(workers))
+        self.steps = steps
+        self.seed = seed
+        self.last_run = None
+        self._history_end_ms = None
+
+    def _steps(self, model: MarketModel):
+        if model.kind == "bootstrap":
+            # Resampled rows are hourly returns, so step in whole hours
+            steps = max(1, round(self.horizon_hours))
+            return steps, 1.0
+        steps = self.steps or max(1, min(MAX_STEPS, round(self.horizon_hours)))
+        return steps, self.horizon_hours / steps
+
+    def _spot_prices(self, assets, positions) -> dict:
+        latest = self.data_locker.prices.get_latest_prices(assets) or {}
+        # Anchor the lookback window on the newest sample, not the wall clock
+        stamps = [int(row.get("epoch_ms") or 0) for row in latest.values() if row]
+        self._history_end_ms = max(stamps) if stamps and max(stamps) > 0 else int(time.time() * 1000)
+        spot = {}
+        for asset in assets:
+            price = (latest.get(asset) or {}).get("current_price")
+            if not price:
+                price = next(
+                    (p.get("current_price") for p in positions if p.get("asset_type") == asset and p.get("current_price")),
+                    None,
+                )
+            if price:
+                spot[asset] = float(price)
+        return spot
+
+    def build_model(self, positions) -> MarketModel:
+        assets = sorted({p.get("asset_type") for p in positions if p.get("asset_type")})
+        spot = self._spot_prices(assets, positions)
+        assets = [a for a in assets if a in spot]
+        end_ms = self._history_end_ms
+        start_ms = end_ms - int(self.lookback_days * 24 * HOUR_MS)
+        history = self.data_locker.prices.get_price_history(assets, start_ms, end_ms) if assets else {}
+        return estimate_model(assets, [spot[a] for a in assets], history, self.model)
+
+    def simulate(self, positions: list, model: MarketModel) -> list:
+        """Estimate risk for ``positions`` under ``model``; nothing is stored."""
+        index = {a: i for i, a in enumerate(model.assets)}
+        scored = [
+            p for p in positions
+            if p.get("asset_type") in index and float(p.get("entry_price") or 0) > 0 and float(p.get("size") or 0) > 0
+        ]
+        if not scored:
+            return []
+        asset_index = [index[p["asset_type"]] for p in scored]
+        steps, dt = self._steps(model)
+        tail_k = max(1, math.ceil(self.paths * TAIL_QUANTILE))
+
+        use_pool = self.workers > 1 and self.paths > INLINE_PATH_LIMIT
+        n_shards = self.workers * 2 if use_pool else 1
+        sizes = [self.paths // n_shards + (1 if i < self.paths % n_shards else 0) for i in range(n_shards)]
+        seeds = np.random.SeedSequence(self.seed).generate_state(n_shards)
+        tasks = [
+            (model, scored, asset_index, steps, dt, n, int(s), tail_k)
+            for n, s in zip(sizes, seeds) if n > 0
+        ]
+
+        shards = None
+        if use_pool:
+            try:
+                shards = list(get_executor(POOL_NAME, self.workers).map(_run_shard, tasks))
+            except Exception as e:
+                log.warning(f"⚠️ Worker pool unavailable, simulating inline: {e}", source="MonteCarloRisk")
+                shutdown_executor(POOL_NAME)
+        if shards is None:
+            shards = [_run_shard(t) for t in tasks]
+
+        total = sum(s["paths"] for s in shards)
+        hits = sum(s["hits"] for s in shards)
+        pnl_sum = sum(s["pnl_sum"] for s in shards)
+        tails = np.concatenate([s["tails"] for s in shards], axis=0)
+        k = min(tail_k, tails.shape[0])
+        p05 = np.partition(tails, k - 1, axis=0)[k - 1]
+
+        computed_at = datetime.now().isoformat()
+        results = []
+        for j, pos in enumerate(scored):
+            expected_pnl = float(pnl_sum[j] / total)
+            results.append({
+                "position_id": pos.get("id"),
+                "asset_type": pos.get("asset_type"),
+                "position_type": pos.get("position_type"),
+                "wallet_name": pos.get("wallet_name"),
+                "liquidation_probability": round(float(hits[j] / total), 6),
+                "expected_pnl": round(expected_pnl, 4),
+                "pnl_p05": round(float(p05[j]), 4),
+                "expected_value": round(float(pos.get("collateral") or 0.0) + expected_pnl, 4),
+                "horizon_hours": self.horizon_hours,
+                "paths": total,
+                "model": f"{model.kind}:{model.source}",
+                "computed_at": computed_at,
+            })
+        return results
+
+    def run(self, positions: list = None, persist: bool = True) -> dict:
+        """Simulate every active position and store the estimates."""
+        started = time.perf_counter()
+        if positions is None:
+            positions = self.data_locker.positions.get_active_positions() or []
+        model = self.build_model(positions)
+        results = self.simulate(positions, model)
+        if persist:
+            self.data_locker.position_risk.replace_all(results)
+
+        elapsed = time.perf_counter() - started
+        try:
+            from core.cycle_metrics import record_timer
+            record_timer("monte_carlo_risk", elapsed)
+        except Exception:
+            pass
+        summary = {
+            "positions": len(results),
+            "paths": self.paths,
+            "horizon_hours": self.horizon_hours,
+            "model": f"{model.kind}:{model.source}",
+            "elapsed_ms": round(elapsed * 1000, 2),
+        }
+        self.last_run = summary
+        log.info("Monte Carlo risk updated", source="MonteCarloRisk", payload=summary)
+        return {**summary, "results": results}
@@ -0,0 +1,165 @@
+# core/cycle_metrics.py
+"""
+Author: BubbaDiego
+Module: cycle_metrics
+Description:
+    Per-step instrumentation for Cyclone cycles.
+
+    ``CycleMetricsRecorder.step(name)`` activates a ``StepMetrics`` for the
+    current context.  While it is active the database layer, HTTP call sites
+    and ``log.end_timer`` add to it through the ``count_*``/``record_*``
+    helpers below; outside a step those helpers do nothing.  With SQL
+    tracing enabled (``core.sql_tracer``) each step is also a trace scope
+    and its statement summary is kept in ``sql_trace``.  The active step
+    lives in a ``ContextVar`` so work pushed to ``asyncio.to_thread`` is
+    attributed to the step that started it.
+
+    Finished cycles are persisted by ``DLCycleMetricsManager``
+    (``dl.cycle_metrics``) and served by ``/api/metrics``.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import uuid4
+
+from core.sql_tracer import sql_trace_scope, sql_tracing_enabled
+
+COUNTER_FIELDS = ("queries", "rows_read", "rows_written", "commits", "http_calls")
+
+_active_step: contextvars.ContextVar = contextvars.ContextVar("cycle_metrics_step", default=None)
+
+
+class StepMetrics:
+    __slots__ = ("name", "started_at", "wall_ms", "cpu_ms", "success", "error", "timers", "sql_trace") + COUNTER_FIELDS
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.wall_ms = 0.0
+        self.cpu_ms = 0.0
+        self.success = True
+        self.error = None
+        self.timers = {}
+        self.sql_trace = None
+        for field in COUNTER_FIELDS:
+            setattr(self, field, 0)
+
+    def to_dict(self) -> dict:
+        return {
+            "step": self.name,
+            "started_at": self.started_at,
+            "wall_ms": round(self.wall_ms, 3),
+            "cpu_ms": round(self.cpu_ms, 3),
+            "success": self.success,
+            "error": self.error,
+            "timers": dict(self.timers),
+            "sql_trace": self.sql_trace,
+            **{field: getattr(self, field) for field in COUNTER_FIELDS},
+        }
+
+
+def active_step() -> Optional[StepMetrics]:
+    return _active_step.get()
+
+
+def count_query(rows_written: int = 0):
+    step = _active_step.get()
+    if step is not None:
+        step.queries += 1
+        if rows_written > 0:
+            step.rows_written += rows_written
+
+
+def count_rows_read(rows: int):
+    step = _active_step.get()
+    if step is not None and rows:
+        step.rows_read += rows
+
+
+def count_commit():
+    step = _active_step.get()
+    if step is not None:
+        step.commits += 1
+
+
+def record_http_call(count: int = 1):
+    step = _active_step.get()
+    if step is not None:
+        step.http_calls += count
+
+
+def record_timer(label: str, elapsed_s: float):
+    step = _active_step.get()
+    if step is not None:
+        step.timers[label] = round(elapsed_s * 1000, 3)
+
+
+class CycleMetricsRecorder:
+    """Collect ``StepMetrics`` for one cycle.
+
+    Steps run one after another, so CPU time is taken from the process clock
+    and includes any worker threads the step uses.
+    """
+
+    TOTAL_STEP = "cycle"
+
+    def __init__(self, source: str = "Cyclone", cycle_id: Optional[str] = None):
+        self.source = source
+        self.cycle_id = cycle_id or str(uuid4())
+        self.steps: List[StepMetrics] = []
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    @contextmanager
+    def step(self, name: str):
+        metrics = StepMetrics(name)
+        token = _active_step.set(metrics)
+        tracer = sql_trace_scope(f"{self.source}.{name}") if sql_tracing_enabled() else nullcontext()
+        scope = None
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            with tracer as scope:
+                yield metrics
+        except BaseException as e:
+            metrics.success = False
+            metrics.error = str(e)
+            raise
+        finally:
+            metrics.wall_ms = (time.perf_counter() - wall) * 1000
+            metrics.cpu_ms = (time.process_time() - cpu) * 1000
+            if scope is not None:
+                metrics.sql_trace = scope.summary_dict
+            _active_step.reset(token)
+            self.steps.append(metrics)
+
+    def total(self) -> StepMetrics:
+        total = StepMetrics(self.TOTAL_STEP)
+        total.started_at = self.started_at
+        total.wall_ms = (time.perf_counter() - self._wall_start) * 1000
+        total.cpu_ms = (time.process_time() - self._cpu_start) * 1000
+        total.success = all(s.success for s in self.steps)
+        total.error = next((s.error for s in self.steps if s.error), None)
+        for field in COUNTER_FIELDS:
+            setattr(total, field, sum(getattr(s, field) for s in self.steps))
+        traced = [s for s in self.steps if s.sql_trace]
+        if traced:
+            total.sql_trace = {
+                "statements": sum(s.sql_trace["statements"] for s in traced),
+                "n_plus_one": [
+                    {"step": s.name, **c} for s in traced for c in s.sql_trace["n_plus_one"]
+                ],
+            }
+        return total
+
+    def summary(self) -> dict:
+        return {
+            "cycle_id": self.cycle_id,
+            "source": self.source,
+            "total": self.total().to_dict(),
+            "steps": [s.to_dict() for s in self.steps],
+        }
@@ -0,0 +1,65 @@
+# core/process_pool.py
+"""
+Author: BubbaDiego
+Module: process_pool
+Description:
+    Shared worker pools for CPU-heavy fan-out (Monte Carlo risk, sharded
+    Cyclone steps).
+
+    Process pools use the ``spawn`` start method (the web server and
+    dispatchers run threads, which ``fork`` does not copy safely), and spawn
+    workers re-import the ``__main__`` script.  That is only harmless when
+    the entry point keeps its side effects under ``if __name__ ==
+    "__main__":``, so process pools are opt-in: guarded entry points call
+    :func:`enable_process_pool` (or set ``SONIC_PROCESS_POOL=1``).  Everyone
+    else gets a thread pool of the same size from :func:`get_executor`.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+_enabled = os.getenv("SONIC_PROCESS_POOL", "").lower() in ("1", "true", "yes")
+_pools = {}
+_lock = threading.Lock()
+
+
+def enable_process_pool(enabled: bool = True):
+    """Allow spawn process pools; call only from a ``__main__``-guarded entry point."""
+    global _enabled
+    _enabled = enabled
+
+
+def process_pool_enabled() -> bool:
+    return _enabled
+
+
+def get_executor(name: str, workers: int):
+    """Shared pool for ``name``; rebuilt when the size or the pool kind changes."""
+    kind = "process" if _enabled else "thread"
+    with _lock:
+        current = _pools.get(name)
+        if current is None or current[:2] != (kind, workers):
+            if current is not None:
+                current[2].shutdown(wait=False, cancel_futures=True)
+            if kind == "process":
+                executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+            current = _pools[name] = (kind, workers, executor)
+        return current[2]
+
+
+def shutdown_executor(name: str = None):
+    """Shut down the pool for ``name`` (all pools when omitted)."""
+    with _lock:
+        names = [name] if name else list(_pools)
+        for key in names:
+            current = _pools.pop(key, None)
+            if current is not None:
+                current[2].shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_executor)
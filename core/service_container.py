@@ -0,0 +1,97 @@
+# core/service_container.py
+"""
+Author: BubbaDiego
+Module: service_container
+Description:
+    App-level service container for the Flask dashboard.
+
+    Services are registered as factories and built once, on first ``get``.
+    ``memoize(key, fn)`` caches a value for the current request scope only,
+    so context processors that run for every template render of a request
+    (including included/extended templates) compute their values once.
+    Outside a request scope ``memoize`` simply calls ``fn``.  The scope lives
+    in a ``ContextVar``; ``sonic_app`` opens it in ``before_request`` and
+    closes it in ``teardown_request``.
+"""
+
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+_request_cache: contextvars.ContextVar = contextvars.ContextVar("service_request_cache", default=None)
+
+
+class ServiceContainer:
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    # --- singletons ------------------------------------------------------
+    def register(self, name: str, factory: Optional[Callable[[], Any]] = None, instance: Any = None):
+        """Register ``factory`` (built lazily) or an already built ``instance``."""
+        with self._lock:
+            if instance is not None:
+                self._instances[name] = instance
+            else:
+                self._instances.pop(name, None)
+            if factory is not None:
+                self._factories[name] = factory
+
+    def get(self, name: str):
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            if name not in self._instances:
+                try:
+                    factory = self._factories[name]
+                except KeyError:
+                    raise KeyError(f"Unknown service '{name}'") from None
+                self._instances[name] = factory()
+            return self._instances[name]
+
+    def reset(self, name: Optional[str] = None):
+        """Drop built instances so the next ``get`` rebuilds them."""
+        with self._lock:
+            if name is None:
+                self._instances = {k: v for k, v in self._instances.items() if k not in self._factories}
+            elif name in self._factories:
+                self._instances.pop(name, None)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._instances or name in self._factories
+
+    # --- request scope ---------------------------------------------------
+    @staticmethod
+    def begin_request():
+        return _request_cache.set({})
+
+    @staticmethod
+    def end_request(token=None):
+        if token is not None:
+            try:
+                _request_cache.reset(token)
+                return
+            except ValueError:  # token from another context
+                pass
+        _request_cache.set(None)
+
+    @contextmanager
+    def request_scope(self):
+        token = self.begin_request()
+        try:
+            yield
+        finally:
+            self.end_request(token)
+
+    @staticmethod
+    def memoize(key: str, fn: Callable[[], Any]):
+        """Return ``fn()``, computed at most once per request scope."""
+        cache = _request_cache.get()
+        if cache is None:
+            return fn()
+        if key not in cache:
+            cache[key] = fn()
+        return cache[key]
@@ -0,0 +1,211 @@
+# core/sql_tracer.py
+"""
+Author: BubbaDiego
+Module: sql_tracer
+Description:
+    Opt-in SQL statement tracing with N+1 detection.
+
+    When enabled (``SONIC_SQL_TRACE=1`` or ``enable_sql_tracing()``)
+    ``DatabaseManager`` installs ``trace_statement`` as the sqlite3 trace
+    callback on its connection.  Statements executed inside an active
+    ``SqlTraceScope`` (a Cyclone step or an HTTP request) are fingerprinted
+    - literals replaced by ``?``, whitespace collapsed - and counted per
+    fingerprint together with their execution time.  Fingerprints that run
+    at least ``threshold`` times in one scope are reported as N+1
+    candidates: the same query issued once per row instead of once per set.
+
+    ``executemany`` batches are counted once (with the row count) so a
+    batched write is never mistaken for an N+1 loop.
+"""
+
+import contextvars
+import os
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Optional
+
+DEFAULT_THRESHOLD = int(os.getenv("SONIC_SQL_TRACE_THRESHOLD", "10"))
+
+_enabled = os.getenv("SONIC_SQL_TRACE", "").lower() in ("1", "true", "yes")
+_threshold = DEFAULT_THRESHOLD
+_active_scope: contextvars.ContextVar = contextvars.ContextVar("sql_trace_scope", default=None)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_BLOB = re.compile(r"\b[xX]\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b")
+_NULL = re.compile(r"\bNULL\b", re.IGNORECASE)
+_NAMED = re.compile(r"[:@$]\w+")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_ROWS = re.compile(r"(\(\?\+\))(?:\s*,\s*\(\?\+\))+")
+_SPACE = re.compile(r"\s+")
+
+
+def enable_sql_tracing(threshold: Optional[int] = None):
+    """Turn tracing on for connections opened from now on."""
+    global _enabled, _threshold
+    _enabled = True
+    if threshold is not None:
+        _threshold = threshold
+
+
+def disable_sql_tracing():
+    global _enabled
+    _enabled = False
+
+
+def sql_tracing_enabled() -> bool:
+    return _enabled
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """Normalise ``sql`` so statements differing only in values match."""
+    text = _STRING.sub("?", sql)
+    text = _BLOB.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _NULL.sub("?", text)
+    text = _NAMED.sub("?", text)
+    text = _SPACE.sub(" ", text).strip().rstrip(";")
+    text = _LIST.sub("(?+)", text)
+    return _ROWS.sub(r"\1", text)
+
+
+class SqlTraceScope:
+    """Statement counts and timings for one cycle step or request."""
+
+    def __init__(self, name: str, threshold: Optional[int] = None):
+        self.name = name
+        self.threshold = threshold or _threshold
+        self.counts = {}
+        self.times_ms = {}
+        self.batch_rows = {}
+        self.summary_dict = None
+        self._lock = threading.Lock()
+        self._suppressed = threading.local()
+
+    # --- recording -------------------------------------------------------
+    def record(self, sql: str, executions: int = 1):
+        fp = fingerprint(sql)
+        with self._lock:
+            self.counts[fp] = self.counts.get(fp, 0) + executions
+
+    def add_time(self, elapsed_ms: float, sql: str):
+        """Charge ``elapsed_ms`` to the statement ``sql`` (not whatever ran last)."""
+        fp = fingerprint(sql)
+        with self._lock:
+            self.times_ms[fp] = self.times_ms.get(fp, 0.0) + elapsed_ms
+
+    def record_batch(self, sql: str, rows: int, elapsed_ms: float):
+        fp = fingerprint(sql)
+        with self._lock:
+            self.counts[fp] = self.counts.get(fp, 0) + 1
+            self.batch_rows[fp] = self.batch_rows.get(fp, 0) + max(rows, 0)
+            self.times_ms[fp] = self.times_ms.get(fp, 0.0) + elapsed_ms
+
+    @contextmanager
+    def suppressed(self):
+        """Ignore trace callbacks in this thread (``executemany`` batches)."""
+        self._suppressed.active = True
+        try:
+            yield
+        finally:
+            self._suppressed.active = False
+
+    def is_suppressed(self) -> bool:
+        return getattr(self._suppressed, "active", False)
+
+    # --- reporting -------------------------------------------------------
+    def _entry(self, fp: str) -> dict:
+        entry = {
+            "fingerprint": fp,
+            "count": self.counts.get(fp, 0),
+            "total_ms": round(self.times_ms.get(fp, 0.0), 3),
+        }
+        if fp in self.batch_rows:
+            entry["batch_rows"] = self.batch_rows[fp]
+        return entry
+
+    def n_plus_one(self) -> list:
+        """Fingerprints executed at least ``threshold`` times, most first."""
+        candidates = [
+            fp for fp, count in self.counts.items()
+            if count >= self.threshold and fp not in self.batch_rows
+        ]
+        candidates.sort(key=lambda fp: self.counts[fp], reverse=True)
+        return [self._entry(fp) for fp in candidates]
+
+    def summary(self, top: int = 10) -> dict:
+        ranked = sorted(self.counts, key=lambda fp: self.times_ms.get(fp, 0.0), reverse=True)
+        return {
+            "scope": self.name,
+            "statements": sum(self.counts.values()),
+            "unique": len(self.counts),
+            "total_ms": round(sum(self.times_ms.values()), 3),
+            "threshold": self.threshold,
+            "top": [self._entry(fp) for fp in ranked[:top]],
+            "n_plus_one": self.n_plus_one(),
+        }
+
+
+def active_sql_scope() -> Optional[SqlTraceScope]:
+    return _active_scope.get()
+
+
+def trace_statement(sql: str):
+    """sqlite3 trace callback; must never raise."""
+    scope = _active_scope.get()
+    if scope is None or scope.is_suppressed() or sql.startswith("--"):
+        return
+    try:
+        scope.record(sql)
+    except Exception:
+        pass
+
+
+def begin_scope(name: str, threshold: Optional[int] = None):
+    """Activate a new scope; returns ``(scope, token)`` for ``end_scope``."""
+    scope = SqlTraceScope(name, threshold)
+    return scope, _active_scope.set(scope)
+
+
+def end_scope(scope: SqlTraceScope, token, log_summary: bool = True) -> dict:
+    _active_scope.reset(token)
+    summary = scope.summary()
+    if log_summary:
+        report(summary)
+    return summary
+
+
+@contextmanager
+def sql_trace_scope(name: str, threshold: Optional[int] = None, log_summary: bool = True):
+    """Trace statements run inside the block; yields the scope."""
+    scope, token = begin_scope(name, threshold)
+    try:
+        yield scope
+    finally:
+        scope.summary_dict = end_scope(scope, token, log_summary)
+
+
+def report(summary: dict):
+    from core.logging import log
+
+    if summary["n_plus_one"]:
+        log.warning(
+            f"⚠️ Possible N+1 queries in {summary['scope']}",
+            source="SqlTracer",
+            payload={
+                "statements": summary["statements"],
+                "candidates": [
+                    {"sql": c["fingerprint"][:160], "count": c["count"], "ms": c["total_ms"]}
+                    for c in summary["n_plus_one"][:5]
+                ],
+            },
+        )
+    else:
+        log.debug(
+            f"SQL trace for {summary['scope']}",
+            source="SqlTracer",
+            payload={k: summary[k] for k in ("statements", "unique", "total_ms")},
+        )
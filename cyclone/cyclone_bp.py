@@ -1,8 +1,10 @@
 import asyncio
 import os
-from flask import Blueprint, jsonify, render_template, current_app
+import json
+from flask import Blueprint, jsonify, render_template, current_app, request, Response, stream_with_context
 # Access the shared Cyclone instance attached to the Flask app
 from core.core_imports import BASE_DIR, log
+from utils.log_tail import tail_lines, follow_lines
 from threading import Thread
 import inspect
 
@@ -128,17 +130,39 @@ def clear_alerts():
         log.error(f"Clear Alerts Error: {e}", source="CycloneAPI")
         return jsonify({"error": str(e)}), 500
 
+OPERATIONS_LOG_PATH = os.path.join(BASE_DIR, "monitor", "operations_log.txt")
+
+
 @cyclone_bp.route("/cyclone_logs", methods=["GET"])
 def api_cyclone_logs():
     try:
-        log_file = os.path.join(BASE_DIR, "monitor", "operations_log.txt")
-        if not os.path.exists(log_file):
-            return jsonify({"logs": []})
-        with open(log_file, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        last_lines = lines[-50:]
-        cleaned = [line.rstrip("\n") for line in last_lines]
-        return jsonify({"logs": cleaned})
+        count = min(max(request.args.get("lines", 50, type=int), 1), 1000)
+        return jsonify({"logs": tail_lines(OPERATIONS_LOG_PATH, count)})
     except Exception as e:
         current_app.logger.exception("Error reading Cyclone logs:", exc_info=True)
         return jsonify({"error": str(e)}), 500
+
+
+@cyclone_bp.route("/cyclone_logs/stream", methods=["GET"])
+def stream_cyclone_logs():
+    """Server-sent events feed of new operations log lines."""
+    backlog = min(max(request.args.get("lines", 0, type=int), 0), 1000)
+
+    def generate():
+        for line in tail_lines(OPERATIONS_LOG_PATH, backlog):
+            yield f"data: {json.dumps(line)}\n\n"
+        idle_polls = 0
+        for line in follow_lines(OPERATIONS_LOG_PATH, poll_interval=1.0):
+            if line is None:
+                idle_polls += 1
+                if idle_polls % 15 == 0:
+                    yield ": keep-alive\n\n"
+                continue
+            idle_polls = 0
+            yield f"data: {json.dumps(line)}\n\n"
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
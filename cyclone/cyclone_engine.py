@@ -24,9 +24,31 @@ from cyclone.cyclone_maintenance_service import CycloneMaintenanceService
 from cyclone.cyclone_wallet_service import CycloneWalletService
 from data.dl_monitor_ledger import DLMonitorLedgerManager
 from hedge_core.hedge_core import HedgeCore
+from calc_core.monte_carlo_risk import MonteCarloRiskEngine
+from cyclone.cyclone_shards import CycloneShardRunner, DEFAULT_SHARD_WORKERS
+from oracle_core.context_snapshot_service import mark_data_changed
+from dashboard.delta_publisher import DeltaPublisher
+from core.cycle_metrics import CycleMetricsRecorder
 
 
-global_data_locker = DataLocker(str(DB_PATH))  # There can be only one
+_global_data_locker = None
+
+
+def get_global_data_locker() -> DataLocker:
+    """Return the shared Cyclone DataLocker, opening it on first use."""
+    global _global_data_locker
+    if _global_data_locker is None:
+        _global_data_locker = DataLocker(str(DB_PATH))  # There can be only one
+    return _global_data_locker
+
+
+def __getattr__(name):
+    # ``global_data_locker`` used to be opened at import time; keep the name
+    # available without paying for the DB connection until it is needed.
+    if name == "global_data_locker":
+        return get_global_data_locker()
+    raise AttributeError(name)
+
 
 def configure_cyclone_console_log(debug: bool = False):
     """Centralized Cyclone Console Log Config
@@ -69,7 +91,8 @@ def configure_cyclone_console_log(debug: bool = False):
 
 
 class Cyclone:
-    def __init__(self, monitor_core=None, poll_interval=60, debug: bool = False):
+    def __init__(self, monitor_core=None, poll_interval=60, debug: bool = False,
+                 sharded: bool = None, shard_workers: int = DEFAULT_SHARD_WORKERS):
         configure_cyclone_console_log(debug=debug)
         self.logger = logging.getLogger("Cyclone")
         self.poll_interval = poll_interval
@@ -79,7 +102,7 @@ class Cyclone:
             self.logger.setLevel(logging.INFO)
         self.monitor_core = monitor_core or MonitorCore()
 
-        self.data_locker = global_data_locker
+        self.data_locker = get_global_data_locker()
         self.price_sync = PriceSyncService(self.data_locker)
 
         # PATCH: Create a system_core instance for death screams
@@ -115,6 +138,11 @@ class Cyclone:
         self.wallet_service = CycloneWalletService(self.data_locker)
         self.maintenance_service = CycloneMaintenanceService(self.data_locker)
         self.hedge_core = HedgeCore(self.data_locker)
+        self.risk_engine = MonteCarloRiskEngine(self.data_locker)
+        # Wallet-sharded mode: per-wallet steps fan out to worker processes
+        if sharded is None:
+            sharded = os.getenv("CYCLONE_SHARDED", "").lower() in ("1", "true", "yes")
+        self.shards = CycloneShardRunner(self.data_locker, workers=shard_workers) if sharded else None
 
         log.banner("🌀  🌪️ CYCLONE ENGINE STARTUP 🌪️ 🌀")
 
@@ -165,6 +193,7 @@ class Cyclone:
             "market_updates": self.run_market_updates,
             "check_jupiter_for_updates": self.run_check_jupiter_for_updates,
             "enrich_positions": self.run_enrich_positions,
+            "position_risk": self.run_position_risk,
             "enrich_alerts": self.run_alert_enrichment,
             "update_evaluated_value": self.run_update_evaluated_value,
             "create_market_alerts": self.run_create_market_alerts,
@@ -181,6 +210,8 @@ class Cyclone:
         default_steps = list(available_steps.keys())
 
         steps = steps or default_steps
+        metrics = CycleMetricsRecorder(source="Cyclone")
+        self.last_cycle_metrics = metrics
 
         for step in steps:
             if step not in available_steps:
@@ -188,8 +219,10 @@ class Cyclone:
                 continue
             log.info(f"▶️ Running step: {step}", source="Cyclone")
             try:
-                await available_steps[step]()
+                with metrics.step(step):
+                    await available_steps[step]()
             except Exception as e:
+                await asyncio.to_thread(self.data_locker.cycle_metrics.record, metrics)
                 log.error(f"💀 Terminal failure during step '{step}': {e}", source="Cyclone")
                 self.system_core.death({
                     "message": f"💀 Cyclone terminal failure during step '{step}'",
@@ -202,18 +235,38 @@ class Cyclone:
                 })
                 raise  # Optionally re-raise if you want to halt further steps
 
+        await asyncio.to_thread(self.data_locker.cycle_metrics.record, metrics)
+        log.debug("Cycle metrics recorded", source="Cyclone", payload=metrics.total().to_dict())
+
+        # New data is committed; cached Oracle/Trader contexts are now stale
+        mark_data_changed(self.data_locker)
+        # Push what changed to dashboard clients
+        await asyncio.to_thread(DeltaPublisher.for_locker(self.data_locker).publish_all)
+        # Wake in-process subscribers of the tables this cycle touched
+        changed = await asyncio.to_thread(self.data_locker.changes.poll)
+        log.debug("Change generations", source="Cyclone", payload=changed)
+
     def run_delete_all_data(self):
         log.warning("⚠️ Deletion requested via legacy method (run_delete_all_data)", source="Cyclone")
         asyncio.run(self.run_clear_all_data())
 
 
     async def run_link_hedges(self):
+        if self.shards is not None:
+            await asyncio.to_thread(self.shards.link_hedges)
+            return
         self.hedge_core.link_hedges()
 
     async def run_update_hedges(self):
+        if self.shards is not None:
+            await asyncio.to_thread(self.shards.update_hedges)
+            return
         await asyncio.to_thread(self.hedge_core.update_hedges)
 
     async def run_alert_evaluation(self):
+        if self.shards is not None:
+            await self.shards.process_alerts(self.alert_core, write="evaluation")
+            return
         await self.alert_core.run_alert_evaluation()
 
     async def run_create_position_alerts(self):
@@ -236,15 +289,33 @@ class Cyclone:
         log.success("✅ Alert IDs cleansed", source="Cyclone")
 
     async def run_enrich_positions(self):
-        await self.position_core.enrich_positions()
+        if self.shards is not None:
+            await asyncio.to_thread(self.shards.enrich_positions)
+        else:
+            await self.position_core.enrich_positions()
         log.success("✅ Position enrichment complete", source="Cyclone")
 
+    async def run_position_risk(self):
+        """Refresh Monte Carlo liquidation-risk estimates for active positions."""
+        summary = await asyncio.to_thread(self.risk_engine.run)
+        log.success(
+            "✅ Position risk updated",
+            source="Cyclone",
+            payload={k: v for k, v in summary.items() if k != "results"},
+        )
+
     async def run_alert_enrichment(self):
-        await self.alert_core.enrich_all_alerts()
+        if self.shards is not None:
+            await self.shards.process_alerts(self.alert_core, evaluate=False, write=None)
+        else:
+            await self.alert_core.enrich_all_alerts()
         log.success("✅ Alert enrichment complete", source="Cyclone")
 
     async def run_update_evaluated_value(self):
-        await self.alert_core.update_evaluated_values()
+        if self.shards is not None:
+            await self.shards.process_alerts(self.alert_core, write="values")
+        else:
+            await self.alert_core.update_evaluated_values()
         log.success("✅ Evaluated alert values updated", source="Cyclone")
 
     # ⚙️ Corrected clear helpers
@@ -269,6 +340,11 @@ class Cyclone:
         self.maintenance_service.clear_all_tables()
 
     async def run_check_jupiter_for_updates(self):
+        if self.shards is not None:
+            # Wallet fetches fan out to the shard pool; inserts stay here
+            log.info("Checking Jupiter/Positions via wallet shards", source="Cyclone")
+            await asyncio.to_thread(self.shards.sync_positions, self.position_core)
+            return
         log.info("Checking Jupiter/Positions via MonitorCore", source="Cyclone")
         await asyncio.to_thread(self.monitor_core.run_by_name, "position_monitor")
 
@@ -5,6 +5,22 @@ import requests
 import sqlite3
 from core.constants import LOG_DATE_FORMAT, LOG_DIR  # Import LOG_DIR
 from core.core_imports import DB_PATH
+from utils.log_tail import JsonLogDigest
+
+# Number of most recent log records rendered in the detailed table
+REPORT_RECENT_ENTRIES = 200
+
+# Cached per log path so repeated reports only parse newly appended lines
+_log_digests = {}
+
+
+def get_cyclone_log_digest(path, recent: int = REPORT_RECENT_ENTRIES) -> JsonLogDigest:
+    """Return the shared incremental digest for ``path``, refreshed."""
+    digest = _log_digests.get(path)
+    if digest is None or digest.recent.maxlen != recent:
+        digest = JsonLogDigest(path, key="operation_type", recent=recent)
+        _log_digests[path] = digest
+    return digest.refresh()
 
 def query_update_ledger():
     """
@@ -79,24 +95,11 @@ def generate_cycle_report():
         print(f"No cyclone log file found at {cyclone_log_path}. Cannot generate report.")
         return
 
-    # Read and parse cyclone log entries
-    log_entries = []
-    with open(cyclone_log_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-                log_entries.append(record)
-            except json.JSONDecodeError:
-                continue
-
-    # Build summary counts
-    summary = {}
-    for record in log_entries:
-        op_type = record.get("operation_type", "Unknown")
-        summary[op_type] = summary.get(op_type, 0) + 1
+    # Only lines appended since the previous report are parsed; summary
+    # counts are kept running and the table shows the most recent records.
+    digest = get_cyclone_log_digest(cyclone_log_path)
+    log_entries = list(digest.recent)
+    summary = dict(digest.counts)
 
     # Query the alert ledger using the updated function
     ledger_entries = query_update_ledger()
@@ -0,0 +1,288 @@
+# cyclone/cyclone_shards.py
+"""
+Wallet-sharded execution of the per-wallet Cyclone steps.
+
+Positions are partitioned by ``wallet_name`` and alerts follow the wallet of
+the position they reference (portfolio/market/system alerts form one extra
+shard).  The fetch, enrich, evaluate and hedge steps for each shard run on a
+shared ``core.process_pool`` executor (spawn processes when the entry point
+enabled them, threads otherwise):
+
+* workers only *compute* — position enrichment and hedge grouping are pure
+  functions of the rows shipped to them, and alert workers read through a
+  :class:`ShardReader` on a ``mode=ro`` connection (SQLite WAL allows
+  concurrent readers), so a worker cannot write even by accident;
+* the coordinator (``CycloneShardRunner`` in the Cyclone process) merges the
+  shard results and performs every write through its single ``DataLocker``,
+  in one batch per step.
+
+With ``workers <= 1``, or if the pool cannot be started, shards run inline in
+the coordinator, so results never depend on the execution mode.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import asyncio
+import threading
+import time
+from uuid import uuid4
+
+from core.logging import log
+from core.process_pool import get_executor, shutdown_executor
+
+DEFAULT_SHARD_WORKERS = int(os.getenv("CYCLONE_SHARD_WORKERS", "0")) or max(1, min(8, (os.cpu_count() or 2) - 1))
+GLOBAL_SHARD = "__global__"
+POOL_NAME = "cyclone_shards"
+
+
+def partition_positions(positions: list) -> dict:
+    """``{wallet_name: [positions]}``; unnamed wallets share the ``Unknown`` shard."""
+    shards = {}
+    for pos in positions:
+        shards.setdefault(pos.get("wallet_name") or "Unknown", []).append(pos)
+    return shards
+
+
+def partition_alerts(alerts: list, position_wallets: dict) -> dict:
+    """``{wallet_name: [alerts]}`` by the wallet of each alert's position.
+
+    Alerts without a (known) position go to :data:`GLOBAL_SHARD`.
+    """
+    shards = {}
+    for alert in alerts:
+        wallet = position_wallets.get(getattr(alert, "position_reference_id", None)) or GLOBAL_SHARD
+        shards.setdefault(wallet, []).append(alert)
+    return shards
+
+
+# --- worker side -----------------------------------------------------------
+
+class ShardReader:
+    """Read-only subset of ``DataLocker`` used by alert shard workers.
+
+    No schema setup, migrations or seeding run, and the ``mode=ro``
+    connection rejects any write.
+    """
+
+    def __init__(self, db_path: str):
+        from data.database import ReadOnlyDatabaseManager
+        from data.dl_portfolio_aggregates import DLPortfolioAggregateManager
+        from data.dl_position_risk import DLPositionRiskManager
+        from data.dl_positions import DLPositionManager
+        from data.dl_prices import DLPriceManager
+        from data.dl_system_data import DLSystemDataManager
+        from data.dl_wallets import DLWalletManager
+
+        self.db = ReadOnlyDatabaseManager(db_path)
+        self.positions = DLPositionManager(self.db)
+        self.prices = DLPriceManager(self.db)
+        self.wallets = DLWalletManager(self.db)
+        self.system = DLSystemDataManager(self.db)
+        self.portfolio_aggregates = DLPortfolioAggregateManager(self.db)
+        # Its CREATE TABLE IF NOT EXISTS is a no-op on the coordinator's schema
+        self.position_risk = DLPositionRiskManager(self.db)
+
+    def get_position_by_reference_id(self, pos_id: str):
+        return self.positions.get_position_by_id(pos_id)
+
+    def get_latest_price(self, asset_type: str) -> dict:
+        return self.prices.get_latest_price(asset_type)
+
+    def get_wallet_by_name(self, wallet_name: str):
+        return self.wallets.get_wallet_by_name(wallet_name)
+
+
+_readers = threading.local()
+
+
+def _reader(db_path: str) -> ShardReader:
+    """Per-thread (and so per-process) read-only reader for ``db_path``."""
+    cache = _readers.__dict__.setdefault("by_path", {})
+    reader = cache.get(db_path)
+    if reader is None:
+        reader = cache[db_path] = ShardReader(db_path)
+    return reader
+
+
+def _run_position_shard(args) -> dict:
+    """Enrich and validate one wallet's positions without touching the DB."""
+    from calc_core.calculation_core import CalculationCore
+    from calc_core.modifier_store import StaticModifierStore
+    from positions.position_enrichment_service import PositionEnrichmentService, validate_enriched_position
+
+    positions, latest_prices, weights = args
+    enricher = PositionEnrichmentService(
+        None, calc_core=CalculationCore(None, modifier_store=StaticModifierStore(weights))
+    )
+    enriched, failed = [], []
+    for pos in positions:
+        pos = enricher.enrich(pos, latest_price=latest_prices.get(pos.get("asset_type")), verbose=False)
+        if validate_enriched_position(pos, source="EnrichmentValidator", verbose=False):
+            enriched.append(pos)
+        else:
+            failed.append(pos.get("id"))
+    return {"enriched": enriched, "failed": failed}
+
+
+def _run_hedge_link_shard(positions: list) -> list:
+    """Position-id groups that should share a ``hedge_buddy_id``."""
+    from hedge_core.hedge_core import HedgeCore
+    return [[p["id"] for p in group] for group in HedgeCore.find_hedge_groups(positions)]
+
+
+def _run_hedge_build_shard(positions: list) -> list:
+    from hedge_core.hedge_core import HedgeCore
+    return HedgeCore(None).build_hedges(positions)
+
+
+def _run_alert_shard(args) -> list:
+    """Enrich (and optionally evaluate) one shard's alerts; nothing is written."""
+    from alert_core.alert_enrichment_service import AlertEnrichmentService
+    from alert_core.alert_evaluation_service import AlertEvaluationService
+    from alert_core.threshold_service import ThresholdService
+    from data.async_data_locker import AsyncDataLocker
+    from utils.travel_percent_logger import get_drift_recorder
+
+    db_path, alerts, evaluate = args
+    reader = _reader(db_path)
+    enricher = AlertEnrichmentService(reader, async_locker=AsyncDataLocker(reader))
+    alerts = asyncio.run(enricher.enrich_all(alerts))
+    if evaluate:
+        evaluator = AlertEvaluationService(ThresholdService(reader.db))
+        results = []
+        for alert in alerts:
+            try:
+                results.append(evaluator.evaluate(alert))
+            except Exception as e:
+                log.error("❌ Failed to evaluate alert", source="CycloneShards", payload={"id": alert.id, "error": str(e)})
+                results.append(alert)
+        alerts = results
+    # Pool workers may never run atexit hooks
+    get_drift_recorder().flush()
+    return alerts
+
+
+# --- coordinator -------------------------------------------------------------
+
+class CycloneShardRunner:
+    """Fan Cyclone's per-wallet steps out to worker processes; write results once."""
+
+    def __init__(self, data_locker, workers: int = DEFAULT_SHARD_WORKERS):
+        self.dl = data_locker
+        self.workers = max(0, int(workers))
+        self.last_stats = {}
+
+    @property
+    def db_path(self) -> str:
+        return str(self.dl.db.db_path)
+
+    def map(self, fn, items) -> list:
+        """``fn`` over ``items`` on the pool (inline when pooling is off or fails)."""
+        items = list(items)
+        if self.workers > 1 and len(items) > 1:
+            try:
+                return list(get_executor(POOL_NAME, self.workers).map(fn, items))
+            except Exception as e:
+                log.warning(f"⚠️ Shard pool unavailable, running inline: {e}", source="CycloneShards")
+                shutdown_executor(POOL_NAME)
+        return [fn(item) for item in items]
+
+    def _stats(self, step: str, started: float, **extra) -> dict:
+        stats = {"step": step, "workers": self.workers, "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)}
+        stats.update(extra)
+        self.last_stats[step] = stats
+        log.info(f"🧩 Sharded {step} complete", source="CycloneShards", payload=stats)
+        return stats
+
+    def sync_positions(self, position_core, source: str = "cyclone_shards") -> dict:
+        """Jupiter sync with one wallet fetch per worker; inserts stay in this process."""
+        started = time.perf_counter()
+        result = position_core.update_positions_from_jupiter(source=source, fetch_map=self.map)
+        self._stats("check_jupiter_for_updates", started, imported=result.get("imported", 0))
+        return result
+
+    def enrich_positions(self) -> list:
+        from calc_core.modifier_store import ModifierStore
+        from positions.position_enrichment_service import PositionEnrichmentService
+
+        started = time.perf_counter()
+        positions = self.dl.positions.get_all_positions()
+        latest = self.dl.prices.get_latest_prices({p.get("asset_type") for p in positions if p.get("asset_type")})
+        weights = dict(ModifierStore.for_locker(self.dl).weights)
+        shards = partition_positions(positions)
+
+        results = self.map(_run_position_shard, [(rows, latest, weights) for rows in shards.values()])
+        enriched = [p for r in results for p in r["enriched"]]
+        failed = [pid for r in results for pid in r["failed"]]
+
+        enriched_at = PositionEnrichmentService(self.dl).persist(enriched)
+        for pos in enriched:
+            pos["enriched_at"] = enriched_at
+        if failed:
+            log.warning("⚠️ Some positions failed enrichment validation", source="CycloneShards",
+                        payload={"invalid_ids": failed})
+        self._stats("enrich_positions", started, shards=len(shards), enriched=len(enriched), failed=len(failed))
+        return enriched
+
+    def link_hedges(self) -> list:
+        started = time.perf_counter()
+        shards = partition_positions(self.dl.positions.get_all_positions())
+        groups = [g for r in self.map(_run_hedge_link_shard, shards.values()) for g in r]
+
+        rows = []
+        for group in groups:
+            hedge_id = str(uuid4())
+            rows.extend((hedge_id, pos_id) for pos_id in group)
+        if rows:
+            cursor = self.dl.db.get_cursor()
+            cursor.executemany("UPDATE positions SET hedge_buddy_id = ? WHERE id = ?", rows)
+            self.dl.db.commit()
+        self._stats("link_hedges", started, shards=len(shards), groups=len(groups))
+        return groups
+
+    def update_hedges(self) -> list:
+        started = time.perf_counter()
+        # Relink first, like HedgeCore.update_hedges, so groups reflect new positions
+        self.link_hedges()
+        shards = partition_positions(self.dl.positions.get_all_positions())
+        hedges = [h for r in self.map(_run_hedge_build_shard, shards.values()) for h in r]
+        self._stats("update_hedges", started, shards=len(shards), hedges=len(hedges))
+        return hedges
+
+    async def process_alerts(self, alert_core, evaluate: bool = True, write: str = "evaluation") -> list:
+        """Enrich/evaluate active alerts per wallet shard and write the results once.
+
+        ``write`` is ``"evaluation"`` (level + value, only changed rows),
+        ``"values"`` (evaluated_value only) or ``None`` (enrich only).
+        """
+        started = time.perf_counter()
+        alerts = await asyncio.to_thread(alert_core.repo.get_active_alerts)
+        if not alerts:
+            log.warning("⚠️ No active alerts found", source="CycloneShards")
+            return []
+
+        positions = await asyncio.to_thread(self.dl.positions.get_all_positions)
+        shards = partition_alerts(alerts, {p["id"]: p.get("wallet_name") for p in positions})
+        if write == "evaluation":
+            alert_core.evaluator.snapshot_alerts(alerts)
+
+        tasks = [(self.db_path, shard, evaluate) for shard in shards.values()]
+        results = [a for r in await asyncio.to_thread(self.map, _run_alert_shard, tasks) for a in r]
+
+        if write == "evaluation":
+            for alert in results:
+                alert_core.evaluator.queue_alert_update(alert)
+            alert_core.last_write_stats = await asyncio.to_thread(alert_core.evaluator.flush_alert_updates)
+        elif write == "values":
+            await asyncio.to_thread(self._write_evaluated_values, results)
+
+        self._stats(f"alerts:{write or 'enrich'}", started, shards=len(shards), alerts=len(results))
+        return results
+
+    def _write_evaluated_values(self, alerts: list):
+        cursor = self.dl.db.get_cursor()
+        cursor.executemany(
+            "UPDATE alerts SET evaluated_value = ? WHERE id = ?",
+            [(a.evaluated_value, a.id) for a in alerts],
+        )
+        self.dl.db.commit()
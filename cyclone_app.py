@@ -53,6 +53,7 @@ async def step_engine_menu():
         ("market_updates", cyclone.run_market_updates),
         ("check_jupiter_for_updates", cyclone.run_check_jupiter_for_updates),
         ("enrich_positions", cyclone.run_enrich_positions),
+        ("position_risk", cyclone.run_position_risk),
         ("enrich_alerts", cyclone.run_alert_enrichment),
         ("update_evaluated_value", cyclone.run_update_evaluated_value),
         ("create_portfolio_alerts", cyclone.run_create_portfolio_alerts),
@@ -204,31 +204,65 @@ def get_profit_badge_value(data_locker, system_core=None):
 
     If a Profit threshold exists, its ``low`` value is used as the minimum
     qualifying profit.  When no threshold is found, ``0`` is used so the badge
-    still appears when any position is in profit.
+    still appears when any position is in profit.  This runs on every
+    template render, so it is a single aggregate query.
     """
     try:
-        threshold_service = ThresholdService(data_locker.db)
-        profit_threshold = threshold_service.get_thresholds(
-            "Profit", "Position", "ABOVE"
-        )
-        low_limit = profit_threshold.low if profit_threshold else 0
-
-        positions = PositionCore(data_locker).get_active_positions() or []
-        profits = [float(p.get("pnl_after_fees_usd") or 0.0) for p in positions]
-        above = [p for p in profits if p >= low_limit]
-        if above:
-            return round(max(above))
+        top = data_locker.positions.get_top_active_profit("Profit")
+        if top is not None:
+            return round(float(top))
     except Exception as e:
         log.error(f"Profit badge calc failed: {e}", source="ProfitBadge")
     return None
 
+def build_graph_data(data_locker, totals=None):
+    """Portfolio history series for the dashboard line chart.
+
+    ``totals`` defaults to the running portfolio aggregates of the stored
+    active positions; unlike :func:`get_dashboard_context` this does not
+    re-aggregate positions.
+    """
+    if totals is None:
+        totals = data_locker.portfolio_aggregates.get_totals()
+
+    # Build graph data from portfolio snapshots
+    snapshots = data_locker.portfolio.get_snapshots() or []
+    timestamps = []
+    values = []
+    collateral = []
+
+    for snap in snapshots:
+        timestamps.append(snap.get("snapshot_time"))
+        values.append(int(round(float(snap.get("total_value", 0)))) )
+        collateral.append(int(round(float(snap.get("total_collateral", 0)))) )
+
+    current_value_int = int(round(totals["total_value"]))
+    if values:
+        if values[-1] != current_value_int:
+            values[-1] = current_value_int
+
+    current_collateral_int = int(round(totals["total_collateral"]))
+    if collateral:
+        if collateral[-1] != current_collateral_int:
+            collateral[-1] = current_collateral_int
+
+    graph_data = {
+        "timestamps": timestamps,
+        "values": values,
+        "collateral": collateral,
+    }
+
+    return graph_data
+
+
 def get_dashboard_context(data_locker, system_core=None):
 
     log.info("📊 Assembling dashboard context", source="DashboardContext")
     core = CalculationCore(data_locker)
     positions = PositionCore(data_locker).get_active_positions() or []
     positions = core.aggregate_positions_and_update(positions, DB_PATH)
-    totals = core.calc_services.calculate_totals(positions)
+    # The aggregation writes above keep the running sums current
+    totals = data_locker.portfolio_aggregates.get_totals()
 
     for pos in positions:
         wallet_name = pos.get("wallet") or pos.get("wallet_name") or "Unknown"
@@ -299,32 +333,7 @@ def get_dashboard_context(data_locker, system_core=None):
     monitor_items = [item for item in universal_items if item["title"] in monitor_titles]
     status_items = [item for item in universal_items if item["title"] not in monitor_titles]
 
-    # Build graph data from portfolio snapshots
-    snapshots = data_locker.portfolio.get_snapshots() or []
-    timestamps = []
-    values = []
-    collateral = []
-
-    for snap in snapshots:
-        timestamps.append(snap.get("snapshot_time"))
-        values.append(int(round(float(snap.get("total_value", 0)))) )
-        collateral.append(int(round(float(snap.get("total_collateral", 0)))) )
-
-    current_value_int = int(round(totals["total_value"]))
-    if values:
-        if values[-1] != current_value_int:
-            values[-1] = current_value_int
-
-    current_collateral_int = int(round(totals["total_collateral"]))
-    if collateral:
-        if collateral[-1] != current_collateral_int:
-            collateral[-1] = current_collateral_int
-
-    graph_data = {
-        "timestamps": timestamps,
-        "values": values,
-        "collateral": collateral,
-    }
+    graph_data = build_graph_data(data_locker, totals)
 
     long_total = sum(float(p.get("size", 0)) for p in positions if str(p.get("position_type", "")).upper() == "LONG")
     short_total = sum(float(p.get("size", 0)) for p in positions if str(p.get("position_type", "")).upper() == "SHORT")
@@ -342,10 +351,20 @@ def get_dashboard_context(data_locker, system_core=None):
         if total_collat > 0 else {"series": [0, 0], "label": "No collateral data"}
     )
 
+    # Latest Monte Carlo estimates, riskiest first
+    liquidation_risk = []
+    risk_manager = getattr(data_locker, "position_risk", None)
+    if risk_manager is not None:
+        for row in risk_manager.get_all(limit=8):
+            row["wallet_image"] = WALLET_IMAGE_MAP.get(row.get("wallet_name") or "Unknown", DEFAULT_WALLET_IMAGE)
+            row["probability_pct"] = round(float(row.get("liquidation_probability") or 0.0) * 100, 1)
+            liquidation_risk.append(row)
+
     return {
         "theme_mode": data_locker.system.get_theme_mode(),
         "positions": positions,
         "liquidation_positions": positions,
+        "liquidation_risk": liquidation_risk,
         "portfolio_value": "${:,.2f}".format(totals["total_value"]),
         "portfolio_change": "N/A",
         "totals": totals,
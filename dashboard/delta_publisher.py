@@ -0,0 +1,209 @@
+"""
+Author: BubbaDiego
+Module: delta_publisher.py
+Description:
+    Push-based dashboard updates.  ``DeltaPublisher`` runs wherever data
+    changes (Cyclone, price sync) and appends only what changed since its
+    last publish to the ``ui_events`` table.  ``DeltaBroadcaster`` runs in the
+    web process, tails that table and emits each event to the SocketIO room
+    named after its topic.  Work per update is proportional to the number of
+    changes, not the number of connected clients.
+
+    Topics: ``prices``, ``positions``, ``alerts``, ``ledger`` — the same names
+    as the ``DataLocker.changes`` topics, so a topic whose generation has not
+    moved since the last publish is skipped without building a snapshot.
+
+    Record topics (positions, alerts) carry only the fields that changed, and
+    ``structural`` is set when rows came or went or a field outside
+    ``LIVE_FIELDS`` moved.  Pages patch live fields in place and reload only
+    for structural deltas, so price ticks never trigger a reload.
+"""
+
+import threading
+
+from core.logging import log
+
+PRICE_ASSETS = ("BTC", "ETH", "SOL", "SP500")
+POSITION_FIELDS = (
+    "asset_type", "position_type", "wallet_name", "size", "value", "collateral", "leverage",
+    "travel_percent", "heat_index", "current_price", "pnl_after_fees_usd", "liquidation_distance",
+)
+# Fields that move with every price tick
+LIVE_FIELDS = {
+    "positions": {
+        "value", "leverage", "travel_percent", "heat_index", "current_price",
+        "pnl_after_fees_usd", "liquidation_distance",
+    },
+    "alerts": {"evaluated_value"},
+}
+LEDGER_MONITORS = {"price": "price_monitor", "positions": "position_monitor", "cyclone": "sonic_monitor"}
+TOPICS = ("prices", "positions", "alerts", "ledger")
+
+
+def _diff(previous: dict, current: dict) -> dict:
+    changed = {k: v for k, v in current.items() if previous.get(k) != v}
+    removed = [k for k in previous if k not in current]
+    return {"changed": changed, "removed": removed} if changed or removed else {}
+
+
+def _record_diff(previous: dict, current: dict, live_fields) -> dict:
+    """Like ``_diff`` but per field; new rows are sent whole."""
+    delta = _diff(previous, current)
+    if not delta:
+        return delta
+    structural = bool(delta["removed"])
+    for key, record in delta["changed"].items():
+        old = previous.get(key)
+        if old is not None:
+            record = delta["changed"][key] = {f: v for f, v in record.items() if old.get(f) != v}
+        structural = structural or old is None or bool(set(record) - live_fields)
+    delta["structural"] = structural
+    return delta
+
+
+class DeltaPublisher:
+    """Compute and publish per-topic deltas against the last published state."""
+
+    _instances = {}
+    _lock = threading.Lock()
+
+    def __init__(self, data_locker):
+        self.dl = data_locker
+        self._state = {topic: None for topic in TOPICS}
+        self._generations = {}
+        self._publish_lock = threading.Lock()
+
+    @classmethod
+    def for_locker(cls, data_locker) -> "DeltaPublisher":
+        key = id(data_locker)
+        with cls._lock:
+            publisher = cls._instances.get(key)
+            if publisher is None or publisher.dl is not data_locker:
+                publisher = cls._instances[key] = cls(data_locker)
+            return publisher
+
+    # --- snapshots -------------------------------------------------------
+    def _prices(self) -> dict:
+        rows = self.dl.prices.get_latest_prices(PRICE_ASSETS)
+        return {a: float(r["current_price"]) for a, r in rows.items() if r.get("current_price") is not None}
+
+    def _positions(self) -> dict:
+        return {
+            p["id"]: {f: p.get(f) for f in POSITION_FIELDS}
+            for p in self.dl.positions.get_active_positions()
+        }
+
+    def _alerts(self) -> dict:
+        return {
+            a["id"]: {"level": a.get("level"), "evaluated_value": a.get("evaluated_value")}
+            for a in self.dl.alerts.get_all_alerts()
+        }
+
+    def _ledger(self) -> dict:
+        # Timestamps only; clients derive ages locally so this changes only
+        # when a monitor actually runs.
+        return {key: self.dl.ledger.get_status(name).get("last_timestamp")
+                for key, name in LEDGER_MONITORS.items()}
+
+    # --- publishing ------------------------------------------------------
+    def publish(self, topic: str) -> dict:
+        """Publish the delta for ``topic``; returns it (empty if unchanged)."""
+        builder = getattr(self, f"_{topic}")
+        changes = getattr(self.dl, "changes", None)
+        with self._publish_lock:
+            generation = changes.generation(topic) if changes is not None else None
+            if generation is not None and self._generations.get(topic) == generation:
+                return {}
+            try:
+                current = builder()
+            except Exception as e:
+                log.error(f"❌ Delta snapshot failed for {topic}: {e}", source="DeltaPublisher")
+                return {}
+            self._generations[topic] = generation
+            previous = self._state[topic]
+            if topic in LIVE_FIELDS:
+                delta = _record_diff(previous or {}, current, LIVE_FIELDS[topic])
+            else:
+                delta = _diff(previous or {}, current)
+            if previous is None:
+                delta["full"] = True
+            self._state[topic] = current
+            if delta.get("changed") or delta.get("removed"):
+                self.dl.ui_events.append(topic, delta)
+                return delta
+            return {}
+
+    def publish_prices(self) -> dict:
+        return self.publish("prices")
+
+    def publish_all(self) -> dict:
+        published = {topic: self.publish(topic) for topic in TOPICS}
+        counts = {t: len(d.get("changed", {})) + len(d.get("removed", [])) for t, d in published.items()}
+        log.debug("Dashboard deltas published", source="DeltaPublisher", payload=counts)
+        return published
+
+
+class DeltaBroadcaster:
+    """Tail ``ui_events`` and emit new rows to SocketIO rooms."""
+
+    def __init__(self, socketio, data_locker, interval: float = 1.0, batch: int = 200):
+        self.socketio = socketio
+        self.dl = data_locker
+        self.interval = interval
+        self.batch = batch
+        self.last_seq = None
+        self._started = False
+
+    def poll_once(self) -> int:
+        """Emit any events newer than the last seen sequence."""
+        if self.last_seq is None:
+            # Only push changes that happen after start-up; clients load the
+            # initial state through the normal page/API requests.
+            self.last_seq = self.dl.ui_events.latest_seq()
+            return 0
+        events = self.dl.ui_events.since(self.last_seq, self.batch)
+        for event in events:
+            self.socketio.emit(
+                event["topic"],
+                {"seq": event["seq"], **event["payload"]},
+                to=event["topic"],
+            )
+            self.last_seq = event["seq"]
+        return len(events)
+
+    def _run(self):
+        while True:
+            try:
+                self.poll_once()
+            except Exception as e:
+                log.error(f"❌ Delta broadcast failed: {e}", source="DeltaBroadcaster")
+            self.socketio.sleep(self.interval)
+
+    def start(self):
+        if self._started or not hasattr(self.socketio, "start_background_task"):
+            return False
+        self._started = True
+        self.socketio.start_background_task(self._run)
+        log.info("📡 Dashboard delta broadcaster started", source="DeltaBroadcaster")
+        return True
+
+
+def register_socket_handlers(socketio):
+    """Let clients subscribe to delta topics (one room per topic)."""
+    if not hasattr(socketio, "on"):
+        return False
+    from flask_socketio import join_room, leave_room
+
+    @socketio.on("subscribe")
+    def _subscribe(data):
+        for topic in (data or {}).get("topics", TOPICS):
+            if topic in TOPICS:
+                join_room(topic)
+
+    @socketio.on("unsubscribe")
+    def _unsubscribe(data):
+        for topic in (data or {}).get("topics", []):
+            if topic in TOPICS:
+                leave_room(topic)
+
+    return True
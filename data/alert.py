@@ -24,6 +24,7 @@ class AlertType(str, Enum):
     Profit = "Profit"
     TravelPercentLiquid = "TravelPercentLiquid"
     DeathNail = "DeathNail"
+    LiquidationRisk = "LiquidationRisk"
 
     # 📈 Market-level alert types
     PriceThreshold = "PriceThreshold"
@@ -0,0 +1,142 @@
+# async_data_locker.py
+"""
+Author: BubbaDiego
+Module: AsyncDataLocker
+Description:
+    Asyncio facade over ``DataLocker`` for the alert pipeline.  All blocking
+    sqlite work is pushed onto one dedicated worker thread so the event loop
+    stays free for network I/O (notifications), and per-alert lookups are
+    replaced by batched queries that prefetch everything a batch needs.
+
+Dependencies:
+    - DataLocker (positions, prices, wallets managers)
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from core.core_imports import log
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Return the process-wide single-thread executor used for DB calls."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dl-async")
+        return _executor
+
+
+class AlertContextSnapshot:
+    """Read-only view of prefetched rows exposing the DataLocker lookups
+    used during alert enrichment.  Misses fall through to the real locker."""
+
+    def __init__(self, data_locker, positions=None, prices=None, wallets=None):
+        self._dl = data_locker
+        self.positions = positions or {}
+        self.prices = prices or {}
+        self.wallets = wallets or {}
+
+    def holds(self, method: str, key) -> bool:
+        """True when ``method(key)`` is answered from the prefetched rows."""
+        table = {
+            "get_position_by_reference_id": self.positions,
+            "get_latest_price": self.prices,
+            "get_wallet_by_name": self.wallets,
+        }.get(method)
+        return table is not None and key in table
+
+    def get_position_by_reference_id(self, pos_id):
+        if pos_id in self.positions:
+            return self.positions[pos_id]
+        return self._dl.get_position_by_reference_id(pos_id)
+
+    def get_latest_price(self, asset_type):
+        if asset_type in self.prices:
+            return self.prices[asset_type]
+        return self._dl.get_latest_price(asset_type)
+
+    def get_wallet_by_name(self, name):
+        if name in self.wallets:
+            return self.wallets[name]
+        return self._dl.get_wallet_by_name(name)
+
+    def __getattr__(self, item):
+        return getattr(self._dl, item)
+
+
+class AsyncDataLocker:
+    """Run DataLocker work on the dedicated DB executor."""
+
+    def __init__(self, data_locker, executor: ThreadPoolExecutor = None):
+        self.dl = data_locker
+        self._executor = executor
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return self._executor or get_db_executor()
+
+    async def run(self, fn, *args, **kwargs):
+        """Execute ``fn`` on the DB executor and await its result.
+
+        ``fn`` runs in a copy of the caller's context so the active cycle
+        step and SQL trace scope still see its queries.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.executor, ctx.run, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def get_positions_by_ids(self, pos_ids) -> dict:
+        return await self.run(self.dl.positions.get_positions_by_ids, pos_ids)
+
+    async def get_latest_prices(self, assets) -> dict:
+        return await self.run(self.dl.prices.get_latest_prices, assets)
+
+    async def get_wallets_by_names(self, names) -> dict:
+        names = set(n for n in names if n)
+        if not names:
+            return {}
+
+        def _load():
+            return {w["name"]: w for w in self.dl.wallets.get_wallets() if w.get("name") in names}
+
+        return await self.run(_load)
+
+    async def prefetch_alert_context(self, alerts) -> AlertContextSnapshot:
+        """Load every position, price and wallet a batch of alerts needs.
+
+        Runs three batched queries instead of one or more per alert.
+        """
+        pos_ids = [a.position_reference_id for a in alerts if getattr(a, "position_reference_id", None)]
+        positions = await self.get_positions_by_ids(pos_ids)
+
+        assets = {getattr(a, "asset", None) for a in alerts}
+        assets.update(p.get("asset_type") for p in positions.values())
+        prices = await self.get_latest_prices([a for a in assets if a])
+
+        wallet_names = {p.get("wallet_name") for p in positions.values() if p.get("wallet_name")}
+        wallets = await self.get_wallets_by_names(wallet_names)
+
+        log.debug(
+            "Prefetched alert context",
+            source="AsyncDataLocker",
+            payload={"positions": len(positions), "prices": len(prices), "wallets": len(wallets)},
+        )
+        # Record known misses too so lookups for them don't fall through to the DB
+        return AlertContextSnapshot(
+            self.dl,
+            {pid: positions.get(pid) for pid in pos_ids},
+            {a: prices.get(a, {}) for a in assets if a},
+            {n: wallets.get(n) for n in wallet_names},
+        )
+
+    async def get_var(self, key):
+        return await self.run(self.dl.system.get_var, key)
@@ -26,6 +26,13 @@ from data.dl_portfolio import DLPortfolioManager
 from data.dl_system_data import DLSystemDataManager
 from data.dl_monitor_ledger import DLMonitorLedgerManager
 from data.dl_modifiers import DLModifierManager
+from data.dl_ui_events import DLUiEventManager
+from data.dl_cycle_metrics import DLCycleMetricsManager
+from data.dl_death_events import DLDeathEventManager
+from data.dl_portfolio_aggregates import DLPortfolioAggregateManager
+from data.dl_position_risk import DLPositionRiskManager
+from data.dl_table_versions import DLTableVersionManager
+from data.dl_change_bus import DLChangeBus
 from data.dl_hedges import DLHedgeManager
 
 from core.constants import (
@@ -37,6 +44,7 @@ from core.constants import (
 )
 
 from core.core_imports import log
+from utils.log_tail import tail_lines
 from system.death_nail_service import DeathNailService
 from datetime import datetime
 
@@ -56,9 +64,16 @@ class DataLocker:
         self.wallets = DLWalletManager(self.db)
         self.brokers = DLBrokerManager(self.db)
         self.portfolio = DLPortfolioManager(self.db)
+        self.portfolio_aggregates = DLPortfolioAggregateManager(self.db)
         self.system = DLSystemDataManager(self.db)
         self.ledger = DLMonitorLedgerManager(self.db)
         self.modifiers = DLModifierManager(self.db)
+        self.ui_events = DLUiEventManager(self.db)
+        self.cycle_metrics = DLCycleMetricsManager(self.db)
+        self.death_events = DLDeathEventManager(self.db)
+        self.position_risk = DLPositionRiskManager(self.db)
+        self.table_versions = DLTableVersionManager(self.db)
+        self.changes = DLChangeBus(self.db, self.table_versions)
 
         try:
             self.initialize_database()
@@ -185,7 +200,9 @@ class DataLocker:
                     heat_index REAL,
                     current_heat_index REAL,
                     pnl_after_fees_usd REAL,
-                    status TEXT DEFAULT 'ACTIVE'
+                    status TEXT DEFAULT 'ACTIVE',
+                    enriched_at TEXT,
+                    jupiter_travel_percent REAL
                 )
             """,
             "positions_totals_history": """
@@ -216,7 +233,8 @@ class DataLocker:
                     previous_price REAL,
                     last_update_time TEXT,
                     previous_update_time TEXT,
-                    source TEXT
+                    source TEXT,
+                    epoch_ms INTEGER
                 )
             """,
             "monitor_heartbeat": """
@@ -280,6 +298,32 @@ class DataLocker:
         # --- Automatic schema migrations ---
         log.debug("Applying schema migrations", source="DataLocker")
         _ensure_column(cursor, "positions", "status TEXT DEFAULT 'ACTIVE'")
+        _ensure_column(cursor, "positions", "enriched_at TEXT")
+        _ensure_column(cursor, "positions", "jupiter_travel_percent REAL")
+        _ensure_column(cursor, "prices", "epoch_ms INTEGER")
+        _ensure_column(cursor, "cycle_metrics", "sql_trace TEXT")
+
+        log.debug("Ensuring indexes", source="DataLocker")
+        try:
+            self.prices.ensure_indexes(cursor)
+        except Exception as e:
+            log.error(f"❌ Failed ensuring price indexes: {e}", source="DataLocker")
+        try:
+            self.alerts.ensure_indexes(cursor)
+        except Exception as e:
+            log.error(f"❌ Failed ensuring alert indexes: {e}", source="DataLocker")
+
+        log.debug("Ensuring portfolio aggregates", source="DataLocker")
+        try:
+            self.portfolio_aggregates.ensure_schema(cursor)
+        except Exception as e:
+            log.error(f"❌ Failed ensuring portfolio aggregates: {e}", source="DataLocker")
+
+        log.debug("Ensuring table version counters", source="DataLocker")
+        try:
+            self.table_versions.ensure_schema(cursor)
+        except Exception as e:
+            log.error(f"❌ Failed ensuring table versions: {e}", source="DataLocker")
 
         # Ensure a default row exists for system vars so lookups don't fail
         log.debug("Ensuring system_vars default row", source="DataLocker")
@@ -298,7 +342,7 @@ class DataLocker:
                     source="DataLocker",
                 )
                 try:
-                    DeathNailService(log).trigger({
+                    DeathNailService(log, db_path=self.db.db_path).trigger({
                         "message": "Database initialization failure",
                         "payload": {"error": str(e)},
                     })
@@ -336,15 +380,26 @@ class DataLocker:
             return {}
 
     def get_death_log_entries(self, limit: int = 20) -> list:
-        """Return the most recent entries from the death log file."""
+        """Return the most recent death nail events.
+
+        Reads the indexed ``death_events`` table; the legacy ``death_log.txt``
+        tail is only used when no events have been recorded there yet.
+        """
+        entries = self.death_events.get_recent(limit)
+        if entries:
+            return entries
         path = os.path.join(BASE_DIR, "death_log.txt")
         try:
-            if not os.path.exists(path):
-                return []
-            with open(path, "r", encoding="utf-8") as f:
-                lines = [line.strip() for line in f.readlines() if line.strip()]
-            entries = [json.loads(l) for l in lines]
-            return entries[-limit:]
+            entries = []
+            for line in tail_lines(path, limit):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+            return entries
         except Exception as e:
             log.error(f"❌ Failed to read death log: {e}", source="DataLocker")
             return []
@@ -352,9 +407,7 @@ class DataLocker:
     def get_system_alerts(self, limit: int = 20) -> list:
         """Return recent alerts belonging to the System class."""
         try:
-            alerts = self.alerts.get_all_alerts()
-            system_alerts = [a for a in alerts if a.get("alert_class") == "System"]
-            return system_alerts[:limit]
+            return self.alerts.get_alerts_by_class("System", limit)
         except Exception as e:
             log.error(f"❌ Failed to retrieve system alerts: {e}", source="DataLocker")
             return []
@@ -481,7 +534,7 @@ class DataLocker:
 
                 try:
                     from system.death_nail_service import DeathNailService
-                    DeathNailService(log).trigger({
+                    DeathNailService(log, db_path=self.db.db_path).trigger({
                         "message": "💀 Failed to seed alert thresholds",
                         "level": "HIGH",
                         "payload": {"error": str(e)},
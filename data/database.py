@@ -2,9 +2,67 @@
 
 import sqlite3
 import os
+from pathlib import Path
 from core.core_imports import log
+import time
+from core.cycle_metrics import count_commit, count_query, count_rows_read
+from core.sql_tracer import active_sql_scope, sql_tracing_enabled, trace_statement
 from system.death_nail_service import DeathNailService
 
+_WRITE_VERBS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+class MetricsCursor(sqlite3.Cursor):
+    """Cursor that reports queries and row counts to the active cycle step.
+
+    The bookkeeping is a context-variable lookup when no step is active.
+    """
+
+    def execute(self, sql, parameters=()):
+        scope = active_sql_scope()
+        if scope is None:
+            result = super().execute(sql, parameters)
+        else:
+            start = time.perf_counter()
+            result = super().execute(sql, parameters)
+            scope.add_time((time.perf_counter() - start) * 1000, sql)
+        count_query(self.rowcount if sql.lstrip()[:7].upper().startswith(_WRITE_VERBS) else 0)
+        return result
+
+    def executemany(self, sql, seq_of_parameters):
+        scope = active_sql_scope()
+        if scope is None:
+            result = super().executemany(sql, seq_of_parameters)
+        else:
+            start = time.perf_counter()
+            with scope.suppressed():
+                result = super().executemany(sql, seq_of_parameters)
+            scope.record_batch(sql, self.rowcount, (time.perf_counter() - start) * 1000)
+        count_query(self.rowcount)
+        return result
+
+    def fetchone(self):
+        row = super().fetchone()
+        if row is not None:
+            count_rows_read(1)
+        return row
+
+    def fetchmany(self, size=None):
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        count_rows_read(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = super().fetchall()
+        count_rows_read(len(rows))
+        return rows
+
+    def __next__(self):
+        row = super().__next__()
+        count_rows_read(1)
+        return row
+
+
 class DatabaseManager:
     def __init__(self, db_path: str):
         self.db_path = db_path
@@ -31,7 +89,7 @@ class DatabaseManager:
                                 os.remove(shm)
                         except OSError:
                             pass
-                        DeathNailService(log).trigger({
+                        DeathNailService(log, db_path=self.db_path).trigger({
                             "message": "Database corruption detected during connect",
                             "payload": {"error": str(e), "db": self.db_path},
                         })
@@ -40,6 +98,8 @@ class DatabaseManager:
                         raise
 
                 self.conn.row_factory = sqlite3.Row
+                if sql_tracing_enabled():
+                    self.conn.set_trace_callback(trace_statement)
                 try:
                     self.conn.execute("PRAGMA journal_mode=WAL;")
                 except sqlite3.DatabaseError as e:
@@ -56,7 +116,7 @@ class DatabaseManager:
                                 os.remove(shm)
                         except OSError:
                             pass
-                        DeathNailService(log).trigger({
+                        DeathNailService(log, db_path=self.db_path).trigger({
                             "message": "Database corruption detected during connect",
                             "payload": {"error": str(e), "db": self.db_path},
                         })
@@ -77,7 +137,7 @@ class DatabaseManager:
                 self.conn.close()
             finally:
                 self.conn = None
-        DeathNailService(log).trigger({
+        DeathNailService(log, db_path=self.db_path).trigger({
             "message": "Database recovery triggered",
             "payload": {"db": self.db_path},
         })
@@ -94,11 +154,11 @@ class DatabaseManager:
             conn = self.connect()
             if conn is None:
                 return None
-            return conn.cursor()
+            return conn.cursor(MetricsCursor)
         except sqlite3.DatabaseError as e:
             if "file is not a database" in str(e) or "database disk image is malformed" in str(e):
                 self.recover_database()
-                return self.conn.cursor() if self.conn else None
+                return self.conn.cursor(MetricsCursor) if self.conn else None
             log.error(f"Failed to get cursor: {e}", source="DatabaseManager")
             return None
         except Exception as e:
@@ -110,9 +170,19 @@ class DatabaseManager:
             conn = self.connect()
             if conn:
                 conn.commit()
+                count_commit()
         except Exception as e:
             log.error(f"Commit failed: {e}", source="DatabaseManager")
 
+    def set_sql_tracing(self, enabled: bool = True):
+        """Install or remove the SQL trace callback on the open connection.
+
+        Statements are only recorded inside a ``core.sql_tracer`` scope.
+        """
+        conn = self.connect()
+        if conn:
+            conn.set_trace_callback(trace_statement if enabled else None)
+
     def close(self):
         if self.conn:
             self.conn.close()
@@ -137,3 +207,29 @@ class DatabaseManager:
         cursor.execute(f"SELECT * FROM {table_name}")
         rows = cursor.fetchall()
         return [dict(r) for r in rows]
+
+
+class ReadOnlyDatabaseManager(DatabaseManager):
+    """``DatabaseManager`` over a ``mode=ro`` connection for worker processes.
+
+    Any write raises ``sqlite3.OperationalError``; there is no schema setup
+    and corruption is reported instead of "recovered" by deleting the file.
+    """
+
+    def connect(self):
+        if self.conn is None:
+            try:
+                uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+                self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+                self.conn.row_factory = sqlite3.Row
+                if sql_tracing_enabled():
+                    self.conn.set_trace_callback(trace_statement)
+            except Exception as e:
+                log.error(f"❌ Failed to open read-only database: {e}", source="DatabaseManager")
+                self.conn = None
+        return self.conn
+
+    def recover_database(self):
+        log.error("❌ Read-only database looks corrupt; leaving it to the writer", source="DatabaseManager",
+                  payload={"db": self.db_path})
+        self.close()
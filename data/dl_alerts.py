@@ -1,4 +1,5 @@
 from core.core_imports import log
+from data.dl_paging import filter_clauses, keyset_page
 # dl_alerts.py
 """
 Author: BubbaDiego
@@ -14,11 +15,52 @@ Dependencies:
 """
 
 
+def _wallet_clause(values):
+    placeholders = ",".join("?" for _ in values)
+    return (
+        f"position_reference_id IN (SELECT id FROM positions WHERE wallet_name COLLATE NOCASE IN ({placeholders}))",
+        values,
+    )
+
+
 class DLAlertManager:
+    # Query-string filter → column (or clause builder) for ``query_alerts``
+    FILTER_COLUMNS = {
+        "status": "status",
+        "class": "alert_class",
+        "level": "level",
+        "type": "alert_type",
+        "asset": "asset_type",
+        "wallet": _wallet_clause,
+    }
+    # Backed by ``idx_alerts_page``; ``created_at`` is kept non-NULL by ``ensure_indexes``
+    PAGE_ORDER = (("created_at", "DESC"), ("id", "DESC"))
+
     def __init__(self, db):
         self.db = db
         log.debug("DLAlertManager initialized.", source="DLAlertManager")
 
+    def ensure_indexes(self, cursor=None):
+        """Create the paging index and keep ``created_at`` non-NULL for it."""
+        cursor = cursor or self.db.get_cursor()
+        # Legacy rows sort after every dated alert, as NULL did
+        backfilled = cursor.execute(
+            "UPDATE alerts SET created_at = '1970-01-01T00:00:00' WHERE created_at IS NULL"
+        ).rowcount
+        if backfilled:
+            log.info(f"Backfilled created_at on {backfilled} alert rows", source="DLAlertManager")
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_alerts_created_at AFTER INSERT ON alerts
+            WHEN NEW.created_at IS NULL
+            BEGIN
+                UPDATE alerts SET created_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')
+                WHERE id = NEW.id;
+            END
+            """
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_alerts_page ON alerts(created_at, id)")
+
     def create_alert(self, alert: dict) -> bool:
         try:
             cursor = self.db.get_cursor()
@@ -78,6 +120,39 @@ class DLAlertManager:
             log.error(f"Failed to retrieve all alerts: {e}", source="DLAlertManager")
             return []
 
+    def query_alerts(self, filters: dict = None, after: str = None, limit: int = None):
+        """Filtered page of alerts, newest first; returns ``(alerts, next_cursor)``.
+
+        ``filters`` keys are those of ``FILTER_COLUMNS``; ``wallet`` matches
+        the wallet of the alert's position.  Raises ``ValueError`` for a
+        malformed ``after`` cursor.
+        """
+        clauses = filter_clauses(filters, self.FILTER_COLUMNS)
+        return keyset_page(self.db.get_cursor(), "alerts", self.PAGE_ORDER, clauses, after, limit)
+
+    def get_recent_alerts(self, limit: int = 20) -> list:
+        """Return the ``limit`` most recently created alerts."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute("SELECT * FROM alerts ORDER BY created_at DESC LIMIT ?", (int(limit),))
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            log.error(f"Failed to retrieve recent alerts: {e}", source="DLAlertManager")
+            return []
+
+    def get_alerts_by_class(self, alert_class: str, limit: int = 20) -> list:
+        """Return the most recent alerts of ``alert_class``."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute(
+                "SELECT * FROM alerts WHERE alert_class = ? ORDER BY created_at DESC LIMIT ?",
+                (alert_class, int(limit)),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            log.error(f"Failed to retrieve {alert_class} alerts: {e}", source="DLAlertManager")
+            return []
+
     def clear_all_alerts(self) -> None:
         cursor = self.db.get_cursor()
         cursor.execute("DELETE FROM alerts")
@@ -0,0 +1,147 @@
+# dl_change_bus.py
+"""
+Author: BubbaDiego
+Module: DLChangeBus
+Description:
+    Per-topic change generations so readers can tell whether data changed
+    before recomputing anything.
+
+    A topic (``positions``, ``prices``, ``alerts``, ``thresholds``,
+    ``modifiers``, ``ledger``, ``portfolio``, ``wallets``) covers one or more
+    tables.  Its generation is the sum of their ``table_versions`` counters,
+    which SQLite triggers bump on every write, so it only ever grows — no
+    matter which DL manager, connection or process (e.g. ``sonic_monitor``)
+    made the change.
+
+    Checking is cheap: ``PRAGMA data_version`` (commits from other
+    connections) and ``total_changes`` (writes on this connection) are
+    compared first, and the counters are re-read only when either moved.
+    Callers either compare generations themselves (``generations``,
+    ``token``, ``changed_since``) or ``subscribe`` a callback that ``poll``
+    invokes with the topics that changed.
+"""
+
+import hashlib
+import threading
+
+from core.core_imports import log
+
+TOPIC_TABLES = {
+    "positions": ("positions",),
+    "prices": ("prices",),
+    "alerts": ("alerts",),
+    "thresholds": ("alert_thresholds",),
+    "modifiers": ("modifiers",),
+    "ledger": ("monitor_ledger",),
+    "portfolio": ("positions_totals_history", "portfolio_aggregates"),
+    "wallets": ("wallets",),
+}
+TOPICS = tuple(TOPIC_TABLES)
+
+
+class DLChangeBus:
+    def __init__(self, db, table_versions):
+        self.db = db
+        self.table_versions = table_versions
+        self._lock = threading.RLock()
+        self._stamp = None
+        self._versions = {}
+        self._polled = None
+        self._subscribers = {}
+        self._next_handle = 0
+        log.debug("DLChangeBus initialized.", source="DLChangeBus")
+
+    def _refresh(self) -> dict:
+        """Current ``table_versions`` rows, re-read only after a write."""
+        with self._lock:
+            try:
+                conn = self.db.connect()
+                # Uncommitted writes may still roll back; publish on commit only
+                if conn is None or conn.in_transaction:
+                    return self._versions
+                stamp = (conn, conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes)
+                if stamp != self._stamp:
+                    tables = {t for tables in TOPIC_TABLES.values() for t in tables}
+                    versions = self.table_versions.get_versions(tables)
+                    if versions:
+                        self._versions, self._stamp = versions, stamp
+            except Exception as e:
+                log.error(f"❌ Failed to check for changes: {e}", source="DLChangeBus")
+            return self._versions
+
+    def generations(self, topics=TOPICS) -> dict:
+        """``{topic: generation}`` for ``topics``."""
+        versions = self._refresh()
+        return {
+            topic: sum(versions.get(t, {}).get("version", 0) for t in TOPIC_TABLES[topic])
+            for topic in topics
+        }
+
+    def generation(self, topic: str) -> int:
+        return self.generations([topic])[topic]
+
+    def token(self, topics=TOPICS) -> tuple:
+        """Hashable snapshot of ``topics``; equal tokens mean nothing changed."""
+        generations = self.generations(sorted(topics))
+        return tuple(generations.items())
+
+    def changed_since(self, since: dict, topics=None) -> dict:
+        """``{topic: generation}`` for topics that moved past ``since``."""
+        current = self.generations(topics or since.keys() or TOPICS)
+        return {t: g for t, g in current.items() if since.get(t) != g}
+
+    def modified_at(self, topics=TOPICS) -> float:
+        """Epoch seconds of the latest write to any of ``topics``."""
+        versions = self._refresh()
+        return max(
+            (float(versions.get(t, {}).get("modified_at") or 0.0) for topic in topics for t in TOPIC_TABLES[topic]),
+            default=0.0,
+        )
+
+    def validators(self, topics, salt: str = ""):
+        """``(etag, last_modified)`` for a response built from ``topics``.
+
+        Same contract as :meth:`DLTableVersionManager.validators`, served
+        from the cached counters while nothing was written.
+        """
+        topics = sorted(topics)
+        if not self._refresh():
+            return None, None
+        key = ";".join(f"{t}={g}" for t, g in self.token(topics))
+        etag = hashlib.sha1(f"{key}|{salt}".encode()).hexdigest()[:20]
+        return etag, self.modified_at(topics)
+
+    # --- subscriptions ---------------------------------------------------
+    def subscribe(self, callback, topics=TOPICS) -> int:
+        """Call ``callback({topic: generation})`` from :meth:`poll` when ``topics`` change."""
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._subscribers[handle] = (callback, self.generations(topics))
+            return handle
+
+    def unsubscribe(self, handle: int):
+        with self._lock:
+            self._subscribers.pop(handle, None)
+
+    def poll(self) -> dict:
+        """Notify subscribers of changes since the last poll; returns the changed topics."""
+        with self._lock:
+            current = self.generations()
+            changed = current if self._polled is None else {
+                t: g for t, g in current.items() if self._polled.get(t) != g
+            }
+            self._polled = current
+            due = []
+            for handle, (callback, seen) in list(self._subscribers.items()):
+                moved = {t: current[t] for t in seen if seen[t] != current[t]}
+                if moved:
+                    self._subscribers[handle] = (callback, {t: current[t] for t in seen})
+                    due.append((callback, moved))
+
+        for callback, moved in due:
+            try:
+                callback(moved)
+            except Exception as e:
+                log.error(f"❌ Change subscriber failed: {e}", source="DLChangeBus", payload={"topics": sorted(moved)})
+        return changed
@@ -0,0 +1,215 @@
+import json
+from core.logging import log
+from core.cycle_metrics import COUNTER_FIELDS, CycleMetricsRecorder
+
+METRIC_FIELDS = ("wall_ms", "cpu_ms") + COUNTER_FIELDS
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def percentile(values: list, q: float) -> float:
+    """Linear-interpolated percentile of ``values`` (``q`` in 0..1)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q
+    low = int(pos)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (pos - low)
+
+
+class DLCycleMetricsManager:
+    """Stores per-step metrics for each Cyclone cycle.
+
+    One row per step plus a ``cycle`` row holding the cycle totals.  When
+    SQL tracing is on, ``sql_trace`` holds the step's statement summary and
+    N+1 candidates.
+    """
+
+    MAX_CYCLES = 2000
+
+    def __init__(self, db):
+        self.db = db
+        self.ensure_table()
+
+    def ensure_table(self):
+        cursor = self.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, cycle_metrics table not created", source="DLCycleMetrics")
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS cycle_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                cycle_id TEXT NOT NULL,
+                source TEXT,
+                step TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                wall_ms REAL,
+                cpu_ms REAL,
+                queries INTEGER,
+                rows_read INTEGER,
+                rows_written INTEGER,
+                commits INTEGER,
+                http_calls INTEGER,
+                success INTEGER,
+                error TEXT,
+                timers TEXT,
+                sql_trace TEXT
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cycle_metrics_step ON cycle_metrics(step, id)"
+        )
+        self.db.commit()
+        log.debug("cycle_metrics table ensured", source="DLCycleMetrics")
+
+    def record(self, recorder: CycleMetricsRecorder, include_total: bool = True) -> int:
+        """Persist ``recorder``'s steps (and totals); returns rows written.
+
+        ``include_total=False`` is used for traced HTTP requests so they stay
+        out of the per-cycle percentiles.
+        """
+        steps = ([recorder.total()] if include_total else []) + list(recorder.steps)
+        rows = [
+            (
+                recorder.cycle_id, recorder.source, s.name, s.started_at,
+                round(s.wall_ms, 3), round(s.cpu_ms, 3),
+                *[getattr(s, f) for f in COUNTER_FIELDS],
+                1 if s.success else 0, s.error,
+                json.dumps(s.timers) if s.timers else None,
+                json.dumps(s.sql_trace) if s.sql_trace else None,
+            )
+            for s in steps
+        ]
+        try:
+            cursor = self.db.get_cursor()
+            cursor.executemany(
+                """
+                INSERT INTO cycle_metrics (
+                    cycle_id, source, step, started_at, wall_ms, cpu_ms,
+                    queries, rows_read, rows_written, commits, http_calls,
+                    success, error, timers, sql_trace
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            last_id = cursor.lastrowid or 0
+            if last_id and last_id % 500 < len(rows):
+                # Keep roughly MAX_CYCLES cycles worth of rows
+                cursor.execute(
+                    "DELETE FROM cycle_metrics WHERE id <= ?",
+                    (last_id - self.MAX_CYCLES * len(rows),),
+                )
+            self.db.commit()
+            return len(rows)
+        except Exception as e:
+            log.error(f"❌ Failed to record cycle metrics: {e}", source="DLCycleMetrics")
+            return 0
+
+    def get_recent(self, limit: int = 50, step: str = None) -> list:
+        try:
+            cursor = self.db.get_cursor()
+            if step:
+                cursor.execute(
+                    "SELECT * FROM cycle_metrics WHERE step = ? ORDER BY id DESC LIMIT ?",
+                    (step, limit),
+                )
+            else:
+                cursor.execute("SELECT * FROM cycle_metrics ORDER BY id DESC LIMIT ?", (limit,))
+            rows = [dict(r) for r in cursor.fetchall()]
+            for row in rows:
+                row["success"] = bool(row["success"])
+                row["timers"] = json.loads(row["timers"]) if row.get("timers") else {}
+                row["sql_trace"] = json.loads(row["sql_trace"]) if row.get("sql_trace") else None
+            return rows
+        except Exception as e:
+            log.error(f"❌ Failed to read cycle metrics: {e}", source="DLCycleMetrics")
+            return []
+
+    def get_n_plus_one(self, limit: int = 20) -> list:
+        """N+1 candidates from the most recent traced steps."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute(
+                """
+                SELECT cycle_id, step, started_at, sql_trace FROM cycle_metrics
+                WHERE sql_trace IS NOT NULL AND step != ?
+                ORDER BY id DESC LIMIT ?
+                """,
+                (CycleMetricsRecorder.TOTAL_STEP, limit),
+            )
+            found = []
+            for row in cursor.fetchall():
+                for candidate in json.loads(row["sql_trace"]).get("n_plus_one", []):
+                    found.append({"cycle_id": row["cycle_id"], "step": row["step"],
+                                  "started_at": row["started_at"], **candidate})
+            return found
+        except Exception as e:
+            log.error(f"❌ Failed to read SQL trace results: {e}", source="DLCycleMetrics")
+            return []
+
+    def get_percentiles(self, window: int = 100, quantiles=QUANTILES) -> dict:
+        """Rolling percentiles per step over the last ``window`` cycles.
+
+        Returns ``{step: {"samples": n, "last_at": ts, "failures": k,
+        field: {"p50": x, ...}}}``.
+        """
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute(
+                f"""
+                SELECT step, started_at, success, {", ".join(METRIC_FIELDS)}
+                FROM cycle_metrics
+                WHERE cycle_id IN (
+                    SELECT cycle_id FROM cycle_metrics WHERE step = ?
+                    ORDER BY id DESC LIMIT ?
+                )
+                ORDER BY id
+                """,
+                (CycleMetricsRecorder.TOTAL_STEP, window),
+            )
+            rows = cursor.fetchall()
+        except Exception as e:
+            log.error(f"❌ Failed to compute cycle metric percentiles: {e}", source="DLCycleMetrics")
+            return {}
+
+        samples = {}
+        for row in rows:
+            entry = samples.setdefault(
+                row["step"], {"samples": 0, "last_at": None, "failures": 0, "values": {f: [] for f in METRIC_FIELDS}}
+            )
+            entry["samples"] += 1
+            entry["last_at"] = row["started_at"]
+            entry["failures"] += 0 if row["success"] else 1
+            for field in METRIC_FIELDS:
+                entry["values"][field].append(row[field] or 0)
+
+        result = {}
+        for step, entry in samples.items():
+            values = entry.pop("values")
+            result[step] = {
+                **entry,
+                **{
+                    field: {f"p{int(q * 100)}": round(percentile(vals, q), 3) for q in quantiles}
+                    for field, vals in values.items()
+                },
+            }
+        return result
+
+    @staticmethod
+    def to_prometheus(percentiles: dict, prefix: str = "sonic_cycle_step") -> str:
+        """Render ``get_percentiles`` output in Prometheus text format."""
+        lines = []
+        for field in METRIC_FIELDS:
+            name = f"{prefix}_{field}"
+            lines.append(f"# HELP {name} Cyclone step {field.replace('_', ' ')} (rolling window)")
+            lines.append(f"# TYPE {name} summary")
+            for step, stats in sorted(percentiles.items()):
+                for key, value in stats[field].items():
+                    quantile = int(key[1:]) / 100
+                    lines.append(f'{name}{{step="{step}",quantile="{quantile}"}} {value}')
+                lines.append(f'{name}_count{{step="{step}"}} {stats["samples"]}')
+        lines.append(f"# HELP {prefix}_failures Failed runs in the rolling window")
+        lines.append(f"# TYPE {prefix}_failures gauge")
+        for step, stats in sorted(percentiles.items()):
+            lines.append(f'{prefix}_failures{{step="{step}"}} {stats["failures"]}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,72 @@
+import json
+from core.logging import log
+
+DEATH_EVENTS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS death_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        fingerprint TEXT NOT NULL,
+        message TEXT NOT NULL,
+        level TEXT,
+        payload TEXT,
+        first_at TEXT NOT NULL,
+        last_at TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 1
+    )
+"""
+
+
+def ensure_death_events_table(cursor):
+    """Create ``death_events`` and its indexes (shared with the writer)."""
+    cursor.execute(DEATH_EVENTS_SCHEMA)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_death_events_last_at ON death_events(last_at)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_death_events_fingerprint ON death_events(fingerprint, first_at)"
+    )
+
+
+class DLDeathEventManager:
+    """Read access to death nail events.
+
+    Rows are written by ``DeathNailService``'s background dispatcher; each row
+    is one coalescing window, with ``count`` holding how many times the same
+    message fired inside it.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.ensure_table()
+
+    def ensure_table(self):
+        cursor = self.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, death_events table not created", source="DLDeathEvents")
+            return
+        ensure_death_events_table(cursor)
+        self.db.commit()
+        log.debug("death_events table ensured", source="DLDeathEvents")
+
+    def get_recent(self, limit: int = 20) -> list:
+        """Most recent events first, in the legacy death log entry shape."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute(
+                """
+                SELECT message, level, payload, first_at, last_at, count
+                FROM death_events ORDER BY last_at DESC, id DESC LIMIT ?
+                """,
+                (limit,),
+            )
+            entries = []
+            for row in cursor.fetchall():
+                entries.append({
+                    "timestamp": row["last_at"],
+                    "first_seen": row["first_at"],
+                    "message": row["message"],
+                    "level": row["level"],
+                    "payload": json.loads(row["payload"]) if row["payload"] else {},
+                    "count": row["count"],
+                })
+            return entries
+        except Exception as e:
+            log.error(f"❌ Failed to read death events: {e}", source="DLDeathEvents")
+            return []
@@ -1,7 +1,34 @@
 import json
+import os
+import threading
 from datetime import datetime
 from core.logging import log
 
+# Process-wide modifier versions keyed by database.  Writers bump the version
+# so cached weights (see ``calc_core.modifier_store``) reload only on change.
+_modifier_versions = {}
+_version_lock = threading.Lock()
+
+
+def modifier_db_key(db):
+    """Return the key identifying ``db`` in the version table."""
+    path = getattr(db, "db_path", None)
+    if path and str(path) != ":memory:":
+        return os.path.abspath(str(path))
+    return ("memory", id(db))
+
+
+def get_modifier_version(db) -> int:
+    return _modifier_versions.get(modifier_db_key(db), 0)
+
+
+def bump_modifier_version(db) -> int:
+    key = modifier_db_key(db)
+    with _version_lock:
+        _modifier_versions[key] = _modifier_versions.get(key, 0) + 1
+        return _modifier_versions[key]
+
+
 class DLModifierManager:
     def __init__(self, db):
         self.db = db
@@ -28,6 +55,7 @@ class DLModifierManager:
             ON CONFLICT(key) DO UPDATE SET value = excluded.value, last_modified = excluded.last_modified
         """, (key, group, value, datetime.now().isoformat()))
         self.db.commit()
+        bump_modifier_version(self.db)
         log.success(f"✅ Modifier set: {key} = {value}", source="DLModifierManager")
 
     def get_modifier(self, key: str) -> float:
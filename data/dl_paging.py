@@ -0,0 +1,124 @@
+# dl_paging.py
+"""
+Author: BubbaDiego
+Module: dl_paging
+Description:
+    Keyset (cursor) pagination, filters and sparse field selection shared by
+    the DL managers' ``query_*`` methods.
+
+    A page is ordered by a fixed list of NOT NULL (or backfilled) columns
+    ending in a unique one, all in one direction, and backed by a composite
+    index on exactly those columns.  The cursor is the sort key of the last
+    row returned, encoded as an opaque URL-safe token; the next page is the
+    row-value range ``(k1, k2) < (v1, v2)`` read straight off that index, so
+    pages stay stable while rows are inserted and cost the same no matter
+    how deep the client has paged (no OFFSET scan, no sort).
+"""
+
+import base64
+import json
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(values) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> list:
+    """Inverse of :func:`encode_cursor`; raises ``ValueError`` on a bad token."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token!r}") from e
+    if not isinstance(values, list):
+        raise ValueError(f"Invalid cursor: {token!r}")
+    return values
+
+
+def clamp_limit(limit, default: int = DEFAULT_PAGE_SIZE) -> int:
+    try:
+        limit = int(limit) if limit not in (None, "") else default
+    except (TypeError, ValueError):
+        limit = default
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def split_values(value) -> list:
+    """``"a,b"`` or ``["a", "b"]`` → ``["a", "b"]`` (blanks dropped)."""
+    if value is None:
+        return []
+    items = value if isinstance(value, (list, tuple, set)) else str(value).split(",")
+    return [str(v).strip() for v in items if str(v).strip()]
+
+
+def filter_clauses(filters: dict, columns: dict) -> list:
+    """``(sql, params)`` clauses for each ``filters`` key found in ``columns``.
+
+    Values may be comma separated; matching is case-insensitive.  A column
+    entry may be a callable returning its own clause for the values.
+    """
+    clauses = []
+    for key, value in (filters or {}).items():
+        values = split_values(value)
+        if key not in columns or not values:
+            continue
+        column = columns[key]
+        if callable(column):
+            clauses.append(column(values))
+            continue
+        placeholders = ",".join("?" for _ in values)
+        clauses.append((f"{column} COLLATE NOCASE IN ({placeholders})", values))
+    return clauses
+
+
+def keyset_page(cursor, table: str, order, clauses=(), after: str = None, limit: int = None):
+    """Fetch one page of ``table`` rows.
+
+    ``order`` is a sequence of ``(column, "ASC"|"DESC")`` sharing one
+    direction, whose last column is unique; the columns must never be NULL.
+    Returns ``(rows, next_cursor)``; ``next_cursor`` is ``None`` on the last
+    page.  ``limit=None`` returns every matching row.
+    """
+    directions = {direction.upper() for _, direction in order}
+    if len(directions) != 1:
+        raise ValueError("keyset_page needs a single sort direction")
+    direction = directions.pop()
+    columns = [col for col, _ in order]
+    where = [sql for sql, _ in clauses]
+    params = [p for _, ps in clauses for p in ps]
+
+    if after:
+        values = decode_cursor(after)
+        if len(values) != len(columns):
+            raise ValueError(f"Invalid cursor: {after!r}")
+        op = "<" if direction == "DESC" else ">"
+        where.append(f"({', '.join(columns)}) {op} ({', '.join('?' for _ in columns)})")
+        params += values
+
+    sql = f"SELECT * FROM {table}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY " + ", ".join(f"{col} {direction}" for col in columns)
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(int(limit) + 1)
+
+    rows = [dict(r) for r in cursor.execute(sql, params).fetchall()]
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].get(col) for col in columns)
+    return rows, next_cursor
+
+
+def select_fields(rows: list, fields) -> list:
+    """Sparse fieldsets: keep only ``fields`` (plus ``id``) in each row."""
+    fields = split_values(fields)
+    if not fields:
+        return rows
+    keep = ["id"] + [f for f in fields if f != "id"]
+    return [{k: row[k] for k in keep if k in row} for row in rows]
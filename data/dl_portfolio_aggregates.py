@@ -0,0 +1,193 @@
+# dl_portfolio_aggregates.py
+"""
+Author: BubbaDiego
+Module: DLPortfolioAggregateManager
+Description:
+    Running portfolio sums over ACTIVE positions, kept in the single-row
+    ``portfolio_aggregates`` table.
+
+    SQLite triggers on ``positions`` subtract a row's old contribution and
+    add its new one on every INSERT, UPDATE (of the summed columns or
+    ``status``) and DELETE, so the sums stay current in O(1) per write no
+    matter which connection or module wrote the row.  ``get_totals`` then
+    returns the same shape as ``CalcServices.calculate_totals`` from one
+    single-row read instead of a scan of every position.
+
+    Adding and subtracting floats leaves residue, so the sums are re-based
+    from ``SUM(...)`` over the active positions whenever the count drops to
+    zero, and ``totals_from_sums`` reports an empty portfolio (and treats
+    near-zero denominators as zero) rather than ratios of rounding noise.
+    ``rebuild`` recomputes the sums from scratch; it runs when the table is
+    first created and can be called at any time to clear drift.
+"""
+
+from core.core_imports import log
+
+AGGREGATE_COLUMNS = (
+    "position_count",
+    "total_size",
+    "total_value",
+    "total_collateral",
+    "weighted_leverage_sum",
+    "weighted_travel_percent_sum",
+    "total_heat_index",
+    "heat_index_count",
+)
+
+# Per-row contribution of each column; ``{r}`` is NEW or OLD.
+_CONTRIBUTIONS = {
+    "position_count": "1",
+    "total_size": "COALESCE({r}.size, 0.0)",
+    "total_value": "COALESCE({r}.value, 0.0)",
+    "total_collateral": "COALESCE({r}.collateral, 0.0)",
+    "weighted_leverage_sum": "COALESCE({r}.leverage, 0.0) * COALESCE({r}.size, 0.0)",
+    "weighted_travel_percent_sum": "COALESCE({r}.travel_percent, 0.0) * COALESCE({r}.size, 0.0)",
+    "total_heat_index": "COALESCE({r}.heat_index, 0.0)",
+    "heat_index_count": "(COALESCE({r}.heat_index, 0.0) != 0)",
+}
+
+_WATCHED_COLUMNS = "size, value, collateral, leverage, travel_percent, heat_index, status"
+
+# Sums smaller than this are float residue, not money
+EPSILON = 1e-6
+
+
+def _delta(sign: str, row: str) -> str:
+    active = f"({row}.status = 'ACTIVE')"
+    return ", ".join(
+        f"{col} = {col} {sign} {active} * {expr.format(r=row)}"
+        for col, expr in _CONTRIBUTIONS.items()
+    )
+
+
+def _rebased_sums() -> str:
+    return ", ".join(
+        f"{col} = (SELECT COALESCE(SUM({expr.format(r='positions')}), 0) FROM positions WHERE status = 'ACTIVE')"
+        for col, expr in _CONTRIBUTIONS.items()
+    )
+
+
+def _update_delta() -> str:
+    return ", ".join(
+        f"{col} = {col}"
+        f" - (OLD.status = 'ACTIVE') * {expr.format(r='OLD')}"
+        f" + (NEW.status = 'ACTIVE') * {expr.format(r='NEW')}"
+        for col, expr in _CONTRIBUTIONS.items()
+    )
+
+
+SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS portfolio_aggregates (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        {", ".join(f"{c} {'INTEGER' if c.endswith('count') else 'REAL'} NOT NULL DEFAULT 0" for c in AGGREGATE_COLUMNS)},
+        rebuilt_at TEXT
+    )
+"""
+
+TRIGGERS = {
+    "trg_portfolio_agg_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_portfolio_agg_insert AFTER INSERT ON positions
+        BEGIN
+            UPDATE portfolio_aggregates SET {_delta('+', 'NEW')} WHERE id = 1;
+        END
+    """,
+    "trg_portfolio_agg_update": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_portfolio_agg_update
+        AFTER UPDATE OF {_WATCHED_COLUMNS} ON positions
+        BEGIN
+            UPDATE portfolio_aggregates SET {_update_delta()} WHERE id = 1;
+        END
+    """,
+    "trg_portfolio_agg_delete": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_portfolio_agg_delete AFTER DELETE ON positions
+        BEGIN
+            UPDATE portfolio_aggregates SET {_delta('-', 'OLD')} WHERE id = 1;
+        END
+    """,
+    "trg_portfolio_agg_rebase": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_portfolio_agg_rebase
+        AFTER UPDATE OF position_count ON portfolio_aggregates
+        WHEN NEW.position_count <= 0 AND ({" OR ".join(f"NEW.{c} != 0" for c in AGGREGATE_COLUMNS)})
+        BEGIN
+            UPDATE portfolio_aggregates SET {_rebased_sums()}, rebuilt_at = datetime('now') WHERE id = 1;
+        END
+    """,
+}
+
+
+def _clean(value) -> float:
+    value = float(value or 0.0)
+    return 0.0 if abs(value) < EPSILON else value
+
+
+def totals_from_sums(sums: dict) -> dict:
+    """``calculate_totals``-shaped dict (plus ratio/heat/count) from raw sums."""
+    count = int(sums.get("position_count") or 0)
+    if count <= 0:
+        sums = {}
+    total_size = _clean(sums.get("total_size"))
+    total_value = _clean(sums.get("total_value"))
+    total_collateral = _clean(sums.get("total_collateral"))
+    heat_count = int(sums.get("heat_index_count") or 0)
+    total_heat = _clean(sums.get("total_heat_index"))
+    return {
+        "total_size": total_size,
+        "total_value": total_value,
+        "total_collateral": total_collateral,
+        "avg_leverage": _clean(sums.get("weighted_leverage_sum")) / total_size if total_size > 0 else 0.0,
+        "avg_travel_percent": _clean(sums.get("weighted_travel_percent_sum")) / total_size if total_size > 0 else 0.0,
+        "avg_heat_index": total_heat / heat_count if heat_count > 0 else 0.0,
+        "total_heat_index": total_heat,
+        "value_to_collateral_ratio": total_value / total_collateral if total_collateral > 0 else None,
+        "position_count": max(count, 0),
+    }
+
+
+class DLPortfolioAggregateManager:
+    def __init__(self, db):
+        self.db = db
+        log.debug("DLPortfolioAggregateManager initialized.", source="DLPortfolioAggregates")
+
+    def ensure_schema(self, cursor=None):
+        """Create the table, its row and the ``positions`` triggers."""
+        cursor = cursor or self.db.get_cursor()
+        cursor.execute(SCHEMA)
+        for ddl in TRIGGERS.values():
+            cursor.execute(ddl)
+        created = cursor.execute(
+            "INSERT OR IGNORE INTO portfolio_aggregates (id) VALUES (1)"
+        ).rowcount
+        if created:
+            self.rebuild(cursor)
+
+    def rebuild(self, cursor=None):
+        """Recompute every sum with one scan of the active positions."""
+        cursor = cursor or self.db.get_cursor()
+        sums = ", ".join(
+            f"COALESCE(SUM({expr.format(r='positions')}), 0)" for expr in _CONTRIBUTIONS.values()
+        )
+        assignments = ", ".join(f"{c} = ?" for c in AGGREGATE_COLUMNS)
+        row = cursor.execute(f"SELECT {sums} FROM positions WHERE status = 'ACTIVE'").fetchone()
+        cursor.execute(
+            f"UPDATE portfolio_aggregates SET {assignments}, rebuilt_at = datetime('now') WHERE id = 1",
+            tuple(row),
+        )
+        log.debug("Portfolio aggregates rebuilt", source="DLPortfolioAggregates")
+
+    def get_sums(self) -> dict:
+        try:
+            cursor = self.db.get_cursor()
+            row = cursor.execute(
+                f"SELECT {', '.join(AGGREGATE_COLUMNS)} FROM portfolio_aggregates WHERE id = 1"
+            ).fetchone()
+            return dict(row) if row else {}
+        except Exception as e:
+            log.error(f"❌ Failed to read portfolio aggregates: {e}", source="DLPortfolioAggregates")
+            return {}
+
+    def get_totals(self) -> dict:
+        """Portfolio totals over ACTIVE positions from the running sums."""
+        return totals_from_sums(self.get_sums())
+
+    def get_metric(self, metric: str):
+        return self.get_totals().get(metric)
@@ -0,0 +1,91 @@
+from core.logging import log
+
+RISK_FIELDS = (
+    "position_id",
+    "asset_type",
+    "position_type",
+    "wallet_name",
+    "liquidation_probability",
+    "expected_pnl",
+    "pnl_p05",
+    "expected_value",
+    "horizon_hours",
+    "paths",
+    "model",
+    "computed_at",
+)
+
+
+class DLPositionRiskManager:
+    """Latest Monte Carlo liquidation-risk estimate per position.
+
+    Rows are replaced wholesale by ``MonteCarloRiskEngine.run`` each cycle;
+    ``liquidation_probability`` is a fraction in 0..1.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.ensure_table()
+
+    def ensure_table(self):
+        cursor = self.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, position_risk table not created", source="DLPositionRisk")
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS position_risk (
+                position_id TEXT PRIMARY KEY,
+                asset_type TEXT,
+                position_type TEXT,
+                wallet_name TEXT,
+                liquidation_probability REAL,
+                expected_pnl REAL,
+                pnl_p05 REAL,
+                expected_value REAL,
+                horizon_hours REAL,
+                paths INTEGER,
+                model TEXT,
+                computed_at TEXT
+            )
+        """)
+        self.db.commit()
+        log.debug("position_risk table ensured", source="DLPositionRisk")
+
+    def replace_all(self, rows: list):
+        """Swap in a new set of estimates in one transaction."""
+        cursor = self.db.get_cursor()
+        placeholders = ", ".join("?" for _ in RISK_FIELDS)
+        try:
+            cursor.execute("DELETE FROM position_risk")
+            cursor.executemany(
+                f"INSERT INTO position_risk ({', '.join(RISK_FIELDS)}) VALUES ({placeholders})",
+                [tuple(row.get(f) for f in RISK_FIELDS) for row in rows],
+            )
+            self.db.commit()
+        except Exception as e:
+            log.error(f"❌ Failed to store position risk: {e}", source="DLPositionRisk")
+
+    def get(self, position_id: str):
+        try:
+            cursor = self.db.get_cursor()
+            row = cursor.execute(
+                "SELECT * FROM position_risk WHERE position_id = ?", (position_id,)
+            ).fetchone()
+            return dict(row) if row else None
+        except Exception as e:
+            log.error(f"❌ Failed to read position risk: {e}", source="DLPositionRisk")
+            return None
+
+    def get_all(self, limit: int = None) -> list:
+        """Estimates ordered by liquidation probability, riskiest first."""
+        try:
+            cursor = self.db.get_cursor()
+            sql = "SELECT * FROM position_risk ORDER BY liquidation_probability DESC, expected_pnl ASC"
+            if limit:
+                cursor.execute(sql + " LIMIT ?", (int(limit),))
+            else:
+                cursor.execute(sql)
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            log.error(f"❌ Failed to read position risk: {e}", source="DLPositionRisk")
+            return []
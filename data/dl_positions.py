@@ -15,9 +15,20 @@ from uuid import uuid4
 from datetime import datetime
 import sqlite3
 from core.core_imports import log
+from data.dl_paging import filter_clauses, keyset_page
 
 
 class DLPositionManager:
+    # Query-string filter → column for ``query_positions``
+    FILTER_COLUMNS = {
+        "status": "status",
+        "wallet": "wallet_name",
+        "asset": "asset_type",
+        "type": "position_type",
+    }
+    # The primary-key index serves this order
+    PAGE_ORDER = (("id", "ASC"),)
+
     def __init__(self, db):
         self.db = db
         log.debug("DLPositionManager initialized.", source="DLPositionManager")
@@ -272,6 +283,120 @@ class DLPositionManager:
             log.error(f"❌ Failed to fetch active positions: {e}", source="DLPositionManager")
             return []
 
+    def query_positions(self, filters: dict = None, after: str = None, limit: int = None):
+        """Filtered page of positions ordered by id; returns ``(positions, next_cursor)``.
+
+        Raises ``ValueError`` for a malformed ``after`` cursor.
+        """
+        clauses = filter_clauses(filters, self.FILTER_COLUMNS)
+        return keyset_page(self.db.get_cursor(), "positions", self.PAGE_ORDER, clauses, after, limit)
+
+    def get_top_active_profit(self, alert_type: str = "Profit"):
+        """Highest active ``pnl_after_fees_usd`` at or above the threshold's ``low``.
+
+        One aggregate query: the minimum comes from the newest enabled
+        ``alert_type``/Position/ABOVE threshold (``0`` when there is none).
+        Returns ``None`` when no active position qualifies.
+        """
+        try:
+            cursor = self.db.get_cursor()
+            row = cursor.execute(
+                """
+                SELECT MAX(COALESCE(pnl_after_fees_usd, 0.0)) AS top
+                FROM positions
+                WHERE status = 'ACTIVE'
+                  AND COALESCE(pnl_after_fees_usd, 0.0) >= COALESCE((
+                      SELECT low FROM alert_thresholds
+                      WHERE alert_type = ? AND alert_class = 'Position'
+                        AND condition = 'ABOVE' AND enabled = 1
+                      ORDER BY last_modified DESC LIMIT 1
+                  ), 0)
+                """,
+                (alert_type,),
+            ).fetchone()
+            return row["top"] if row else None
+        except Exception as e:
+            log.error(f"❌ Failed to fetch top active profit: {e}", source="DLPositionManager")
+            return None
+
+    def get_recent_positions(self, limit: int = 20) -> list:
+        """Return the ``limit`` most recently updated positions."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute(
+                "SELECT * FROM positions ORDER BY last_updated DESC LIMIT ?", (int(limit),)
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            log.error(f"❌ Failed to fetch recent positions: {e}", source="DLPositionManager")
+            return []
+
+    def get_positions_by_ids(self, pos_ids) -> dict:
+        """Fetch many positions in chunked ``IN`` queries keyed by ID."""
+        ids = list(dict.fromkeys(p for p in pos_ids if p))
+        found = {}
+        try:
+            cursor = self.db.get_cursor()
+            if not cursor:
+                return found
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                cursor.execute(f"SELECT * FROM positions WHERE id IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    found[row["id"]] = dict(row)
+        except Exception as e:
+            log.error(f"❌ Failed to batch fetch positions: {e}", source="DLPositionManager")
+        return found
+
+    # ``travel_percent`` is left out on purpose so the value Jupiter sync
+    # stored is not rewritten every cycle; drift tracking reads Jupiter's
+    # figure from ``jupiter_travel_percent``, which enrichment never touches.
+    ENRICHED_FIELDS = (
+        "position_type", "wallet_name", "current_price", "leverage",
+        "liquidation_distance", "heat_index", "current_heat_index",
+    )
+
+    def update_enrichment_batch(self, positions, enriched_at: str) -> int:
+        """Write derived fields for many positions in one transaction."""
+        fields = self.ENRICHED_FIELDS
+        rows = [
+            tuple(pos.get(f) for f in fields) + (enriched_at, pos["id"])
+            for pos in positions
+            if pos.get("id")
+        ]
+        if not rows:
+            return 0
+        assignments = ", ".join(f"{f} = ?" for f in fields)
+        try:
+            cursor = self.db.get_cursor()
+            if not cursor:
+                return 0
+            cursor.executemany(
+                f"UPDATE positions SET {assignments}, enriched_at = ? WHERE id = ?", rows
+            )
+            self.db.commit()
+            return len(rows)
+        except Exception as e:
+            log.error(f"❌ Failed to persist enrichment batch: {e}", source="DLPositionManager")
+            return 0
+
+    def update_jupiter_travel_batch(self, reported: dict) -> int:
+        """Store Jupiter's ``{position_id: travel_percent}`` without touching other fields."""
+        rows = [(value, pos_id) for pos_id, value in reported.items() if value is not None]
+        if not rows:
+            return 0
+        try:
+            cursor = self.db.get_cursor()
+            if not cursor:
+                return 0
+            cursor.executemany("UPDATE positions SET jupiter_travel_percent = ? WHERE id = ?", rows)
+            self.db.commit()
+            return len(rows)
+        except Exception as e:
+            log.error(f"❌ Failed to store Jupiter travel percent: {e}", source="DLPositionManager")
+            return 0
+
     def get_position_by_id(self, pos_id: str):
         try:
             cursor = self.db.get_cursor()
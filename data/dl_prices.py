@@ -1,13 +1,64 @@
 # dl_prices.py
+import sys
+from array import array
+from base64 import b64encode
 from uuid import uuid4
 from datetime import datetime
 from core.core_imports import log
+from data.dl_paging import filter_clauses, keyset_page
+
+
+def iso_to_epoch_ms(iso_str):
+    """Convert an ISO timestamp (naive = local time) to epoch milliseconds."""
+    if not iso_str:
+        return None
+    try:
+        return int(datetime.fromisoformat(str(iso_str)).timestamp() * 1000)
+    except ValueError:
+        return None
 
 class DLPriceManager:
+    # Query-string filter → column for ``query_prices``
+    FILTER_COLUMNS = {"asset": "asset_type", "source": "source"}
+    # Backed by ``idx_prices_page``; ``epoch_ms`` is kept non-NULL by ``ensure_indexes``
+    PAGE_ORDER = (("epoch_ms", "DESC"), ("id", "DESC"))
+
     def __init__(self, db):
         self.db = db
         log.debug("DLPriceManager initialized.", source="DLPriceManager")
 
+    def ensure_indexes(self, cursor=None):
+        """Create history indexes and, once per database, backfill ``epoch_ms``."""
+        cursor = cursor or self.db.get_cursor()
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_prices_asset_epoch ON prices(asset_type, epoch_ms)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_prices_asset_time ON prices(asset_type, last_update_time)"
+        )
+        # One-time migration: the trigger below doubles as the "done" flag, and
+        # insert_price always writes epoch_ms, so later inits skip the scan.
+        # Unparseable times become 0 so paging can key on the plain column
+        migrated = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_prices_epoch_ms'"
+        ).fetchone()
+        if not migrated:
+            rows = cursor.execute("SELECT id, last_update_time FROM prices WHERE epoch_ms IS NULL").fetchall()
+            updates = [(iso_to_epoch_ms(r[1]) or 0, r[0]) for r in rows]
+            if updates:
+                cursor.executemany("UPDATE prices SET epoch_ms = ? WHERE id = ?", updates)
+                log.info(f"Backfilled epoch_ms on {len(updates)} price rows", source="DLPriceManager")
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_prices_epoch_ms AFTER INSERT ON prices
+            WHEN NEW.epoch_ms IS NULL
+            BEGIN
+                UPDATE prices SET epoch_ms = 0 WHERE id = NEW.id;
+            END
+            """
+        )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_prices_page ON prices(epoch_ms, id)")
+
     def insert_price(self, price_data: dict):
         try:
             cursor = self.db.get_cursor()
@@ -15,14 +66,18 @@ class DLPriceManager:
                 price_data["id"] = str(uuid4())
             if "last_update_time" not in price_data:
                 price_data["last_update_time"] = datetime.now().isoformat()
+            price_data.setdefault("previous_price", 0.0)
+            price_data.setdefault("previous_update_time", None)
+            price_data.setdefault("source", None)
+            price_data["epoch_ms"] = iso_to_epoch_ms(price_data["last_update_time"]) or 0
 
             cursor.execute("""
                 INSERT INTO prices (
                     id, asset_type, current_price, previous_price,
-                    last_update_time, previous_update_time, source
+                    last_update_time, previous_update_time, source, epoch_ms
                 ) VALUES (
                     :id, :asset_type, :current_price, :previous_price,
-                    :last_update_time, :previous_update_time, :source
+                    :last_update_time, :previous_update_time, :source, :epoch_ms
                 )
             """, price_data)
 
@@ -46,6 +101,27 @@ class DLPriceManager:
             log.error(f"Error retrieving price for {asset_type}: {e}", source="DLPriceManager")
             return {}
 
+    def get_latest_prices(self, assets) -> dict:
+        """Return the latest price row for each asset in one query."""
+        assets = list(dict.fromkeys(a for a in assets if a))
+        if not assets:
+            return {}
+        try:
+            cursor = self.db.get_cursor()
+            placeholders = ",".join("?" for _ in assets)
+            cursor.execute(f"""
+                SELECT p.* FROM prices p
+                JOIN (
+                    SELECT asset_type, MAX(last_update_time) AS latest
+                    FROM prices WHERE asset_type IN ({placeholders})
+                    GROUP BY asset_type
+                ) m ON p.asset_type = m.asset_type AND p.last_update_time = m.latest
+            """, assets)
+            return {row["asset_type"]: dict(row) for row in cursor.fetchall()}
+        except Exception as e:
+            log.error(f"Error retrieving latest prices: {e}", source="DLPriceManager")
+            return {}
+
     def get_all_prices(self) -> list:
         try:
             cursor = self.db.get_cursor()
@@ -56,6 +132,97 @@ class DLPriceManager:
             log.error(f"Failed to retrieve all prices: {e}", source="DLPriceManager")
             return []
 
+    def get_recent_prices(self, limit: int = 20) -> list:
+        """Return the ``limit`` most recent price rows across all assets."""
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute(
+                "SELECT * FROM prices ORDER BY last_update_time DESC LIMIT ?", (int(limit),)
+            )
+            return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            log.error(f"Failed to retrieve recent prices: {e}", source="DLPriceManager")
+            return []
+
+    def query_prices(self, filters: dict = None, after: str = None, limit: int = None):
+        """Filtered page of price rows, newest first; returns ``(prices, next_cursor)``.
+
+        Raises ``ValueError`` for a malformed ``after`` cursor.
+        """
+        clauses = filter_clauses(filters, self.FILTER_COLUMNS)
+        return keyset_page(self.db.get_cursor(), "prices", self.PAGE_ORDER, clauses, after, limit)
+
+    def get_price_history(self, assets, start_ms: int, end_ms: int = None,
+                          max_points: int = None) -> dict:
+        """Return price history for ``assets`` as columnar arrays.
+
+        A single indexed range query serves every asset.  When ``max_points``
+        is given the window is split into ``max_points // 2`` buckets and
+        each bucket is reduced to its min and max sample (in time order),
+        which keeps spikes visible while bounding the payload.
+
+        Returns ``{asset: {"t": [epoch_ms, ...], "p": [price, ...]}}``.
+        """
+        assets = list(assets)
+        history = {asset: {"t": [], "p": []} for asset in assets}
+        if not assets:
+            return history
+        if end_ms is None:
+            end_ms = int(datetime.now().timestamp() * 1000)
+
+        placeholders = ",".join("?" for _ in assets)
+        where = f"asset_type IN ({placeholders}) AND epoch_ms BETWEEN ? AND ?"
+        params = [*assets, int(start_ms), int(end_ms)]
+
+        buckets = (max_points or 0) // 2
+        if buckets > 0:
+            bucket_ms = max(1, -(-(int(end_ms) - int(start_ms) + 1) // buckets))
+            # SQLite returns the bare columns of the row holding MIN()/MAX()
+            sql = f"""
+                SELECT asset_type, epoch_ms, MIN(current_price) AS price
+                FROM prices WHERE {where}
+                GROUP BY asset_type, (epoch_ms - ?) / ?
+                UNION
+                SELECT asset_type, epoch_ms, MAX(current_price) AS price
+                FROM prices WHERE {where}
+                GROUP BY asset_type, (epoch_ms - ?) / ?
+                ORDER BY asset_type, epoch_ms
+            """
+            params = params + [int(start_ms), bucket_ms] + params + [int(start_ms), bucket_ms]
+        else:
+            sql = f"""
+                SELECT asset_type, epoch_ms, current_price AS price
+                FROM prices WHERE {where}
+                ORDER BY asset_type, epoch_ms
+            """
+
+        try:
+            cursor = self.db.get_cursor()
+            for asset, ts, price in cursor.execute(sql, params):
+                series = history[asset]
+                series["t"].append(ts)
+                series["p"].append(float(price))
+        except Exception as e:
+            log.error(f"Failed to load price history: {e}", source="DLPriceManager")
+        return history
+
+    @staticmethod
+    def encode_history(history: dict) -> dict:
+        """Pack columnar history into base64 little-endian Float64 arrays."""
+        packed = {}
+        for asset, series in history.items():
+            t = array("d", series["t"])
+            p = array("d", series["p"])
+            if sys.byteorder == "big":
+                t.byteswap()
+                p.byteswap()
+            packed[asset] = {
+                "n": len(p),
+                "t": b64encode(t.tobytes()).decode("ascii"),
+                "p": b64encode(p.tobytes()).decode("ascii"),
+            }
+        return packed
+
     def clear_prices(self):
         try:
             cursor = self.db.get_cursor()
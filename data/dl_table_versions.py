@@ -0,0 +1,111 @@
+# dl_table_versions.py
+"""
+Author: BubbaDiego
+Module: DLTableVersionManager
+Description:
+    Per-table change counters kept in the ``table_versions`` table.
+
+    SQLite triggers bump ``version`` and stamp ``modified_at`` (epoch
+    seconds) on every INSERT, UPDATE and DELETE of a versioned table, so the
+    counters move no matter which connection, process or module wrote the
+    row.  API routes derive ETag/Last-Modified validators from them and can
+    answer ``304 Not Modified`` with one single-row read; ``DLChangeBus``
+    groups them into per-topic change generations.
+"""
+
+import hashlib
+
+from core.core_imports import log
+
+VERSIONED_TABLES = (
+    "alerts", "positions", "prices", "wallets",
+    "alert_thresholds", "modifiers", "monitor_ledger",
+    "positions_totals_history", "portfolio_aggregates",
+)
+
+_NOW_EPOCH = "(julianday('now') - 2440587.5) * 86400.0"
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS table_versions (
+        table_name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0,
+        modified_at REAL
+    )
+"""
+
+
+def _trigger(table: str, event: str) -> str:
+    return f"""
+        CREATE TRIGGER IF NOT EXISTS trg_version_{table}_{event.lower()} AFTER {event} ON {table}
+        BEGIN
+            UPDATE table_versions SET version = version + 1, modified_at = {_NOW_EPOCH}
+            WHERE table_name = '{table}';
+        END
+    """
+
+
+TRIGGERS = {
+    f"trg_version_{table}_{event.lower()}": _trigger(table, event)
+    for table in VERSIONED_TABLES
+    for event in ("INSERT", "UPDATE", "DELETE")
+}
+
+
+class DLTableVersionManager:
+    def __init__(self, db):
+        self.db = db
+        log.debug("DLTableVersionManager initialized.", source="DLTableVersions")
+
+    def ensure_schema(self, cursor=None):
+        """Create the counter table, one row per versioned table, and the triggers."""
+        cursor = cursor or self.db.get_cursor()
+        cursor.execute(SCHEMA)
+        cursor.executemany(
+            f"INSERT OR IGNORE INTO table_versions (table_name, version, modified_at) VALUES (?, 0, {_NOW_EPOCH})",
+            [(t,) for t in VERSIONED_TABLES],
+        )
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        existing = {row[0] for row in cursor.fetchall()}
+        for table in VERSIONED_TABLES:
+            if table not in existing:
+                log.warning(f"⚠️ No version triggers for missing table {table}", source="DLTableVersions")
+                continue
+            for event in ("INSERT", "UPDATE", "DELETE"):
+                cursor.execute(TRIGGERS[f"trg_version_{table}_{event.lower()}"])
+
+    def get_versions(self, tables=VERSIONED_TABLES) -> dict:
+        """``{table: {"version": int, "modified_at": float}}`` for ``tables``."""
+        tables = list(tables)
+        try:
+            cursor = self.db.get_cursor()
+            placeholders = ",".join("?" for _ in tables)
+            cursor.execute(
+                f"SELECT table_name, version, modified_at FROM table_versions WHERE table_name IN ({placeholders})",
+                tables,
+            )
+            return {
+                row["table_name"]: {"version": row["version"], "modified_at": row["modified_at"]}
+                for row in cursor.fetchall()
+            }
+        except Exception as e:
+            log.error(f"❌ Failed to read table versions: {e}", source="DLTableVersions")
+            return {}
+
+    def get_version(self, table: str) -> int:
+        return self.get_versions([table]).get(table, {}).get("version", 0)
+
+    def validators(self, tables, salt: str = ""):
+        """``(etag, last_modified)`` for a response built from ``tables``.
+
+        ``salt`` distinguishes representations of the same data (query
+        string, process start).  Returns ``(None, None)`` when the counters
+        cannot be read, so callers fall back to an uncached response.
+        """
+        tables = sorted(tables)
+        versions = self.get_versions(tables)
+        if len(versions) != len(tables):
+            return None, None
+        key = ";".join(f"{t}={versions[t]['version']}" for t in tables)
+        etag = hashlib.sha1(f"{key}|{salt}".encode()).hexdigest()[:20]
+        last_modified = max(float(v["modified_at"] or 0.0) for v in versions.values())
+        return etag, last_modified
@@ -0,0 +1,76 @@
+import json
+from datetime import datetime, timezone
+from core.logging import log
+
+
+class DLUiEventManager:
+    """Append-only log of compact dashboard delta events.
+
+    Publishers (Cyclone, price sync) may run in a different process from the
+    web app, so deltas go through this table; the web process tails it by
+    ``seq`` and broadcasts new rows over SocketIO.
+    """
+
+    MAX_ROWS = 5000
+
+    def __init__(self, db):
+        self.db = db
+        self.ensure_table()
+
+    def ensure_table(self):
+        cursor = self.db.get_cursor()
+        if not cursor:
+            log.error("❌ DB unavailable, ui_events table not created", source="DLUiEvents")
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ui_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                topic TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+        """)
+        self.db.commit()
+        log.debug("ui_events table ensured", source="DLUiEvents")
+
+    def append(self, topic: str, payload: dict) -> int:
+        try:
+            cursor = self.db.get_cursor()
+            cursor.execute(
+                "INSERT INTO ui_events (topic, payload, created_at) VALUES (?, ?, ?)",
+                (topic, json.dumps(payload, default=str), datetime.now(timezone.utc).isoformat()),
+            )
+            seq = cursor.lastrowid
+            if seq % 500 == 0:
+                cursor.execute("DELETE FROM ui_events WHERE seq <= ?", (seq - self.MAX_ROWS,))
+            self.db.commit()
+            return seq
+        except Exception as e:
+            log.error(f"❌ Failed to append ui event: {e}", source="DLUiEvents")
+            return 0
+
+    def latest_seq(self) -> int:
+        try:
+            cursor = self.db.get_cursor()
+            row = cursor.execute("SELECT MAX(seq) FROM ui_events").fetchone()
+            return row[0] or 0
+        except Exception as e:
+            log.error(f"❌ Failed to read ui event seq: {e}", source="DLUiEvents")
+            return 0
+
+    def since(self, seq: int, limit: int = 200) -> list:
+        """Return events with ``seq`` greater than ``seq`` in order."""
+        try:
+            cursor = self.db.get_cursor()
+            rows = cursor.execute(
+                "SELECT seq, topic, payload, created_at FROM ui_events WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, limit),
+            ).fetchall()
+            return [
+                {"seq": r["seq"], "topic": r["topic"], "payload": json.loads(r["payload"]),
+                 "created_at": r["created_at"]}
+                for r in rows
+            ]
+        except Exception as e:
+            log.error(f"❌ Failed to read ui events: {e}", source="DLUiEvents")
+            return []
@@ -39,6 +39,7 @@ class AlertType(str, Enum):
     PROFIT = "profit"
     HEAT_INDEX = "heatindex"
     DEATH_NAIL = "deathnail"
+    LIQUIDATION_RISK = "liquidationrisk"
 
     # 📦 Portfolio-Wide Alerts
     TOTAL_VALUE = "totalvalue"
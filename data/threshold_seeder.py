@@ -103,6 +103,8 @@ class AlertThresholdSeeder:
                 "BELOW",
             ),
             ("LiquidationDistance", "Position", "liquidation_distance", 10, 5, 2, "BELOW"),
+            # Monte Carlo probability (%) of touching liquidation_price within the horizon
+            ("LiquidationRisk", "Position", "liquidation_probability", 5, 15, 30, "ABOVE"),
 
             # === Market Metrics
             ("PriceThreshold", "Market", "current_price", 20000, 30000, 40000, "ABOVE"),
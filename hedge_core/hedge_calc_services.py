@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from typing import List, Dict
 
+import numpy as np
+
+from hedge_core.hedge_optimizer import HedgeRebalanceOptimizer, evaluate_legs
+
 
 class HedgeCalcServices:
     """Utility class for simple hedge evaluations and rebalancing suggestions."""
@@ -48,10 +52,21 @@ class HedgeCalcServices:
         return {"long": long_eval, "short": short_eval, "net": net}
 
     def suggest_rebalance(self, long_pos: dict, short_pos: dict, price: float, config: dict) -> Dict[str, object]:
-        """Suggest basic rebalance actions based on the provided strategy."""
-        eval_data = self.evaluate_at_price(long_pos, short_pos, price)
+        """Suggest basic rebalance actions based on the provided strategy.
 
+        ``equal_value`` at a single price is solved directly.  Passing
+        ``scenarios`` (or ``span``) in ``config``, or asking for
+        ``delta_neutral``, runs the scenario optimizer instead.
+        """
         target = (config.get("adjustment_target") or "equal_value").lower()
+        if target == "delta_neutral" or config.get("scenarios") or config.get("span"):
+            try:
+                return self.optimize_rebalance(long_pos, short_pos, price, config)
+            except ValueError as e:
+                return {"side": (config.get("adjustable_side") or "long").lower(), "updates": {}, "note": str(e)}
+
+        eval_data = self.evaluate_at_price(long_pos, short_pos, price)
+
         side = (config.get("adjustable_side") or "long").lower()
         fields: List[str] = config.get("adjust_fields", ["collateral"])
 
@@ -81,6 +96,57 @@ class HedgeCalcServices:
 
         return suggestion
 
+    def optimize_rebalance(self, long_pos: dict, short_pos: dict, price: float, config: dict) -> Dict[str, object]:
+        """Search ``adjustable_side`` adjustments across a grid of price scenarios."""
+        optimizer = HedgeRebalanceOptimizer(
+            steps=int(config.get("steps", 61)),
+            max_leverage=float(config.get("max_leverage", 100.0)),
+            fee_rate=float(config.get("fee_rate", 0.0)),
+        )
+        return optimizer.optimize(
+            long_pos,
+            short_pos,
+            price,
+            target=config.get("adjustment_target") or "equal_value",
+            side=config.get("adjustable_side") or "long",
+            fields=config.get("adjust_fields", ["collateral", "size"]),
+            scenarios=config.get("scenarios"),
+            span=float(config.get("span") or 0.25),
+            scenario_count=int(config.get("scenario_count", 101)),
+        )
+
     def simulate_range(self, long_pos: dict, short_pos: dict, price_range: List[float]) -> List[Dict[str, Dict[str, float]]]:
         """Evaluate the hedge pair across multiple prices."""
-        return [self.evaluate_at_price(long_pos, short_pos, p) for p in price_range]
+        prices = np.asarray(price_range, dtype=float)
+        legs = {}
+        for name, pos in (("long", long_pos), ("short", short_pos)):
+            entry = float(pos.get("entry_price", 0.0))
+            size = float(pos.get("size", 0.0))
+            collateral = float(pos.get("collateral", 0.0))
+            sign = 1.0 if (pos.get("position_type") or "LONG").upper() == "LONG" else -1.0
+            tokens = size / entry if entry else 0.0
+            value, pnl, _ = evaluate_legs(entry, tokens, collateral, sign, prices)
+            legs[name] = (value, pnl, sign * tokens, collateral, size)
+
+        results = []
+        for i in range(prices.shape[0]):
+            row = {}
+            for name, (value, pnl, delta, collateral, size) in legs.items():
+                row[name] = {
+                    "value": round(float(value[i]), 6),
+                    "pnl": round(float(pnl[i]), 6),
+                    "delta": round(delta, 6),
+                    "gamma": 0.0,
+                    "collateral": collateral,
+                    "size": size,
+                }
+            long_eval, short_eval = row["long"], row["short"]
+            row["net"] = {
+                "value": round(long_eval["value"] + short_eval["value"], 6),
+                "pnl": round(long_eval["pnl"] + short_eval["pnl"], 6),
+                "delta": round(long_eval["delta"] + short_eval["delta"], 6),
+                "gamma": 0.0,
+                "imbalance": round(long_eval["value"] - short_eval["value"], 6),
+            }
+            results.append(row)
+        return results
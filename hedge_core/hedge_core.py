@@ -93,9 +93,9 @@ class HedgeCore:
         )
         return hedges
 
-    def link_hedges(self) -> List[list]:
-        """Scan positions and assign hedge IDs for qualifying groups."""
-        positions = self.dl.positions.get_all_positions()
+    @staticmethod
+    def find_hedge_groups(positions: List[dict]) -> List[list]:
+        """Groups of positions (same wallet and asset) holding both a long and a short."""
         groups = {}
         for pos in positions:
             wallet = pos.get("wallet_name")
@@ -104,21 +104,29 @@ class HedgeCore:
                 key = (wallet.strip(), asset.strip())
                 groups.setdefault(key, []).append(pos)
 
-        hedged_groups = []
-        for key, pos_list in groups.items():
+        hedged = []
+        for pos_list in groups.values():
             types = [pos.get("position_type", "").strip().lower() for pos in pos_list]
             if "long" in types and "short" in types:
-                hedge_id = str(uuid4())
-                for pos in pos_list:
-                    cursor = self.dl.db.get_cursor()
-                    cursor.execute(
-                        "UPDATE positions SET hedge_buddy_id = ? WHERE id = ?",
-                        (hedge_id, pos["id"])
-                    )
-                    self.dl.db.commit()
-                    cursor.close()
-                    pos["hedge_buddy_id"] = hedge_id
-                hedged_groups.append(pos_list)
+                hedged.append(pos_list)
+        return hedged
+
+    def link_hedges(self) -> List[list]:
+        """Scan positions and assign hedge IDs for qualifying groups."""
+        positions = self.dl.positions.get_all_positions()
+        hedged_groups = []
+        for pos_list in self.find_hedge_groups(positions):
+            hedge_id = str(uuid4())
+            for pos in pos_list:
+                cursor = self.dl.db.get_cursor()
+                cursor.execute(
+                    "UPDATE positions SET hedge_buddy_id = ? WHERE id = ?",
+                    (hedge_id, pos["id"])
+                )
+                self.dl.db.commit()
+                cursor.close()
+                pos["hedge_buddy_id"] = hedge_id
+            hedged_groups.append(pos_list)
 
         log.success(f"✅ Linked {len(hedged_groups)} hedge group(s)", source="HedgeCore")
         return hedged_groups
@@ -0,0 +1,234 @@
+"""
+Hedge rebalance optimizer.
+
+Searches collateral and size adjustments for one side of a long/short pair
+and picks the candidate that minimises the chosen objective across a grid of
+price scenarios:
+
+``equal_value``
+    mean ``|long value - short value|``
+``delta_neutral``
+    mean ``|net dollar delta|`` (a liquidated leg carries no delta)
+
+Every candidate × scenario pair is evaluated in one pass of numpy arrays, so
+a few thousand candidates over ~100 prices is a few hundred thousand element
+operations rather than a Python loop over position dicts.
+
+Adding size is assumed to fill at the reference price, which blends the
+side's entry price; reducing size keeps the entry price.  A leg whose value
+drops to zero at a scenario price counts as liquidated there.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.logging import log
+
+OBJECTIVES = ("equal_value", "delta_neutral")
+
+DEFAULT_SPAN = 0.25
+DEFAULT_SCENARIOS = 101
+DEFAULT_STEPS = 61
+DEFAULT_MIN_FACTOR = -0.9
+DEFAULT_MAX_FACTOR = 2.0
+DEFAULT_MAX_LEVERAGE = 100.0
+
+
+def _leg(pos: dict):
+    entry = float(pos.get("entry_price") or 0.0)
+    size = float(pos.get("size") or 0.0)
+    collateral = float(pos.get("collateral") or 0.0)
+    sign = 1.0 if (pos.get("position_type") or "LONG").upper() == "LONG" else -1.0
+    return entry, size, collateral, sign
+
+
+def price_grid(price: float, span: float = DEFAULT_SPAN, count: int = DEFAULT_SCENARIOS) -> np.ndarray:
+    """``count`` evenly spaced prices within ``±span`` of ``price``."""
+    low = max(price * (1.0 - span), 1e-9)
+    return np.linspace(low, price * (1.0 + span), max(2, int(count)))
+
+
+def evaluate_legs(entry, tokens, collateral, sign, prices, liquidation: bool = False):
+    """Value, PnL and dollar delta of one leg (or a column of candidates) at each price.
+
+    ``entry``/``tokens``/``collateral`` broadcast against ``prices``: pass
+    scalars for a single leg, or ``(N, 1)`` arrays for ``N`` candidates.
+    """
+    pnl = sign * (prices - entry) * tokens
+    value = collateral + pnl
+    delta = sign * tokens * prices
+    if liquidation:
+        alive = value > 0
+        value = np.where(alive, value, 0.0)
+        delta = np.where(alive, delta, 0.0)
+    return value, pnl, delta
+
+
+class HedgeRebalanceOptimizer:
+    """Grid search over one side's collateral/size adjustments."""
+
+    def __init__(self, steps: int = DEFAULT_STEPS, min_factor: float = DEFAULT_MIN_FACTOR,
+                 max_factor: float = DEFAULT_MAX_FACTOR, max_leverage: float = DEFAULT_MAX_LEVERAGE,
+                 fee_rate: float = 0.0):
+        self.steps = max(2, int(steps))
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+        self.max_leverage = max_leverage
+        self.fee_rate = fee_rate
+
+    def _factors(self, enabled: bool, low: float = None, high: float = None) -> np.ndarray:
+        if not enabled:
+            return np.zeros(1)
+        low = self.min_factor if low is None else max(low, self.min_factor)
+        high = self.max_factor if high is None else min(high, self.max_factor)
+        factors = np.linspace(low, high, self.steps)
+        # Always include "leave it alone" so the optimum never regresses
+        return np.unique(np.append(factors, 0.0))
+
+    def objective(self, target: str, long_value, short_value, long_delta, short_delta):
+        if target == "delta_neutral":
+            return np.abs(long_delta + short_delta).mean(axis=-1)
+        return np.abs(long_value - short_value).mean(axis=-1)
+
+    def _score(self, c_factors, s_factors, adj, fixed, price, prices, target, side) -> dict:
+        """Evaluate every (collateral, size) factor pair against every scenario price."""
+        entry, size, collateral, sign = adj
+        fixed_value, fixed_delta = fixed
+
+        # Candidate grid: collateral factor × size factor, flattened to (N, 1)
+        cf, sf = np.meshgrid(c_factors, s_factors, indexing="ij")
+        d_collateral = (cf * collateral).reshape(-1, 1)
+        d_size = (sf * size).reshape(-1, 1)
+
+        new_collateral = collateral + d_collateral
+        new_size = size + d_size
+        tokens = np.where(d_size >= 0, size / entry + d_size / price, new_size / entry)
+        new_entry = np.divide(new_size, tokens, out=np.full_like(tokens, entry), where=tokens > 0)
+
+        valid = (new_collateral > 0) & (new_size >= 0)
+        valid &= new_size <= new_collateral * self.max_leverage
+
+        value, _, delta = evaluate_legs(new_entry, tokens, new_collateral, sign, prices, liquidation=True)
+        if side == "long":
+            raw = self.objective(target, value, fixed_value, delta, fixed_delta)
+        else:
+            raw = self.objective(target, fixed_value, value, fixed_delta, delta)
+
+        cost = self.fee_rate * np.abs(d_size[:, 0])
+        # Tiny preference for the smallest move when candidates tie
+        scores = raw + cost + 1e-9 * (np.abs(d_collateral[:, 0]) + np.abs(d_size[:, 0]))
+        scores = np.where(valid[:, 0], scores, np.inf)
+        best = int(np.argmin(scores))
+        baseline = np.flatnonzero((d_collateral[:, 0] == 0) & (d_size[:, 0] == 0))
+        return {
+            "score": float(scores[best]),
+            "objective": float(raw[best]),
+            "baseline": float(raw[baseline[0]]) if baseline.size and valid[baseline[0], 0] else None,
+            "c_factor": float(cf.reshape(-1)[best]),
+            "s_factor": float(sf.reshape(-1)[best]),
+            "d_collateral": float(d_collateral[best, 0]),
+            "d_size": float(d_size[best, 0]),
+            "collateral": float(new_collateral[best, 0]),
+            "size": float(new_size[best, 0]),
+            "entry": float(new_entry[best, 0]),
+            "value": value[best],
+            "delta": delta[best],
+            "candidates": int(d_collateral.shape[0]),
+        }
+
+    def optimize(self, long_pos: dict, short_pos: dict, price: float,
+                 target: str = "equal_value", side: str = "long",
+                 fields: Sequence[str] = ("collateral", "size"),
+                 scenarios: Optional[Sequence[float]] = None,
+                 span: float = DEFAULT_SPAN, scenario_count: int = DEFAULT_SCENARIOS) -> Dict[str, object]:
+        """Best adjustment for ``side``; see module docstring for the objectives.
+
+        A coarse pass covers the whole factor range, then one refinement pass
+        re-grids ±1 coarse step around the best candidate.
+        """
+        started = time.perf_counter()
+        target = (target or "equal_value").lower()
+        if target not in OBJECTIVES:
+            raise ValueError(f"Unsupported rebalance target: {target}")
+        side = (side or "long").lower()
+        if side not in ("long", "short"):
+            raise ValueError(f"Unsupported adjustable side: {side}")
+        price = float(price)
+        if price <= 0:
+            raise ValueError("price must be positive")
+
+        prices = (
+            np.asarray(sorted(float(p) for p in scenarios), dtype=float)
+            if scenarios else price_grid(price, span, scenario_count)
+        )
+
+        adj_pos, fixed_pos = (long_pos, short_pos) if side == "long" else (short_pos, long_pos)
+        adj = _leg(adj_pos)
+        f_entry, f_size, f_collateral, f_sign = _leg(fixed_pos)
+        if adj[0] <= 0 or f_entry <= 0:
+            raise ValueError("both positions need a positive entry_price")
+        fixed_value, _, fixed_delta = evaluate_legs(
+            f_entry, f_size / f_entry, f_collateral, f_sign, prices, liquidation=True
+        )
+        fixed = (fixed_value, fixed_delta)
+
+        use_c, use_s = "collateral" in fields, "size" in fields
+        coarse = self._score(self._factors(use_c), self._factors(use_s), adj, fixed, price, prices, target, side)
+        if not np.isfinite(coarse["score"]):
+            raise ValueError("no feasible adjustment for the given positions")
+
+        step = (self.max_factor - self.min_factor) / (self.steps - 1)
+        fine = self._score(
+            self._factors(use_c, coarse["c_factor"] - step, coarse["c_factor"] + step),
+            self._factors(use_s, coarse["s_factor"] - step, coarse["s_factor"] + step),
+            adj, fixed, price, prices, target, side,
+        )
+        best = fine if fine["score"] < coarse["score"] else coarse
+
+        long_value, short_value = (best["value"], fixed_value) if side == "long" else (fixed_value, best["value"])
+        long_delta, short_delta = (best["delta"], fixed_delta) if side == "long" else (fixed_delta, best["delta"])
+        profile: List[Dict[str, float]] = [
+            {
+                "price": round(float(p), 6),
+                "long_value": round(float(lv), 6),
+                "short_value": round(float(sv), 6),
+                "imbalance": round(float(lv - sv), 6),
+                "net_delta": round(float(ld + sd), 6),
+            }
+            for p, lv, sv, ld, sd in zip(prices, long_value, short_value, long_delta, short_delta)
+        ]
+
+        updates = {}
+        if use_c:
+            updates["collateral"] = round(best["collateral"], 6)
+        if use_s:
+            updates["size"] = round(best["size"], 6)
+            updates["entry_price"] = round(best["entry"], 6)
+
+        elapsed = time.perf_counter() - started
+        baseline = coarse["baseline"]
+        result = {
+            "side": side,
+            "target": target,
+            "updates": updates,
+            "adjustments": {
+                "collateral": round(best["d_collateral"], 6),
+                "size": round(best["d_size"], 6),
+            },
+            "objective": round(best["objective"], 6),
+            "baseline_objective": round(baseline, 6) if baseline is not None else None,
+            "candidates": coarse["candidates"] + fine["candidates"],
+            "scenarios": int(prices.shape[0]),
+            "elapsed_ms": round(elapsed * 1000, 2),
+            "profile": profile,
+        }
+        log.debug(
+            "Hedge rebalance optimized",
+            source="HedgeOptimizer",
+            payload={k: result[k] for k in ("side", "target", "candidates", "scenarios", "elapsed_ms", "objective")},
+        )
+        return result
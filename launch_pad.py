@@ -3,22 +3,27 @@
 
 import os
 import sys
+
+from utils.startup_profiler import StartupProfiler
+
+startup_profiler = StartupProfiler("launch_pad")
+startup_profiler.begin("imports", kind="import")
 import subprocess
 import time
 import webbrowser
 import asyncio
-import cyclone_app
 from rich.console import Console
 from rich.text import Text
 
 from core.core_imports import configure_console_log
 from core.logging import log
-from monitor.operations_monitor import OperationsMonitor
-from test_core import TestCore
 from data.data_locker import DataLocker
 from core.constants import DB_PATH
-from utils.startup_service import StartUpService
-from scripts.verify_all_tables_exist import verify_all_tables_exist
+startup_profiler.end()
+
+# Cyclone, monitors, TestCore and the startup service are imported inside the
+# menu actions that use them; importing them here opened DB connections and
+# built every monitor before the menu was even drawn.
 
 console = Console()
 configure_console_log()
@@ -58,6 +63,8 @@ def launch_sonic_web():
 def launch_cyclone():
     """Launch the Cyclone interactive console."""
     console.print("[bold blue]Launching Cyclone...[/bold blue]")
+    import cyclone_app
+
     asyncio.run(cyclone_app.main())
 
 
@@ -84,12 +91,16 @@ def operations_menu():
         console.print("b) 🔙 Back")
         choice = input("→ ").strip().lower()
         if choice == "1":
+            from monitor.operations_monitor import OperationsMonitor
+
             monitor = OperationsMonitor()
 
             result = monitor.run_startup_post()
             log.info("POST Result", payload=result)
             input("Press ENTER to continue...")
         elif choice == "2":
+            from monitor.operations_monitor import OperationsMonitor
+
             monitor = OperationsMonitor()
 
             result = monitor.run_configuration_test()
@@ -151,6 +162,8 @@ def database_utils_menu():
             insert_wallets_main(args)
             input("Press ENTER to continue...")
         elif choice == "4":
+            from scripts.verify_all_tables_exist import verify_all_tables_exist
+
             code = verify_all_tables_exist()
             msg = "[green]All tables verified.[/green]" if code == 0 else "[red]Missing tables detected.[/red]"
             console.print(msg)
@@ -164,6 +177,8 @@ def database_utils_menu():
 
 def core_tests_menu():
     """Run unit tests via :class:`TestCore`."""
+    from test_core import TestCore
+
     tester = TestCore()
     tester.interactive_menu()
     input("Press ENTER to return...")
@@ -229,6 +244,8 @@ def main_menu():
         elif choice == "3":
             launch_sonic_web()
         elif choice == "4":
+            from utils.startup_service import StartUpService
+
             StartUpService.run_all()
             input("Press ENTER to continue...")
         elif choice == "5":
@@ -248,4 +265,5 @@ def main_menu():
 
 
 if __name__ == "__main__":
+    startup_profiler.write_report()
     main_menu()
@@ -2,33 +2,29 @@
 
 from flask import Flask, jsonify
 from monitor_core import MonitorCore
-from monitor_registry import MonitorRegistry
-from price_monitor import PriceMonitor
-from operations_monitor import OperationsMonitor
-from position_monitor import PositionMonitor
-from latency_monitor import LatencyMonitor
+from monitor_registry import MonitorRegistry, lazy_monitor
 from core.logging import log
 
 app = Flask(__name__)
 
-# Setup core + registry
+# Setup core + registry (monitors are built on first run)
 registry = MonitorRegistry()
-registry.register("price_monitor", PriceMonitor())
-registry.register("operations_monitor", OperationsMonitor())
-registry.register("position_monitor", PositionMonitor())
-registry.register("latency_monitor", LatencyMonitor())
+registry.register_factory("price_monitor", lazy_monitor("monitor.price_monitor", "PriceMonitor"))
+registry.register_factory("operations_monitor", lazy_monitor("monitor.operations_monitor", "OperationsMonitor"))
+registry.register_factory("position_monitor", lazy_monitor("monitor.position_monitor", "PositionMonitor"))
+registry.register_factory("latency_monitor", lazy_monitor("monitor.latency_monitor", "LatencyMonitor"))
 
 core = MonitorCore(registry=registry)
 
 @app.route("/monitors", methods=["GET"])
 def list_monitors():
     log.route("📜 Listing all registered monitors", source="API")
-    return jsonify(sorted(registry.get_all_monitors().keys()))
+    return jsonify(sorted(registry.names()))
 
 @app.route("/monitor/<name>", methods=["POST"])
 def run_monitor(name):
     log.banner(f"🚨 API Triggered: {name}")
-    if name not in registry.get_all_monitors():
+    if name not in registry.names():
         log.warning(f"❌ Unknown monitor: {name}", source="API")
         return jsonify({"error": f"Monitor '{name}' not found"}), 404
 
@@ -47,7 +43,7 @@ def run_all_monitors():
     try:
         core.run_all()
         log.success("✅ All monitors ran successfully via API", source="API")
-        return jsonify({"status": "success", "monitors": list(registry.get_all_monitors().keys())})
+        return jsonify({"status": "success", "monitors": registry.names()})
     except Exception as e:
         log.error("❌ Core execution failure", source="API", payload={"error": str(e)})
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -10,11 +10,7 @@ PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
 from monitor_core import MonitorCore
-from monitor_registry import MonitorRegistry
-from price_monitor import PriceMonitor
-from operations_monitor import OperationsMonitor
-from latency_monitor import LatencyMonitor
-from position_monitor import PositionMonitor
+from monitor_registry import MonitorRegistry, lazy_monitor
 from core.logging import log
 from core.core_imports import configure_console_log
 
@@ -26,12 +22,12 @@ configure_console_log()
 data_locker = DataLocker(DB_PATH)
 ledger = data_locker.ledger
 
-# Register monitors
+# Register monitors (built on first run)
 registry = MonitorRegistry()
-registry.register("price_monitor", PriceMonitor())
-registry.register("operations_monitor", OperationsMonitor())
-registry.register("latency_monitor", LatencyMonitor())
-registry.register("position_monitor", PositionMonitor())
+registry.register_factory("price_monitor", lazy_monitor("monitor.price_monitor", "PriceMonitor"))
+registry.register_factory("operations_monitor", lazy_monitor("monitor.operations_monitor", "OperationsMonitor"))
+registry.register_factory("latency_monitor", lazy_monitor("monitor.latency_monitor", "LatencyMonitor"))
+registry.register_factory("position_monitor", lazy_monitor("monitor.position_monitor", "PositionMonitor"))
 
 core = MonitorCore(registry=registry)
 
@@ -47,7 +43,7 @@ def show_banner():
 def show_monitor_freshness():
     print("\n📊 Monitor Freshness Snapshot")
     print("-" * 40)
-    for name in sorted(registry.get_all_monitors().keys()):
+    for name in sorted(registry.names()):
         try:
             status = ledger.get_status(name)
             ts = status.get("last_timestamp", "N/A")
@@ -59,7 +55,7 @@ def show_monitor_freshness():
     print("-" * 40)
 
 def select_monitor(title: str):
-    monitors = list(sorted(registry.get_all_monitors().keys()))
+    monitors = list(sorted(registry.names()))
     if not monitors:
         log.warning("No monitors registered.", source="Console")
         return None
@@ -4,15 +4,18 @@ from typing import Optional
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.logging import log
 
-# Import your monitor classes here
-from monitor.price_monitor import PriceMonitor
-from monitor.position_monitor import PositionMonitor
-from monitor.operations_monitor import OperationsMonitor
-from monitor.xcom_monitor import XComMonitor
-from monitor.twilio_monitor import TwilioMonitor
-# Add any new monitors here
+from monitor.monitor_registry import MonitorRegistry, lazy_monitor
 
-from monitor.monitor_registry import MonitorRegistry
+# Default monitors as (name, module, class).  They are imported and built on
+# first use so creating a MonitorCore costs no DB connections or provider setup.
+DEFAULT_MONITORS = [
+    ("price_monitor", "monitor.price_monitor", "PriceMonitor"),
+    ("position_monitor", "monitor.position_monitor", "PositionMonitor"),
+    ("operations_monitor", "monitor.operations_monitor", "OperationsMonitor"),
+    ("xcom_monitor", "monitor.xcom_monitor", "XComMonitor"),
+    ("twilio_monitor", "monitor.twilio_monitor", "TwilioMonitor"),
+    # Add any new monitors here
+]
 
 class MonitorCore:
     """Central controller for all registered monitors."""
@@ -21,7 +24,8 @@ class MonitorCore:
         """Create the core controller.
 
         If ``registry`` is not supplied a new :class:`MonitorRegistry` instance
-        is created and the default monitors are registered. When a registry is
+        is created and the default monitors are registered as lazy factories
+        (instantiated on first ``run_by_name``/``run_all``). When a registry is
         provided it is used as-is, allowing external callers to customize the
         available monitors.
         """
@@ -30,19 +34,16 @@ class MonitorCore:
 
         if registry is None:
             # Register default monitors when no custom registry is supplied
-            self.registry.register("price_monitor", PriceMonitor())
-            self.registry.register("position_monitor", PositionMonitor())
-            self.registry.register("operations_monitor", OperationsMonitor())
-            self.registry.register("xcom_monitor", XComMonitor())
-            self.registry.register("twilio_monitor", TwilioMonitor())
-            # Add more monitors as needed
+            for name, module_path, class_name in DEFAULT_MONITORS:
+                self.registry.register_factory(name, lazy_monitor(module_path, class_name))
 
     def run_all(self):
         """
         Run all registered monitors in sequence.
         """
-        for name, monitor in self.registry.get_all_monitors().items():
+        for name in self.registry.names():
             try:
+                monitor = self.registry.get(name)
                 log.info(f"Running monitor: {name}", source="MonitorCore")
                 monitor.run_cycle()
                 log.success(f"Monitor '{name}' completed successfully.", source="MonitorCore")
@@ -53,7 +54,11 @@ class MonitorCore:
         """
         Run a specific monitor by its registered name.
         """
-        monitor = self.registry.get(name)
+        try:
+            monitor = self.registry.get(name)
+        except Exception as e:
+            log.error(f"Monitor '{name}' failed to load: {e}", source="MonitorCore")
+            return
         if monitor:
             try:
                 log.info(f"Running monitor: {name}", source="MonitorCore")
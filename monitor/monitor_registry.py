@@ -1,17 +1,54 @@
 # monitor/core/monitor_registry.py
 
+import importlib
+from typing import Callable
+
+
+def lazy_monitor(module_path: str, class_name: str) -> Callable[[], object]:
+    """Return a factory that imports ``module_path`` and builds ``class_name``
+    only when the monitor is first needed."""
+
+    def _factory():
+        module = importlib.import_module(module_path)
+        return getattr(module, class_name)()
+
+    _factory.__qualname__ = f"lazy_monitor({module_path}.{class_name})"
+    return _factory
+
+
 class MonitorRegistry:
     """
     Holds and manages all monitor instances.
+
+    Monitors may be registered either as ready instances (``register``) or as
+    zero-argument factories (``register_factory``).  Factories are invoked on
+    first lookup so importing or constructing the registry does no DB or
+    provider work.
     """
     def __init__(self):
         self.monitors = {}
+        self.factories = {}
 
     def register(self, name: str, monitor):
+        self.factories.pop(name, None)
         self.monitors[name] = monitor
 
+    def register_factory(self, name: str, factory: Callable[[], object]):
+        self.monitors.pop(name, None)
+        self.factories[name] = factory
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self.monitors
+
+    def names(self):
+        return list(self.monitors.keys()) + [n for n in self.factories if n not in self.monitors]
+
     def get(self, name: str):
+        if name not in self.monitors and name in self.factories:
+            self.monitors[name] = self.factories.pop(name)()
         return self.monitors.get(name)
 
     def get_all_monitors(self):
+        for name in list(self.factories):
+            self.get(name)
         return self.monitors
@@ -1,23 +1,19 @@
 # monitor/core/monitor_service.py
 
 import subprocess
-import requests
 from datetime import datetime
 from core.core_imports import log
+from prices.price_feed import get_price_feed
 
 class MonitorService:
     def fetch_prices(self):
-        url = "https://api.coingecko.com/api/v3/simple/price"
-        params = {"ids": "bitcoin,ethereum,solana", "vs_currencies": "usd"}
+        """Return ``{"BTC": .., "ETH": .., "SOL": ..}`` from the shared price feed.
+
+        The feed caches, coalesces concurrent calls and falls back across
+        providers, so simultaneous syncs cost a single upstream request.
+        """
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            return {
-                "BTC": data.get("bitcoin", {}).get("usd"),
-                "ETH": data.get("ethereum", {}).get("usd"),
-                "SOL": data.get("solana", {}).get("usd"),
-            }
+            return get_price_feed().get_prices()
         except Exception as e:
             log.error(f"[PriceFetch] failed: {e}")
             return {}
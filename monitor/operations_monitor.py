@@ -14,6 +14,7 @@ import time
 from monitor.base_monitor import BaseMonitor
 from data.data_locker import DataLocker
 from core.logging import log
+from system.health_probes import HealthProbeService, chatgpt_probe, twilio_probe
 from core.constants import DB_PATH, ALERT_THRESHOLDS_PATH
 from config.config_loader import load_config
 from utils.schema_validation_service import SchemaValidationService
@@ -38,6 +39,9 @@ class OperationsMonitor(BaseMonitor):
         self.continuous_mode = continuous_mode
         self.notifications_enabled = notifications_enabled
         self.logger = logging.getLogger("OperationsMonitor")
+        self.health = HealthProbeService()
+        self.health.register("chatgpt", chatgpt_probe)
+        self.health.register("twilio", twilio_probe)
 
     def check_for_config_updates(self) -> bool:
         """Reload ``alert_thresholds`` from disk and update the DB entry if changed.
@@ -158,45 +162,29 @@ class OperationsMonitor(BaseMonitor):
         }
 
     def check_api_status(self) -> dict:
-        """Check ChatGPT and API (Twilio) connectivity and log to XCom ledger."""
+        """Check ChatGPT and API (Twilio) connectivity and log to XCom ledger.
+
+        Both probes run concurrently through ``self.health`` and are cached
+        for its TTL, so repeated calls do not hit the network every time.
+        """
         log.info("🔌 Checking API status", source=self.name)
 
-        chatgpt_success = False
-        chatgpt_error = None
-        api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPEN_AI_KEY")
-        if not api_key:
-            log.warning("OPENAI_API_KEY not configured", source=self.name)
-            chatgpt_error = "missing api key"
+        results = self.health.check_all(["chatgpt", "twilio"])
+        chatgpt, api = results["chatgpt"], results["twilio"]
+
+        chatgpt_success = chatgpt["ok"]
+        chatgpt_error = None if chatgpt_success else chatgpt["status"]
+        if chatgpt_success:
+            log.success("ChatGPT API reachable", source=self.name)
         else:
-            try:  # pragma: no cover - openai optional
-                from openai import OpenAI
+            log.error(f"ChatGPT check failed: {chatgpt_error}", source=self.name)
 
-                client = OpenAI(api_key=api_key)
-                client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": "ping"}],
-                )
-                chatgpt_success = True
-                log.success("ChatGPT API reachable", source=self.name)
-            except Exception as exc:  # pragma: no cover - network dependent
-                chatgpt_error = str(exc)
-                log.error(f"ChatGPT check failed: {exc}", source=self.name)
-
-        api_success = False
-        api_error = None
-        try:
-            from xcom.check_twilio_heartbeat_service import CheckTwilioHeartbeatService
-
-            result = CheckTwilioHeartbeatService({}).check(dry_run=True)
-            api_success = bool(result.get("success"))
-            if api_success:
-                log.success("Twilio credentials valid", source=self.name)
-            else:
-                api_error = result.get("error")
-                log.error(f"Twilio check failed: {api_error}", source=self.name)
-        except Exception as exc:  # pragma: no cover - network dependent
-            api_error = str(exc)
-            log.error(f"Twilio check failed: {exc}", source=self.name)
+        api_success = api["ok"]
+        api_error = None if api_success else api["status"]
+        if api_success:
+            log.success("Twilio credentials valid", source=self.name)
+        else:
+            log.error(f"Twilio check failed: {api_error}", source=self.name)
 
         status = "Success" if chatgpt_success and api_success else "Failed"
         metadata = {
@@ -1,6 +1,10 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.startup_profiler import StartupProfiler
+
+startup_profiler = StartupProfiler("sonic_monitor")
+startup_profiler.begin("imports", kind="import")
 import asyncio
 import logging
 import time
@@ -9,6 +13,7 @@ from cyclone.cyclone_engine import Cyclone
 
 from data.data_locker import DataLocker
 from core.constants import DB_PATH
+startup_profiler.end()
 
 MONITOR_NAME = "sonic_monitor"
 DEFAULT_INTERVAL = 60  # fallback if nothing set in DB
@@ -58,24 +63,29 @@ async def sonic_cycle(loop_counter: int, cyclone: Cyclone, interval: int):
 def main():
     loop_counter = 0
 
-    from monitor.monitor_core import MonitorCore
-    monitor_core = MonitorCore()
-    cyclone = Cyclone(monitor_core=monitor_core)
+    with startup_profiler.phase("cyclone_init"):
+        from monitor.monitor_core import MonitorCore
+        monitor_core = MonitorCore()  # monitors are built on first run
+        cyclone = Cyclone(monitor_core=monitor_core)
 
     # --- Ensure the heartbeat table exists ---
-    dl = DataLocker(str(DB_PATH))
-    cursor = dl.db.get_cursor()
-    if not cursor:
-        logging.error("No DB cursor available; cannot initialize heartbeat table")
-        return
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS monitor_heartbeat (
-            monitor_name TEXT PRIMARY KEY,
-            last_run TIMESTAMP NOT NULL,
-            interval_seconds INTEGER NOT NULL
-        )
-    """)
-    dl.db.commit()
+    with startup_profiler.phase("heartbeat_table"):
+        dl = DataLocker(str(DB_PATH))
+        cursor = dl.db.get_cursor()
+        if not cursor:
+            logging.error("No DB cursor available; cannot initialize heartbeat table")
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS monitor_heartbeat (
+                monitor_name TEXT PRIMARY KEY,
+                last_run TIMESTAMP NOT NULL,
+                interval_seconds INTEGER NOT NULL
+            )
+        """)
+        dl.db.commit()
+
+    report_path = startup_profiler.write_report()
+    logging.info("Startup profile written to %s (%.0f ms)", report_path, startup_profiler.summary()["total_ms"])
 
     loop = asyncio.get_event_loop()
     try:
@@ -89,4 +99,8 @@ def main():
         logging.info("SonicMonitor terminated by user.")
 
 if __name__ == "__main__":
+    from core.process_pool import enable_process_pool
+
+    # Nothing above runs on import, so spawn workers may re-import this script
+    enable_process_pool()
     main()
@@ -10,8 +10,7 @@ from core.core_imports import configure_console_log, DB_PATH
 from data.data_locker import DataLocker
 from xcom.xcom_core import XComCore
 from monitor.monitor_core import MonitorCore
-from monitor.monitor_registry import MonitorRegistry
-from monitor.price_monitor import PriceMonitor
+from monitor.monitor_registry import MonitorRegistry, lazy_monitor
 from data.dl_system_data import DLSystemDataManager
 
 
@@ -23,7 +22,7 @@ sysman = dl.system
 
 # Monitor Registration
 registry = MonitorRegistry()
-registry.register("price_monitor", PriceMonitor())
+registry.register_factory("price_monitor", lazy_monitor("monitor.price_monitor", "PriceMonitor"))
 monitor_core = MonitorCore(registry=registry)
 
 # ───────────────────────────────────────────────
@@ -70,7 +69,7 @@ def menu_monitors():
         pause()
 
 def select_monitor():
-    names = list(sorted(registry.get_all_monitors().keys()))
+    names = list(sorted(registry.names()))
     if not names: log.warning("No monitors registered"); return None
     for i, n in enumerate(names): print(f"{i+1}) {n}")
     try:
@@ -8,6 +8,7 @@ from .alerts_topic_handler import AlertsTopicHandler
 from .prices_topic_handler import PricesTopicHandler
 from .system_topic_handler import SystemTopicHandler
 from .positions_topic_handler import PositionsTopicHandler
+from .context_snapshot_service import ContextSnapshotService, mark_data_changed
 
 __all__ = [
     "StrategyManager",
@@ -20,6 +21,8 @@ __all__ = [
     "PricesTopicHandler",
     "SystemTopicHandler",
     "PositionsTopicHandler",
+    "ContextSnapshotService",
+    "mark_data_changed",
     "OracleCore",
 ]
 
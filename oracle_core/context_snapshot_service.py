@@ -0,0 +1,111 @@
+"""Per-generation cache of Oracle/Trader context.
+
+Topic contexts and the serialized prompt payloads built from them only
+change when Cyclone commits new data.  ``ContextSnapshotService`` keeps the
+results keyed by a *data generation*; as long as the generation is unchanged
+repeated ``OracleCore.ask``/``to_dict`` and ``TraderLoader.load_trader``
+calls are served from memory without touching the database.
+
+The generation combines the ``DataLocker.changes`` topic generations, which
+move on every committed write from any process, with the explicit
+:func:`mark_data_changed` counter (called by Cyclone after each cycle).  The
+latter is mirrored to ``global_config`` and re-read at most every
+``check_interval`` seconds.
+"""
+
+import threading
+import time
+import weakref
+from typing import Callable, Dict, Hashable
+
+GENERATION_KEY = "context_generation"
+
+_local_generation = 0
+_registry = weakref.WeakKeyDictionary()
+_registry_lock = threading.Lock()
+
+
+def mark_data_changed(data_locker=None) -> int:
+    """Invalidate all cached contexts and publish the change to other processes."""
+    global _local_generation
+    _local_generation += 1
+    if data_locker is not None and getattr(data_locker, "system", None):
+        try:
+            current = data_locker.system.get_var(GENERATION_KEY) or {}
+            shared = int(current.get("value", 0)) + 1 if isinstance(current, dict) else 1
+            data_locker.system.set_var(GENERATION_KEY, {"value": shared})
+        except Exception:
+            pass
+    return _local_generation
+
+
+class ContextSnapshotService:
+    """Memoize context builders for the current data generation."""
+
+    def __init__(self, data_locker=None, check_interval: float = 5.0):
+        self.data_locker = data_locker
+        self.check_interval = check_interval
+        self._cache: Dict[Hashable, object] = {}
+        self._generation = None
+        self._shared_generation = 0
+        self._last_check = None
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_locker(cls, data_locker) -> "ContextSnapshotService":
+        """Return the shared service for ``data_locker`` (one per locker)."""
+        if data_locker is None:
+            return cls(None)
+        with _registry_lock:
+            try:
+                service = _registry.get(data_locker)
+                if service is None:
+                    service = cls(data_locker)
+                    _registry[data_locker] = service
+                return service
+            except TypeError:  # not weak-referenceable
+                return cls(data_locker)
+
+    def _read_shared_generation(self) -> int:
+        system = getattr(self.data_locker, "system", None) if self.data_locker else None
+        if system is None:
+            return 0
+        try:
+            value = system.get_var(GENERATION_KEY) or {}
+            return int(value.get("value", 0)) if isinstance(value, dict) else 0
+        except Exception:
+            return self._shared_generation
+
+    def generation(self) -> tuple:
+        now = time.monotonic()
+        if self._last_check is None or now - self._last_check >= self.check_interval:
+            self._shared_generation = self._read_shared_generation()
+            self._last_check = now
+        changes = getattr(self.data_locker, "changes", None) if self.data_locker else None
+        token = changes.token() if changes is not None else None
+        return (_local_generation, self._shared_generation, token)
+
+    def _sync(self):
+        gen = self.generation()
+        if gen != self._generation:
+            self._cache.clear()
+            self._generation = gen
+
+    def get(self, key: Hashable, builder: Callable[[], object]):
+        """Return the cached value for ``key`` or build and cache it."""
+        with self._lock:
+            self._sync()
+            if key in self._cache:
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+            value = builder()
+            self._cache[key] = value
+            return value
+
+    def invalidate(self):
+        with self._lock:
+            self._cache.clear()
+            self._generation = None
@@ -9,6 +9,7 @@ except Exception:  # pragma: no cover - optional dependency
 
 from .strategy_manager import StrategyManager, Strategy
 from .persona_manager import PersonaManager
+from .context_snapshot_service import ContextSnapshotService
 from trader.trader_loader import TraderLoader
 from .portfolio_topic_handler import PortfolioTopicHandler
 from .alerts_topic_handler import AlertsTopicHandler
@@ -46,6 +47,8 @@ class OracleCore:
         # Load built-in strategies and personas automatically
         self.strategy_manager = StrategyManager()
         self.persona_manager = PersonaManager()
+        # Contexts and prompt payloads are rebuilt only when data changes
+        self.snapshots = ContextSnapshotService.for_locker(data_locker)
         self.handlers: Dict[str, object] = {}
         self.register_topic_handler("portfolio", PortfolioTopicHandler(data_locker))
         self.register_topic_handler("alerts", AlertsTopicHandler(data_locker))
@@ -78,7 +81,9 @@ class OracleCore:
         if topic not in self.handlers:
             raise ValueError(f"Unsupported topic: {topic}")
         handler = self.handlers[topic]
-        context = handler.get_context()
+        context = self.snapshots.get(
+            ("context", topic, type(handler).__name__), handler.get_context
+        )
         instructions = self.DEFAULT_INSTRUCTIONS.get(topic, "Assist the user.")
 
         if topic == "positions" and not strategy_name:
@@ -112,19 +117,30 @@ class OracleCore:
 
         return context, instructions
 
+    def get_messages(self, topic: str, strategy_name: Optional[str] = None) -> List[Dict]:
+        """Return the prompt for ``topic``, serialized once per data generation."""
+        handler = self.handlers.get(topic)
+
+        def _build():
+            context, instructions = self._get_context_and_instructions(topic, strategy_name)
+            return self.build_prompt(topic, context, instructions)
+
+        messages = self.snapshots.get(
+            ("messages", topic, type(handler).__name__, strategy_name), _build
+        )
+        return [dict(m) for m in messages]
+
     def ask(self, topic: str, strategy_name: Optional[str] = None) -> str:
-        context, instructions = self._get_context_and_instructions(topic, strategy_name)
-        messages = self.build_prompt(topic, context, instructions)
-        return self.query_gpt(messages)
+        return self.query_gpt(self.get_messages(topic, strategy_name))
 
     def to_dict(self, topic: str, strategy_name: Optional[str] = None) -> Dict:
-        context, instructions = self._get_context_and_instructions(topic, strategy_name)
-        messages = self.build_prompt(topic, context, instructions)
-        return {"topic": topic, "messages": messages}
+        return {"topic": topic, "messages": self.get_messages(topic, strategy_name)}
 
     def ask_trader(self, topic: str, trader_name: str) -> str:
         """Query GPT for a trader persona."""
-        loader = TraderLoader(self.persona_manager, self.strategy_manager, self.data_locker)
+        loader = TraderLoader(
+            self.persona_manager, self.strategy_manager, self.data_locker, snapshots=self.snapshots
+        )
         trader = loader.load_trader(trader_name)
         weighted = [
             (self.strategy_manager.get(n).modifiers, w)
@@ -1,24 +1,34 @@
 class OracleDataService:
     """Provide data for the GPT Oracle context."""
 
+    # Rows of each table included in a topic context
+    CONTEXT_LIMIT = 20
+
     def __init__(self, data_locker):
         self.dl = data_locker
 
+    def _recent(self, manager, limited: str, full: str):
+        """Use the manager's ``LIMIT``ed query when available."""
+        fetch = getattr(manager, limited, None)
+        if callable(fetch):
+            return fetch(self.CONTEXT_LIMIT)
+        return getattr(manager, full)()[: self.CONTEXT_LIMIT]
+
     def fetch_portfolio(self):
         return self.dl.portfolio.get_latest_snapshot()
 
     def fetch_alerts(self):
-        return self.dl.alerts.get_all_alerts()[:20]
+        return self._recent(self.dl.alerts, "get_recent_alerts", "get_all_alerts")
 
     def fetch_prices(self):
-        return self.dl.prices.get_all_prices()[:20]
+        return self._recent(self.dl.prices, "get_recent_prices", "get_all_prices")
 
     def fetch_positions(self):
         """Return recent positions for context."""
-        return self.dl.positions.get_all_positions()[:20]
+        return self._recent(self.dl.positions, "get_recent_positions", "get_all_positions")
 
     def fetch_death_log(self):
-        return self.dl.get_death_log_entries()
+        return self.dl.get_death_log_entries(self.CONTEXT_LIMIT)
 
     def fetch_system_alerts(self):
         return self.dl.get_system_alerts()
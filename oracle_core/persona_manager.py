@@ -1,9 +1,33 @@
+import copy
 import json
 import os
+from functools import lru_cache
 
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
+def _read_definitions(path: str) -> List[Dict]:
+    """Persona dicts from a JSON file holding one definition or a list."""
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    if isinstance(data, dict) and "name" in data:
+        return [data]
+    if isinstance(data, list):
+        return data
+    return []
+
+
+@lru_cache(maxsize=None)
+def _dir_definitions(base_dir: str) -> Tuple[Dict, ...]:
+    """Persona definitions under ``base_dir``, parsed once per process."""
+    if not os.path.isdir(base_dir):
+        return ()
+    definitions = []
+    for fname in os.listdir(base_dir):
+        if fname.endswith(".json"):
+            definitions.extend(_read_definitions(os.path.join(base_dir, fname)))
+    return tuple(definitions)
+
 
 class Persona:
     """Simple persona container."""
@@ -28,11 +52,8 @@ class PersonaManager:
         self._load_all()
 
     def _load_all(self):
-        if not os.path.isdir(self.base_dir):
-            return
-        for fname in os.listdir(self.base_dir):
-            if fname.endswith(".json"):
-                self.load_from_file(os.path.join(self.base_dir, fname))
+        # Each instance gets its own copy of the cached definitions
+        self.load(copy.deepcopy(_dir_definitions(os.path.abspath(self.base_dir))))
 
     def load(self, personas: Iterable[Dict]):
         for data in personas:
@@ -40,13 +61,7 @@ class PersonaManager:
 
 
     def load_from_file(self, path: str):
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-
-        if isinstance(data, dict) and "name" in data:
-            self.register(data)
-        elif isinstance(data, list):
-            self.load(data)
+        self.load(_read_definitions(path))
 
     def register(self, data: Dict):
         persona = data if isinstance(data, Persona) else Persona(data)
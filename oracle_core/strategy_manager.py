@@ -1,9 +1,39 @@
+import copy
 import json
+from functools import lru_cache
 
 from typing import Dict, Iterable, List, Tuple
 
 import importlib.resources as resources
 
+
+def _read_definitions(path) -> List[Dict]:
+    """Strategy dicts from a JSON file holding one definition or a list."""
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    if isinstance(data, dict) and "name" in data:
+        return [data]
+    if isinstance(data, list):
+        return data
+    return []
+
+
+@lru_cache(maxsize=None)
+def _builtin_definitions() -> Tuple[Dict, ...]:
+    """Bundled strategy definitions, parsed once per process."""
+    strategies_dir = resources.files("oracle_core").joinpath("strategies")
+    if not strategies_dir.is_dir():  # pragma: no cover - defensive
+        return ()
+
+    definitions = []
+    for entry in strategies_dir.glob("*.json"):
+        try:
+            with resources.as_file(entry) as path:
+                definitions.extend(_read_definitions(path))
+        except Exception:
+            continue
+    return tuple(definitions)
+
 class Strategy:
     """Simple strategy container."""
 
@@ -77,29 +107,15 @@ class StrategyManager:
         self._load_builtin()
 
     def _load_builtin(self):
-        """Load strategies bundled with the package."""
-        strategies_dir = resources.files("oracle_core").joinpath("strategies")
-        if not strategies_dir.is_dir():  # pragma: no cover - defensive
-            return
-
-        for entry in strategies_dir.glob("*.json"):
-            try:
-                with resources.as_file(entry) as path:
-                    self.load_from_file(path)
-            except Exception:
-                continue
+        """Load strategies bundled with the package (each instance gets its own copy)."""
+        self.load(copy.deepcopy(_builtin_definitions()))
 
     def load(self, strategies: Iterable[Dict]):
         for data in strategies:
             self.register(data)
 
     def load_from_file(self, path: str):
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        if isinstance(data, dict) and "name" in data:
-            self.register(data)
-        elif isinstance(data, list):
-            self.load(data)
+        self.load(_read_definitions(path))
 
     def register(self, data: Dict):
         strat = data if isinstance(data, Strategy) else Strategy(data)
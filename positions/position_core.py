@@ -7,7 +7,6 @@ from positions.position_store import PositionStore
 from positions.position_enrichment_service import PositionEnrichmentService
 from positions.position_enrichment_service import validate_enriched_position
 from hedge_core.hedge_core import HedgeCore
-from calc_core.calc_services import CalcServices
 from datetime import datetime
 
 class PositionCore:
@@ -15,6 +14,7 @@ class PositionCore:
         self.dl = data_locker
         self.store = PositionStore(data_locker)
         self.enricher = PositionEnrichmentService(data_locker)
+        self.last_enriched_at = None
 
     def get_all_positions(self):
         return self.store.get_all_positions()
@@ -34,20 +34,22 @@ class PositionCore:
 
     def record_snapshot(self):
         try:
-            raw = self.store.get_active_positions()
-            totals = CalcServices().calculate_totals(raw)
+            totals = self.dl.portfolio_aggregates.get_totals()
             self.dl.portfolio.record_snapshot(totals)
             log.success("📸 Position snapshot recorded", source="PositionCore")
         except Exception as e:
             log.error(f"❌ Snapshot recording failed: {e}", source="PositionCore")
 
-    def update_positions_from_jupiter(self, source="console"):
+    def update_positions_from_jupiter(self, source="console", fetch_map=None):
         """
         Legacy passthrough for console + engine.
-        Uses PositionSyncService under the hood.
+        Uses PositionSyncService under the hood; ``fetch_map`` maps the
+        per-wallet fetch (e.g. over a process pool).
         """
         from positions.position_sync_service import PositionSyncService
         sync_service = PositionSyncService(self.dl)
+        if fetch_map:
+            return sync_service.run_full_jupiter_sync(source=source, fetch_map=fetch_map)
         return sync_service.run_full_jupiter_sync(source=source)
 
     def link_hedges(self):
@@ -78,8 +80,10 @@ class PositionCore:
 
     async def enrich_positions(self):
         """
-        Enriches all current positions and returns the list.
-        Performs validation after enrichment.
+        Enriches all current positions in one batch and returns the list.
+        Prices are prefetched once, results are validated and the derived
+        fields of valid positions are written back with an ``enriched_at``
+        stamp so downstream steps can reuse them.
         """
         log.banner("🧠 Enriching All Positions via PositionCore")
 
@@ -88,21 +92,20 @@ class PositionCore:
             enriched = []
             failed = []
 
-            for pos in raw:
-                try:
-                    enriched_pos = self.enricher.enrich(pos)
+            for pos in self.enricher.enrich_batch(raw):
+                if validate_enriched_position(pos, source="EnrichmentValidator", verbose=False):
+                    enriched.append(pos)
+                else:
+                    failed.append(pos.get("id"))
 
-                    if validate_enriched_position(enriched_pos, source="EnrichmentValidator"):
-                        enriched.append(enriched_pos)
-                    else:
-                        failed.append(enriched_pos.get("id"))
-
-                except Exception as e:
-                    log.error(f"⚠️ Failed to enrich position {pos.get('id')}: {e}", source="PositionCore")
+            self.last_enriched_at = self.enricher.persist(enriched)
+            for pos in enriched:
+                pos["enriched_at"] = self.last_enriched_at
 
             log.success("✅ Position enrichment complete", source="PositionCore", payload={
                 "enriched": len(enriched),
-                "failed": len(failed)
+                "failed": len(failed),
+                "enriched_at": self.last_enriched_at
             })
 
             if failed:
@@ -2,7 +2,6 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from positions.position_enrichment_service import PositionEnrichmentService, validate_enriched_position
-from calc_core.calculation_core import CalculationCore
 from core.logging import log
 
 class PositionCoreService:
@@ -58,10 +57,8 @@ class PositionCoreService:
 
     def record_positions_snapshot(self):
         try:
-            positions = self.dl.positions.get_active_positions()
-            calc = CalculationCore(self.dl)
-            totals = calc.calculate_totals(positions)
+            totals = self.dl.portfolio_aggregates.get_totals()
             self.dl.portfolio.record_snapshot(totals)
-            log.success(f"📋 Snapshot of {len(positions)} positions recorded.", source="PositionCoreService")
+            log.success(f"📋 Snapshot of {totals['position_count']} positions recorded.", source="PositionCoreService")
         except Exception as e:
             log.error(f"❌ record_positions_snapshot failed: {e}", source="PositionCoreService")
@@ -7,21 +7,69 @@ from core.logging import log
 from core.constants import DB_PATH
 from data.data_locker import DataLocker
 from utils.fuzzy_wuzzy import fuzzy_match_key
-from calc_core.calculation_core import CalculationCore
+from datetime import datetime, timezone
+from functools import lru_cache
+
+_UNSET = object()
+
+
+@lru_cache(maxsize=256)
+def normalize_position_type(raw_type: str) -> str:
+    """Map a raw side string to LONG/SHORT/UNKNOWN (fuzzy match is cached)."""
+    raw_type = str(raw_type or "").strip().lower()
+    if raw_type in ["long", "l"]:
+        return "LONG"
+    if raw_type in ["short", "s"]:
+        return "SHORT"
+    match = fuzzy_match_key(raw_type, {"LONG": None, "SHORT": None}, threshold=60.0)
+    return match.upper() if match else "UNKNOWN"
+
 
 class PositionEnrichmentService:
-    def __init__(self, data_locker=None):
+    def __init__(self, data_locker=None, calc_core=None):
         self.dl = data_locker
-        self.calc_core = CalculationCore(data_locker)
-
-    def enrich(self, position):
-        from core.logging import log
-        from utils.fuzzy_wuzzy import fuzzy_match_key
+        # A prebuilt ``calc_core`` (e.g. over a StaticModifierStore) lets
+        # ``enrich`` run without a DataLocker when prices are passed in
+        self.calc_core = calc_core or CalculationCore(data_locker)
 
+    def enrich_batch(self, positions: list) -> list:
+        """Enrich many positions with one price query and summary logging."""
+        assets = {p.get("asset_type") for p in positions}
+        try:
+            latest = self.dl.prices.get_latest_prices([a for a in assets if a])
+        except Exception as e:
+            log.error(f"❌ Price prefetch failed: {e}", source="Enrichment")
+            latest = {}
+        enriched = [
+            self.enrich(p, latest_price=latest.get(p.get("asset_type")), verbose=False)
+            for p in positions
+        ]
+        log.info(
+            f"📥 Enriched {len(enriched)} positions",
+            source="Enrichment",
+            payload={"assets": sorted(a for a in assets if a), "priced": sorted(latest)},
+        )
+        return enriched
+
+    def persist(self, positions: list) -> str:
+        """Write derived fields back in one transaction; returns the ``enriched_at`` stamp."""
+        enriched_at = datetime.now(timezone.utc).isoformat()
+        written = self.dl.positions.update_enrichment_batch(positions, enriched_at)
+        log.info(f"💾 Persisted enrichment for {written} positions", source="Enrichment",
+                 payload={"enriched_at": enriched_at})
+        return enriched_at
+
+    def enrich(self, position, latest_price=_UNSET, verbose: bool = True):
+        """Enrich one position in place.
+
+        ``latest_price`` is the prefetched price row for the asset (``None`` if
+        there is none); when omitted it is read from the DB.
+        """
         pos_id = position.get('id', 'UNKNOWN')
         asset = position.get('asset_type', '??')
 
-        log.info(f"\n📥 Enriching position [{pos_id}] — Asset: {asset}", source="Enrichment")
+        if verbose:
+            log.info(f"\n📥 Enriching position [{pos_id}] — Asset: {asset}", source="Enrichment")
 
         try:
             # Step 1: Field defaults
@@ -47,13 +95,7 @@ class PositionEnrichmentService:
 
             # 🔍 Step 2: Position Type Normalization
             raw_type = str(position.get("position_type", "")).strip().lower()
-            if raw_type in ["long", "l"]:
-                position["position_type"] = "LONG"
-            elif raw_type in ["short", "s"]:
-                position["position_type"] = "SHORT"
-            else:
-                match = fuzzy_match_key(raw_type, {"LONG": None, "SHORT": None}, threshold=60.0)
-                position["position_type"] = match.upper() if match else "UNKNOWN"
+            position["position_type"] = normalize_position_type(raw_type)
 
             if position["position_type"] == "UNKNOWN":
                 log.warning(f"⚠️ Could not normalize position_type for [{pos_id}] — input: '{raw_type}'",
@@ -73,7 +115,15 @@ class PositionEnrichmentService:
                     log.error(f"❌ Failed to coerce field [{field}] for [{pos_id}]: {e}", source="Enrichment")
                     position[field] = 0.0
 
-            # Step 5: Derived field enrichment (through CalculationCore)
+            # Step 5: Market price injection (before the derived fields so the
+            # stored heat values match the stored current_price)
+            latest = self.dl.get_latest_price(asset) if latest_price is _UNSET else latest_price
+            if latest and latest.get('current_price') is not None:
+                position['current_price'] = float(latest['current_price'])
+                if verbose:
+                    log.info(f"🌐 Market price injected for {asset}: {position['current_price']}", source="Enrichment")
+
+            # Step 6: Derived field enrichment (through CalculationCore)
             # NOTE: Jupiter already provides an accurate value field.
             # Historically we recomputed value from size * current_price,
             # but that overwrote the API-provided figure.  We keep the
@@ -99,13 +149,8 @@ class PositionEnrichmentService:
             position['heat_index'] = risk
             position['current_heat_index'] = risk
 
-            # Step 6: Market price injection
-            latest = self.dl.get_latest_price(asset)
-            if latest and 'current_price' in latest:
-                position['current_price'] = float(latest['current_price'])
-                log.info(f"🌐 Market price injected for {asset}: {position['current_price']}", source="Enrichment")
-
-            log.success(f"✅ Enriched [{pos_id}] complete", source="Enrichment")
+            if verbose:
+                log.success(f"✅ Enriched [{pos_id}] complete", source="Enrichment")
             return position
 
         except Exception as e:
@@ -113,7 +158,7 @@ class PositionEnrichmentService:
             return position
 
 
-def validate_enriched_position(position: dict, source="EnrichmentValidator") -> bool:
+def validate_enriched_position(position: dict, source="EnrichmentValidator", verbose: bool = True) -> bool:
     pos_id = position.get("id", "UNKNOWN")
     failures = []
 
@@ -139,5 +184,6 @@ def validate_enriched_position(position: dict, source="EnrichmentValidator") ->
         })
         return False
     else:
-        log.success(f"✅ Position [{pos_id}] passed all enrichment checks", source=source)
+        if verbose:
+            log.success(f"✅ Position [{pos_id}] passed all enrichment checks", source=source)
         return True
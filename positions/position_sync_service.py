@@ -6,10 +6,10 @@ from datetime import datetime
 import requests
 import time
 from core.logging import log
+from core.cycle_metrics import record_http_call
 from core.constants import JUPITER_API_BASE
 from data.data_locker import DataLocker
 from positions.position_enrichment_service import PositionEnrichmentService
-from calc_core.calculation_core import CalculationCore
 
 class PositionSyncService:
     def __init__(self, data_locker):
@@ -26,6 +26,7 @@ class PositionSyncService:
         headers = {"User-Agent": "Cyclone/PositionSyncService"}
         for attempt in range(1, attempts + 1):
             try:
+                record_http_call()
                 res = requests.get(url, headers=headers, timeout=10)
                 log.debug(
                     f"📡 Attempt {attempt} → status {res.status_code}",
@@ -42,13 +43,13 @@ class PositionSyncService:
                     raise
                 time.sleep(delay * attempt)
 
-    def run_full_jupiter_sync(self, source="user") -> dict:
+    def run_full_jupiter_sync(self, source="user", fetch_map=None) -> dict:
         from positions.hedge_manager import HedgeManager
         from data.dl_monitor_ledger import DLMonitorLedgerManager
 
         try:
             # Step 1: Sync Jupiter Positions
-            result = self.update_jupiter_positions()
+            result = self.update_jupiter_positions(fetch_map=fetch_map) if fetch_map else self.update_jupiter_positions()
 
             if "error" in result:
                 log.error(f"❌ Jupiter Sync Failed: {result['error']}", source="PositionSyncService")
@@ -80,9 +81,7 @@ class PositionSyncService:
                 "last_update_prices_source": source
             })
 
-            calc_core = CalculationCore(self.dl)
-            active_positions = self.dl.positions.get_active_positions()
-            totals = calc_core.calculate_totals(active_positions)
+            totals = self.dl.portfolio_aggregates.get_totals()
             self.dl.portfolio.record_snapshot(totals)
 
             # Step 4: HTML Report
@@ -146,7 +145,64 @@ class PositionSyncService:
                 "timestamp": datetime.now().isoformat()
             }
 
-    def update_jupiter_positions(self):
+    def fetch_wallet(self, wallet: dict) -> dict:
+        """Fetch and parse one wallet's Jupiter positions (no DB access).
+
+        Returns ``{"wallet": name, "positions": [...], "errors": n}``.
+        """
+        pub = (wallet.get("public_address") or "").strip()
+        name = wallet.get("name", "Unnamed")
+        result = {"wallet": name, "positions": [], "errors": 0}
+
+        if not pub:
+            log.warning(f"⚠️ Skipping {name} — missing address", source="PositionSyncService")
+            return result
+
+        try:
+            url = f"{JUPITER_API_BASE}/v1/positions?walletAddress={pub}&showTpslRequests=true"
+            res = self._request_with_retries(url)
+
+            log.debug(f"🌐 [{name}] Jupiter API status: {res.status_code}", source="JupiterAPI")
+            log.debug(f"📝 Response Body:\n{res.text}", source="JupiterAPI")
+
+            data_list = res.json().get("dataList", [])
+            log.info(f"📊 {name} → {len(data_list)} Jupiter positions", source="PositionSyncService")
+
+            for item in data_list:
+                pos_id = item.get("positionPubkey")
+                if not pos_id:
+                    log.warning("🚫 Missing positionPubkey, skipping", source="PositionSyncService")
+                    continue
+
+                raw_pos = {
+                    "id": pos_id,
+                    "asset_type": self.MINT_TO_ASSET.get(item.get("marketMint", ""), "BTC"),
+                    "position_type": item.get("side", "short").lower(),
+                    "entry_price": float(item.get("entryPrice", 0.0)),
+                    "liquidation_price": float(item.get("liquidationPrice", 0.0)),
+                    "collateral": float(item.get("collateral", 0.0)),
+                    "size": float(item.get("size", 0.0)),
+                    "leverage": float(item.get("leverage", 0.0)),
+                    "value": float(item.get("value", 0.0)),
+                    "last_updated": datetime.fromtimestamp(float(item.get("updatedTime", 0))).isoformat(),
+                    "wallet_name": name,
+                    "pnl_after_fees_usd": float(item.get("pnlAfterFeesUsd", 0.0)),
+                    "travel_percent": float(item.get("pnlChangePctAfterFees", 0.0)),
+                    # Kept apart from ``travel_percent``, which enrichment recalculates
+                    "jupiter_travel_percent": float(item.get("pnlChangePctAfterFees", 0.0)),
+                    "current_price": float(item.get("markPrice", 0.0))
+                }
+
+                log.debug(f"🆕 Parsed Jupiter position: {raw_pos}", source="Parser")
+                result["positions"].append(raw_pos)
+
+        except requests.RequestException as e:
+            log.error(f"❌ [{name}] API Request Error: {e}", source="JupiterAPI")
+            log.debug(f"📝 Raw body:\n{res.text if 'res' in locals() else 'no response'}", source="JupiterAPI")
+            result["errors"] += 1
+        return result
+
+    def update_jupiter_positions(self, fetch_map=None):
         from positions.position_enrichment_service import PositionEnrichmentService
         from core.logging import log
 
@@ -158,58 +214,16 @@ class PositionSyncService:
             log.info(f"🔍 Loaded {len(wallets)} wallets for sync", source="PositionSyncService")
 
             new_positions = []
+            reported = {}
             errors = 0
             imported = 0
             skipped = 0
 
-            for wallet in wallets:
-                pub = wallet.get("public_address", "").strip()
-                name = wallet.get("name", "Unnamed")
-
-                if not pub:
-                    log.warning(f"⚠️ Skipping {name} — missing address", source="PositionSyncService")
-                    continue
-
-                try:
-                    url = f"{JUPITER_API_BASE}/v1/positions?walletAddress={pub}&showTpslRequests=true"
-                    res = self._request_with_retries(url)
-
-                    log.debug(f"🌐 [{name}] Jupiter API status: {res.status_code}", source="JupiterAPI")
-                    log.debug(f"📝 Response Body:\n{res.text}", source="JupiterAPI")
-
-                    data_list = res.json().get("dataList", [])
-                    log.info(f"📊 {name} → {len(data_list)} Jupiter positions", source="PositionSyncService")
-
-                    for item in data_list:
-                        pos_id = item.get("positionPubkey")
-                        if not pos_id:
-                            log.warning("🚫 Missing positionPubkey, skipping", source="PositionSyncService")
-                            continue
-
-                        raw_pos = {
-                            "id": pos_id,
-                            "asset_type": self.MINT_TO_ASSET.get(item.get("marketMint", ""), "BTC"),
-                            "position_type": item.get("side", "short").lower(),
-                            "entry_price": float(item.get("entryPrice", 0.0)),
-                            "liquidation_price": float(item.get("liquidationPrice", 0.0)),
-                            "collateral": float(item.get("collateral", 0.0)),
-                            "size": float(item.get("size", 0.0)),
-                            "leverage": float(item.get("leverage", 0.0)),
-                            "value": float(item.get("value", 0.0)),
-                            "last_updated": datetime.fromtimestamp(float(item.get("updatedTime", 0))).isoformat(),
-                            "wallet_name": name,
-                            "pnl_after_fees_usd": float(item.get("pnlAfterFeesUsd", 0.0)),
-                            "travel_percent": float(item.get("pnlChangePctAfterFees", 0.0)),
-                            "current_price": float(item.get("markPrice", 0.0))
-                        }
-
-                        log.debug(f"🆕 Parsed Jupiter position: {raw_pos}", source="Parser")
-                        new_positions.append(raw_pos)
-
-                except requests.RequestException as e:
-                    log.error(f"❌ [{name}] API Request Error: {e}", source="JupiterAPI")
-                    log.debug(f"📝 Raw body:\n{res.text if 'res' in locals() else 'no response'}", source="JupiterAPI")
-                    errors += 1
+            # One request per wallet; ``fetch_map`` may spread them over a pool
+            fetches = fetch_map(fetch_wallet_positions, wallets) if fetch_map else map(self.fetch_wallet, wallets)
+            for fetched in fetches:
+                new_positions.extend(fetched["positions"])
+                errors += fetched["errors"]
 
             enricher = PositionEnrichmentService(self.dl)
 
@@ -236,6 +250,7 @@ class PositionSyncService:
 
                 if exists:
                     log.info(f"⏭️ Skipped (already exists): {pos['id']}", source="InsertCheck")
+                    reported[pos["id"]] = pos.get("jupiter_travel_percent")
                     skipped += 1
                     continue
 
@@ -264,6 +279,10 @@ class PositionSyncService:
                     log.error(f"❌ Insert failed for {pos['id']}: {e}", source="InsertVerify")
                     errors += 1
 
+            # Existing rows are not re-imported, but Jupiter's latest travel
+            # percent is still recorded for drift tracking
+            self.dl.positions.update_jupiter_travel_batch(reported)
+
             log.info(
                 f"📦 Jupiter Sync Result → Imported: {imported}, Skipped: {skipped}, Errors: {errors}",
                 source="SyncSummary"
@@ -281,4 +300,6 @@ class PositionSyncService:
             return {"error": str(e)}
 
 
-
+def fetch_wallet_positions(wallet: dict) -> dict:
+    """Module-level :meth:`PositionSyncService.fetch_wallet` so process pools can pickle it."""
+    return PositionSyncService(None).fetch_wallet(wallet)
@@ -0,0 +1,342 @@
+# prices/price_feed.py
+"""
+Author: BubbaDiego
+Module: PriceFeed
+Description:
+    Multi-source spot price feed shared by every price sync trigger
+    (Cyclone, ``PriceMonitor``, ``/prices/update``, ``/cyclone_market_update``).
+
+    - Providers are tried in order; assets a provider misses are filled from
+      the next one.
+    - Results are cached for ``ttl`` seconds.
+    - Concurrent callers coalesce onto a single in-flight fetch when it
+      covers the assets they asked for; others wait for it and fetch again.
+    - Per-provider latency and error counters are exposed by ``stats()``,
+      keyed ``name`` (``name#2``, ... for repeated provider names).
+
+    Set ``SONIC_PRICE_REPLAY=/path/to/ticks.jsonl`` to run the whole price
+    path offline from a recorded file (see ``ReplayPriceProvider``).
+"""
+
+import csv
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from core.cycle_metrics import record_http_call
+from core.logging import log
+
+DEFAULT_ASSETS = ("BTC", "ETH", "SOL")
+
+
+class PriceProvider:
+    """Base class: ``fetch`` returns ``{asset: price}`` for what it knows."""
+
+    name = "base"
+
+    def fetch(self, assets: Iterable[str]) -> Dict[str, float]:
+        raise NotImplementedError
+
+
+class CoinGeckoProvider(PriceProvider):
+    name = "coingecko"
+    URL = "https://api.coingecko.com/api/v3/simple/price"
+    IDS = {"BTC": "bitcoin", "ETH": "ethereum", "SOL": "solana"}
+
+    def __init__(self, timeout: float = 10):
+        self.timeout = timeout
+
+    def fetch(self, assets):
+        import requests
+
+        ids = {self.IDS[a]: a for a in assets if a in self.IDS}
+        if not ids:
+            return {}
+        record_http_call()
+        response = requests.get(
+            self.URL,
+            params={"ids": ",".join(ids), "vs_currencies": "usd"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return {
+            asset: float(data[cid]["usd"])
+            for cid, asset in ids.items()
+            if data.get(cid, {}).get("usd") is not None
+        }
+
+
+class BinanceProvider(PriceProvider):
+    name = "binance"
+    URL = "https://api.binance.com/api/v3/ticker/price"
+
+    def __init__(self, timeout: float = 10, quote: str = "USDT"):
+        self.timeout = timeout
+        self.quote = quote
+
+    def fetch(self, assets):
+        import requests
+
+        symbols = {f"{a}{self.quote}": a for a in assets}
+        if not symbols:
+            return {}
+        record_http_call()
+        response = requests.get(
+            self.URL,
+            params={"symbols": json.dumps(list(symbols), separators=(",", ":"))},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return {
+            symbols[row["symbol"]]: float(row["price"])
+            for row in response.json()
+            if row.get("symbol") in symbols
+        }
+
+
+class StaticPriceProvider(PriceProvider):
+    """Serve fixed prices (tests and manual overrides)."""
+
+    name = "static"
+
+    def __init__(self, prices: Dict[str, float]):
+        self.prices = dict(prices)
+
+    def fetch(self, assets):
+        return {a: self.prices[a] for a in assets if a in self.prices}
+
+
+class ReplayPriceProvider(PriceProvider):
+    """Deterministic offline provider backed by a recorded tick file.
+
+    Supported formats:
+      - ``.jsonl``: one ``{"BTC": 1.0, "ETH": 2.0}`` (or
+        ``{"asset": "BTC", "price": 1.0}``) object per line
+      - ``.json``: a list of such objects
+      - ``.csv``: ``asset,price`` rows or one column per asset
+
+    Each ``fetch`` advances one frame; per-asset rows are grouped into frames
+    in file order.  With ``loop=True`` the replay restarts at the end,
+    otherwise the last frame is repeated.
+    """
+
+    name = "replay"
+
+    def __init__(self, path: str, loop: bool = True):
+        self.path = path
+        self.loop = loop
+        self.frames = self._load(path)
+        self.position = 0
+
+    @staticmethod
+    def _to_frames(rows: List[dict]) -> List[Dict[str, float]]:
+        frames: List[Dict[str, float]] = []
+        current: Dict[str, float] = {}
+        for row in rows:
+            if "asset" in row and "price" in row:
+                asset = str(row["asset"]).upper()
+                if asset in current:
+                    frames.append(current)
+                    current = {}
+                current[asset] = float(row["price"])
+            else:
+                if current:
+                    frames.append(current)
+                    current = {}
+                frames.append({
+                    str(k).upper(): float(v)
+                    for k, v in row.items()
+                    if v not in (None, "") and str(k).lower() not in ("timestamp", "ts", "time")
+                })
+        if current:
+            frames.append(current)
+        return [f for f in frames if f]
+
+    def _load(self, path: str) -> List[Dict[str, float]]:
+        ext = os.path.splitext(path)[1].lower()
+        with open(path, "r", encoding="utf-8") as f:
+            if ext == ".csv":
+                rows = list(csv.DictReader(f))
+            elif ext == ".json":
+                rows = json.load(f)
+            else:
+                rows = [json.loads(line) for line in f if line.strip()]
+        frames = self._to_frames(rows)
+        if not frames:
+            raise ValueError(f"No price frames in replay file {path}")
+        return frames
+
+    def fetch(self, assets):
+        frame = self.frames[self.position]
+        if self.position + 1 < len(self.frames):
+            self.position += 1
+        elif self.loop:
+            self.position = 0
+        return {a: frame[a] for a in assets if a in frame}
+
+
+class _Flight:
+    """One in-flight fetch that concurrent callers wait on."""
+
+    def __init__(self, assets):
+        self.assets = frozenset(assets)
+        self.done = threading.Event()
+        self.result: Dict[str, float] = {}
+
+
+class PriceFeed:
+    """TTL-cached, coalescing front for an ordered list of providers."""
+
+    def __init__(self, providers: List[PriceProvider], ttl: float = 15.0, assets=DEFAULT_ASSETS):
+        self.providers = list(providers)
+        self.ttl = ttl
+        self.assets = tuple(assets)
+        self._cache: Dict[str, float] = {}
+        self._cached_at = 0.0
+        self._lock = threading.Lock()
+        self._inflight: Optional[_Flight] = None
+        self._labels = self._provider_labels(self.providers)
+        self._stats = {
+            label: {"requests": 0, "errors": 0, "assets_served": 0, "total_latency_ms": 0.0,
+                    "last_latency_ms": None, "last_error": None}
+            for label in self._labels
+        }
+        self.fetches = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def _provider_labels(providers) -> List[str]:
+        """Stats keys: the provider name, suffixed ``#n`` when it repeats."""
+        seen: Dict[str, int] = {}
+        labels = []
+        for provider in providers:
+            seen[provider.name] = seen.get(provider.name, 0) + 1
+            n = seen[provider.name]
+            labels.append(provider.name if n == 1 else f"{provider.name}#{n}")
+        return labels
+
+    def _fresh(self, assets, max_age) -> bool:
+        age = time.monotonic() - self._cached_at
+        return age < max_age and all(a in self._cache for a in assets)
+
+    def get_prices(self, assets: Optional[Iterable[str]] = None, max_age: Optional[float] = None) -> Dict[str, float]:
+        """Return ``{asset: price}``; never raises, returns ``{}`` on total failure."""
+        assets = tuple(assets or self.assets)
+        max_age = self.ttl if max_age is None else max_age
+        while True:
+            with self._lock:
+                if self._fresh(assets, max_age):
+                    self.cache_hits += 1
+                    return {a: self._cache[a] for a in assets}
+                flight = self._inflight
+                if flight is None:
+                    flight = self._inflight = _Flight(assets)
+                    break
+                covered = flight.assets.issuperset(assets)
+                if covered:
+                    self.coalesced += 1
+
+            flight.done.wait()
+            if covered:
+                return {a: flight.result[a] for a in assets if a in flight.result}
+            # The flight fetched other assets: re-check the cache, then lead
+            # a fetch of our own if it still does not cover this request
+
+        try:
+            flight.result = self._fetch(assets)
+            with self._lock:
+                if flight.result:
+                    self._cache.update(flight.result)
+                    self._cached_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._inflight = None
+            flight.done.set()
+        return dict(flight.result)
+
+    def _fetch(self, assets) -> Dict[str, float]:
+        self.fetches += 1
+        prices: Dict[str, float] = {}
+        for label, provider in zip(self._labels, self.providers):
+            missing = [a for a in assets if a not in prices]
+            if not missing:
+                break
+            stats = self._stats[label]
+            stats["requests"] += 1
+            start = time.perf_counter()
+            try:
+                got = provider.fetch(missing) or {}
+            except Exception as e:
+                stats["errors"] += 1
+                stats["last_error"] = str(e)
+                log.warning(f"⚠️ Price provider {provider.name} failed: {e}", source="PriceFeed")
+                got = {}
+            finally:
+                latency = (time.perf_counter() - start) * 1000
+                stats["last_latency_ms"] = round(latency, 3)
+                stats["total_latency_ms"] += latency
+            got = {a: p for a, p in got.items() if a in missing and p is not None}
+            stats["assets_served"] += len(got)
+            prices.update(got)
+        if len(prices) < len(assets):
+            log.warning(
+                "⚠️ Price feed incomplete",
+                source="PriceFeed",
+                payload={"missing": [a for a in assets if a not in prices]},
+            )
+        return prices
+
+    def invalidate(self):
+        with self._lock:
+            self._cache.clear()
+            self._cached_at = 0.0
+
+    def stats(self) -> dict:
+        providers = {}
+        for name, s in self._stats.items():
+            avg = s["total_latency_ms"] / s["requests"] if s["requests"] else None
+            providers[name] = {
+                **s,
+                "total_latency_ms": round(s["total_latency_ms"], 3),
+                "avg_latency_ms": round(avg, 3) if avg is not None else None,
+            }
+        return {
+            "ttl": self.ttl,
+            "fetches": self.fetches,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "providers": providers,
+        }
+
+
+_feed: Optional[PriceFeed] = None
+_feed_lock = threading.Lock()
+
+
+def build_default_feed() -> PriceFeed:
+    ttl = float(os.getenv("PRICE_FEED_TTL", "15"))
+    replay = os.getenv("SONIC_PRICE_REPLAY")
+    if replay:
+        log.info(f"📼 Price feed replaying {replay}", source="PriceFeed")
+        return PriceFeed([ReplayPriceProvider(replay)], ttl=ttl)
+    return PriceFeed([CoinGeckoProvider(), BinanceProvider()], ttl=ttl)
+
+
+def get_price_feed() -> PriceFeed:
+    """Return the process-wide price feed."""
+    global _feed
+    with _feed_lock:
+        if _feed is None:
+            _feed = build_default_feed()
+        return _feed
+
+
+def set_price_feed(feed: Optional[PriceFeed]):
+    """Replace the process-wide feed (``None`` rebuilds from the environment)."""
+    global _feed
+    with _feed_lock:
+        _feed = feed
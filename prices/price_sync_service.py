@@ -4,6 +4,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from core.logging import log
 from monitor.monitor_service import MonitorService
+from prices.price_feed import get_price_feed
 from data.dl_monitor_ledger import DLMonitorLedgerManager
 from datetime import datetime, timezone
 
@@ -46,7 +47,8 @@ class PriceSyncService:
                 "fetched_count": len(prices),
                 "assets": asset_list,
                 "success": True,
-                "timestamp": now.isoformat()
+                "timestamp": now.isoformat(),
+                "feed": get_price_feed().stats()
             }
 
             log.success("✅ Price sync complete", source="PriceSyncService", payload={
@@ -55,6 +57,7 @@ class PriceSyncService:
             })
 
             self._write_ledger(result, "Success")
+            self._publish_deltas()
             log.banner("✅ Price Sync Completed")
             return result
 
@@ -72,6 +75,15 @@ class PriceSyncService:
             self._write_ledger(result, "Error")
             return result
 
+    def _publish_deltas(self):
+        try:
+            from dashboard.delta_publisher import DeltaPublisher
+            publisher = DeltaPublisher.for_locker(self.dl)
+            publisher.publish("prices")
+            publisher.publish("ledger")
+        except Exception as e:
+            log.warning(f"⚠️ Price delta publish failed: {e}", source="PriceSyncService")
+
     def _write_ledger(self, result: dict, status: str):
         try:
             ledger = DLMonitorLedgerManager(self.dl.db)
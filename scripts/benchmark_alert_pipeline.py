@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+"""Compare wall time of the legacy pseudo-async alert loop with the
+async-native pipeline in ``AlertCore.evaluate_all_alerts``.
+
+Both runs use a throwaway SQLite database seeded with ``--alerts`` position
+alerts and a fake SMS sender that blocks (legacy) or sleeps on the event
+loop (async) for ``--notify-ms`` per message, so the numbers reflect how
+much DB and notification latency each version overlaps.
+
+Usage::
+
+    python scripts/benchmark_alert_pipeline.py --alerts 200 --notify-ms 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from data.data_locker import DataLocker  # noqa: E402
+from data.alert import AlertType, Condition, NotificationType  # noqa: E402
+from alert_core.alert_core import AlertCore  # noqa: E402
+from core.logging import log  # noqa: E402
+
+
+class _BlockingSender:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def notify(self, alert):
+        time.sleep(self.delay)
+        return True
+
+
+class _AsyncSender:
+    def __init__(self, delay: float, limit: int):
+        self.delay = delay
+        self.limit = limit
+
+    async def __aenter__(self):
+        self._sem = asyncio.Semaphore(self.limit)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def notify(self, alert):
+        async with self._sem:
+            await asyncio.sleep(self.delay)
+            return True
+
+
+def _seed(dl: DataLocker, core: AlertCore, count: int) -> None:
+    for i in range(count):
+        pos_id = f"bench-pos-{i}"
+        dl.positions.create_position({
+            "id": pos_id,
+            "asset_type": ("BTC", "ETH", "SOL")[i % 3],
+            "entry_price": 100.0,
+            "liquidation_price": 50.0,
+            "position_type": "LONG",
+            "wallet_name": "bench",
+            "pnl_after_fees_usd": float(i),
+            "current_heat_index": float(i % 100),
+        })
+        core.repo.create_alert({
+            "id": str(uuid4()),
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "alert_type": (AlertType.Profit, AlertType.HeatIndex)[i % 2].value,
+            "alert_class": "Position",
+            "asset_type": "BTC",
+            "trigger_value": 10.0,
+            "condition": Condition.ABOVE.value,
+            "notification_type": "SMS",
+            "position_reference_id": pos_id,
+        })
+
+
+async def _legacy_pass(core: AlertCore, sender: _BlockingSender) -> int:
+    """The pre-async loop: gather over coroutines that never yield."""
+    alerts = core.repo.get_active_alerts()
+    enriched = [await core.enricher.enrich(a) for a in alerts]
+
+    async def _one(alert):
+        evaluated = core.evaluator.evaluate(alert)
+        core.evaluator.update_alert_level(evaluated.id, evaluated.level)
+        core.evaluator.update_alert_evaluated_value(evaluated.id, evaluated.evaluated_value)
+        if evaluated.notification_type == NotificationType.SMS:
+            sender.notify(evaluated)
+        return evaluated
+
+    results = await asyncio.gather(*(_one(a) for a in enriched))
+    return len(results)
+
+
+def run(alert_count: int, notify_ms: float, repeat: int) -> dict:
+    log.silence_all()
+    delay = notify_ms / 1000.0
+    timings = {"legacy": [], "async": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        dl = DataLocker(os.path.join(tmp, "bench.db"))
+        core = AlertCore(dl, lambda: {})
+        _seed(dl, core, alert_count)
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            asyncio.run(_legacy_pass(core, _BlockingSender(delay)))
+            timings["legacy"].append(time.perf_counter() - start)
+
+            core.notifier_factory = lambda: _AsyncSender(delay, AlertCore.NOTIFY_CONCURRENCY)
+            start = time.perf_counter()
+            asyncio.run(core.evaluate_all_alerts())
+            timings["async"].append(time.perf_counter() - start)
+
+        dl.close()
+    log.enable_all()
+
+    best = {k: min(v) for k, v in timings.items()}
+    return {
+        "alerts": alert_count,
+        "notify_ms": notify_ms,
+        "repeat": repeat,
+        "legacy_s": round(best["legacy"], 4),
+        "async_s": round(best["async"], 4),
+        "speedup": round(best["legacy"] / best["async"], 2) if best["async"] else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alerts", type=int, default=200)
+    parser.add_argument("--notify-ms", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(json.dumps(run(args.alerts, args.notify_ms, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
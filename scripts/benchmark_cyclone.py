@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Time each Cyclone step, the dashboard context, alert processing and the
+Jupiter position import on seeded synthetic data.
+
+Every scale gets its own throwaway database (see
+``test_core/synthetic_data.py``).  Results are written as JSON to
+``reports/benchmarks/<commit>.json`` so runs from different commits can be
+compared with ``--compare``.
+
+Usage::
+
+    python scripts/benchmark_cyclone.py --scales small medium
+    python scripts/benchmark_cyclone.py --compare reports/benchmarks/abc1234.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from core.logging import log  # noqa: E402
+from test_core.synthetic_data import SCALES, build_synthetic_locker  # noqa: E402
+from test_core.cyclone_benchmark import (  # noqa: E402
+    benchmark_environment,
+    benchmark_metadata,
+    build_cyclone,
+    build_targets,
+    compare_results,
+    time_target,
+)
+
+REPORT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "reports", "benchmarks"))
+
+
+def run(scales, repeat: int, seed: int, only=None) -> dict:
+    log.silence_all()
+    results = {"meta": benchmark_metadata(seed, repeat), "scales": {}}
+    try:
+        for scale in scales:
+            with tempfile.TemporaryDirectory() as tmp:
+                dl, gen, counts = build_synthetic_locker(os.path.join(tmp, "bench.db"), scale, seed)
+                timings = {}
+                with benchmark_environment(dl, gen):
+                    targets = build_targets(dl, build_cyclone(dl))
+                    for name, (setup, call) in targets.items():
+                        if only and not any(o in name for o in only):
+                            continue
+                        timings[name] = time_target(setup, call, repeat)
+                dl.db.close()
+            results["scales"][scale] = {"counts": counts, "targets": timings}
+    finally:
+        log.enable_all()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", nargs="+", default=["small", "medium"], choices=sorted(SCALES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument("--only", nargs="*", help="substring filter on target names")
+    parser.add_argument("--output", help="result file (default reports/benchmarks/<commit>.json)")
+    parser.add_argument("--compare", help="baseline result file to compare against")
+    args = parser.parse_args()
+
+    results = run(args.scales, args.repeat, args.seed, args.only)
+
+    output = args.output or os.path.join(REPORT_DIR, f"{results['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare_results(baseline, results)
+        print(json.dumps(
+            [dict(zip(("scale", "target", "baseline_s", "current_s", "ratio"), r)) for r in rows],
+            indent=2,
+        ))
+    else:
+        print(json.dumps(results, indent=2))
+    print(f"Results written to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,8 +15,13 @@ except Exception:  # pragma: no cover - optional dependency
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 load_dotenv()
 
+from utils.startup_profiler import StartupProfiler
+
+startup_profiler = StartupProfiler("sonic_app")
+startup_profiler.begin("core_imports", kind="import")
+
 try:
-    from flask import Flask, redirect, url_for, current_app, jsonify
+    from flask import Flask, Response, g, redirect, request, url_for, current_app, jsonify
     from flask_socketio import SocketIO
 except Exception:  # pragma: no cover - optional dependency
     class Flask:
@@ -34,6 +39,13 @@ except Exception:  # pragma: no cover - optional dependency
     def jsonify(*_a, **_k):
         return {}
 
+    request = None
+    g = None
+
+    class Response:
+        def __init__(self, *a, **k):
+            pass
+
     class SocketIO:
         def __init__(self, *a, **k):
             pass
@@ -46,6 +58,7 @@ from dashboard.dashboard_service import get_profit_badge_value
 # --- Monitor & Cyclone Core Integration ---
 from monitor.monitor_core import MonitorCore
 from cyclone.cyclone_engine import Cyclone
+startup_profiler.end()
 
 # --- Logging Setup ---
 log.banner("SONIC DASHBOARD STARTUP")
@@ -63,56 +76,112 @@ app.config["PHANTOM_PATH"] = os.getenv(
 socketio = SocketIO(app)
 
 # --- SINGLETON BACKEND ---
-app.data_locker = DataLocker(str(DB_PATH))
-app.system_core = SystemCore(app.data_locker)
-app.monitor_core = MonitorCore()
-app.cyclone = Cyclone(monitor_core=app.monitor_core, debug=True)
+from core.service_container import ServiceContainer
+from dashboard.delta_publisher import DeltaBroadcaster, register_socket_handlers
+
+
+def init_backend(app):
+    """Build the DataLocker, Cyclone and push broadcaster for ``app``."""
+    with startup_profiler.phase("backend_init"):
+        app.data_locker = DataLocker(str(DB_PATH))
+        app.services = ServiceContainer()
+        app.services.register("data_locker", instance=app.data_locker)
+        app.services.register("system_core", lambda: SystemCore(app.data_locker))
+        app.system_core = app.services.get("system_core")
+        app.monitor_core = MonitorCore()  # monitors are built on first run
+        app.cyclone = Cyclone(monitor_core=app.monitor_core, debug=True)
+
+    # --- Push-based dashboard updates ---
+    if register_socket_handlers(socketio):
+        app.delta_broadcaster = DeltaBroadcaster(socketio, app.data_locker)
+        app.delta_broadcaster.start()
+
+
+# Spawned pool workers re-import this script as ``__mp_main__``; they must
+# not boot a second backend
+BOOTSTRAP = __name__ != "__mp_main__"
+if BOOTSTRAP:
+    init_backend(app)
+
+# --- Request scope for memoized context-processor values ---
+@app.before_request
+def _begin_service_scope():
+    g.service_scope = app.services.begin_request()
+
+
+@app.teardown_request
+def _end_service_scope(exc=None):
+    app.services.end_request(g.pop("service_scope", None))
+
+# --- Opt-in SQL tracing per request (SONIC_SQL_TRACE=1) ---
+from contextlib import ExitStack
+from core.cycle_metrics import CycleMetricsRecorder
+from core.sql_tracer import sql_tracing_enabled
+
+if sql_tracing_enabled():
+    @app.before_request
+    def _begin_sql_trace():
+        g.sql_trace_recorder = CycleMetricsRecorder(source="http")
+        g.sql_trace_stack = ExitStack()
+        g.sql_trace_stack.enter_context(
+            g.sql_trace_recorder.step(f"{request.method} {request.path}")
+        )
+
+    @app.teardown_request
+    def _end_sql_trace(exc=None):
+        stack = g.pop("sql_trace_stack", None)
+        recorder = g.pop("sql_trace_recorder", None)
+        if stack is None:
+            return
+        stack.close()
+        step = recorder.steps[-1] if recorder.steps else None
+        if step is not None and step.sql_trace and step.sql_trace["n_plus_one"]:
+            app.data_locker.cycle_metrics.record(recorder, include_total=False)
 
 # --- Blueprints ---
-from app.positions_bp import positions_bp
-from app.alerts_bp import alerts_bp
-from app.prices_bp import prices_bp
-from app.dashboard_bp import dashboard_bp
-from portfolio.portfolio_bp import portfolio_bp
-from sonic_labs.sonic_labs_bp import sonic_labs_bp
-from cyclone.cyclone_bp import cyclone_bp
-from routes.theme_routes import theme_bp
-from app.system_bp import system_bp
-from settings.settings_bp import settings_bp
-from gpt.chat_gpt_bp import chat_gpt_bp
-from gpt.gpt_bp import gpt_bp
-from trader.trader_bp import trader_bp
-
-log.info("Registering blueprints...", source="Startup")
-app.register_blueprint(positions_bp, url_prefix="/positions")
-app.register_blueprint(alerts_bp, url_prefix="/alerts")
-app.register_blueprint(prices_bp, url_prefix="/prices")
-app.register_blueprint(dashboard_bp)
-app.register_blueprint(portfolio_bp, url_prefix="/portfolio")
-app.register_blueprint(sonic_labs_bp, url_prefix="/sonic_labs")
-app.register_blueprint(cyclone_bp)
-app.register_blueprint(theme_bp)
-app.register_blueprint(system_bp)
-app.register_blueprint(settings_bp)
-app.register_blueprint(chat_gpt_bp)
-app.register_blueprint(gpt_bp)
-app.register_blueprint(trader_bp)
+# Imported and registered on the first request (see app/lazy_blueprints.py)
+from app.lazy_blueprints import LazyBlueprints
+
+BLUEPRINTS = (
+    ("app.positions_bp", "positions_bp", "/positions"),
+    ("app.alerts_bp", "alerts_bp", "/alerts"),
+    ("app.prices_bp", "prices_bp", "/prices"),
+    ("app.dashboard_bp", "dashboard_bp", None),
+    ("portfolio.portfolio_bp", "portfolio_bp", "/portfolio"),
+    ("sonic_labs.sonic_labs_bp", "sonic_labs_bp", "/sonic_labs"),
+    ("cyclone.cyclone_bp", "cyclone_bp", None),
+    ("routes.theme_routes", "theme_bp", None),
+    ("app.system_bp", "system_bp", None),
+    ("settings.settings_bp", "settings_bp", None),
+    ("gpt.chat_gpt_bp", "chat_gpt_bp", None),
+    ("gpt.gpt_bp", "gpt_bp", None),
+    ("trader.trader_bp", "trader_bp", None),
+)
+
+
+def _blueprint_aliases(app):
+    if "dashboard.index" in app.view_functions:
+        app.add_url_rule("/dashboard", endpoint="dash", view_func=app.view_functions["dashboard.index"])
+
+
+blueprints = LazyBlueprints(app, BLUEPRINTS, on_loaded=_blueprint_aliases).install()
 
 # --- Set Default Email Provider for XCom ---
-with app.app_context():
-    providers = app.data_locker.system.get_var("xcom_providers") or {}
-    providers["email"] = {
-        "enabled": False,  # True,
-        "smtp": {
-            "server": os.getenv("SMTP_SERVER"),
-            "port": int(os.getenv("SMTP_PORT", "0")) if os.getenv("SMTP_PORT") else None,
-            "username": os.getenv("SMTP_USERNAME"),
-            "password": os.getenv("SMTP_PASSWORD"),
-            "default_recipient": os.getenv("SMTP_DEFAULT_RECIPIENT"),
-        },
-    }
-    app.data_locker.system.set_var("xcom_providers", providers)
-    print("✅ Default email provider set in xcom_providers")
+if BOOTSTRAP:
+    with app.app_context():
+        providers = app.data_locker.system.get_var("xcom_providers") or {}
+        providers["email"] = {
+            "enabled": False,  # True,
+            "smtp": {
+                "server": os.getenv("SMTP_SERVER"),
+                "port": int(os.getenv("SMTP_PORT", "0")) if os.getenv("SMTP_PORT") else None,
+                "username": os.getenv("SMTP_USERNAME"),
+                "password": os.getenv("SMTP_PASSWORD"),
+                "default_recipient": os.getenv("SMTP_DEFAULT_RECIPIENT"),
+            },
+        }
+        app.data_locker.system.set_var("xcom_providers", providers)
+        print("✅ Default email provider set in xcom_providers")
 
 # --- Heartbeat API Route for Countdown ---
 @app.route("/api/heartbeat")
@@ -133,15 +202,39 @@ def api_heartbeat():
         })
     return jsonify({"monitors": result})
 
+# --- Cycle Metrics API ---
+@app.route("/api/metrics")
+def api_metrics():
+    """Rolling per-step Cyclone metrics as JSON or Prometheus text.
+
+    Query args: ``window`` (cycles, default 100) and ``format``
+    (``json``/``prometheus``).  Prometheus is also chosen when the
+    ``Accept`` header asks for ``text/plain``.
+    """
+    metrics = app.data_locker.cycle_metrics
+    window = max(1, min(request.args.get("window", 100, type=int), 2000))
+    percentiles = metrics.get_percentiles(window=window)
+    fmt = request.args.get("format")
+    if fmt is None and "text/plain" in request.headers.get("Accept", ""):
+        fmt = "prometheus"
+    if fmt == "prometheus":
+        return Response(
+            metrics.to_prometheus(percentiles),
+            mimetype="text/plain; version=0.0.4",
+        )
+    return jsonify({
+        "window": window,
+        "steps": percentiles,
+        "recent_cycles": metrics.get_recent(limit=10, step="cycle"),
+        "n_plus_one": metrics.get_n_plus_one(),
+    })
+
 # --- Hedge Calculator Redirect ---
 @app.route("/hedge_calculator")
 def hedge_calculator_redirect():
     """Redirect to the Hedge Calculator page within the system blueprint."""
     return redirect(url_for("system.hedge_calculator_page"))
 
-if "dashboard.index" in app.view_functions:
-    app.add_url_rule("/dashboard", endpoint="dash", view_func=app.view_functions["dashboard.index"])
-
 # --- Simple Root Redirect ---
 @app.route("/")
 @retry_on_locked()
@@ -156,8 +249,11 @@ def index():
 @app.context_processor
 def inject_theme_profile():
     try:
-        core = SystemCore(current_app.data_locker)
-        active_theme = core.get_active_profile()
+        services = current_app.services
+        active_theme = services.memoize(
+            "active_theme_profile",
+            lambda: services.get("system_core").get_active_profile(),
+        )
         return {"active_theme_profile": active_theme or {}}
     except Exception:
         return {"active_theme_profile": {}}
@@ -166,7 +262,11 @@ def inject_theme_profile():
 @app.context_processor
 def inject_profit_badge():
     try:
-        value = get_profit_badge_value(current_app.data_locker, current_app.system_core)
+        services = current_app.services
+        value = services.memoize(
+            "profit_badge_value",
+            lambda: get_profit_badge_value(services.get("data_locker"), services.get("system_core")),
+        )
         return {"profit_badge_value": value}
     except Exception:
         return {"profit_badge_value": None}
@@ -186,6 +286,13 @@ if __name__ == "__main__":
 
     host = "0.0.0.0"
     port = 5000
+    report_path = startup_profiler.write_report()
+    summary = startup_profiler.summary()
+    log.info(
+        f"Startup took {summary['total_ms']:.0f} ms (report: {report_path})",
+        source="Startup",
+        payload={"import_ms": summary["import_ms"], "init_ms": summary["init_ms"]},
+    )
     log.success(f"Starting Flask server at {host}:{port}", source="Startup")
     log.print_dashboard_link(host="127.0.0.1", port=port, route="/")
     app.run(debug=False, host=host, port=port)
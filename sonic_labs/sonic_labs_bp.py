@@ -264,36 +264,69 @@ def api_get_hedge_positions():
     return jsonify({"positions": pos_list})
 
 
-@sonic_labs_bp.route("/api/evaluate_hedge", methods=["GET"])
+@sonic_labs_bp.route("/api/evaluate_hedge", methods=["GET", "POST"])
 @retry_on_locked()
 def api_evaluate_hedge():
-    """Evaluate hedge positions at a specific price."""
-    hedge_id = request.args.get("hedge_id")
-    price = request.args.get("price")
-    if not hedge_id or price is None:
+    """Evaluate hedge positions at a specific price.
+
+    GET takes ``hedge_id`` and ``price``; ``optimize=1`` (with optional
+    ``target``, ``side``, ``fields``, ``span``) adds a scenario rebalance.
+    POST takes a JSON body with ``price`` and either ``hedge_id`` or explicit
+    ``long``/``short`` position dicts, plus an optional ``optimize`` config.
+    """
+    if request.method == "POST":
+        body = request.get_json(silent=True) or {}
+        hedge_id = body.get("hedge_id")
+        price = body.get("price")
+        optimize = body.get("optimize")
+        if optimize is True:
+            optimize = {}
+    else:
+        body = {}
+        hedge_id = request.args.get("hedge_id")
+        price = request.args.get("price")
+        optimize = None
+        if request.args.get("optimize") in ("1", "true", "yes"):
+            optimize = {
+                "adjustment_target": request.args.get("target"),
+                "adjustable_side": request.args.get("side"),
+                "span": request.args.get("span"),
+            }
+            if request.args.get("fields"):
+                optimize["adjust_fields"] = request.args.get("fields").split(",")
+
+    if price is None or not (hedge_id or (body.get("long") and body.get("short"))):
         return jsonify({"error": "hedge_id and price required"}), 400
 
     try:
         price = float(price)
-    except ValueError:
+    except (TypeError, ValueError):
         return jsonify({"error": "invalid price"}), 400
 
-    dl = current_app.data_locker
-    hedges = dl.hedges.get_hedges() or []
-    hedge = next((h for h in hedges if str(h.id) == hedge_id), None)
-    if not hedge:
-        return jsonify({"error": "Hedge not found"}), 404
+    if hedge_id:
+        dl = current_app.data_locker
+        hedges = dl.hedges.get_hedges() or []
+        hedge = next((h for h in hedges if str(h.id) == str(hedge_id)), None)
+        if not hedge:
+            return jsonify({"error": "Hedge not found"}), 404
+        positions = [(pid, dl.positions.get_position_by_id(pid)) for pid in hedge.positions]
+    else:
+        positions = [
+            (body["long"].get("id"), {**body["long"], "position_type": "LONG"}),
+            (body["short"].get("id"), {**body["short"], "position_type": "SHORT"}),
+        ]
 
     calc = CalcServices()
     results = {}
+    by_side = {}
     eval_positions = []
 
-    for pid in hedge.positions:
-        pos = dl.positions.get_position_by_id(pid)
+    for pid, pos in positions:
         if not pos:
             continue
         eval_data = calc.evaluate_at_price(pos, price)
         ptype = str(pos.get("position_type", "")).lower()
+        by_side.setdefault(ptype, pos)
         results[ptype] = {
             "id": pid,
             **{k: round(v, 6) if isinstance(v, float) else v for k, v in eval_data.items()},
@@ -303,8 +336,21 @@ def api_evaluate_hedge():
         eval_positions.append(pos_copy)
 
     totals = calc.calculate_totals(eval_positions)
+    response = {"long": results.get("long"), "short": results.get("short"), "totals": totals}
+
+    if optimize is not None:
+        if "long" not in by_side or "short" not in by_side:
+            response["rebalance"] = {"updates": {}, "note": "hedge needs one long and one short position"}
+        else:
+            from hedge_core.hedge_calc_services import HedgeCalcServices
+
+            config = {k: v for k, v in optimize.items() if v not in (None, "")}
+            config.setdefault("span", 0.25)
+            response["rebalance"] = HedgeCalcServices().suggest_rebalance(
+                by_side["long"], by_side["short"], price, config
+            )
 
-    return jsonify({"long": results.get("long"), "short": results.get("short"), "totals": totals})
+    return jsonify(response)
 
 
 # -----------------------------------------------------------
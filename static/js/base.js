@@ -129,8 +129,7 @@ document.addEventListener('DOMContentLoaded', function() {
     }
   }
 
+  // Initial values only; dashboard_live.js keeps the spans current from the
+  // 'prices' socket topic, so there is no polling here.
   fetchAndUpdatePrices();
-
-  // Refresh prices every 30 seconds
-  setInterval(fetchAndUpdatePrices, 30000);
 });
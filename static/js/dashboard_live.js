@@ -0,0 +1,50 @@
+console.log('✅ dashboard_live.js loaded');
+
+// Push-based dashboard updates. The server emits compact deltas
+// ({changed: {...}, removed: [...]}) per topic; pages react to them instead
+// of polling the JSON endpoints.
+(function () {
+  const TOPICS = ['prices', 'positions', 'alerts', 'ledger'];
+  const live = {
+    connected: false,
+    lastDelta: {},
+    on(topic, fn) {
+      document.addEventListener(`sonic:${topic}`, e => fn(e.detail));
+    }
+  };
+  window.sonicLive = live;
+
+  if (typeof io !== 'function') {
+    console.warn('⚠️ Socket.IO client unavailable; falling back to timed refresh.');
+    return;
+  }
+
+  const socket = io({ transports: ['websocket', 'polling'] });
+
+  socket.on('connect', () => {
+    live.connected = true;
+    socket.emit('subscribe', { topics: TOPICS });
+  });
+  socket.on('disconnect', () => { live.connected = false; });
+
+  TOPICS.forEach(topic => {
+    socket.on(topic, delta => {
+      live.lastDelta[topic] = Date.now();
+      document.dispatchEvent(new CustomEvent(`sonic:${topic}`, { detail: delta }));
+    });
+  });
+
+  // Price spans present on several pages
+  live.on('prices', delta => {
+    Object.entries(delta.changed || {}).forEach(([asset, price]) => {
+      const span = document.getElementById(`${asset.toLowerCase()}Price`);
+      if (!span) return;
+      const old = parseFloat(span.textContent.replace('$', ''));
+      span.textContent = `$${Number(price).toFixed(2)}`;
+      if (!isNaN(old) && old !== price) {
+        span.classList.add(price > old ? 'flash-green' : 'flash-red');
+        setTimeout(() => span.classList.remove('flash-green', 'flash-red'), 1000);
+      }
+    });
+  });
+})();
@@ -6,7 +6,7 @@ function setDisplayMode(mode) {
   const showMods = mode !== 'test';
   toggle('positionInputRow', showInputs);
   toggle('modifierRow', showMods);
-  ['approachToggleRow','recommendationRow','outputRow','projectedOutputRow'].forEach(id=>toggle(id,true));
+  ['approachToggleRow','optimizerRow','recommendationRow','outputRow','projectedOutputRow'].forEach(id=>toggle(id,true));
 }
 
 let longLiquidation = null;
@@ -78,7 +78,65 @@ function resetPriceToCurrent(){
   sliderChanged();
 }
 
+function fillOptimizerSelect(id, positions, selected) {
+  const select = document.getElementById(id);
+  if (!select) return;
+  select.innerHTML = '';
+  (positions || []).forEach(p => {
+    const opt = document.createElement('option');
+    opt.value = p.id;
+    opt.textContent = `${p.asset_type || ''} ${p.wallet_name || ''} (${Number(p.size || 0).toFixed(0)})`;
+    if (p.id === selected) opt.selected = true;
+    select.appendChild(opt);
+  });
+}
+
+function runRebalanceOptimizer() {
+  const long = (window.longPositionsData || []).find(p => p.id === document.getElementById('optLongSelect').value);
+  const short = (window.shortPositionsData || []).find(p => p.id === document.getElementById('optShortSelect').value);
+  const text = document.getElementById('recommendationText');
+  if (!long || !short) {
+    text.textContent = 'Select a long and a short position to optimize.';
+    return;
+  }
+  const longPrice = parseFloat(long.current_price) || parseFloat(long.entry_price) || 0;
+  const shortPrice = parseFloat(short.current_price) || parseFloat(short.entry_price) || 0;
+  const price = longPrice && shortPrice ? (longPrice + shortPrice) / 2 : longPrice || shortPrice;
+  const optimize = {
+    adjustment_target: document.getElementById('optTarget').value,
+    adjustable_side: document.getElementById('optSide').value,
+    span: (parseFloat(document.getElementById('optSpan').value) || 25) / 100,
+  };
+  text.textContent = 'Optimizing…';
+  fetch('/sonic_labs/api/evaluate_hedge', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ long, short, price, optimize })
+  })
+    .then(resp => resp.json())
+    .then(data => {
+      const r = data.rebalance || {};
+      if (data.error || r.note) {
+        text.textContent = data.error || r.note;
+        return;
+      }
+      const adj = r.adjustments || {};
+      const fmt = v => (v >= 0 ? '+' : '') + Number(v).toFixed(2);
+      text.textContent =
+        `${r.side.toUpperCase()}: collateral ${fmt(adj.collateral)}, size ${fmt(adj.size)} → ` +
+        `${r.target.replace('_', ' ')} ${Number(r.baseline_objective).toFixed(2)} → ${Number(r.objective).toFixed(2)} ` +
+        `(${r.candidates} candidates × ${r.scenarios} prices, ${r.elapsed_ms} ms)`;
+    })
+    .catch(() => { text.textContent = 'Optimizer request failed.'; });
+}
+
 document.addEventListener('DOMContentLoaded', () => {
+  fillOptimizerSelect('optLongSelect', window.longPositionsData, window.defaultLongId);
+  fillOptimizerSelect('optShortSelect', window.shortPositionsData, window.defaultShortId);
+  const optBtn = document.getElementById('optRunBtn');
+  if (optBtn) {
+    optBtn.addEventListener('click', runRebalanceOptimizer);
+  }
   const longSel = document.getElementById('longSelect');
   if (longSel && longSel.value) {
     loadLongPosition();
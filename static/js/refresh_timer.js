@@ -24,9 +24,25 @@ document.addEventListener('DOMContentLoaded', () => {
 
   updateDial();
 
+  // With a live connection the page only reloads when the server pushed a
+  // structural position/alert change (rows added/removed, sizes, levels);
+  // price-driven fields alone never reload, the dial just starts over.
+  let dirty = false;
+  const live = window.sonicLive;
+  if (live) {
+    ['positions', 'alerts'].forEach(topic => live.on(topic, delta => {
+      if (delta && delta.structural) dirty = true;
+    }));
+  }
+
   setInterval(() => {
     remaining -= 1;
     if (remaining <= 0) {
+      if (live && live.connected && !dirty) {
+        remaining = INTERVAL;
+        updateDial();
+        return;
+      }
       window.location.reload();
     } else {
       updateDial();
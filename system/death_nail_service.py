@@ -1,101 +1,295 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import atexit
 import json
-import os
 import asyncio
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from xcom.sound_service import SoundService
 from core.logging import log
-import asyncio
+from core.constants import BASE_DIR, DB_PATH
+from data.dl_death_events import ensure_death_events_table
+
+
+class _DeathDispatcher:
+    """Background event loop that performs death nail side effects.
+
+    ``DeathNailService.trigger`` only enqueues; sound, file/table writes and
+    escalation run here, at most ``max_concurrency`` events at a time.  Repeat
+    counts of coalesced events are written back every ``flush_interval`` while
+    any are outstanding.
+    """
+
+    def __init__(self, max_concurrency: int = 2, flush_interval: float = 1.0):
+        self.max_concurrency = max_concurrency
+        self.flush_interval = flush_interval
+        self._loop = None
+        self._queue = None
+        self._ready = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._dirty = {}
+        self._pending = set()
+        self._dirty_lock = threading.Lock()
+        self.processed = 0
+
+    # --- lifecycle -------------------------------------------------------
+    def _ensure_started(self):
+        if self._thread and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._thread_main, name="DeathNailDispatcher", daemon=True)
+            self._thread.start()
+        self._ready.wait(5)
+
+    def _thread_main(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._ready.set()
+        self._loop.run_until_complete(self._run())
+
+    async def _run(self):
+        while True:
+            try:
+                service, entry = await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval)
+                self._loop.create_task(self._handle(service, entry))
+            except asyncio.TimeoutError:
+                pass
+            if self._has_dirty():
+                await asyncio.to_thread(self.flush_repeats)
+
+    async def _handle(self, service, entry):
+        try:
+            async with self._semaphore:
+                await asyncio.to_thread(service._side_effects, entry)
+        except Exception as e:
+            service.logger.warning(f"⚠️ Death nail side effects failed: {e}", source="DeathNail")
+        finally:
+            with self._dirty_lock:
+                self._pending.discard(_event_key(service.db_path, entry))
+            self.processed += 1
+            self._queue.task_done()
+
+    # --- API -------------------------------------------------------------
+    def submit(self, service, entry: dict):
+        self._ensure_started()
+        with self._dirty_lock:
+            self._pending.add(_event_key(service.db_path, entry))
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (service, entry))
+
+    def mark_repeat(self, db_path: str, fingerprint: str, first_at: str, count: int, last_at: str):
+        with self._dirty_lock:
+            self._dirty[(db_path, fingerprint, first_at)] = (count, last_at)
+
+    def _has_dirty(self) -> bool:
+        with self._dirty_lock:
+            return bool(self._dirty)
+
+    def flush_repeats(self):
+        with self._dirty_lock:
+            # Counts for events whose row is not inserted yet wait for the next flush
+            dirty = {k: v for k, v in self._dirty.items() if k not in self._pending}
+            for key in dirty:
+                del self._dirty[key]
+        for (db_path, fingerprint, first_at), (count, last_at) in dirty.items():
+            try:
+                with _connect(db_path) as conn:
+                    conn.execute(
+                        "UPDATE death_events SET count = ?, last_at = ? WHERE fingerprint = ? AND first_at = ?",
+                        (count, last_at, fingerprint, first_at),
+                    )
+            except Exception as e:
+                log.warning(f"⚠️ Failed to update death event count: {e}", source="DeathNail")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued events are handled and counts written."""
+        if not (self._thread and self._thread.is_alive()):
+            self.flush_repeats()
+            return True
+
+        async def _drain():
+            await self._queue.join()
+            await asyncio.to_thread(self.flush_repeats)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_drain(), self._loop).result(timeout)
+            return True
+        except Exception:
+            return False
+
+
+def _event_key(db_path: str, entry: dict) -> tuple:
+    return db_path, entry["fingerprint"], entry["timestamp"]
+
+
+def _connect(db_path: str):
+    conn = sqlite3.connect(db_path, timeout=5)
+    ensure_death_events_table(conn.cursor())
+    return conn
+
+
+_dispatcher = _DeathDispatcher()
+atexit.register(lambda: _dispatcher.flush(timeout=2.0))
 
 
 class DeathNailService:
-    def __init__(self, logger, xcom_core=None, log_path="death_log.txt", default_level="HIGH", default_recipient="admin@example.com"):
+    """Fatal-error reporting with coalescing and async side effects.
+
+    The first ``trigger`` for a message opens a coalescing window of
+    ``window`` seconds: it is logged immediately and its side effects (sound,
+    ``death_log.txt``, ``death_events`` row, XCom escalation, DeathNail alert)
+    are queued on the background dispatcher.  Further triggers of the same
+    message and level inside the window only bump the event's ``count``.
+    """
+
+    DEFAULT_WINDOW = float(os.getenv("DEATH_NAIL_WINDOW", "60"))
+
+    _windows = {}
+    _windows_lock = threading.Lock()
+
+    def __init__(self, logger, xcom_core=None, log_path=None, default_level="HIGH",
+                 default_recipient="admin@example.com", db_path=None, window=None):
         self.logger = logger
         self.xcom = xcom_core
-        self.log_path = log_path
+        self.log_path = log_path or os.path.join(BASE_DIR, "death_log.txt")
         self.level = default_level
         self.recipient = default_recipient
-        self._death_active = False
+        self.db_path = str(db_path or DB_PATH)
+        self.window = self.DEFAULT_WINDOW if window is None else window
 
-    def trigger(self, metadata: dict):
-        if self._death_active:
-            self.logger.warning("⚠️ Death nail suppressed to prevent recursion", source="DeathNail")
-            return
+    @staticmethod
+    def fingerprint(message: str, level: str) -> str:
+        return f"{level}|{message}"
+
+    def trigger(self, metadata: dict) -> dict:
+        """Report a fatal event; returns ``{"coalesced", "count", "fingerprint"}``."""
+        message = metadata.get("message", "💀 Fatal error")
+        level = metadata.get("level", self.level)
+        payload = metadata.get("payload", {})
+        fingerprint = self.fingerprint(message, level)
+        now = time.monotonic()
+        timestamp = datetime.now().isoformat()
+
+        key = (self.db_path, fingerprint)
+        with self._windows_lock:
+            window = self._windows.get(key)
+            if window and now - window["opened"] < self.window:
+                window["count"] += 1
+                count, first_at = window["count"], window["first_at"]
+                coalesced = True
+            else:
+                self._windows[key] = {"opened": now, "count": 1, "first_at": timestamp}
+                count, first_at = 1, timestamp
+                coalesced = False
+
+        if coalesced:
+            _dispatcher.mark_repeat(self.db_path, fingerprint, first_at, count, timestamp)
+            return {"coalesced": True, "count": count, "fingerprint": fingerprint}
+
+        entry = {
+            "timestamp": timestamp,
+            "message": message,
+            "payload": payload,
+            "level": level,
+            "recipient": metadata.get("recipient", self.recipient),
+            "fingerprint": fingerprint,
+        }
+
+        # 💀 Console log right away; everything else runs on the dispatcher
+        self.logger.death(message, payload=payload)
+        _dispatcher.submit(self, entry)
+        return {"coalesced": False, "count": 1, "fingerprint": fingerprint}
+
+    @staticmethod
+    def flush(timeout: float = 5.0) -> bool:
+        """Block until queued death events have been fully handled."""
+        return _dispatcher.flush(timeout)
 
-        self._death_active = True
+    @classmethod
+    def reset_windows(cls):
+        with cls._windows_lock:
+            cls._windows.clear()
 
+    # --- side effects (dispatcher thread) ------------------------------------
+    def _side_effects(self, entry: dict):
+        self._record(entry)
+        self._play_sound()
+        self._escalate(entry)
+
+    def _record(self, entry: dict):
+        # 📁 Event table (indexed, read back with LIMIT)
         try:
-            message = metadata.get("message", "💀 Fatal error")
-            level = metadata.get("level", self.level)
-            recipient = metadata.get("recipient", self.recipient)
-            payload = metadata.get("payload", {})
-
-            timestamp = datetime.now().isoformat()
-            entry = {
-                "timestamp": timestamp,
-                "message": message,
-                "payload": payload,
-                "level": level
-            }
-
-            # 💀 1. Console log
-            self.logger.death(message, payload=payload)
-
-            # 🔊 2. Play death spiral sound
-            try:
-                base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                abs_path = os.path.join(base_dir, "static", "sounds", "death_spiral.mp3")
-                SoundService().play(abs_path)
-            except Exception as e:
-                self.logger.warning(f"⚠️ Death spiral sound failed: {e}", source="DeathNail")
+            with _connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT INTO death_events (fingerprint, message, level, payload, first_at, last_at, count)
+                    VALUES (?, ?, ?, ?, ?, ?, 1)
+                    """,
+                    (entry["fingerprint"], entry["message"], entry["level"],
+                     json.dumps(entry["payload"], default=str), entry["timestamp"], entry["timestamp"]),
+                )
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to record death event: {e}", source="DeathNail")
 
-            # 📁 3. Log to file
-            try:
-                with open(self.log_path, "a") as f:
-                    f.write(json.dumps(entry) + "\n")
-            except Exception as e:
-                self.logger.warning(f"⚠️ Failed to write death log: {e}", source="DeathNail")
-
-            # 📡 4. Optional escalation
-            if self.xcom and hasattr(self.xcom, "send_notification"):
-                try:
-                    api_cfg = self.xcom.config_service.get_provider("api") or {}
-                    if not api_cfg.get("account_sid"):
-                        raise Exception("API config missing or incomplete")
-
-                    self.xcom.send_notification(
-                        level=level,
-                        subject="💀 Fatal Error Triggered",
-                        body=message,
-                        recipient=recipient,
-                        initiator="SystemCore"
-                    )
+        # 📁 Legacy log file
+        try:
+            with open(self.log_path, "a") as f:
+                f.write(json.dumps({k: entry[k] for k in ("timestamp", "message", "payload", "level")},
+                                   default=str) + "\n")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to write death log: {e}", source="DeathNail")
 
-                except Exception as e:
-                    self.logger.warning(f"⚠️ XCom escalation failed: {e}", source="DeathNail")
+    def _play_sound(self):
+        # 🔊 Death spiral sound
+        try:
+            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            abs_path = os.path.join(base_dir, "static", "sounds", "death_spiral.mp3")
+            SoundService().play(abs_path)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Death spiral sound failed: {e}", source="DeathNail")
 
+    def _escalate(self, entry: dict):
+        # 📡 Optional escalation
+        if self.xcom and hasattr(self.xcom, "send_notification"):
+            try:
+                api_cfg = self.xcom.config_service.get_provider("api") or {}
+                if not api_cfg.get("account_sid"):
+                    raise Exception("API config missing or incomplete")
 
-            # 🚨 5. Create system alert via AlertCore
-            if self.xcom and hasattr(self.xcom, "alert_core"):
-                try:
-                    alert_payload = {
-                        "alert_type": "DeathNail",
-                        "alert_class": "System",
-                        "evaluated_value": 1.0,
-                        "trigger_value": 1.0,
-                        "condition": "ABOVE",
-                    }
-                    created = asyncio.run(self.xcom.alert_core.create_alert(alert_payload))
-                    if not created:
-                        self.logger.warning("⚠️ Failed to create DeathNail alert", source="DeathNail")
-                except Exception as e:
-                    self.logger.warning(f"⚠️ Alert creation failed: {e}", source="DeathNail")
+                self.xcom.send_notification(
+                    level=entry["level"],
+                    subject="💀 Fatal Error Triggered",
+                    body=entry["message"],
+                    recipient=entry["recipient"],
+                    initiator="SystemCore"
+                )
 
+            except Exception as e:
+                self.logger.warning(f"⚠️ XCom escalation failed: {e}", source="DeathNail")
 
-        finally:
-            self._death_active = False
+        # 🚨 System alert via AlertCore
+        if self.xcom and hasattr(self.xcom, "alert_core"):
+            try:
+                alert_payload = {
+                    "alert_type": "DeathNail",
+                    "alert_class": "System",
+                    "evaluated_value": 1.0,
+                    "trigger_value": 1.0,
+                    "condition": "ABOVE",
+                }
+                created = asyncio.run(self.xcom.alert_core.create_alert(alert_payload))
+                if not created:
+                    self.logger.warning("⚠️ Failed to create DeathNail alert", source="DeathNail")
+            except Exception as e:
+                self.logger.warning(f"⚠️ Alert creation failed: {e}", source="DeathNail")
 
 
 # 🔥 RUNNABLE ENTRYPOINT
@@ -109,3 +303,4 @@ if __name__ == "__main__":
         },
         "level": "HIGH"
     })
+    service.flush()
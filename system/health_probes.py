@@ -0,0 +1,206 @@
+# system/health_probes.py
+"""
+Author: BubbaDiego
+Module: health_probes
+Description:
+    Concurrent, cached health probes for external services.
+
+    A probe is a callable returning ``"ok"`` or an error string.
+    ``HealthProbeService`` runs probes on a small thread pool, each bounded by
+    its own timeout, and caches the result:
+
+    * younger than ``ttl``: returned as is;
+    * younger than ``ttl + stale_ttl``: returned immediately (``stale``) while
+      a background refresh runs (stale-while-revalidate);
+    * older or missing: probed now, concurrently with the other probes.
+
+    Every completed probe appends ``(checked_at, latency_ms, ok)`` to a
+    bounded history so status pages can show latency without probing.
+    Probes run in a copy of the caller's ``contextvars`` context so Flask's
+    application context is available to them.
+"""
+
+import contextvars
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, Optional
+
+from core.logging import log
+
+DEFAULT_TTL = 60.0
+DEFAULT_STALE_TTL = 600.0
+DEFAULT_TIMEOUT = 5.0
+HISTORY_SIZE = 50
+
+
+def http_probe(requests_module, url: str, timeout: float, headers: Optional[dict] = None) -> str:
+    """``HEAD`` ``url`` (falling back to ``GET`` when unsupported) and return ``"ok"``."""
+    if not requests_module:
+        return "requests_unavailable"
+    kwargs = {"timeout": timeout}
+    if headers:
+        kwargs["headers"] = headers
+    head = getattr(requests_module, "head", None)
+    resp = None
+    if head is not None:
+        resp = head(url, allow_redirects=True, **kwargs)
+        if getattr(resp, "status_code", None) in (405, 501):
+            resp = None
+    if resp is None:
+        resp = requests_module.get(url, **kwargs)
+    resp.raise_for_status()
+    return "ok"
+
+
+def chatgpt_probe(timeout: float = DEFAULT_TIMEOUT) -> str:
+    """List OpenAI models (free) instead of sending a billed completion."""
+    api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPEN_AI_KEY")
+    if not api_key:
+        return "missing api key"
+    from openai import OpenAI  # type: ignore
+
+    OpenAI(api_key=api_key, timeout=timeout).models.list()
+    return "ok"
+
+
+def twilio_probe() -> str:
+    """Validate Twilio credentials without placing a call."""
+    from xcom.check_twilio_heartbeat_service import CheckTwilioHeartbeatService
+
+    result = CheckTwilioHeartbeatService({}).check(dry_run=True)
+    if result.get("success"):
+        return "ok"
+    return result.get("error", "unknown error")
+
+
+class _Probe:
+    __slots__ = ("name", "fn", "timeout", "ttl", "result", "history", "future")
+
+    def __init__(self, name: str, fn: Callable[[], str], timeout: float, ttl: float):
+        self.name = name
+        self.fn = fn
+        self.timeout = timeout
+        self.ttl = ttl
+        self.result = None
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self.future = None
+
+
+class HealthProbeService:
+    def __init__(self, ttl: float = DEFAULT_TTL, stale_ttl: float = DEFAULT_STALE_TTL,
+                 timeout: float = DEFAULT_TIMEOUT, max_workers: int = 4):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.timeout = timeout
+        self._probes: Dict[str, _Probe] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="health-probe")
+
+    def register(self, name: str, fn: Callable[[], str], timeout: Optional[float] = None,
+                 ttl: Optional[float] = None):
+        self._probes[name] = _Probe(
+            name, fn,
+            self.timeout if timeout is None else timeout,
+            self.ttl if ttl is None else ttl,
+        )
+
+    def names(self) -> list:
+        return list(self._probes)
+
+    # --- execution -------------------------------------------------------
+    def _run(self, probe: _Probe) -> dict:
+        started = time.perf_counter()
+        try:
+            status = probe.fn()
+        except Exception as exc:
+            status = str(exc)
+        return self._store(probe, str(status), started)
+
+    def _store(self, probe: _Probe, status: str, started: float) -> dict:
+        latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        result = {
+            "name": probe.name,
+            "status": status,
+            "ok": status.lower() == "ok",
+            "latency_ms": latency_ms,
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "_monotonic": time.monotonic(),
+        }
+        with self._lock:
+            probe.result = result
+            probe.history.append({"checked_at": result["checked_at"], "latency_ms": latency_ms, "ok": result["ok"]})
+        if not result["ok"]:
+            log.warning(f"Health probe '{probe.name}' failed: {status}", source="HealthProbes")
+        return result
+
+    def _submit(self, probe: _Probe):
+        """Start a probe unless one is already running; return its future."""
+        with self._lock:
+            if probe.future is None or probe.future.done():
+                ctx = contextvars.copy_context()
+                probe.future = self._executor.submit(ctx.run, self._run, probe)
+            return probe.future
+
+    def _wait(self, probe: _Probe, future, deadline: float) -> dict:
+        try:
+            return future.result(timeout=max(0.0, deadline - time.perf_counter()))
+        except FutureTimeout:
+            # The probe thread keeps running; its result replaces this one when it lands.
+            return self._store(probe, f"timeout after {probe.timeout}s", deadline - probe.timeout)
+
+    # --- API -------------------------------------------------------------
+    def check_all(self, names: Optional[Iterable[str]] = None, force: bool = False) -> Dict[str, dict]:
+        """Results for ``names`` (all probes by default), probing concurrently where needed."""
+        now = time.monotonic()
+        results, pending = {}, []
+        for name in (names or self.names()):
+            probe = self._probes.get(name)
+            if probe is None:
+                raise KeyError(f"Unknown health probe '{name}'")
+            cached = probe.result
+            age = now - cached["_monotonic"] if cached else None
+            if not force and cached and age < probe.ttl:
+                results[name] = self._public(cached, stale=False)
+            elif not force and cached and age < probe.ttl + self.stale_ttl:
+                self._submit(probe)
+                results[name] = self._public(cached, stale=True)
+            else:
+                pending.append((probe, self._submit(probe), time.perf_counter() + probe.timeout))
+        for probe, future, deadline in pending:
+            results[probe.name] = self._public(self._wait(probe, future, deadline), stale=False)
+        return results
+
+    def check(self, name: str, force: bool = False) -> dict:
+        return self.check_all([name], force=force)[name]
+
+    def history(self, name: str) -> list:
+        with self._lock:
+            return list(self._probes[name].history)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Cached results and latency history without probing anything."""
+        snap = {}
+        with self._lock:
+            for name, probe in self._probes.items():
+                latencies = sorted(h["latency_ms"] for h in probe.history)
+                snap[name] = {
+                    "result": self._public(probe.result, stale=None) if probe.result else None,
+                    "history": list(probe.history),
+                    "latency_ms": {
+                        "last": probe.history[-1]["latency_ms"] if probe.history else None,
+                        "p50": latencies[len(latencies) // 2] if latencies else None,
+                        "max": latencies[-1] if latencies else None,
+                    },
+                }
+        return snap
+
+    @staticmethod
+    def _public(result: dict, stale: Optional[bool]) -> dict:
+        out = {k: v for k, v in result.items() if not k.startswith("_")}
+        if stale is not None:
+            out["stale"] = stale
+        return out
@@ -1,13 +1,12 @@
 # 🧠 SystemCore — updated for theme profile support
 
-import os
-
 from alert_core.threshold_service import ThresholdService
 from wallets.wallet_service import WalletService
 from wallets.wallet_core import WalletCore
 from system.theme_service import ThemeService
 from xcom.xcom_core import XComCore
 from system.death_nail_service import DeathNailService
+from system.health_probes import HealthProbeService, chatgpt_probe, http_probe, twilio_probe
 from core.logging import log
 from core.constants import JUPITER_API_BASE
 
@@ -23,7 +22,12 @@ class SystemCore:
         self.wallet_core = WalletCore()
         self.theme = ThemeService(data_locker)
         self.xcom = XComCore(data_locker)
-        self.death_nail_service = DeathNailService(self.log, self.xcom)
+        self.death_nail_service = DeathNailService(self.log, self.xcom, db_path=data_locker.db.db_path)
+        self.health = HealthProbeService()
+        self.health.register("twilio", self._probe_twilio)
+        self.health.register("chatgpt", self._probe_chatgpt)
+        self.health.register("jupiter", self._probe_jupiter)
+        self.health.register("github", self._probe_github)
 
         self.log.success("SystemCore initialized with Wallet, WalletCore and Theme services.")
 
@@ -114,6 +118,7 @@ class SystemCore:
         """
         try:
             self.theme.dl.insert_or_update_theme_profile(name, config)
+            self.theme.invalidate_cache()
             return True
         except Exception as e:
             self.log.error(f"❌ Failed to save theme profile '{name}': {e}", source="SystemCore")
@@ -139,54 +144,56 @@ class SystemCore:
             return ""
 
     # --- Connectivity Checks ---
+    # ``check_*`` return the cached probe status (see ``system.health_probes``);
+    # the ``_probe_*`` methods below do the actual network call.
     def check_twilio_api(self) -> str:
         """Return 'ok' if Twilio credentials are valid, otherwise error text."""
-        try:
-            from xcom.check_twilio_heartbeat_service import CheckTwilioHeartbeatService
+        return self.health.check("twilio")["status"]
+
+    def check_chatgpt(self) -> str:
+        """Return 'ok' if ChatGPT API is reachable, else an error message."""
+        return self.health.check("chatgpt")["status"]
+
+    def check_jupiter(self) -> str:
+        """Return 'ok' if the Jupiter API endpoint is reachable."""
+        return self.health.check("jupiter")["status"]
+
+    def check_github(self) -> str:
+        """Return 'ok' if the GitHub API is reachable."""
+        return self.health.check("github")["status"]
+
+    def check_all_apis(self, force: bool = False) -> dict:
+        """Run all connectivity probes concurrently; ``{name: status}``."""
+        return {name: res["status"] for name, res in self.health.check_all(force=force).items()}
 
-            result = CheckTwilioHeartbeatService({}).check(dry_run=True)
-            if result.get("success"):
-                return "ok"
-            return result.get("error", "unknown error")
+    def _probe_twilio(self) -> str:
+        try:
+            return twilio_probe()
         except Exception as exc:  # pragma: no cover - optional dependency
             self.log.error(f"Twilio heartbeat check failed: {exc}", source="SystemCore")
             return str(exc)
 
-    def check_chatgpt(self) -> str:
-        """Return 'ok' if ChatGPT API is reachable, else an error message."""
-        api_key = os.getenv("OPENAI_API_KEY") or os.getenv("OPEN_AI_KEY")
-        if not api_key:
-            return "missing api key"
+    def _probe_chatgpt(self) -> str:
         try:
-            from openai import OpenAI  # type: ignore
-
-            client = OpenAI(api_key=api_key)
-            client.chat.completions.create(model="gpt-3.5-turbo", messages=[{"role": "user", "content": "ping"}])
-            return "ok"
+            return chatgpt_probe(self.health.timeout)
         except Exception as exc:  # pragma: no cover - network dependent
             self.log.error(f"ChatGPT check failed: {exc}", source="SystemCore")
             return str(exc)
 
-    def check_jupiter(self) -> str:
-        """Return 'ok' if the Jupiter API endpoint is reachable."""
+    def _probe_jupiter(self) -> str:
         if not requests:  # pragma: no cover - optional dependency
             return "requests_unavailable"
         try:
-            resp = requests.get(f"{JUPITER_API_BASE}/v1/perp_markets", timeout=5)
-            resp.raise_for_status()
-            return "ok"
+            return http_probe(requests, f"{JUPITER_API_BASE}/v1/perp_markets", self.health.timeout)
         except Exception as exc:  # pragma: no cover - network dependent
             self.log.error(f"Jupiter API check failed: {exc}", source="SystemCore")
             return str(exc)
 
-    def check_github(self) -> str:
-        """Return 'ok' if the GitHub API is reachable."""
+    def _probe_github(self) -> str:
         if not requests:  # pragma: no cover - optional dependency
             return "requests_unavailable"
         try:
-            resp = requests.get("https://api.github.com", timeout=5)
-            resp.raise_for_status()
-            return "ok"
+            return http_probe(requests, "https://api.github.com", self.health.timeout)
         except Exception as exc:  # pragma: no cover - network dependent
             self.log.error(f"GitHub API check failed: {exc}", source="SystemCore")
             return str(exc)
@@ -1,14 +1,27 @@
 import sys
 import os
+import copy
 import json
 from core.logging import log
 from core.constants import THEME_CONFIG_PATH  # Optional fallback path
 
 class ThemeService:
+    """Theme mode and profile access.
+
+    Profiles and the active profile are cached after the first read and
+    invalidated by ``save_profile``/``delete_profile``/``set_active_profile``.
+    """
+
     def __init__(self, data_locker, config_path=THEME_CONFIG_PATH):
         self.dl = data_locker
         self.config_path = config_path
         self.logger = log
+        self._profiles = None
+        self._active_profile = None
+
+    def invalidate_cache(self):
+        self._profiles = None
+        self._active_profile = None
 
     # 🌗 Theme mode (light/dark)
     def get_theme_mode(self) -> str:
@@ -54,7 +67,12 @@ class ThemeService:
 
     def get_all_profiles(self) -> dict:
         try:
-            return self.dl.system.get_theme_profiles()
+            profiles = self._profiles
+            if profiles is None:
+                profiles = self.dl.system.get_theme_profiles()
+                # Empty results (no profiles yet, or a failed read) are not cached
+                self._profiles = profiles or None
+            return copy.deepcopy(profiles)
         except Exception as e:
             self.logger.error(f"Failed to load profiles: {e}", source="ThemeService")
             return {}
@@ -62,6 +80,7 @@ class ThemeService:
     def save_profile(self, name: str, config: dict):
         try:
             self.dl.system.insert_or_update_theme_profile(name, config)
+            self.invalidate_cache()
             self.logger.success(f"Theme profile '{name}' saved.")
         except Exception as e:
             self.logger.error(f"Failed to save profile '{name}': {e}")
@@ -70,6 +89,7 @@ class ThemeService:
     def delete_profile(self, name: str):
         try:
             self.dl.system.delete_theme_profile(name)
+            self.invalidate_cache()
             self.logger.info(f"Deleted theme profile '{name}'")
         except Exception as e:
             self.logger.error(f"Error deleting profile '{name}': {e}")
@@ -77,6 +97,7 @@ class ThemeService:
     def set_active_profile(self, name: str):
         try:
             self.dl.system.set_active_theme_profile(name)
+            self.invalidate_cache()
             self.logger.success(f"Theme profile '{name}' set as active")
         except Exception as e:
             self.logger.error(f"Error activating profile '{name}': {e}")
@@ -84,7 +105,11 @@ class ThemeService:
 
     def get_active_profile(self) -> dict:
         try:
-            return self.dl.system.get_active_theme_profile()
+            profile = self._active_profile
+            if profile is None:
+                profile = self.dl.system.get_active_theme_profile()
+                self._active_profile = profile or None
+            return copy.deepcopy(profile)
         except Exception as e:
             self.logger.error(f"Failed to get active profile: {e}")
             return {}
@@ -0,0 +1,177 @@
+"""Benchmark harness for the Cyclone pipeline on synthetic data.
+
+Shared by ``scripts/benchmark_cyclone.py`` (standalone JSON reports) and the
+pytest-benchmark suite in ``tests/benchmarks``.  Everything runs against a
+temporary database filled by :mod:`test_core.synthetic_data`; prices come from
+a static feed and Jupiter from :class:`~test_core.synthetic_data.JupiterStub`,
+so no network access is needed.
+
+Each target is a ``(setup, run)`` pair: ``setup`` restores whatever ``run``
+consumes (e.g. deletes positions before a Jupiter import) and is not timed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+
+from test_core.synthetic_data import ASSETS, JupiterStub
+
+# Cyclone.run_cycle step -> Cyclone method.  ``update_operations`` is left out:
+# it runs the pytest suite through OperationsMonitor.
+CYCLONE_STEPS = {
+    "market_updates": "run_market_updates",
+    "check_jupiter_for_updates": "run_check_jupiter_for_updates",
+    "enrich_positions": "run_enrich_positions",
+    "position_risk": "run_position_risk",
+    "enrich_alerts": "run_alert_enrichment",
+    "update_evaluated_value": "run_update_evaluated_value",
+    "create_market_alerts": "run_create_market_alerts",
+    "create_portfolio_alerts": "run_create_portfolio_alerts",
+    "create_position_alerts": "run_create_position_alerts",
+    "create_global_alerts": "run_create_global_alerts",
+    "evaluate_alerts": "run_alert_evaluation",
+    "cleanse_ids": "run_cleanse_ids",
+    "link_hedges": "run_link_hedges",
+    "update_hedges": "run_update_hedges",
+}
+
+
+class _NullNotifier:
+    """Async notifier that accepts every alert without sending anything."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def notify(self, alert):
+        return True
+
+
+class _JupiterSyncMonitor:
+    """Stand-in for ``position_monitor`` bound to the benchmark locker."""
+
+    def __init__(self, data_locker):
+        self.dl = data_locker
+
+    def run_cycle(self):
+        from positions.position_core import PositionCore
+
+        return PositionCore(self.dl).update_positions_from_jupiter(source="benchmark")
+
+
+@contextlib.contextmanager
+def benchmark_environment(data_locker, generator):
+    """Point Cyclone, the price feed and Jupiter at synthetic sources."""
+    import cyclone.cyclone_engine as engine
+    import prices.price_feed as price_feed
+    from prices.price_feed import PriceFeed, StaticPriceProvider
+
+    saved_locker = engine._global_data_locker
+    saved_feed = price_feed._feed
+    engine._global_data_locker = data_locker
+    price_feed.set_price_feed(PriceFeed([StaticPriceProvider(ASSETS)], ttl=0))
+    try:
+        with JupiterStub(generator):
+            yield
+    finally:
+        engine._global_data_locker = saved_locker
+        price_feed.set_price_feed(saved_feed)
+
+
+def build_cyclone(data_locker):
+    """Cyclone wired to ``data_locker`` with a stubbed position monitor.
+
+    Must be called inside :func:`benchmark_environment`.
+    """
+    from cyclone.cyclone_engine import Cyclone
+    from monitor.monitor_core import MonitorCore
+    from monitor.monitor_registry import MonitorRegistry
+
+    registry = MonitorRegistry()
+    registry.register("position_monitor", _JupiterSyncMonitor(data_locker))
+    cyclone = Cyclone(monitor_core=MonitorCore(registry))
+    cyclone.alert_core.notifier_factory = _NullNotifier
+    return cyclone
+
+
+def build_targets(data_locker, cyclone) -> dict:
+    """Return ``{name: (setup, run)}`` for every benchmarked call."""
+    from alert_core.alert_core import AlertCore
+    from dashboard.dashboard_service import get_dashboard_context
+    from positions.position_sync_service import PositionSyncService
+
+    def _noop():
+        pass
+
+    def _clear_positions():
+        data_locker.positions.delete_all_positions()
+
+    targets = {}
+    for step, method in CYCLONE_STEPS.items():
+        setup = _clear_positions if step == "check_jupiter_for_updates" else _noop
+        targets[f"cyclone.{step}"] = (setup, lambda m=method: asyncio.run(getattr(cyclone, m)()))
+
+    alert_core = AlertCore(data_locker, config_loader=lambda: cyclone.config)
+    alert_core.notifier_factory = _NullNotifier
+    sync = PositionSyncService(data_locker)
+
+    targets["dashboard.get_dashboard_context"] = (_noop, lambda: get_dashboard_context(data_locker))
+    targets["alerts.process_alerts"] = (_noop, lambda: asyncio.run(alert_core.process_alerts()))
+    targets["positions.update_jupiter_positions"] = (_clear_positions, sync.update_jupiter_positions)
+    return targets
+
+
+def time_target(setup, run, repeat: int = 3) -> dict:
+    runs = []
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        run()
+        runs.append(time.perf_counter() - start)
+    return {
+        "min_s": round(min(runs), 6),
+        "mean_s": round(statistics.fmean(runs), 6),
+        "runs": len(runs),
+    }
+
+
+def git_revision(default: str = "unknown") -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip() or default
+    except Exception:
+        return default
+
+
+def benchmark_metadata(seed: int, repeat: int) -> dict:
+    return {
+        "commit": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+    }
+
+
+def compare_results(baseline: dict, current: dict) -> list:
+    """Rows of ``(scale, target, baseline_s, current_s, ratio)`` by ``min_s``."""
+    rows = []
+    for scale, data in current.get("scales", {}).items():
+        base_targets = baseline.get("scales", {}).get(scale, {}).get("targets", {})
+        for name, result in data.get("targets", {}).items():
+            base = base_targets.get(name, {}).get("min_s")
+            now = result.get("min_s")
+            ratio = round(now / base, 3) if base and now is not None else None
+            rows.append((scale, name, base, now, ratio))
+    return rows
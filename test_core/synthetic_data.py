@@ -0,0 +1,320 @@
+"""Seeded synthetic data for tests and benchmarks.
+
+``SyntheticDataGenerator`` fills a (temporary) mother_brain database with
+wallets, positions, alerts, alert thresholds and price history.  The same
+seed always produces the same rows, so benchmark results are comparable
+between commits.  ``jupiter_payload`` produces matching Jupiter
+``/v1/positions`` responses and ``JupiterStub`` serves them to
+``PositionSyncService`` in place of the real endpoint.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import types
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from core.constants import ALERT_THRESHOLDS_PATH
+
+ASSETS = {"BTC": 60000.0, "ETH": 3000.0, "SOL": 150.0}
+MINTS = {
+    "BTC": "3NZ9JMVBmGAqocybic2c7LQCJScmgsAZ6vQqTDzcqmJh",
+    "ETH": "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs",
+    "SOL": "So11111111111111111111111111111111111111112",
+}
+POSITION_ALERT_TYPES = ("HeatIndex", "Profit", "TravelPercentLiquid")
+
+
+@dataclass
+class SyntheticScale:
+    wallets: int = 3
+    positions: int = 30
+    alerts: int = 60
+    price_hours: int = 24
+    price_interval_minutes: int = 5
+
+
+SCALES = {
+    "small": SyntheticScale(3, 30, 60, 24),
+    "medium": SyntheticScale(10, 300, 600, 72),
+    "large": SyntheticScale(25, 2000, 4000, 168),
+}
+
+
+def _bulk_insert(cursor, table: str, rows: list) -> int:
+    """Insert dict rows, keeping only columns that exist in ``table``."""
+    if not rows:
+        return 0
+    columns = {r[1] for r in cursor.execute(f"PRAGMA table_info({table})").fetchall()}
+    keys = [k for k in rows[0] if k in columns]
+    placeholders = ",".join("?" for _ in keys)
+    cursor.executemany(
+        f"INSERT OR REPLACE INTO {table} ({','.join(keys)}) VALUES ({placeholders})",
+        [tuple(r.get(k) for k in keys) for r in rows],
+    )
+    return len(rows)
+
+
+class SyntheticDataGenerator:
+    def __init__(self, seed: int = 1337):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.wallets: list = []
+        self.positions: list = []
+        self.alerts: list = []
+
+    # --- row builders -----------------------------------------------------
+    def make_wallets(self, count: int) -> list:
+        self.wallets = [
+            {
+                "name": f"SynthVault{i:03d}",
+                "public_address": f"SYNTH{self.rng.getrandbits(64):016x}",
+                "private_address": "",
+                "image_path": "",
+                "balance": round(self.rng.uniform(100, 10000), 2),
+                "tags": "synthetic",
+                "is_active": 1,
+                "type": "personal",
+            }
+            for i in range(count)
+        ]
+        return self.wallets
+
+    def make_positions(self, count: int) -> list:
+        wallets = self.wallets or self.make_wallets(1)
+        self.positions = []
+        for i in range(count):
+            asset = self.rng.choice(list(ASSETS))
+            side = self.rng.choice(("LONG", "SHORT"))
+            entry = ASSETS[asset] * self.rng.uniform(0.85, 1.15)
+            leverage = self.rng.uniform(1.5, 20)
+            collateral = round(self.rng.uniform(50, 5000), 2)
+            size = round(collateral * leverage, 2)
+            liq = entry * (1 - 0.9 / leverage) if side == "LONG" else entry * (1 + 0.9 / leverage)
+            current = ASSETS[asset]
+            pnl = (current - entry) / entry * size * (1 if side == "LONG" else -1)
+            self.positions.append({
+                "id": f"synth-pos-{i:05d}",
+                "asset_type": asset,
+                "position_type": side,
+                "entry_price": round(entry, 4),
+                "liquidation_price": round(liq, 4),
+                "current_price": current,
+                "collateral": collateral,
+                "size": size,
+                "leverage": round(leverage, 3),
+                "value": round(collateral + pnl, 2),
+                "pnl_after_fees_usd": round(pnl, 2),
+                "travel_percent": 0.0,
+                "liquidation_distance": 0.0,
+                "heat_index": 0.0,
+                "current_heat_index": 0.0,
+                "wallet_name": wallets[i % len(wallets)]["name"],
+                "last_updated": (self.now - timedelta(minutes=i)).isoformat(),
+                "status": "ACTIVE",
+            })
+        return self.positions
+
+    def make_alerts(self, count: int) -> list:
+        positions = self.positions or self.make_positions(1)
+        created = self.now.strftime("%Y-%m-%d %H:%M:%S")
+        self.alerts = []
+        for i in range(count):
+            kind = i % 4
+            if kind == 3:
+                asset = self.rng.choice(list(ASSETS))
+                row = {
+                    "alert_type": "PriceThreshold",
+                    "alert_class": "Market",
+                    "asset": asset,
+                    "asset_type": asset,
+                    "trigger_value": round(ASSETS[asset] * self.rng.uniform(0.9, 1.1), 2),
+                    "condition": self.rng.choice(("ABOVE", "BELOW")),
+                    "position_reference_id": None,
+                }
+            else:
+                pos = positions[i % len(positions)]
+                alert_type = POSITION_ALERT_TYPES[kind]
+                row = {
+                    "alert_type": alert_type,
+                    "alert_class": "Position",
+                    "asset": pos["asset_type"],
+                    "asset_type": pos["asset_type"],
+                    "trigger_value": {"HeatIndex": 50.0, "Profit": 100.0, "TravelPercentLiquid": -25.0}[alert_type],
+                    "condition": "BELOW" if alert_type == "TravelPercentLiquid" else "ABOVE",
+                    "position_reference_id": pos["id"],
+                    "position_type": pos["position_type"],
+                    "liquidation_price": pos["liquidation_price"],
+                }
+            row.update({
+                "id": f"synth-alert-{i:05d}",
+                "created_at": created,
+                "notification_type": "SMS",
+                "level": "Normal",
+                "status": "Active",
+                "frequency": 1,
+                "counter": 0,
+                "evaluated_value": 0.0,
+                "notes": "",
+                "description": "synthetic",
+            })
+            self.alerts.append(row)
+        return self.alerts
+
+    def make_price_history(self, hours: int, interval_minutes: int = 5) -> list:
+        rows = []
+        steps = max(1, hours * 60 // interval_minutes)
+        start = self.now - timedelta(hours=hours)
+        for asset, base in ASSETS.items():
+            price = base
+            for n in range(steps + 1):
+                ts = start + timedelta(minutes=n * interval_minutes)
+                prev = price
+                price = max(0.01, price * (1 + self.rng.gauss(0, 0.002)))
+                if n == steps:
+                    price = base  # end on the reference price positions were built from
+                rows.append({
+                    "id": f"synth-{asset}-{n:06d}",
+                    "asset_type": asset,
+                    "current_price": round(price, 4),
+                    "previous_price": round(prev, 4),
+                    "last_update_time": ts.isoformat(),
+                    "previous_update_time": None,
+                    "source": "synthetic",
+                    "epoch_ms": int(ts.timestamp() * 1000),
+                })
+        return rows
+
+    # --- database ---------------------------------------------------------
+    def populate(self, dl, scale: SyntheticScale | str = "small") -> dict:
+        """Write a full synthetic dataset into ``dl`` and return row counts."""
+        if isinstance(scale, str):
+            scale = SCALES[scale]
+        cursor = dl.db.get_cursor()
+        counts = {
+            "wallets": _bulk_insert(cursor, "wallets", self.make_wallets(scale.wallets)),
+            "positions": _bulk_insert(cursor, "positions", self.make_positions(scale.positions)),
+            "alerts": _bulk_insert(cursor, "alerts", self.make_alerts(scale.alerts)),
+            "prices": _bulk_insert(
+                cursor, "prices", self.make_price_history(scale.price_hours, scale.price_interval_minutes)
+            ),
+        }
+        dl.db.commit()
+
+        try:
+            from data.threshold_seeder import AlertThresholdSeeder
+            AlertThresholdSeeder(dl.db).seed_all()
+        except Exception:
+            pass
+        counts["thresholds"] = cursor.execute("SELECT COUNT(*) FROM alert_thresholds").fetchone()[0]
+
+        try:
+            with open(ALERT_THRESHOLDS_PATH, "r", encoding="utf-8") as f:
+                dl.system.set_var("alert_thresholds", json.load(f))
+        except Exception:
+            dl.system.set_var("alert_thresholds", {"alert_ranges": {}})
+        return counts
+
+    def jupiter_payload(self, wallet_name: str, drift: float = 0.01) -> dict:
+        """Jupiter ``/v1/positions`` body for ``wallet_name``'s positions."""
+        data = []
+        for pos in self.positions:
+            if pos["wallet_name"] != wallet_name:
+                continue
+            mark = pos["current_price"] * (1 + self.rng.uniform(-drift, drift))
+            data.append({
+                "positionPubkey": pos["id"],
+                "marketMint": MINTS[pos["asset_type"]],
+                "side": pos["position_type"].lower(),
+                "entryPrice": pos["entry_price"],
+                "liquidationPrice": pos["liquidation_price"],
+                "collateral": pos["collateral"],
+                "size": pos["size"],
+                "leverage": pos["leverage"],
+                "value": pos["value"],
+                "updatedTime": self.now.timestamp(),
+                "pnlAfterFeesUsd": pos["pnl_after_fees_usd"],
+                "pnlChangePctAfterFees": 0.0,
+                "markPrice": round(mark, 4),
+            })
+        return {"dataList": data}
+
+
+class _StubResponse:
+    def __init__(self, data: dict, status_code: int = 200):
+        self._data = data
+        self.status_code = status_code
+        self.text = json.dumps(data)
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class JupiterStub:
+    """Serve ``generator.jupiter_payload`` in place of the Jupiter API.
+
+    Used as a context manager it swaps ``requests`` inside
+    ``positions.position_sync_service`` so ``update_jupiter_positions`` runs
+    without network access::
+
+        with JupiterStub(gen):
+            PositionSyncService(dl).update_jupiter_positions()
+    """
+
+    def __init__(self, generator: SyntheticDataGenerator):
+        self.generator = generator
+        self.calls = 0
+        self._module = None
+        self._saved = None
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        self.calls += 1
+        address = url.split("walletAddress=", 1)[-1].split("&", 1)[0]
+        for wallet in self.generator.wallets:
+            if wallet["public_address"] == address:
+                return _StubResponse(self.generator.jupiter_payload(wallet["name"]))
+        return _StubResponse({"dataList": []})
+
+    def __enter__(self):
+        import positions.position_sync_service as svc
+
+        self._module = svc
+        self._saved = svc.requests
+        error = getattr(self._saved, "RequestException", Exception)
+        svc.requests = types.SimpleNamespace(
+            get=self.get,
+            RequestException=error,
+            HTTPError=getattr(self._saved, "HTTPError", error),
+        )
+        return self
+
+    def __exit__(self, *exc):
+        self._module.requests = self._saved
+        return False
+
+
+def build_synthetic_locker(db_path: str, scale: SyntheticScale | str = "small", seed: int = 1337):
+    """Create a DataLocker at ``db_path`` without the default seeds and
+    populate it.  Returns ``(data_locker, generator, counts)``."""
+    from data.data_locker import DataLocker
+
+    seeds = ("_seed_modifiers_if_empty", "_seed_wallets_if_empty",
+             "_seed_thresholds_if_empty", "_seed_alerts_if_empty")
+    saved = {name: getattr(DataLocker, name) for name in seeds}
+    try:
+        for name in seeds:
+            setattr(DataLocker, name, lambda self: None)
+        dl = DataLocker(str(db_path))
+    finally:
+        for name, fn in saved.items():
+            setattr(DataLocker, name, fn)
+    gen = SyntheticDataGenerator(seed)
+    counts = gen.populate(dl, scale)
+    return dl, gen, counts
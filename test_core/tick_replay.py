@@ -0,0 +1,235 @@
+"""Price-tick replay engine for end-to-end throughput testing.
+
+``TickReplayEngine`` feeds BTC/ETH/SOL ticks through the real per-tick
+pipeline on a (synthetic) database:
+
+    DLPriceManager.insert_price
+      → PositionCore.enrich_positions
+      → AlertCore.evaluate_all_alerts (AlertEnrichmentService +
+        AlertEvaluationService, notifications stubbed)
+
+Ticks are either recorded (any file ``ReplayPriceProvider`` reads) or a
+seeded random walk (``synthetic_ticks``).  With ``speed=None`` ticks are
+processed back to back; otherwise tick ``i`` is due at
+``i * tick_interval / speed`` seconds after start.  When the pipeline falls
+behind, ticks that are already superseded by a later due tick are dropped,
+the way ``sonic_monitor`` only ever sees the latest price.
+
+Missed/late alert levels are checked against a reference replay of the
+``Market`` (price threshold) alerts, evaluated in memory after the run.
+A level change is *on time* when its tick was processed before the next
+tick was due, *late* when it was seen on a later (or overdue) tick, and
+*missed* when the tick was dropped and the level had reverted by the next
+processed tick.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from test_core.synthetic_data import ASSETS, SyntheticDataGenerator
+
+TICK_ASSETS = ("BTC", "ETH", "SOL")
+
+
+def synthetic_ticks(count: int, seed: int = 1337, volatility: float = 0.004) -> list:
+    """Seeded random-walk frames ``[{asset: price}, ...]``."""
+    rng = random.Random(seed)
+    prices = {a: ASSETS[a] for a in TICK_ASSETS}
+    frames = []
+    for _ in range(count):
+        prices = {a: max(0.01, p * (1 + rng.gauss(0, volatility))) for a, p in prices.items()}
+        frames.append({a: round(p, 4) for a, p in prices.items()})
+    return frames
+
+
+def recorded_ticks(path: str) -> list:
+    """Frames from a recorded tick file (jsonl/json/csv)."""
+    from prices.price_feed import ReplayPriceProvider
+
+    return ReplayPriceProvider(path, loop=False).frames
+
+
+class _CountingNotifier:
+    """Async notifier stand-in that only counts calls."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def notify(self, alert):
+        self.engine.notifications += 1
+        return True
+
+
+def _level(alert) -> str:
+    level = getattr(alert, "level", None)
+    return getattr(level, "value", None) or str(level)
+
+
+def _summary(values: list) -> dict:
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    return {
+        "mean": round(statistics.fmean(ordered) * 1000, 3),
+        "p50": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+class TickReplayEngine:
+    def __init__(self, data_locker, ticks: list, speed: float | None = None,
+                 tick_interval: float = 60.0, cycle_budget: float | None = None,
+                 start_time=None):
+        from alert_core.alert_core import AlertCore
+        from positions.position_core import PositionCore
+
+        self.dl = data_locker
+        self.ticks = list(ticks)
+        self.speed = speed
+        self.tick_interval = tick_interval
+        self.cycle_budget = cycle_budget
+        self.start_time = start_time or SyntheticDataGenerator().now
+        self.position_core = PositionCore(data_locker)
+        config = data_locker.system.get_var("alert_thresholds") or {}
+        self.alert_core = AlertCore(data_locker, config_loader=lambda: config)
+        self.alert_core.notifier_factory = lambda: _CountingNotifier(self)
+        self.notifications = 0
+        self.records = []
+
+    # --- pipeline --------------------------------------------------------
+    def _insert_prices(self, index: int, frame: dict):
+        stamp = (self.start_time + timedelta(seconds=(index + 1) * self.tick_interval)).isoformat()
+        for asset, price in frame.items():
+            self.dl.prices.insert_price({
+                "asset_type": asset,
+                "current_price": price,
+                "last_update_time": stamp,
+                "source": "tick_replay",
+            })
+
+    async def process_tick(self, index: int) -> dict:
+        """Run one tick through the pipeline; returns ``{alert_id: level}``."""
+        await asyncio.to_thread(self._insert_prices, index, self.ticks[index])
+        await self.position_core.enrich_positions()
+        results = await self.alert_core.evaluate_all_alerts()
+        return {a.id: _level(a) for a in results}
+
+    # --- run -------------------------------------------------------------
+    def _due(self, index: int) -> float:
+        return 0.0 if not self.speed else index * self.tick_interval / self.speed
+
+    async def run(self) -> dict:
+        self.records = []
+        started = time.perf_counter()
+        index = 0
+        while index < len(self.ticks):
+            now = time.perf_counter() - started
+            if self.speed:
+                # Skip ticks already superseded by a later due tick
+                latest_due = min(len(self.ticks) - 1, int(now * self.speed / self.tick_interval))
+                for dropped in range(index, max(index, latest_due)):
+                    self.records.append({"tick": dropped, "dropped": True})
+                index = max(index, latest_due)
+                wait = self._due(index) - now
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            arrival = self._due(index) if self.speed else time.perf_counter() - started
+            tick_start = time.perf_counter()
+            levels = await self.process_tick(index)
+            finished = time.perf_counter() - started
+            next_due = self._due(index + 1) if self.speed else None
+            self.records.append({
+                "tick": index,
+                "dropped": False,
+                "processing_s": time.perf_counter() - tick_start,
+                "latency_s": finished - arrival,
+                "late": bool(self.speed) and finished > next_due,
+                "levels": levels,
+            })
+            index += 1
+        return self.report(time.perf_counter() - started)
+
+    # --- reporting -------------------------------------------------------
+    def reference_levels(self) -> list:
+        """Expected Market alert levels per tick, evaluated in memory."""
+        alerts = [a for a in self.alert_core.repo.get_active_alerts()
+                  if str(a.alert_class).strip() == "Market"]
+        evaluator = self.alert_core.evaluator
+        expected = []
+        for frame in self.ticks:
+            levels = {}
+            for alert in alerts:
+                probe = copy.copy(alert)
+                probe.evaluated_value = frame.get(alert.asset or alert.asset_type)
+                if probe.evaluated_value is None:
+                    continue
+                levels[alert.id] = _level(evaluator.evaluate(probe))
+            expected.append(levels)
+        return expected
+
+    def level_accuracy(self) -> dict:
+        expected = self.reference_levels()
+        by_tick = {r["tick"]: r for r in self.records}
+        processed = sorted(t for t, r in by_tick.items() if not r["dropped"])
+        counts = {"changes": 0, "on_time": 0, "late": 0, "missed": 0, "mismatched": 0}
+        for tick in range(1, len(expected)):
+            for alert_id, level in expected[tick].items():
+                if expected[tick - 1].get(alert_id) == level:
+                    continue
+                counts["changes"] += 1
+                record = by_tick.get(tick)
+                if record and not record["dropped"]:
+                    seen = record["levels"].get(alert_id)
+                    if seen != level:
+                        counts["mismatched"] += 1
+                    elif record["late"]:
+                        counts["late"] += 1
+                    else:
+                        counts["on_time"] += 1
+                    continue
+                later = next((t for t in processed if t > tick), None)
+                if later is not None and expected[later].get(alert_id) == level:
+                    counts["late"] += 1
+                else:
+                    counts["missed"] += 1
+        counts["reference_alerts"] = len(expected[0]) if expected else 0
+        return counts
+
+    def report(self, elapsed: float) -> dict:
+        done = [r for r in self.records if not r["dropped"]]
+        processing = [r["processing_s"] for r in done]
+        p95 = _summary(processing)["p95"] / 1000
+        report = {
+            "ticks": len(self.ticks),
+            "processed": len(done),
+            "dropped": len(self.records) - len(done),
+            "late_ticks": sum(1 for r in done if r["late"]),
+            "elapsed_s": round(elapsed, 4),
+            "ticks_per_s": round(len(done) / elapsed, 3) if elapsed else None,
+            "speed": self.speed,
+            "tick_interval_s": self.tick_interval,
+            "processing_ms": _summary(processing),
+            "latency_ms": _summary([r["latency_s"] for r in done]),
+            "positions": len(self.dl.positions.get_active_positions()),
+            "alerts": len(done[-1]["levels"]) if done else 0,
+            "notifications": self.notifications,
+            "alert_levels": self.level_accuracy(),
+        }
+        if self.cycle_budget:
+            report["cycle_budget_s"] = self.cycle_budget
+            report["budget_used_p95"] = round(p95 / self.cycle_budget, 4)
+            report["overruns"] = sum(1 for t in processing if t > self.cycle_budget)
+        return report
@@ -0,0 +1,51 @@
+"""pytest-benchmark suite for the Cyclone pipeline on synthetic data.
+
+Skipped unless ``pytest-benchmark`` is installed.  Only the ``small`` scale
+runs by default; set ``SONIC_BENCH_SCALES=small,medium,large`` for more.
+Save and compare runs with pytest-benchmark's own options::
+
+    pytest tests/benchmarks --benchmark-autosave
+    pytest tests/benchmarks --benchmark-compare
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from core.logging import log  # noqa: E402
+from test_core.synthetic_data import build_synthetic_locker  # noqa: E402
+from test_core.cyclone_benchmark import (  # noqa: E402
+    CYCLONE_STEPS,
+    benchmark_environment,
+    build_cyclone,
+    build_targets,
+)
+
+pytestmark = pytest.mark.benchmark
+
+SCALES = [s.strip() for s in os.getenv("SONIC_BENCH_SCALES", "small").split(",") if s.strip()]
+TARGETS = [f"cyclone.{step}" for step in CYCLONE_STEPS] + [
+    "dashboard.get_dashboard_context",
+    "alerts.process_alerts",
+    "positions.update_jupiter_positions",
+]
+
+
+@pytest.fixture(scope="module", params=SCALES)
+def synthetic_targets(request, tmp_path_factory):
+    db_path = tmp_path_factory.mktemp(f"bench_{request.param}") / "bench.db"
+    log.silence_all()
+    dl, gen, _ = build_synthetic_locker(str(db_path), request.param)
+    with benchmark_environment(dl, gen):
+        yield build_targets(dl, build_cyclone(dl))
+    dl.db.close()
+    log.enable_all()
+
+
+@pytest.mark.parametrize("target", TARGETS)
+def test_pipeline_benchmark(benchmark, synthetic_targets, target):
+    setup, run = synthetic_targets[target]
+    benchmark.group = target
+    benchmark.pedantic(run, setup=setup, rounds=3, iterations=1)
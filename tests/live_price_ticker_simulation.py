@@ -1,120 +1,70 @@
-
 import asyncio
+import os
 import random
+import sys
+import tempfile
 from datetime import datetime
 
-from alert_core.alert_service import AlertService
-from alert_core.alert_repository import AlertRepository
-from alert_core.alert_enrichment_service import AlertEnrichmentService
-from xcom.notification_service import NotificationService
-from data.alert import Alert, AlertType
-from utils.config_loader import load_config
-from core.core_imports import log, retry_on_locked
-
-# Mock DataLocker with Live Price Updates
-class LiveMockDataLocker:
-    @retry_on_locked()
-    def __init__(self):
-        self.alerts = []
-        self.prices = {
-            "BTC": {"current_price": 60000},
-            "ETH": {"current_price": 1900},
-            "SOL": {"current_price": 130},
-        }
-
-    def get_alerts(self):
-        return [a.__dict__ for a in self.alerts]
-
-    def get_latest_price(self, asset_type):
-        return self.prices.get(asset_type.upper())
-
-    def read_positions(self):
-        # Simulate positions for travel percent, profit, heat index alerts
-        return [
-            {
-                "id": "pos1",
-                "travel_percent": random.uniform(-90, 0),
-                "pnl_after_fees_usd": random.uniform(-1000, 5000),
-                "current_heat_index": random.uniform(0, 100)
-            }
-        ]
-
-    def update_alert_conditions(self, alert_id, fields: dict):
-        for a in self.alerts:
-            if a.id == alert_id:
-                for key, val in fields.items():
-                    setattr(a, key, val)
-
-    def get_current_timestamp(self):
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    def simulate_price_tick(self):
-        # Randomly update BTC, ETH, SOL prices slightly
-        for asset in self.prices:
-            change = random.uniform(-100, 100) if asset == "BTC" else random.uniform(-5, 5)
-            self.prices[asset]["current_price"] += change
-            if self.prices[asset]["current_price"] < 0:
-                self.prices[asset]["current_price"] = 10  # Prevent negative prices
-
-# Create alerts
-def create_test_alerts(data_locker):
-    assets = ["BTC", "ETH", "SOL"]
-    alert_types = [AlertType.PRICE_THRESHOLD, AlertType.PROFIT, AlertType.TRAVEL_PERCENT_LIQUID, AlertType.HEAT_INDEX]
-
-    for i in range(10):
-        asset = random.choice(assets)
-        alert_type = random.choice(alert_types)
-
-        if alert_type == AlertType.PRICE_THRESHOLD:
-            trigger = random.uniform(55000, 65000) if asset == "BTC" else random.uniform(1700, 2100)
-            condition = "ABOVE"
-        elif alert_type == AlertType.PROFIT:
-            trigger = 1000
-            condition = "ABOVE"
-        elif alert_type == AlertType.TRAVEL_PERCENT_LIQUID:
-            trigger = -25
-            condition = "BELOW"
-        elif alert_type == AlertType.HEAT_INDEX:
-            trigger = 50
-            condition = "ABOVE"
-
-        alert = Alert(
-            id=f"alert-{i+1:03d}",
-            alert_type=alert_type,
-            asset=asset,
-            trigger_value=trigger,
-            evaluated_value=0.0,
-            condition=condition
-        )
-        data_locker.alerts.append(alert)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from alert_core.alert_core import AlertCore
+from core.core_imports import log
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
 
-# Main runner
-async def live_price_ticker_simulation():
-    data_locker = LiveMockDataLocker()
 
-    repo = AlertRepository(data_locker)
-    enrichment = AlertEnrichmentService(data_locker)
-    config_loader = lambda: load_config("alert_thresholds.json") or {}
-    notification_service = NotificationService(config_loader)
+class _LogNotifier:
+    """Log alerts instead of sending SMS during the simulation."""
 
-    service = AlertService(repo, enrichment, config_loader)
-    service.notification_service = notification_service
+    async def __aenter__(self):
+        return self
 
-    create_test_alerts(data_locker)
+    async def __aexit__(self, *exc):
+        return False
 
-    log.banner("🚀 LIVE Price Ticker Simulation Started")
+    async def notify(self, alert):
+        log.info(f"📣 {alert.alert_type} {alert.asset} → {alert.level}", source="PriceTicker")
+        return True
 
-    try:
-        while True:
-            data_locker.simulate_price_tick()
-            log.info("💹 Simulated price tick updated.", source="PriceTicker")
 
-            await service.process_all_alerts()
+def simulate_price_tick(data_locker, rng):
+    """Move BTC, ETH and SOL by a small random step."""
+    for asset, row in data_locker.prices.get_latest_prices(["BTC", "ETH", "SOL"]).items():
+        previous = float(row["current_price"])
+        price = max(10.0, previous * (1 + rng.uniform(-0.003, 0.003)))
+        data_locker.prices.insert_price({
+            "asset_type": asset,
+            "current_price": price,
+            "previous_price": previous,
+            "last_update_time": datetime.now().isoformat(),
+            "source": "ticker_simulation",
+        })
+
+
+# Main runner
+async def live_price_ticker_simulation(interval: float = 5.0, seed: int = 1337):
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        scale = SyntheticScale(wallets=1, positions=10, alerts=12, price_hours=1)
+        data_locker, _, _ = build_synthetic_locker(os.path.join(tmp, "ticker.db"), scale, seed)
+        core = AlertCore(data_locker, lambda: data_locker.system.get_var("alert_thresholds") or {})
+        core.notifier_factory = _LogNotifier
+
+        log.banner("🚀 LIVE Price Ticker Simulation Started")
+
+        try:
+            while True:
+                simulate_price_tick(data_locker, rng)
+                log.info("💹 Simulated price tick updated.", source="PriceTicker")
+
+                await core.process_alerts()
+
+                await asyncio.sleep(interval)  # Wait for next price tick
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            log.warning("Simulation manually stopped.", source="PriceTicker")
+            log.banner("🚀 LIVE Price Ticker Simulation Ended")
+        finally:
+            data_locker.db.close()
 
-            await asyncio.sleep(5)  # Wait 5 seconds for next price tick
-    except KeyboardInterrupt:
-        log.warning("Simulation manually stopped.", source="PriceTicker")
-        log.banner("🚀 LIVE Price Ticker Simulation Ended")
 
 if __name__ == "__main__":
     asyncio.run(live_price_ticker_simulation())
@@ -0,0 +1,77 @@
+import asyncio
+from uuid import uuid4
+from datetime import datetime
+
+from data.data_locker import DataLocker
+from alert_core.alert_core import AlertCore
+from data.alert import AlertType, Condition
+
+
+def _setup(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_alerts_if_empty", lambda self: None)
+
+    dl = DataLocker(str(tmp_path / "batch.db"))
+    dl.positions.create_position({
+        "id": "pos1",
+        "asset_type": "BTC",
+        "entry_price": 10000.0,
+        "liquidation_price": 5000.0,
+        "position_type": "LONG",
+        "wallet_name": "test",
+        "current_heat_index": 10.0,
+        "pnl_after_fees_usd": 150.0,
+        "travel_percent": 0.0,
+        "liquidation_distance": 0.0,
+    })
+    return dl
+
+
+def _profit_alert():
+    return {
+        "id": str(uuid4()),
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "alert_type": AlertType.Profit.value,
+        "alert_class": "Position",
+        "asset_type": "BTC",
+        "trigger_value": 50.0,
+        "condition": Condition.ABOVE.value,
+        "notification_type": "Email",
+        "position_reference_id": "pos1",
+    }
+
+
+def test_process_alerts_writes_only_changed_rows(tmp_path, monkeypatch):
+    dl = _setup(tmp_path, monkeypatch)
+    core = AlertCore(dl, lambda: {})
+    asyncio.run(core.create_alert(_profit_alert()))
+    asyncio.run(core.create_alert(_profit_alert()))
+
+    asyncio.run(core.process_alerts())
+    assert core.last_write_stats == {"evaluated": 2, "written": 2}
+    assert all(r["evaluated_value"] == 150.0 for r in dl.db.fetch_all("alerts"))
+
+    # Nothing changed since the last pass → no rows written
+    asyncio.run(core.process_alerts())
+    assert core.last_write_stats == {"evaluated": 2, "written": 0}
+
+    dl.db.close()
+
+
+def test_flush_uses_single_executemany(tmp_path, monkeypatch):
+    dl = _setup(tmp_path, monkeypatch)
+    core = AlertCore(dl, lambda: {})
+    for _ in range(3):
+        asyncio.run(core.create_alert(_profit_alert()))
+
+    commits = []
+    original_commit = dl.db.commit
+    monkeypatch.setattr(dl.db, "commit", lambda: (commits.append(1), original_commit()))
+
+    asyncio.run(core.evaluate_all_alerts())
+    assert core.last_write_stats == {"evaluated": 3, "written": 3}
+    assert len(commits) == 1
+
+    dl.db.close()
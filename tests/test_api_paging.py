@@ -0,0 +1,119 @@
+import pytest
+
+from data.dl_paging import decode_cursor, encode_cursor, select_fields
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+
+
+@pytest.fixture
+def dl(tmp_path):
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "paging.db"), SyntheticScale(3, 20, 60, 6))
+    yield dl
+    dl.db.close()
+
+
+def _walk(query, filters=None, limit=7):
+    rows, cursor, pages = [], None, 0
+    while True:
+        page, cursor = query(filters, cursor, limit)
+        rows += page
+        pages += 1
+        if not cursor:
+            return rows, pages
+
+
+def test_alert_pages_cover_filtered_rows_once(dl):
+    everything = dl.alerts.get_all_alerts()
+    rows, pages = _walk(dl.alerts.query_alerts)
+    assert [r["id"] for r in rows] == [r["id"] for r in sorted(
+        everything, key=lambda r: (r["created_at"] or "", r["id"]), reverse=True)]
+    assert pages == -(-len(everything) // 7)
+
+    alert_class = everything[0]["alert_class"]
+    filtered, _ = _walk(dl.alerts.query_alerts, {"class": alert_class.lower()})
+    assert {r["id"] for r in filtered} == {r["id"] for r in everything if r["alert_class"] == alert_class}
+
+
+def test_alert_wallet_filter_follows_position(dl):
+    positions = {p["id"]: p for p in dl.positions.get_all_positions()}
+    wallet = next(iter(positions.values()))["wallet_name"]
+    rows, _ = dl.alerts.query_alerts({"wallet": wallet})
+    expected = [a["id"] for a in dl.alerts.get_all_alerts()
+                if a["position_reference_id"] in positions
+                and positions[a["position_reference_id"]]["wallet_name"] == wallet]
+    assert expected and sorted(r["id"] for r in rows) == sorted(expected)
+
+
+def test_position_and_price_pages(dl):
+    rows, _ = _walk(dl.positions.query_positions, {"status": "ACTIVE"}, limit=6)
+    assert sorted(r["id"] for r in rows) == sorted(p["id"] for p in dl.positions.get_active_positions())
+
+    asset = dl.prices.get_recent_prices(1)[0]["asset_type"]
+    page, cursor = dl.prices.query_prices({"asset": asset}, limit=5)
+    more, _ = dl.prices.query_prices({"asset": asset}, cursor, 5)
+    stamps = [r["epoch_ms"] for r in page + more]
+    assert stamps == sorted(stamps, reverse=True) and len(set(r["id"] for r in page + more)) == 10
+    assert {r["asset_type"] for r in page + more} == {asset}
+
+
+@pytest.mark.parametrize("manager, table", [("alerts", "alerts"), ("prices", "prices"), ("positions", "positions")])
+def test_pages_read_off_an_index(dl, monkeypatch, manager, table):
+    plans = []
+    cursor = dl.db.get_cursor()
+    original = cursor.execute
+
+    class Recorder:
+        def execute(self, sql, params=()):
+            if sql.startswith("SELECT * FROM"):
+                plans.extend(r[-1] for r in original("EXPLAIN QUERY PLAN " + sql, params).fetchall())
+            return original(sql, params)
+
+    monkeypatch.setattr(dl.db, "get_cursor", lambda: Recorder())
+    query = getattr(getattr(dl, manager), f"query_{manager}")
+    _, after = query(None, None, 3)
+    query(None, after, 3)
+    assert plans and all(table in p and "INDEX" in p for p in plans)
+    assert not any("TEMP B-TREE" in p for p in plans)
+
+
+def test_null_sort_keys_are_filled(dl):
+    cursor = dl.db.get_cursor()
+    cursor.execute("INSERT INTO alerts (id, alert_type, alert_class) VALUES ('bare', 'X', 'System')")
+    cursor.execute("INSERT INTO prices (id, asset_type, current_price) VALUES ('bare', 'BTC', 1.0)")
+    dl.db.commit()
+    assert cursor.execute("SELECT created_at FROM alerts WHERE id = 'bare'").fetchone()[0]
+    assert cursor.execute("SELECT epoch_ms FROM prices WHERE id = 'bare'").fetchone()[0] == 0
+    rows, _ = _walk(dl.alerts.query_alerts)
+    assert "bare" in {r["id"] for r in rows}
+
+
+def test_bad_cursor_rejected(dl):
+    with pytest.raises(ValueError):
+        dl.alerts.query_alerts(after="not-a-cursor")
+    with pytest.raises(ValueError):
+        dl.alerts.query_alerts(after=encode_cursor(["only-one"]))
+    assert decode_cursor(encode_cursor(["2024-01-01", "a1"])) == ["2024-01-01", "a1"]
+
+
+def test_select_fields_keeps_id():
+    rows = [{"id": "a", "level": "High", "notes": "x"}]
+    assert select_fields(rows, "level,missing") == [{"id": "a", "level": "High"}]
+    assert select_fields(rows, None) is rows
+
+
+def test_versions_bump_on_any_write(dl):
+    before = dl.table_versions.get_versions()
+    etag, _ = dl.table_versions.validators(["alerts", "positions"])
+    assert etag == dl.table_versions.validators(["positions", "alerts"])[0]
+
+    alert_id = dl.alerts.get_recent_alerts(1)[0]["id"]
+    cursor = dl.db.get_cursor()
+    cursor.execute("UPDATE alerts SET level = 'High' WHERE id = ?", (alert_id,))
+    dl.alerts.delete_alert(alert_id)
+    dl.db.commit()
+
+    after = dl.table_versions.get_versions()
+    assert after["alerts"]["version"] == before["alerts"]["version"] + 2
+    assert after["positions"]["version"] == before["positions"]["version"]
+    assert after["alerts"]["modified_at"] >= before["alerts"]["modified_at"]
+    assert dl.table_versions.validators(["alerts", "positions"])[0] != etag
+    assert dl.table_versions.validators(["positions"], salt="x")[0] != dl.table_versions.validators(["positions"])[0]
@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from data.data_locker import DataLocker
+from data.async_data_locker import AsyncDataLocker
+from data.alert import Alert, AlertLevel, AlertType, Condition
+from alert_core.alert_core import AlertCore
+from alert_core.alert_evaluation_service import AlertEvaluationService
+
+
+def _make_locker(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_alerts_if_empty", lambda self: None)
+    return DataLocker(str(tmp_path / "async.db"))
+
+
+def _add_position_alert(core, dl, idx):
+    pos_id = f"pos{idx}"
+    dl.positions.create_position({
+        "id": pos_id,
+        "asset_type": "BTC",
+        "entry_price": 100.0,
+        "liquidation_price": 50.0,
+        "position_type": "LONG",
+        "wallet_name": "w",
+        "pnl_after_fees_usd": float(idx),
+    })
+    asyncio.run(core.create_alert({
+        "id": str(uuid4()),
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "alert_type": AlertType.Profit.value,
+        "alert_class": "Position",
+        "asset_type": "BTC",
+        "trigger_value": 1.0,
+        "condition": Condition.ABOVE.value,
+        "notification_type": "SMS",
+        "position_reference_id": pos_id,
+    }))
+
+
+class SlowNotifier:
+    def __init__(self, delay, limit):
+        self.delay = delay
+        self.semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.peak = 0
+        self.sent = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def notify(self, alert):
+        async with self.semaphore:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(self.delay)
+            self.in_flight -= 1
+            self.sent += 1
+            return True
+
+
+def test_prefetch_alert_context_batches_lookups(tmp_path, monkeypatch):
+    dl = _make_locker(tmp_path, monkeypatch)
+    core = AlertCore(dl, lambda: {})
+    for i in range(5):
+        _add_position_alert(core, dl, i)
+
+    calls = []
+    monkeypatch.setattr(dl, "get_position_by_reference_id", lambda pid: calls.append(pid))
+
+    alerts = [
+        Alert(id="a", alert_type=AlertType.Profit, alert_class="Position",
+              condition=Condition.ABOVE, position_reference_id="pos3"),
+        Alert(id="b", alert_type=AlertType.Profit, alert_class="Position",
+              condition=Condition.ABOVE, position_reference_id="missing"),
+    ]
+    snapshot = asyncio.run(AsyncDataLocker(dl).prefetch_alert_context(alerts))
+
+    assert snapshot.get_position_by_reference_id("pos3")["pnl_after_fees_usd"] == 3.0
+    assert snapshot.get_position_by_reference_id("missing") is None
+    assert calls == []
+    dl.db.close()
+
+
+def test_evaluate_all_alerts_overlaps_notifications(tmp_path, monkeypatch):
+    dl = _make_locker(tmp_path, monkeypatch)
+    core = AlertCore(dl, lambda: {})
+    for i in range(8):
+        _add_position_alert(core, dl, i)
+
+    notifier = SlowNotifier(delay=0.05, limit=4)
+    core.notifier_factory = lambda: notifier
+
+    start = time.perf_counter()
+    results = asyncio.run(core.evaluate_all_alerts())
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == 8
+    assert notifier.sent == 8
+    assert notifier.peak == 4
+    assert elapsed < 8 * 0.05
+    assert core.last_write_stats["evaluated"] == 8
+    dl.db.close()
+
+
+def test_enrichment_reads_stay_off_the_event_loop(tmp_path, monkeypatch):
+    dl = _make_locker(tmp_path, monkeypatch)
+    core = AlertCore(dl, lambda: {})
+    for i in range(3):
+        _add_position_alert(core, dl, i)
+    dl.insert_or_update_price("BTC", 90.0, "test")
+
+    reads = []
+
+    def watch(owner, name):
+        original = getattr(owner, name)
+
+        def wrapper(*args, **kwargs):
+            reads.append((name, threading.current_thread() is threading.main_thread()))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(owner, name, wrapper)
+
+    for name in ("get_position_by_reference_id", "get_latest_price", "get_wallet_by_name"):
+        watch(dl, name)
+    watch(dl.portfolio_aggregates, "get_totals")
+    watch(dl.position_risk, "get")
+
+    alerts = [
+        Alert(id="p", alert_type=AlertType.Profit, alert_class="Position",
+              condition=Condition.ABOVE, position_reference_id="pos1"),
+        Alert(id="m", alert_type=AlertType.PriceThreshold, alert_class="Market",
+              asset="BTC", condition=Condition.ABOVE),
+        Alert(id="t", alert_type=AlertType.TotalValue, alert_class="Portfolio", condition=Condition.ABOVE),
+        Alert(id="r", alert_type=AlertType.LiquidationRisk, alert_class="Position",
+              condition=Condition.ABOVE, position_reference_id="pos2"),
+    ]
+    enriched = {a.id: a for a in asyncio.run(core.enricher.enrich_all(alerts))}
+
+    assert enriched["p"].evaluated_value == 1.0 and enriched["m"].evaluated_value == 90.0
+    # Prefetched rows are served from the snapshot; everything else ran on the DB executor
+    assert {name for name, _ in reads} == {"get_totals", "get"}
+    assert not any(on_loop for _, on_loop in reads)
+    dl.db.close()
+
+
+def test_single_alert_flush_leaves_other_queued_rows():
+    evaluator = AlertEvaluationService(threshold_service=None)
+    repo = MagicMock()
+    cursor = repo.data_locker.db.get_cursor.return_value
+    evaluator.inject_repo(repo)
+
+    def written():
+        return [row[2] for call in cursor.executemany.call_args_list for row in call.args[1]]
+
+    a = Alert(id="a", alert_type=AlertType.Profit, alert_class="Position", condition=Condition.ABOVE)
+    b = Alert(id="b", alert_type=AlertType.Profit, alert_class="Position", condition=Condition.ABOVE)
+    evaluator.snapshot_alerts([a, b])
+    for alert, value in ((a, 1.0), (b, 2.0)):
+        alert.level, alert.evaluated_value = AlertLevel.HIGH, value
+        evaluator.queue_alert_update(alert)
+
+    assert evaluator.flush_alert_updates(["a"]) == {"evaluated": 1, "written": 1}
+    assert written() == ["a"]
+    assert evaluator.flush_alert_updates(["b"]) == {"evaluated": 1, "written": 1}
+    assert written() == ["a", "b"]
+    assert evaluator.flush_alert_updates() == {"evaluated": 0, "written": 0}
@@ -0,0 +1,99 @@
+import pytest
+
+from dashboard.delta_publisher import DeltaPublisher
+from data.data_locker import DataLocker
+from data.dl_change_bus import TOPICS
+from data.dl_table_versions import DLTableVersionManager
+
+
+@pytest.fixture
+def dl(tmp_path, monkeypatch):
+    for name in ("_seed_modifiers_if_empty", "_seed_wallets_if_empty",
+                 "_seed_thresholds_if_empty", "_seed_alerts_if_empty"):
+        monkeypatch.setattr(DataLocker, name, lambda self: None)
+    locker = DataLocker(str(tmp_path / "bus.db"))
+    yield locker
+    locker.db.close()
+
+
+def _position(pid="p1"):
+    return {"id": pid, "asset_type": "BTC", "position_type": "LONG", "entry_price": 100.0,
+            "liquidation_price": 50.0, "collateral": 10.0, "size": 100.0, "wallet_name": "W"}
+
+
+def test_manager_writes_bump_their_topics(dl):
+    writes = {
+        "positions": lambda: dl.positions.create_position(_position()),
+        "prices": lambda: dl.insert_or_update_price("BTC", 100.0, "test"),
+        "modifiers": lambda: dl.modifiers.set_modifier("distance_weight", 0.5),
+        "ledger": lambda: dl.ledger.insert_ledger_entry("price_monitor", "Success"),
+        "thresholds": lambda: (dl.db.get_cursor().execute(
+            "INSERT INTO alert_thresholds (id, alert_type, alert_class, metric_key, condition, low, medium, high) "
+            "VALUES ('t1', 'PriceThreshold', 'Market', 'current_price', 'ABOVE', 1, 2, 3)"
+        ), dl.db.commit()),
+    }
+    for topic, write in writes.items():
+        before = dl.changes.generations()
+        write()
+        after = dl.changes.generations()
+        assert after[topic] > before[topic], topic
+        assert {t for t in TOPICS if after[t] != before[t]} <= {topic, "portfolio"}
+
+    # Position writes also move the incrementally maintained portfolio totals
+    before = dl.changes.generation("portfolio")
+    dl.portfolio.record_snapshot({"total_value": 1.0})
+    assert dl.changes.generation("portfolio") > before
+
+
+def test_unchanged_check_skips_counter_query(dl, monkeypatch):
+    dl.changes.generations()
+    calls = []
+    original = DLTableVersionManager.get_versions
+    monkeypatch.setattr(DLTableVersionManager, "get_versions",
+                        lambda self, tables: calls.append(1) or original(self, tables))
+
+    token = dl.changes.token()
+    assert dl.changes.token() == token and calls == []
+
+    dl.insert_or_update_price("SOL", 1.0, "test")
+    assert dl.changes.token() != token and len(calls) == 1
+
+
+def test_sees_commits_from_other_connections(dl):
+    before = dl.changes.generation("alerts")
+    other = DataLocker(str(dl.db.db_path))
+    try:
+        other.db.get_cursor().execute("INSERT INTO alerts (id, alert_type, alert_class) VALUES ('a1', 'X', 'System')")
+        assert dl.changes.generation("alerts") == before  # not committed yet
+        other.db.commit()
+        assert dl.changes.generation("alerts") > before
+    finally:
+        other.db.close()
+
+
+def test_subscribe_and_poll(dl):
+    seen = []
+    handle = dl.changes.subscribe(seen.append, topics=["prices"])
+    dl.changes.poll()
+
+    dl.positions.create_position(_position())
+    assert "positions" in dl.changes.poll() and seen == []
+
+    dl.insert_or_update_price("BTC", 100.0, "test")
+    assert set(dl.changes.poll()) == {"prices"}
+    assert seen == [{"prices": dl.changes.generation("prices")}]
+    assert dl.changes.poll() == {}
+
+    dl.changes.unsubscribe(handle)
+    dl.insert_or_update_price("BTC", 101.0, "test")
+    dl.changes.poll()
+    assert len(seen) == 1
+
+
+def test_delta_publisher_skips_unchanged_topics(dl, monkeypatch):
+    pub = DeltaPublisher(dl)
+    dl.insert_or_update_price("BTC", 100.0, "test")
+    assert pub.publish("prices")["full"]
+
+    monkeypatch.setattr(DeltaPublisher, "_prices", lambda self: pytest.fail("snapshot rebuilt"))
+    assert pub.publish("prices") == {}
@@ -0,0 +1,52 @@
+import pytest
+import importlib
+
+flask = importlib.import_module("flask")
+if not getattr(flask, "Flask", None):
+    pytest.skip("Flask not available", allow_module_level=True)
+from flask import Flask
+from app.alerts_bp import alerts_bp
+from app.prices_bp import prices_bp
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+
+
+@pytest.fixture
+def client(tmp_path):
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "etag.db"), SyntheticScale(2, 10, 25, 2))
+    app = Flask(__name__)
+    app.register_blueprint(alerts_bp)
+    app.register_blueprint(prices_bp, url_prefix="/prices")
+    app.config["TESTING"] = True
+    app.data_locker = dl
+    with app.test_client() as client:
+        client.dl = dl
+        yield client
+    dl.db.close()
+
+
+def test_monitor_pages_and_revalidates(client):
+    first = client.get("/alerts/monitor?limit=10&fields=level")
+    assert first.status_code == 200
+    body = first.get_json()
+    assert len(body["alerts"]) == 10 and body["next_cursor"]
+    assert set(body["alerts"][0]) == {"id", "level"}
+    etag = first.headers["ETag"]
+
+    again = client.get("/alerts/monitor?limit=10&fields=level", headers={"If-None-Match": etag})
+    assert again.status_code == 304 and not again.data
+
+    client.dl.alerts.delete_alert(body["alerts"][0]["id"])
+    changed = client.get("/alerts/monitor?limit=10&fields=level", headers={"If-None-Match": etag})
+    assert changed.status_code == 200 and changed.headers["ETag"] != etag
+
+
+def test_bad_cursor_is_400(client):
+    assert client.get("/alerts/monitor?cursor=garbage").status_code == 400
+
+
+def test_prices_history_page(client):
+    response = client.get("/prices/api/data?asset=SOL&limit=5")
+    body = response.get_json()
+    assert [p["asset_type"] for p in body["prices"]] == ["SOL"]
+    assert len(body["history"]) == 5 and body["next_cursor"]
+    assert response.headers.get("Last-Modified")
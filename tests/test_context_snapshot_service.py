@@ -0,0 +1,49 @@
+import pytest
+
+from data.data_locker import DataLocker
+from oracle_core.context_snapshot_service import ContextSnapshotService, mark_data_changed
+
+
+@pytest.fixture
+def dl(tmp_path, monkeypatch):
+    for name in (
+        "_seed_modifiers_if_empty",
+        "_seed_wallets_if_empty",
+        "_seed_thresholds_if_empty",
+        "_seed_alerts_if_empty",
+    ):
+        monkeypatch.setattr(DataLocker, name, lambda self: None)
+    locker = DataLocker(str(tmp_path / "ctx.db"))
+    yield locker
+    locker.db.close()
+
+
+def test_builder_runs_once_per_generation(dl):
+    snaps = ContextSnapshotService(dl)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert snaps.get("k", build) == {"n": 1}
+    assert snaps.get("k", build) == {"n": 1}
+    assert snaps.hits == 1 and snaps.misses == 1
+
+    mark_data_changed(dl)
+    assert snaps.get("k", build) == {"n": 2}
+    assert dl.system.get_var("context_generation")["value"] == 1
+
+
+def test_shared_generation_invalidates_other_instances(dl):
+    snaps = ContextSnapshotService(dl, check_interval=0)
+    calls = []
+    snaps.get("k", lambda: calls.append(1))
+    # Another process bumps the shared generation only
+    dl.system.set_var("context_generation", {"value": 42})
+    snaps.get("k", lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_for_locker_shares_instance(dl):
+    assert ContextSnapshotService.for_locker(dl) is ContextSnapshotService.for_locker(dl)
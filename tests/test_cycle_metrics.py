@@ -0,0 +1,79 @@
+import asyncio
+
+from core.cycle_metrics import CycleMetricsRecorder, record_http_call
+from data.async_data_locker import AsyncDataLocker
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+from test_core.cyclone_benchmark import benchmark_environment, build_cyclone
+
+
+def _locker(tmp_path):
+    scale = SyntheticScale(wallets=1, positions=4, alerts=8, price_hours=1)
+    return build_synthetic_locker(str(tmp_path / "metrics.db"), scale)
+
+
+def test_recorder_counts_db_work_and_http(tmp_path):
+    dl, _, _ = _locker(tmp_path)
+    recorder = CycleMetricsRecorder(source="test")
+
+    async def _step():
+        def _work():
+            cursor = dl.db.get_cursor()
+            rows = list(cursor.execute("SELECT id FROM positions"))
+            cursor.execute("UPDATE positions SET size = size + 1")
+            dl.db.commit()
+            record_http_call()
+            return rows
+
+        return await asyncio.to_thread(_work)
+
+    with recorder.step("work") as step:
+        rows = asyncio.run(_step())
+
+    assert len(rows) == 4
+    assert step.queries == 2
+    assert step.rows_read == 4
+    assert step.rows_written == 4
+    assert step.commits == 1
+    assert step.http_calls == 1
+    assert step.wall_ms > 0
+
+    # Nothing is attributed once the step has finished
+    dl.db.get_cursor().execute("SELECT 1").fetchall()
+    assert step.queries == 2
+    dl.db.close()
+
+
+def test_async_locker_queries_count_in_active_step(tmp_path):
+    dl, _, _ = _locker(tmp_path)
+    ids = [p["id"] for p in dl.positions.get_all_positions()]
+    recorder = CycleMetricsRecorder(source="test")
+
+    with recorder.step("evaluate") as step:
+        found = asyncio.run(AsyncDataLocker(dl).get_positions_by_ids(ids))
+
+    assert len(found) == len(ids) == 4
+    assert step.queries == 1
+    assert step.rows_read == 4
+    dl.db.close()
+
+
+def test_run_cycle_persists_metrics_and_percentiles(tmp_path):
+    dl, gen, _ = _locker(tmp_path)
+    with benchmark_environment(dl, gen):
+        cyclone = build_cyclone(dl)
+        for _ in range(3):
+            asyncio.run(cyclone.run_cycle(["market_updates", "cleanse_ids"]))
+
+    recent = dl.cycle_metrics.get_recent(limit=20)
+    assert {r["step"] for r in recent} == {"cycle", "market_updates", "cleanse_ids"}
+    assert len(recent) == 9
+
+    stats = dl.cycle_metrics.get_percentiles(window=2)
+    assert stats["market_updates"]["samples"] == 2
+    assert stats["market_updates"]["rows_written"]["p50"] > 0
+    assert set(stats["cycle"]["wall_ms"]) == {"p50", "p90", "p99"}
+
+    text = dl.cycle_metrics.to_prometheus(stats)
+    assert "# TYPE sonic_cycle_step_wall_ms summary" in text
+    assert 'sonic_cycle_step_queries{step="cleanse_ids",quantile="0.5"}' in text
+    dl.db.close()
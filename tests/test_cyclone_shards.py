@@ -0,0 +1,107 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from alert_core.alert_core import AlertCore
+from core import process_pool
+from cyclone.cyclone_shards import (
+    GLOBAL_SHARD, CycloneShardRunner, ShardReader, partition_alerts, partition_positions,
+)
+from data.alert import Alert, AlertType, Condition
+from hedge_core.hedge_core import HedgeCore
+from positions.position_core import PositionCore
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+
+DERIVED = ("leverage", "travel_percent", "liquidation_distance", "heat_index", "current_price")
+
+
+@pytest.fixture
+def locker(tmp_path):
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "shards.db"), SyntheticScale(3, 30, 40, 2), seed=5)
+    yield dl
+    dl.db.close()
+
+
+def _derived(dl):
+    return {p["id"]: tuple(p.get(f) for f in DERIVED) for p in dl.positions.get_all_positions()}
+
+
+def _reset_derived(dl):
+    dl.db.get_cursor().execute(
+        "UPDATE positions SET leverage = 0, travel_percent = 0, liquidation_distance = 0, "
+        "heat_index = 0, current_heat_index = 0"
+    )
+    dl.db.commit()
+
+
+def test_partitioning():
+    positions = [{"id": "a", "wallet_name": "W1"}, {"id": "b", "wallet_name": "W2"},
+                 {"id": "c", "wallet_name": "W1"}, {"id": "d"}]
+    assert {w: [p["id"] for p in rows] for w, rows in partition_positions(positions).items()} == {
+        "W1": ["a", "c"], "W2": ["b"], "Unknown": ["d"]
+    }
+
+    def alert(aid, ref):
+        return Alert(id=aid, alert_type=AlertType.TravelPercentLiquid, alert_class="Position",
+                     trigger_value=1.0, condition=Condition.BELOW, position_reference_id=ref)
+
+    shards = partition_alerts([alert("x", "a"), alert("y", "b"), alert("z", None)], {"a": "W1", "b": "W2"})
+    assert {w: [a.id for a in rows] for w, rows in shards.items()} == {
+        "W1": ["x"], "W2": ["y"], GLOBAL_SHARD: ["z"]
+    }
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_sharded_enrichment_matches_serial(locker, workers):
+    asyncio.run(PositionCore(locker).enrich_positions())
+    serial = _derived(locker)
+
+    _reset_derived(locker)
+    enriched = CycloneShardRunner(locker, workers=workers).enrich_positions()
+
+    assert len(enriched) == len(serial)
+    assert _derived(locker) == serial
+    assert all(p["enriched_at"] for p in locker.positions.get_all_positions())
+
+
+@pytest.mark.parametrize("workers, processes", [(0, False), (2, False), (2, True)])
+def test_sharded_alert_evaluation_matches_serial(locker, monkeypatch, workers, processes):
+    monkeypatch.setattr(process_pool, "_enabled", processes)
+    core = AlertCore(locker, config_loader=lambda: {})
+    asyncio.run(core.process_alerts())
+    serial = {a["id"]: (a["level"], a["evaluated_value"]) for a in locker.alerts.get_all_alerts()}
+
+    locker.db.get_cursor().execute("UPDATE alerts SET level = 'Normal', evaluated_value = 0")
+    locker.db.commit()
+    runner = CycloneShardRunner(locker, workers=workers)
+    results = asyncio.run(runner.process_alerts(core, write="evaluation"))
+
+    assert len(results) == len(serial)
+    assert {a["id"]: (a["level"], a["evaluated_value"]) for a in locker.alerts.get_all_alerts()} == serial
+    assert runner.last_stats["alerts:evaluation"]["alerts"] == len(serial)
+
+
+def test_sharded_hedge_linking_matches_serial(locker):
+    serial = sorted(sorted(p["id"] for p in group) for group in HedgeCore(locker).link_hedges())
+    HedgeCore(locker).unlink_hedges()
+
+    groups = CycloneShardRunner(locker, workers=2).link_hedges()
+
+    assert sorted(sorted(g) for g in groups) == serial
+    buddies = {}
+    for pos in locker.positions.get_all_positions():
+        if pos.get("hedge_buddy_id"):
+            buddies.setdefault(pos["hedge_buddy_id"], []).append(pos["id"])
+    assert sorted(sorted(ids) for ids in buddies.values()) == serial
+
+
+def test_shard_reader_cannot_write(locker):
+    reader = ShardReader(str(locker.db.db_path))
+    try:
+        assert len(reader.positions.get_all_positions()) == 30
+        with pytest.raises(sqlite3.OperationalError):
+            reader.db.get_cursor().execute("DELETE FROM positions")
+    finally:
+        reader.db.close()
+    assert len(locker.positions.get_all_positions()) == 30
@@ -0,0 +1,68 @@
+import pytest
+
+from data.data_locker import DataLocker
+from dashboard.delta_publisher import DeltaBroadcaster, DeltaPublisher
+
+
+@pytest.fixture
+def dl(tmp_path, monkeypatch):
+    for name in ("_seed_modifiers_if_empty", "_seed_wallets_if_empty",
+                 "_seed_thresholds_if_empty", "_seed_alerts_if_empty"):
+        monkeypatch.setattr(DataLocker, name, lambda self: None)
+    locker = DataLocker(str(tmp_path / "deltas.db"))
+    yield locker
+    locker.db.close()
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    def emit(self, event, data, to=None):
+        self.sent.append((event, data, to))
+
+
+def test_publisher_only_emits_changes(dl):
+    pub = DeltaPublisher(dl)
+    dl.insert_or_update_price("BTC", 100.0, "test")
+    dl.insert_or_update_price("ETH", 10.0, "test")
+
+    first = pub.publish("prices")
+    assert first["full"] and first["changed"] == {"BTC": 100.0, "ETH": 10.0}
+
+    assert pub.publish("prices") == {}
+
+    dl.insert_or_update_price("BTC", 101.0, "test")
+    assert pub.publish("prices") == {"changed": {"BTC": 101.0}, "removed": []}
+
+
+def test_broadcaster_emits_new_events_to_topic_rooms(dl):
+    socket = FakeSocket()
+    caster = DeltaBroadcaster(socket, dl)
+    dl.ui_events.append("prices", {"changed": {"BTC": 1.0}})
+    assert caster.poll_once() == 0  # start-up skips history
+
+    dl.ui_events.append("alerts", {"changed": {"a1": {"level": "High"}}, "removed": []})
+    assert caster.poll_once() == 1
+    event, data, room = socket.sent[0]
+    assert event == "alerts" and room == "alerts"
+    assert data["changed"]["a1"]["level"] == "High" and data["seq"] == caster.last_seq
+    assert caster.poll_once() == 0
+
+
+def test_position_deltas_flag_structural_changes(dl):
+    pub = DeltaPublisher(dl)
+    dl.positions.create_position({"id": "p1", "asset_type": "BTC", "position_type": "LONG", "entry_price": 100.0,
+                                  "liquidation_price": 50.0, "collateral": 10.0, "size": 100.0,
+                                  "wallet_name": "W", "status": "ACTIVE"})
+    assert pub.publish("positions")["structural"]
+
+    dl.db.get_cursor().execute("UPDATE positions SET current_price = 110, travel_percent = 10 WHERE id = 'p1'")
+    dl.db.commit()
+    tick = pub.publish("positions")
+    assert tick["changed"] == {"p1": {"current_price": 110, "travel_percent": 10}}
+    assert not tick["structural"]
+
+    dl.db.get_cursor().execute("UPDATE positions SET size = 200 WHERE id = 'p1'")
+    dl.db.commit()
+    assert pub.publish("positions")["structural"]
@@ -0,0 +1,85 @@
+import pytest
+
+from system.death_nail_service import DeathNailService
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+
+
+class _Logger:
+    def __init__(self):
+        self.deaths = []
+
+    def death(self, message, payload=None):
+        self.deaths.append(message)
+
+    def warning(self, *a, **k):
+        pass
+
+
+@pytest.fixture
+def locker(tmp_path, monkeypatch):
+    monkeypatch.setattr(DeathNailService, "_play_sound", lambda self: None)
+    DeathNailService.reset_windows()
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "death.db"), SyntheticScale(1, 1, 1, 1))
+    yield dl
+    DeathNailService.reset_windows()
+    dl.db.close()
+
+
+def _service(dl, tmp_path, logger, window=60):
+    return DeathNailService(logger, db_path=dl.db.db_path,
+                            log_path=str(tmp_path / "death_log.txt"), window=window)
+
+
+def test_repeats_inside_window_are_coalesced(locker, tmp_path):
+    logger = _Logger()
+    service = _service(locker, tmp_path, logger)
+
+    results = [service.trigger({"message": "db down", "payload": {"n": i}}) for i in range(5)]
+    assert service.flush()
+
+    assert [r["coalesced"] for r in results] == [False, True, True, True, True]
+    assert results[-1]["count"] == 5
+    assert logger.deaths == ["db down"]
+    assert len((tmp_path / "death_log.txt").read_text().splitlines()) == 1
+
+    entries = locker.get_death_log_entries()
+    assert len(entries) == 1
+    assert entries[0]["count"] == 5
+    assert entries[0]["payload"] == {"n": 0}
+
+
+def test_expired_window_opens_new_event(locker, tmp_path):
+    service = _service(locker, tmp_path, _Logger(), window=0)
+    service.trigger({"message": "flaky"})
+    service.trigger({"message": "flaky"})
+    assert service.flush()
+
+    assert [e["count"] for e in locker.get_death_log_entries()] == [1, 1]
+
+
+def test_death_log_entries_are_limited_and_newest_first(locker, tmp_path):
+    service = _service(locker, tmp_path, _Logger())
+    for i in range(4):
+        service.trigger({"message": f"fatal {i}"})
+        assert service.flush()
+
+    entries = locker.get_death_log_entries(limit=2)
+    assert [e["message"] for e in entries] == ["fatal 3", "fatal 2"]
+
+
+def test_idle_dispatcher_does_not_flush(monkeypatch):
+    import time
+    from system.death_nail_service import _DeathDispatcher
+
+    dispatcher = _DeathDispatcher(flush_interval=0.01)
+    calls = []
+    monkeypatch.setattr(dispatcher, "flush_repeats", lambda: calls.append(1) or dispatcher._dirty.clear())
+    dispatcher._ensure_started()
+    time.sleep(0.1)
+    assert calls == []
+
+    dispatcher.mark_repeat("x.db", "HIGH|boom", "t0", 2, "t1")
+    deadline = time.monotonic() + 2
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert calls == [1]
@@ -5,23 +5,43 @@ from alert_core.alert_enrichment_service import AlertEnrichmentService
 from data.alert import Alert, AlertType, Condition
 
 
-def test_enrich_portfolio_sets_default_value():
+def _locker(totals):
     locker = MagicMock()
-    service = AlertEnrichmentService(locker)
-    alert = Alert(
+    locker.portfolio_aggregates.get_totals.return_value = totals
+    return locker
+
+
+def _alert(alert_type, evaluated_value=10.5):
+    return Alert(
         id="port1",
-        alert_type=AlertType.TotalValue,
+        alert_type=alert_type,
         alert_class="Portfolio",
         asset="PORTFOLIO",
         trigger_value=100.0,
         condition=Condition.ABOVE,
-        evaluated_value=10.5,
+        evaluated_value=evaluated_value,
     )
 
-    original = alert.dict()
 
-    enriched = asyncio.run(service._enrich_portfolio(alert))
+def test_enrich_portfolio_uses_aggregates():
+    totals = {"total_value": 1234.5, "avg_leverage": 3.25, "value_to_collateral_ratio": 1.5, "avg_heat_index": 42.0}
+    service = AlertEnrichmentService(_locker(totals))
+
+    for alert_type, expected in [
+        (AlertType.TotalValue, 1234.5),
+        (AlertType.AvgLeverage, 3.25),
+        (AlertType.ValueToCollateralRatio, 1.5),
+        (AlertType.TotalHeat, 42.0),
+    ]:
+        alert = _alert(alert_type)
+        original = alert.dict()
+        enriched = asyncio.run(service._enrich_portfolio(alert))
+        assert enriched.evaluated_value == expected
+        original["evaluated_value"] = expected
+        assert enriched.dict() == original
+
 
-    assert enriched.evaluated_value == 0.0
-    original["evaluated_value"] = 0.0
-    assert enriched.dict() == original
+def test_enrich_portfolio_leaves_undefined_ratio():
+    service = AlertEnrichmentService(_locker({"value_to_collateral_ratio": None}))
+    alert = asyncio.run(service._enrich_portfolio(_alert(AlertType.ValueToCollateralRatio)))
+    assert alert.evaluated_value == 10.5
@@ -23,6 +23,17 @@ def test_strategy_manager_alias(monkeypatch):
     assert strat.name == "degen"
 
 
+def test_builtin_strategies_parsed_once(monkeypatch):
+    sm_mod = importlib.import_module("oracle_core.strategy_manager")
+    first = sm_mod.StrategyManager()
+    monkeypatch.setattr(sm_mod, "_read_definitions", lambda path: pytest.fail(f"re-parsed {path}"))
+    second = sm_mod.StrategyManager()
+    assert second.list_strategies() == first.list_strategies()
+
+    second.get("safe").modifiers["risk_level"] = "high"
+    assert first.get("safe").modifiers["risk_level"] == "low"
+
+
 def test_merge_modifiers():
     sm_mod = importlib.import_module("oracle_core.strategy_manager")
     Strategy = sm_mod.Strategy
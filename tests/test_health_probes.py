@@ -0,0 +1,86 @@
+import threading
+import time
+
+from system.health_probes import HealthProbeService, http_probe
+
+
+def _counting(status="ok", delay=0.0):
+    calls = []
+
+    def probe():
+        calls.append(time.perf_counter())
+        time.sleep(delay)
+        return status
+
+    return probe, calls
+
+
+def test_probes_run_concurrently_and_are_cached():
+    health = HealthProbeService(ttl=60)
+    probes = {}
+    for name in ("a", "b", "c"):
+        probes[name], _ = _counting(delay=0.2)
+        health.register(name, probes[name])
+
+    started = time.perf_counter()
+    results = health.check_all()
+    assert time.perf_counter() - started < 0.5
+    assert all(r["ok"] and not r["stale"] for r in results.values())
+
+    started = time.perf_counter()
+    health.check_all()
+    assert time.perf_counter() - started < 0.05
+    assert [len(health.history(n)) for n in "abc"] == [1, 1, 1]
+
+
+def test_timeout_reports_failure_without_blocking():
+    health = HealthProbeService()
+    release = threading.Event()
+    health.register("slow", lambda: release.wait(2) and "ok", timeout=0.1)
+
+    started = time.perf_counter()
+    result = health.check("slow")
+    assert time.perf_counter() - started < 0.5
+    assert result["ok"] is False and result["status"].startswith("timeout")
+    release.set()
+
+
+def test_stale_result_served_while_revalidating():
+    health = HealthProbeService(ttl=0, stale_ttl=60)
+    probe, calls = _counting()
+    health.register("svc", probe)
+
+    assert health.check("svc")["stale"] is False
+    result = health.check("svc")
+    assert result["stale"] is True and result["ok"] is True
+    for _ in range(50):
+        if len(calls) == 2:
+            break
+        time.sleep(0.01)
+    assert len(calls) == 2
+
+    snap = health.snapshot()["svc"]
+    assert len(snap["history"]) == 2
+    assert snap["latency_ms"]["last"] is not None
+
+
+def test_http_probe_prefers_head():
+    seen = []
+
+    class Resp:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+    class Requests:
+        def head(self, url, **kwargs):
+            seen.append("head")
+            return Resp()
+
+        def get(self, url, **kwargs):
+            seen.append("get")
+            return Resp()
+
+    assert http_probe(Requests(), "https://example.invalid", 1) == "ok"
+    assert seen == ["head"]
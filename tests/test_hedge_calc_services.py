@@ -50,3 +50,51 @@ def test_suggest_rebalance_equal_value_collateral():
     assert suggestion["side"] == "long"
     assert pytest.approx(suggestion["updates"]["collateral"], rel=1e-6) == expected_collateral
 
+
+
+LONG = {"position_type": "LONG", "entry_price": 100.0, "size": 1000.0, "collateral": 500.0}
+SHORT = {"position_type": "SHORT", "entry_price": 110.0, "size": 1000.0, "collateral": 500.0}
+
+
+def test_simulate_range_matches_single_price_evaluation():
+    calc = HedgeCalcServices()
+    prices = [80.0, 100.0, 105.5, 130.0]
+    assert calc.simulate_range(LONG, SHORT, prices) == [calc.evaluate_at_price(LONG, SHORT, p) for p in prices]
+
+
+@pytest.mark.parametrize("side", ["long", "short"])
+def test_delta_neutral_rebalance_over_scenarios(side):
+    calc = HedgeCalcServices()
+    config = {"adjustment_target": "delta_neutral", "adjustable_side": side, "span": 0.2}
+    result = calc.suggest_rebalance(LONG, SHORT, 105.0, config)
+
+    assert result["side"] == side
+    assert result["objective"] < result["baseline_objective"] / 100
+    # Token counts end up (nearly) matched
+    updated = {**(LONG if side == "long" else SHORT), **result["updates"]}
+    other = SHORT if side == "long" else LONG
+    tokens = lambda p: p["size"] / p["entry_price"]
+    assert tokens(updated) == pytest.approx(tokens(other), rel=0.01)
+    assert len(result["profile"]) == result["scenarios"] == 101
+
+
+def test_equal_value_optimizer_agrees_with_single_price_solution():
+    calc = HedgeCalcServices()
+    config = {"adjustment_target": "equal_value", "adjust_fields": ["collateral"], "scenarios": [105.0], "steps": 201}
+    result = calc.suggest_rebalance(LONG, SHORT, 105.0, config)
+    assert result["updates"]["collateral"] == pytest.approx(495.454545, abs=0.1)
+
+
+def test_optimizer_searches_thousands_of_candidates_quickly():
+    calc = HedgeCalcServices()
+    config = {"adjustment_target": "equal_value", "span": 0.3, "steps": 101, "scenario_count": 201}
+    result = calc.optimize_rebalance(LONG, SHORT, 105.0, config)
+    assert result["candidates"] > 10000
+    assert result["elapsed_ms"] < 1000
+    assert result["objective"] <= result["baseline_objective"]
+
+
+def test_unknown_strategy_is_reported():
+    calc = HedgeCalcServices()
+    suggestion = calc.suggest_rebalance(LONG, SHORT, 105.0, {"adjustment_target": "gamma_flat", "span": 0.2})
+    assert suggestion["updates"] == {} and "gamma_flat" in suggestion["note"]
@@ -74,3 +74,27 @@ def test_evaluate_hedge_endpoint():
     assert data["short"]["id"] == "short1"
 
 
+
+
+def test_evaluate_hedge_with_optimizer():
+    client = make_client()
+    resp = client.get(
+        "/sonic_labs/api/evaluate_hedge",
+        query_string={"hedge_id": "h1", "price": "105", "optimize": "1", "target": "delta_neutral"},
+    )
+    assert resp.status_code == 200
+    rebalance = resp.get_json()["rebalance"]
+    assert rebalance["target"] == "delta_neutral"
+    assert rebalance["objective"] <= rebalance["baseline_objective"]
+
+
+def test_evaluate_hedge_post_positions():
+    client = make_client()
+    positions = MockPositions().data
+    resp = client.post(
+        "/sonic_labs/api/evaluate_hedge",
+        json={"long": positions["long1"], "short": positions["short1"], "price": 105, "optimize": True},
+    )
+    assert resp.status_code == 200
+    data = resp.get_json()
+    assert data["long"]["id"] == "long1" and "rebalance" in data
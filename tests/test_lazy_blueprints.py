@@ -0,0 +1,46 @@
+import importlib
+import sys
+import types
+
+from app.lazy_blueprints import LazyBlueprints
+
+
+class _App:
+    def __init__(self):
+        self.registered = []
+        self.view_functions = {}
+        self.wsgi_app = lambda environ, start_response: ["ok"]
+
+    def register_blueprint(self, blueprint, url_prefix=None):
+        self.registered.append((blueprint, url_prefix))
+
+
+def test_blueprints_load_on_first_request(monkeypatch):
+    module = types.ModuleType("fake_lazy_bp")
+    module.first_bp, module.second_bp = "first", "second"
+    monkeypatch.setitem(sys.modules, "fake_lazy_bp", module)
+    imported = []
+    real_import = importlib.import_module
+    monkeypatch.setattr(
+        "app.lazy_blueprints.importlib.import_module",
+        lambda name: imported.append(name) or real_import(name),
+    )
+    app = _App()
+    loaded = []
+    lazy = LazyBlueprints(
+        app,
+        [("fake_lazy_bp", "first_bp", "/first"), ("fake_lazy_bp", "second_bp", None)],
+        on_loaded=lambda a: loaded.append(list(a.registered)),
+    ).install()
+
+    assert app.wsgi_app is lazy
+    assert imported == [] and app.registered == []
+
+    assert app.wsgi_app({}, None) == ["ok"]
+    assert app.registered == [("first", "/first"), ("second", None)]
+    assert loaded == [app.registered]
+    assert lazy.loaded and lazy.load_ms is not None
+
+    app.wsgi_app({}, None)
+    assert imported == ["fake_lazy_bp", "fake_lazy_bp"]
+    assert len(app.registered) == 2
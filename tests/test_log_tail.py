@@ -0,0 +1,62 @@
+import json
+
+from utils.log_tail import tail_lines, IncrementalLogReader, JsonLogDigest, follow_lines
+
+
+def test_tail_lines_small_blocks(tmp_path):
+    path = tmp_path / "ops.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)), encoding="utf-8")
+
+    assert tail_lines(str(path), 3, block_size=7) == ["line 997", "line 998", "line 999"]
+    assert tail_lines(str(path), 5000)[0] == "line 0"
+    assert tail_lines(str(tmp_path / "missing.log"), 10) == []
+
+
+def test_tail_lines_without_trailing_newline(tmp_path):
+    path = tmp_path / "ops.log"
+    path.write_text("a\nb\nc", encoding="utf-8")
+    assert tail_lines(str(path), 2, block_size=2) == ["b", "c"]
+
+
+def test_incremental_reader_tracks_offset_and_truncation(tmp_path):
+    path = tmp_path / "ops.log"
+    path.write_text("one\ntwo\npart", encoding="utf-8")
+    reader = IncrementalLogReader(path)
+
+    assert reader.read_new_lines() == ["one", "two"]
+    assert reader.read_new_lines() == []
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("ial\nthree\n")
+    assert reader.read_new_lines() == ["partial", "three"]
+
+    path.write_text("fresh\n", encoding="utf-8")
+    assert reader.read_new_lines() == ["fresh"]
+    assert reader.resets == 1
+
+
+def test_json_log_digest_counts_incrementally(tmp_path):
+    path = tmp_path / "cyclone_log.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        for op in ["Market", "Market", "Alert"]:
+            f.write(json.dumps({"operation_type": op}) + "\n")
+
+    digest = JsonLogDigest(path, recent=2).refresh()
+    assert digest.counts == {"Market": 2, "Alert": 1}
+    assert len(digest.recent) == 2
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"operation_type": "Alert"}) + "\n")
+    digest.refresh()
+    assert digest.counts == {"Market": 2, "Alert": 2}
+
+
+def test_follow_lines_yields_new_lines(tmp_path):
+    path = tmp_path / "ops.log"
+    path.write_text("old\n", encoding="utf-8")
+    gen = follow_lines(str(path), poll_interval=0.01, max_idle=1)
+
+    assert next(gen) is None
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("new\n")
+    assert next(gen) == "new"
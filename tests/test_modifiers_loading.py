@@ -25,3 +25,19 @@ def test_calculation_core_loads_modifiers_from_db(dl):
         "collateralWeight": 0.7,
     }
     assert calc.calc_services.weights == calc.modifiers
+
+
+def test_calculation_cores_share_weights_until_version_bump(dl):
+    dl.modifiers.set_modifier("distanceWeight", 0.5)
+    first = CalculationCore(dl)
+    second = CalculationCore(dl)
+    assert first.modifier_store is second.modifier_store
+
+    assert first.modifiers == {"distanceWeight": 0.5}
+    loads = first.modifier_store.loads
+    assert second.modifiers is first.modifiers
+    assert first.modifier_store.loads == loads
+
+    second.set_modifier("distanceWeight", 0.25)
+    assert first.calc_services.weights == {"distanceWeight": 0.25}
+    assert first.modifier_store.loads == loads + 1
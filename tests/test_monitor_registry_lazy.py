@@ -0,0 +1,48 @@
+import json
+import sys
+
+from monitor.monitor_registry import MonitorRegistry
+from utils.startup_profiler import StartupProfiler
+
+
+def test_factory_built_on_first_get():
+    built = []
+
+    class Dummy:
+        def run_cycle(self):
+            pass
+
+    reg = MonitorRegistry()
+    reg.register_factory("dummy", lambda: built.append(1) or Dummy())
+    assert reg.names() == ["dummy"]
+    assert not reg.is_loaded("dummy") and built == []
+
+    first = reg.get("dummy")
+    assert reg.get("dummy") is first
+    assert built == [1] and reg.is_loaded("dummy")
+
+
+def test_monitor_core_defers_monitor_imports(monkeypatch):
+    for mod in ("monitor.price_monitor", "monitor.position_monitor"):
+        monkeypatch.delitem(sys.modules, mod, raising=False)
+    from monitor.monitor_core import MonitorCore
+
+    core = MonitorCore()
+    assert "price_monitor" in core.registry.names()
+    assert not core.registry.is_loaded("price_monitor")
+    assert "monitor.price_monitor" not in sys.modules
+
+
+def test_startup_profiler_report(tmp_path):
+    prof = StartupProfiler("unit", profile_imports=True)
+    with prof.phase("imports", kind="import"):
+        mod = __import__("colorsys")
+    with prof.phase("init"):
+        pass
+    path = prof.write_report(tmp_path)
+    report = json.loads(path.read_text())
+    assert [p["phase"] for p in report["phases"]] == ["imports", "init"]
+    assert report["import_ms"] >= 0 and report["init_ms"] >= 0
+    assert "slowest_imports" in report
+    assert prof.import_timer not in sys.meta_path
+    assert mod is sys.modules["colorsys"]
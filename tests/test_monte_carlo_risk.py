@@ -0,0 +1,76 @@
+import asyncio
+import math
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from alert_core.alert_enrichment_service import AlertEnrichmentService
+from calc_core.monte_carlo_risk import POOL_NAME, MarketModel, MonteCarloRiskEngine
+from core import process_pool
+from data.alert import Alert, AlertType, Condition
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+
+
+def _long(liquidation_price=97.0):
+    return {"id": "p1", "asset_type": "SOL", "position_type": "LONG", "entry_price": 100.0,
+            "liquidation_price": liquidation_price, "size": 1000.0, "collateral": 100.0}
+
+
+def _barrier_probability(sigma, hours, dt, barrier):
+    """Driftless-GBM down-and-out probability with the discrete-monitoring shift."""
+    nu = -0.5 * sigma ** 2
+    b = math.log(barrier) - 0.5826 * sigma * math.sqrt(dt)
+    s = sigma * math.sqrt(hours)
+    phi = lambda x: 0.5 * (1 + math.erf(x / math.sqrt(2)))
+    return phi((b - nu * hours) / s) + math.exp(2 * nu * b / sigma ** 2) * phi((b + nu * hours) / s)
+
+
+def test_gbm_hit_rate_matches_barrier_formula():
+    sigma = 0.012
+    model = MarketModel(["SOL"], [100.0], cov=np.array([[sigma ** 2]]))
+    engine = MonteCarloRiskEngine(None, paths=40000, horizon_hours=24, workers=0, seed=7)
+
+    [risk] = engine.simulate([_long()], model)
+
+    expected = _barrier_probability(sigma, 24, 1.0, 0.97)
+    assert risk["liquidation_probability"] == pytest.approx(expected, abs=0.02)
+    assert risk["paths"] == 40000
+    # A liquidated path loses exactly the collateral, so that is the worst case
+    assert risk["pnl_p05"] == pytest.approx(-100.0)
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_pool_agrees_with_inline(monkeypatch, processes):
+    monkeypatch.setattr(process_pool, "_enabled", processes)
+    model = MarketModel(["SOL"], [100.0], cov=np.array([[0.012 ** 2]]))
+    positions = [_long(95.0), {**_long(110.0), "id": "p2", "position_type": "SHORT"}]
+    inline = MonteCarloRiskEngine(None, paths=30000, workers=0, seed=3).simulate(positions, model)
+    pooled = MonteCarloRiskEngine(None, paths=30000, workers=2, seed=3).simulate(positions, model)
+
+    for a, b in zip(inline, pooled):
+        assert b["paths"] == 30000
+        assert b["liquidation_probability"] == pytest.approx(a["liquidation_probability"], abs=0.02)
+        assert b["expected_pnl"] == pytest.approx(a["expected_pnl"], abs=2.0)
+    expected = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    assert isinstance(process_pool.get_executor(POOL_NAME, 2), expected)
+
+
+def test_run_persists_and_feeds_liquidation_risk_alerts(tmp_path):
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "risk.db"), SyntheticScale(2, 12, 1, 24 * 5))
+    try:
+        summary = MonteCarloRiskEngine(dl, paths=2000, workers=0, seed=1).run()
+        stored = dl.position_risk.get_all()
+        assert summary["positions"] == len(stored) > 0
+        probabilities = [r["liquidation_probability"] for r in stored]
+        assert probabilities == sorted(probabilities, reverse=True)
+
+        target = stored[0]
+        alert = Alert(id="risk1", alert_type=AlertType.LiquidationRisk, alert_class="Position",
+                      asset=target["asset_type"], trigger_value=15.0, condition=Condition.ABOVE,
+                      position_reference_id=target["position_id"])
+        enriched = asyncio.run(AlertEnrichmentService(dl)._enrich_liquidation_risk(alert))
+        assert enriched.evaluated_value == round(target["liquidation_probability"] * 100, 2)
+    finally:
+        dl.db.close()
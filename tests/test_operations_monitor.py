@@ -101,10 +101,8 @@ def test_check_api_status_logs_to_xcom(monkeypatch):
 
     # Stub OpenAI
     class DummyClient:
-        def __init__(self, api_key=None):
-            self.chat = types.SimpleNamespace(
-                completions=types.SimpleNamespace(create=lambda *a, **k: None)
-            )
+        def __init__(self, api_key=None, timeout=None):
+            self.models = types.SimpleNamespace(list=lambda: [])
 
     monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=DummyClient))
 
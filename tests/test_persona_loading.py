@@ -1,5 +1,7 @@
 import importlib
 
+import pytest
+
 
 def test_persona_manager_loads_bundle():
     pm_mod = importlib.import_module("oracle_core.persona_manager")
@@ -25,3 +27,14 @@ def test_persona_attributes_loaded():
     assert persona.strategy_weights == {"safe": 0.7, "cautious": 0.3}
     assert persona.instructions == "Adopt a conservative trading approach."
     assert hasattr(persona, "system_message")
+
+
+def test_persona_files_parsed_once(monkeypatch):
+    pm_mod = importlib.import_module("oracle_core.persona_manager")
+    first = pm_mod.PersonaManager()
+    monkeypatch.setattr(pm_mod, "_read_definitions", lambda path: pytest.fail("re-parsed " + path))
+    second = pm_mod.PersonaManager()
+    assert second.list_personas() == first.list_personas()
+
+    second.get("Wizard").strategy_weights["safe"] = 1.0
+    assert "safe" not in first.get("Wizard").strategy_weights
@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from calc_core.calc_services import CalcServices
+from data.dl_portfolio_aggregates import totals_from_sums
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+
+KEYS = ("total_size", "total_value", "total_collateral", "avg_leverage", "avg_travel_percent", "avg_heat_index")
+
+
+def _assert_matches_scan(dl):
+    expected = CalcServices().calculate_totals(dl.positions.get_active_positions())
+    totals = dl.portfolio_aggregates.get_totals()
+    for key in KEYS:
+        assert totals[key] == pytest.approx(expected[key], abs=1e-6), key
+    return totals
+
+
+@pytest.fixture
+def dl(tmp_path):
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "agg.db"), SyntheticScale(2, 30, 1, 1))
+    yield dl
+    dl.db.close()
+
+
+def test_aggregates_follow_every_write(dl):
+    assert _assert_matches_scan(dl)["position_count"] == 30
+    ids = [p["id"] for p in dl.positions.get_active_positions()]
+
+    dl.positions.create_position({"id": "new", "size": 500.0, "value": 80.0, "collateral": 40.0,
+                                  "leverage": 12.5, "travel_percent": -20.0, "heat_index": 55.0})
+    dl.positions.delete_position(ids[0])
+    cursor = dl.db.get_cursor()
+    cursor.execute("UPDATE positions SET status = 'CLOSED' WHERE id = ?", (ids[1],))
+    cursor.execute("UPDATE positions SET size = size * 2, heat_index = 70 WHERE id = ?", (ids[2],))
+    # Writers that bypass the manager (other connections) are covered by the triggers too
+    cursor.execute("UPDATE positions SET hedge_buddy_id = 'x' WHERE id = ?", (ids[3],))
+    dl.db.commit()
+
+    totals = _assert_matches_scan(dl)
+    assert totals["position_count"] == 29
+    assert totals["value_to_collateral_ratio"] == pytest.approx(totals["total_value"] / totals["total_collateral"])
+
+    dl.positions.delete_all_positions()
+    totals = dl.portfolio_aggregates.get_totals()
+    assert totals["position_count"] == 0 and totals["value_to_collateral_ratio"] is None
+
+
+def test_rebuild_matches_incremental(dl):
+    before = dl.portfolio_aggregates.get_sums()
+    dl.portfolio_aggregates.rebuild()
+    dl.db.commit()
+    after = dl.portfolio_aggregates.get_sums()
+    assert after == pytest.approx(before)
+
+
+def test_float_drift_rebased_when_portfolio_empties(dl):
+    rng = random.Random(7)
+    ids = [p["id"] for p in dl.positions.get_active_positions()]
+    cursor = dl.db.get_cursor()
+    for _ in range(300):
+        cursor.execute(
+            "UPDATE positions SET size = ?, value = ?, collateral = ?, leverage = ?, travel_percent = ? WHERE id = ?",
+            (rng.uniform(1, 1e5) / 3, rng.uniform(1, 1e4) / 7, rng.uniform(1, 1e3) / 9,
+             rng.uniform(1, 50) / 3, rng.uniform(-100, 100) / 7, rng.choice(ids)),
+        )
+    cursor.execute("UPDATE positions SET status = 'CLOSED'")
+    dl.db.commit()
+
+    sums = dl.portfolio_aggregates.get_sums()
+    assert sums["position_count"] == 0
+    assert all(v == 0 for v in sums.values())
+    totals = dl.portfolio_aggregates.get_totals()
+    assert totals["total_size"] == totals["total_collateral"] == totals["total_value"] == 0.0
+    assert totals["value_to_collateral_ratio"] is None
+
+
+def test_totals_ignore_residue():
+    totals = totals_from_sums({"position_count": 0, "total_size": -4.7e-10,
+                               "total_value": 5.2e-11, "total_collateral": 5.8e-12})
+    assert totals["total_size"] == 0.0 and totals["value_to_collateral_ratio"] is None
+
+    totals = totals_from_sums({"position_count": 1, "total_value": 10.0, "total_collateral": 3e-9})
+    assert totals["total_collateral"] == 0.0 and totals["value_to_collateral_ratio"] is None
@@ -47,3 +47,44 @@ async def test_enrich_positions_returns_enriched_list(tmp_path, monkeypatch):
             "value",
         ]:
             assert field in entry
+
+
+@pytest.mark.asyncio
+async def test_enrich_positions_persists_with_single_price_query(tmp_path, monkeypatch):
+    for name in ("_seed_modifiers_if_empty", "_seed_wallets_if_empty",
+                 "_seed_thresholds_if_empty", "_seed_alerts_if_empty"):
+        monkeypatch.setattr(DataLocker, name, lambda self: None)
+    dl = DataLocker(str(tmp_path / "positions.db"))
+    dl.insert_or_update_price("BTC", 75.0, "test")
+    for i in range(3):
+        dl.positions.insert_position({
+            "id": f"pos{i}",
+            "asset_type": "BTC",
+            "entry_price": 100.0,
+            "liquidation_price": 50.0,
+            "position_type": "Lng" if i == 0 else "LONG",
+            "wallet_name": "test",
+            "collateral": 10.0,
+            "size": 100.0,
+            "travel_percent": -7.5,  # as reported by Jupiter
+        })
+
+    calls = []
+    original = dl.prices.get_latest_prices
+    monkeypatch.setattr(dl.prices, "get_latest_prices", lambda assets: calls.append(assets) or original(assets))
+    monkeypatch.setattr(dl, "get_latest_price", lambda *a: pytest.fail("per-position price read"))
+
+    core = PositionCore(dl)
+    enriched = await core.enrich_positions()
+
+    assert len(calls) == 1
+    assert core.last_enriched_at
+    stored = dl.positions.get_positions_by_ids(["pos0", "pos1", "pos2"])
+    for pos in enriched:
+        row = stored[pos["id"]]
+        assert row["enriched_at"] == core.last_enriched_at
+        assert row["current_price"] == 75.0
+        assert row["position_type"] == "LONG"
+        assert row["travel_percent"] == -7.5 != pytest.approx(pos["travel_percent"])
+        assert row["leverage"] == pytest.approx(10.0)
+    dl.db.close()
@@ -0,0 +1,88 @@
+import json
+import threading
+import time
+
+from prices.price_feed import PriceFeed, PriceProvider, ReplayPriceProvider, StaticPriceProvider
+
+
+class SlowProvider(PriceProvider):
+    name = "slow"
+
+    def __init__(self, prices, delay=0.05):
+        self.prices = prices
+        self.delay = delay
+        self.calls = 0
+
+    def fetch(self, assets):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {a: self.prices[a] for a in assets if a in self.prices}
+
+
+class BrokenProvider(PriceProvider):
+    name = "broken"
+
+    def fetch(self, assets):
+        raise RuntimeError("down")
+
+
+def test_concurrent_callers_share_one_fetch():
+    provider = SlowProvider({"BTC": 1.0, "ETH": 2.0, "SOL": 3.0})
+    feed = PriceFeed([provider], ttl=60)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(feed.get_prices())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert provider.calls == 1
+    assert all(r == {"BTC": 1.0, "ETH": 2.0, "SOL": 3.0} for r in results)
+    assert feed.get_prices() == results[0]
+    assert provider.calls == 1 and feed.cache_hits == 1
+
+
+def test_fallback_fills_missing_assets_and_counts_errors():
+    feed = PriceFeed(
+        [BrokenProvider(), StaticPriceProvider({"BTC": 10.0}), StaticPriceProvider({"ETH": 20.0, "SOL": 30.0})],
+        ttl=0,
+    )
+    assert feed.get_prices() == {"BTC": 10.0, "ETH": 20.0, "SOL": 30.0}
+    stats = feed.stats()["providers"]
+    assert set(stats) == {"broken", "static", "static#2"}
+    assert stats["broken"]["requests"] == 1 and stats["broken"]["errors"] == 1
+    assert stats["broken"]["last_error"] == "down"
+    assert stats["static"]["requests"] == 1 and stats["static"]["assets_served"] == 1
+    assert stats["static#2"]["requests"] == 1 and stats["static#2"]["assets_served"] == 2
+    assert stats["static"]["errors"] == stats["static#2"]["errors"] == 0
+    assert stats["broken"]["avg_latency_ms"] is not None
+
+
+def test_follower_wanting_other_assets_is_not_shortchanged():
+    provider = SlowProvider({"BTC": 1.0, "ETH": 2.0, "SOL": 3.0}, delay=0.1)
+    feed = PriceFeed([provider], ttl=60)
+    results = {}
+    leader = threading.Thread(target=lambda: results.setdefault("leader", feed.get_prices(["BTC"])))
+    leader.start()
+    while provider.calls == 0:
+        time.sleep(0.001)
+    follower = threading.Thread(target=lambda: results.setdefault("follower", feed.get_prices(["BTC", "ETH"])))
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert results["leader"] == {"BTC": 1.0}
+    assert results["follower"] == {"BTC": 1.0, "ETH": 2.0}
+    assert provider.calls == 2 and feed.coalesced == 0
+
+
+def test_replay_provider_is_deterministic(tmp_path):
+    path = tmp_path / "ticks.jsonl"
+    path.write_text("\n".join(json.dumps(f) for f in [
+        {"asset": "BTC", "price": 1}, {"asset": "ETH", "price": 2},
+        {"asset": "BTC", "price": 3}, {"asset": "ETH", "price": 4},
+    ]))
+    feed = PriceFeed([ReplayPriceProvider(str(path), loop=False)], ttl=0)
+    assert feed.get_prices(["BTC", "ETH"]) == {"BTC": 1.0, "ETH": 2.0}
+    assert feed.get_prices(["BTC", "ETH"]) == {"BTC": 3.0, "ETH": 4.0}
+    assert feed.get_prices(["BTC", "ETH"]) == {"BTC": 3.0, "ETH": 4.0}
@@ -0,0 +1,128 @@
+import importlib
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from data.data_locker import DataLocker
+from data.dl_prices import DLPriceManager
+
+
+def _make_locker(tmp_path, monkeypatch):
+    monkeypatch.setattr(DataLocker, "_seed_modifiers_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_wallets_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_thresholds_if_empty", lambda self: None)
+    monkeypatch.setattr(DataLocker, "_seed_alerts_if_empty", lambda self: None)
+    return DataLocker(str(tmp_path / "prices.db"))
+
+
+def _insert(dl, asset, price, when):
+    dl.prices.insert_price({
+        "id": str(uuid4()),
+        "asset_type": asset,
+        "current_price": price,
+        "previous_price": 0.0,
+        "last_update_time": when.isoformat(),
+        "previous_update_time": None,
+        "source": "test",
+    })
+
+
+def test_history_is_columnar_and_ordered(tmp_path, monkeypatch):
+    dl = _make_locker(tmp_path, monkeypatch)
+    base = datetime.now() - timedelta(minutes=30)
+    for i in range(10):
+        _insert(dl, "BTC", 100.0 + i, base + timedelta(minutes=i))
+        _insert(dl, "ETH", 10.0 + i, base + timedelta(minutes=i))
+
+    start = int((base - timedelta(minutes=1)).timestamp() * 1000)
+    history = dl.prices.get_price_history(["BTC", "ETH", "SOL"], start)
+
+    assert history["BTC"]["p"] == [100.0 + i for i in range(10)]
+    assert history["BTC"]["t"] == sorted(history["BTC"]["t"])
+    assert len(history["ETH"]["t"]) == 10
+    assert history["SOL"] == {"t": [], "p": []}
+    dl.db.close()
+
+
+def test_history_downsampling_keeps_extremes(tmp_path, monkeypatch):
+    dl = _make_locker(tmp_path, monkeypatch)
+    base = datetime.now() - timedelta(hours=2)
+    prices = [100.0] * 100
+    prices[37] = 500.0
+    prices[71] = 1.0
+    for i, p in enumerate(prices):
+        _insert(dl, "SOL", p, base + timedelta(minutes=i))
+
+    start = int(base.timestamp() * 1000)
+    end = int((base + timedelta(minutes=100)).timestamp() * 1000)
+    history = dl.prices.get_price_history(["SOL"], start, end, max_points=20)
+
+    assert len(history["SOL"]["p"]) <= 20
+    assert max(history["SOL"]["p"]) == 500.0
+    assert min(history["SOL"]["p"]) == 1.0
+    dl.db.close()
+
+
+def test_legacy_rows_are_backfilled_once(tmp_path, monkeypatch):
+    dl = _make_locker(tmp_path, monkeypatch)
+    when = datetime.now() - timedelta(minutes=5)
+    cursor = dl.db.get_cursor()
+    # A database from before the migration has neither the trigger nor epoch_ms values
+    cursor.execute("DROP TRIGGER trg_prices_epoch_ms")
+    cursor.execute(
+        "INSERT INTO prices (id, asset_type, current_price, last_update_time) VALUES (?, ?, ?, ?)",
+        ("legacy", "BTC", 42.0, when.isoformat()),
+    )
+    dl.db.commit()
+
+    dl.prices.ensure_indexes()
+    row = dl.db.get_cursor().execute("SELECT epoch_ms FROM prices WHERE id='legacy'").fetchone()
+    assert row[0] == int(when.timestamp() * 1000)
+
+    # Later inits skip the scan; out-of-band inserts are kept non-NULL by the trigger
+    cursor = dl.db.get_cursor()
+    cursor.execute(
+        "INSERT INTO prices (id, asset_type, current_price, last_update_time) VALUES (?, ?, ?, ?)",
+        ("raw", "BTC", 43.0, when.isoformat()),
+    )
+    dl.db.commit()
+    statements = []
+    dl.db.conn.set_trace_callback(statements.append)
+    dl.prices.ensure_indexes()
+    dl.db.conn.set_trace_callback(None)
+    assert not any(s.startswith("SELECT id, last_update_time") for s in statements)
+    row = dl.db.get_cursor().execute("SELECT epoch_ms FROM prices WHERE id='raw'").fetchone()
+    assert row[0] == 0
+    dl.db.close()
+
+
+def test_encode_history_roundtrip():
+    from array import array
+    from base64 import b64decode
+
+    packed = DLPriceManager.encode_history({"BTC": {"t": [1.0, 2.0], "p": [3.5, 4.5]}})
+    p = array("d")
+    p.frombytes(b64decode(packed["BTC"]["p"]))
+    assert packed["BTC"]["n"] == 2
+    assert list(p) == [3.5, 4.5]
+
+
+def test_price_chart_page_skips_history_query(tmp_path, monkeypatch):
+    flask = importlib.import_module("flask")
+    if not getattr(flask, "Flask", None):
+        pytest.skip("Flask not available")
+    import app.prices_bp as prices_mod
+
+    dl = _make_locker(tmp_path, monkeypatch)
+    app = flask.Flask(__name__)
+    app.register_blueprint(prices_mod.prices_bp, url_prefix="/prices")
+    app.data_locker = dl
+    monkeypatch.setattr(dl.prices, "get_price_history", lambda *a, **k: pytest.fail("history queried"))
+    monkeypatch.setattr(prices_mod, "render_template", lambda name, **ctx: flask.jsonify(ctx))
+
+    with app.test_client() as client:
+        resp = client.get("/prices/charts?hours=24")
+    assert resp.status_code == 200
+    assert resp.get_json() == {"assets": prices_mod.ASSETS_LIST, "timeframe": 24}
+    dl.db.close()
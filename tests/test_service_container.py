@@ -0,0 +1,95 @@
+import pytest
+
+from core.service_container import ServiceContainer
+from system.theme_service import ThemeService
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+
+
+def test_singletons_are_built_once():
+    built = []
+    services = ServiceContainer()
+    services.register("core", lambda: built.append(1) or object())
+
+    assert services.get("core") is services.get("core")
+    assert built == [1]
+    services.reset("core")
+    services.get("core")
+    assert built == [1, 1]
+    with pytest.raises(KeyError):
+        services.get("missing")
+
+
+def test_memoize_is_request_scoped():
+    calls = []
+    services = ServiceContainer()
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    with services.request_scope():
+        assert [services.memoize("badge", compute) for _ in range(3)] == [1, 1, 1]
+    with services.request_scope():
+        assert services.memoize("badge", compute) == 2
+    # Outside a request nothing is cached
+    assert services.memoize("badge", compute) == 3
+    assert services.memoize("badge", compute) == 4
+
+
+class _System:
+    def __init__(self):
+        self.reads = 0
+        self.active = "dark"
+        self.profiles = {"dark": {"bg": "#000"}, "light": {"bg": "#fff"}}
+
+    def get_active_theme_profile(self):
+        self.reads += 1
+        return self.profiles.get(self.active, {})
+
+    def get_theme_profiles(self):
+        self.reads += 1
+        return dict(self.profiles)
+
+    def set_active_theme_profile(self, name):
+        self.active = name
+
+    def insert_or_update_theme_profile(self, name, config):
+        self.profiles[name] = config
+
+
+def test_theme_profile_cached_until_changed():
+    system = _System()
+    theme = ThemeService(type("DL", (), {"system": system})())
+
+    for _ in range(5):
+        assert theme.get_active_profile() == {"bg": "#000"}
+    assert system.reads == 1
+
+    theme.set_active_profile("light")
+    assert theme.get_active_profile() == {"bg": "#fff"}
+    theme.save_profile("light", {"bg": "#eee"})
+    assert theme.get_active_profile() == {"bg": "#eee"}
+    assert system.reads == 3
+
+    # Callers get copies, not the cached dict
+    theme.get_active_profile()["bg"] = "mutated"
+    assert theme.get_active_profile() == {"bg": "#eee"}
+
+
+def test_top_active_profit_honours_threshold(tmp_path):
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "badge.db"), SyntheticScale(1, 8, 1, 1))
+    pnls = [float(p.get("pnl_after_fees_usd") or 0.0) for p in dl.positions.get_active_positions()]
+    cursor = dl.db.get_cursor()
+    cursor.execute("DELETE FROM alert_thresholds WHERE alert_type = 'Profit'")
+    dl.db.commit()
+
+    assert dl.positions.get_top_active_profit() == pytest.approx(max(pnls))
+
+    cursor.execute(
+        "INSERT INTO alert_thresholds (id, alert_type, alert_class, metric_key, condition, low, medium, high,"
+        " enabled, last_modified) VALUES ('p', 'Profit', 'Position', 'pnl', 'ABOVE', ?, 0, 0, 1, 'now')",
+        (max(pnls) + 1,),
+    )
+    dl.db.commit()
+    assert dl.positions.get_top_active_profit() is None
+    dl.db.close()
@@ -0,0 +1,122 @@
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from xcom import smtp_transport
+from xcom.email_service import EmailService
+from xcom.sms_service import SMSService
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP (EHLO/AUTH PLAIN/MAIL/RCPT/DATA) for a debug server."""
+
+    def reply(self, line):
+        self.wfile.write((line + "\r\n").encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 debug ESMTP")
+        while True:
+            line = self.rfile.readline().decode().strip()
+            if not line:
+                return
+            verb = line.split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self.wfile.write(b"250-debug\r\n250 AUTH PLAIN\r\n")
+            elif verb == "AUTH":
+                server.logins += 1
+                self.reply("235 ok")
+            elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 ok")
+            elif verb == "DATA":
+                self.reply("354 go")
+                data = []
+                while True:
+                    chunk = self.rfile.readline().decode()
+                    if chunk.rstrip("\r\n") == ".":
+                        break
+                    data.append(chunk)
+                server.messages.append("".join(data))
+                self.reply("250 queued")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 no")
+
+
+class _DebugSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.connections = 0
+        self.logins = 0
+        self.messages = []
+
+
+@pytest.fixture
+def smtp_server():
+    server = _DebugSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    smtp_transport.close_transports()
+    server.shutdown()
+    server.server_close()
+
+
+def _cfg(server, **extra):
+    smtp = {
+        "server": "127.0.0.1",
+        "port": server.server_address[1],
+        "username": "sonic@example.com",
+        "password": "secret",
+        "starttls": False,
+        **extra,
+    }
+    return {"enabled": True, "smtp": smtp}
+
+
+def test_session_is_reused_across_sends(smtp_server):
+    email = EmailService(_cfg(smtp_server, batch_window=0))
+    for i in range(5):
+        assert email.send("ops@example.com", f"alert {i}", "body")
+
+    assert len(smtp_server.messages) == 5
+    assert smtp_server.connections == 1 and smtp_server.logins == 1
+    stats = smtp_transport.get_transport(email.config["smtp"]).stats()
+    assert stats["sent"] == 5 and stats["reused"] == 4
+    assert stats["latency_ms"]["p95"] is not None
+
+
+def test_concurrent_sms_burst_is_batched(smtp_server):
+    cfg = _cfg(smtp_server, batch_window=0.2)
+    cfg["carrier_gateway"] = "sms.example.com"
+    sms = SMSService(cfg)
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(lambda n: sms.send(f"555000{n}", "HIGH alert"), range(6)))
+
+    assert results == [True] * 6
+    assert len(smtp_server.messages) == 6
+    assert smtp_server.logins == 1
+    assert smtp_transport.get_transport(cfg["smtp"]).stats()["batches"] == 1
+
+
+def test_idle_session_is_reconnected(smtp_server):
+    email = EmailService(_cfg(smtp_server, batch_window=0, idle_timeout=0))
+    transport = smtp_transport.get_transport(email.config["smtp"])
+    assert email.send("ops@example.com", "first", "body")
+
+    # Simulate the server dropping the idle connection
+    transport._idle[0][0].close()
+    assert email.send("ops@example.com", "second", "body")
+
+    assert len(smtp_server.messages) == 2
+    assert smtp_server.connections == 2
+    assert transport.stats()["reconnects"] == 1
@@ -0,0 +1,86 @@
+import asyncio
+
+import core.sql_tracer as sql_tracer
+from core.cycle_metrics import CycleMetricsRecorder
+from core.sql_tracer import fingerprint, sql_trace_scope
+from data.async_data_locker import AsyncDataLocker
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+
+
+def _locker(tmp_path):
+    scale = SyntheticScale(wallets=1, positions=12, alerts=4, price_hours=1)
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "trace.db"), scale)
+    dl.db.set_sql_tracing(True)
+    return dl
+
+
+def test_fingerprint_normalises_literals():
+    assert fingerprint("SELECT * FROM alerts WHERE id = 'abc'  AND level = 3") == (
+        "SELECT * FROM alerts WHERE id = ? AND level = ?"
+    )
+    assert fingerprint("SELECT * FROM t WHERE x IS NULL") == "SELECT * FROM t WHERE x IS ?"
+    assert fingerprint("SELECT * FROM t WHERE id IN (1, 2, 3)") == "SELECT * FROM t WHERE id IN (?+)"
+    assert fingerprint("UPDATE t SET a = :a WHERE id = :id") == "UPDATE t SET a = ? WHERE id = ?"
+
+
+def test_scope_flags_per_row_queries_but_not_batches(tmp_path):
+    dl = _locker(tmp_path)
+    ids = [p["id"] for p in dl.positions.get_active_positions()]
+
+    with sql_trace_scope("test", threshold=10, log_summary=False) as scope:
+        for pid in ids:
+            dl.positions.get_position_by_id(pid)
+        cursor = dl.db.get_cursor()
+        cursor.executemany("UPDATE positions SET size = ? WHERE id = ?", [(1.0, pid) for pid in ids])
+        dl.db.commit()
+
+    summary = scope.summary_dict
+    flagged = [c["fingerprint"] for c in summary["n_plus_one"]]
+    assert len(flagged) == 1
+    assert flagged[0].startswith("SELECT") and "positions" in flagged[0]
+    batch = next(e for e in summary["top"] if e["fingerprint"].startswith("UPDATE positions"))
+    assert batch["count"] == 1 and batch["batch_rows"] == len(ids)
+
+    # Outside a scope nothing is recorded
+    dl.positions.get_position_by_id(ids[0])
+    assert scope.counts[flagged[0]] == len(ids)
+    dl.db.close()
+
+
+def test_async_locker_statements_are_traced(tmp_path):
+    dl = _locker(tmp_path)
+    ids = [p["id"] for p in dl.positions.get_active_positions()]
+    async_dl = AsyncDataLocker(dl)
+
+    async def _per_row():
+        for pid in ids:
+            await async_dl.run(dl.positions.get_position_by_id, pid)
+
+    with sql_trace_scope("async", threshold=10, log_summary=False) as scope:
+        asyncio.run(_per_row())
+
+    flagged = scope.summary_dict["n_plus_one"]
+    assert len(flagged) == 1 and flagged[0]["count"] == len(ids)
+    # Time is charged to the statement that ran, never to another fingerprint
+    assert set(scope.times_ms) <= set(scope.counts)
+    assert flagged[0]["total_ms"] > 0
+    dl.db.close()
+
+
+def test_cycle_step_keeps_trace_in_metrics_table(tmp_path, monkeypatch):
+    dl = _locker(tmp_path)
+    monkeypatch.setattr(sql_tracer, "_enabled", True)
+    monkeypatch.setattr(sql_tracer, "_threshold", 5)
+
+    recorder = CycleMetricsRecorder(source="test")
+    with recorder.step("lookup"):
+        for p in dl.positions.get_active_positions():
+            dl.positions.get_position_by_id(p["id"])
+    dl.cycle_metrics.record(recorder)
+
+    found = dl.cycle_metrics.get_n_plus_one()
+    assert found and found[0]["step"] == "lookup"
+    assert found[0]["count"] == 12
+    total = dl.cycle_metrics.get_recent(step="cycle")[0]
+    assert total["sql_trace"]["n_plus_one"][0]["step"] == "lookup"
+    dl.db.close()
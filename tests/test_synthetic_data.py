@@ -0,0 +1,34 @@
+from test_core.synthetic_data import (
+    JupiterStub,
+    SyntheticDataGenerator,
+    SyntheticScale,
+    build_synthetic_locker,
+)
+
+
+def test_generator_is_deterministic():
+    a = SyntheticDataGenerator(seed=7)
+    b = SyntheticDataGenerator(seed=7)
+    a.make_wallets(2)
+    b.make_wallets(2)
+    assert a.make_positions(10) == b.make_positions(10)
+    assert a.make_alerts(12) == b.make_alerts(12)
+
+
+def test_populate_and_jupiter_stub(tmp_path):
+    scale = SyntheticScale(wallets=2, positions=8, alerts=16, price_hours=1)
+    dl, gen, counts = build_synthetic_locker(str(tmp_path / "synth.db"), scale)
+
+    assert counts["wallets"] == 2
+    assert len(dl.positions.get_active_positions()) == 8
+    assert len(dl.alerts.get_all_alerts()) == 16
+    assert dl.prices.get_latest_prices(["BTC"])["BTC"]["current_price"] == 60000.0
+
+    import positions.position_sync_service as svc
+
+    dl.positions.delete_all_positions()
+    with JupiterStub(gen) as stub:
+        result = svc.PositionSyncService(dl).update_jupiter_positions()
+    assert stub.calls == 2
+    assert result["imported"] == 8
+    dl.db.close()
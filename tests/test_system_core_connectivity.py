@@ -15,7 +15,7 @@ def load_core(monkeypatch, requests_module=None):
 
 
 def make_core(sc):
-    return sc.SystemCore(SimpleNamespace())
+    return sc.SystemCore(SimpleNamespace(db=SimpleNamespace(db_path=":memory:")))
 
 
 def test_check_twilio_api_success(monkeypatch):
@@ -54,8 +54,8 @@ def test_check_twilio_api_failure(monkeypatch):
 
 def test_check_chatgpt_success(monkeypatch):
     class DummyClient:
-        def __init__(self, api_key=None):
-            self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=lambda *a, **k: None))
+        def __init__(self, api_key=None, timeout=None):
+            self.models = types.SimpleNamespace(list=lambda: [])
 
     monkeypatch.setenv("OPENAI_API_KEY", "key")
     monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=DummyClient))
@@ -0,0 +1,47 @@
+import asyncio
+import json
+
+from test_core.synthetic_data import SyntheticScale, build_synthetic_locker
+from test_core.tick_replay import TickReplayEngine, recorded_ticks, synthetic_ticks
+
+
+def _locker(tmp_path):
+    scale = SyntheticScale(wallets=1, positions=6, alerts=16, price_hours=1)
+    dl, _, _ = build_synthetic_locker(str(tmp_path / "replay.db"), scale)
+    return dl
+
+
+def test_replay_as_fast_as_possible_matches_reference(tmp_path):
+    dl = _locker(tmp_path)
+    ticks = synthetic_ticks(12, seed=3, volatility=0.03)
+    report = asyncio.run(TickReplayEngine(dl, ticks, cycle_budget=60).run())
+
+    assert report["processed"] == 12 and report["dropped"] == 0
+    assert report["ticks_per_s"] > 0
+    assert report["alerts"] == 16
+    levels = report["alert_levels"]
+    assert levels["reference_alerts"] == 4
+    assert levels["mismatched"] == 0 and levels["missed"] == 0
+    assert levels["on_time"] == levels["changes"]
+    # Latest stored price is the last replayed tick
+    assert dl.prices.get_latest_price("BTC")["current_price"] == ticks[-1]["BTC"]
+    dl.db.close()
+
+
+def test_paced_replay_drops_superseded_ticks(tmp_path):
+    dl = _locker(tmp_path)
+    ticks = synthetic_ticks(8, seed=3, volatility=0.03)
+    # 60s ticks at 60000x: one tick per millisecond, far faster than the pipeline
+    report = asyncio.run(TickReplayEngine(dl, ticks, speed=60000, tick_interval=60).run())
+
+    assert report["dropped"] > 0
+    assert report["processed"] + report["dropped"] == 8
+    levels = report["alert_levels"]
+    assert levels["on_time"] + levels["late"] + levels["missed"] + levels["mismatched"] == levels["changes"]
+    dl.db.close()
+
+
+def test_recorded_ticks_load_frames(tmp_path):
+    path = tmp_path / "ticks.jsonl"
+    path.write_text("\n".join(json.dumps({"BTC": 1.0 + i, "ETH": 2.0, "SOL": 3.0}) for i in range(3)))
+    assert [f["BTC"] for f in recorded_ticks(str(path))] == [1.0, 2.0, 3.0]
@@ -0,0 +1,110 @@
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from alert_core.alert_enrichment_service import AlertEnrichmentService
+from data.alert import Alert, AlertType, Condition
+from data.data_locker import DataLocker
+from positions.position_core import PositionCore
+from positions.position_sync_service import PositionSyncService
+from utils import travel_percent_logger
+from utils.travel_percent_logger import TravelDriftRecorder
+
+
+def test_samples_are_buffered_then_flushed_in_batches(tmp_path):
+    recorder = TravelDriftRecorder(str(tmp_path), batch_size=3, flush_interval=3600)
+    recorder.record("p1", 40.0, 42.0)
+    recorder.record("p2", -10.0, -12.5)
+    assert recorder.pending() == 2 and not os.listdir(tmp_path)
+
+    recorder.record("p1", 40.0, 39.0)
+    assert recorder.pending() == 0 and recorder.flushes == 1
+    files = os.listdir(tmp_path)
+    assert len(files) == 1 and files[0].endswith(".csv")
+
+    recorder.record("p1", None, 10.0)  # nothing reported by Jupiter → ignored
+    recorder.record("p1", 40.0, 44.0)  # still buffered, included in stats
+    stats = recorder.drift_stats()
+    assert stats["p1"]["count"] == 3
+    assert stats["p1"]["mean_drift"] == pytest.approx(5.0 / 3, abs=1e-4)
+    assert stats["p1"]["max_abs_drift"] == 4.0
+    assert stats["p1"]["last"]["calculated"] == 44.0
+    assert recorder.drift_stats("p2")["p2"]["mean_abs_drift"] == 2.5
+
+    assert recorder.flush() == 1
+    with open(tmp_path / files[0]) as f:
+        assert len(f.readlines()) == 5  # header + 4 rows
+
+
+def test_samples_split_across_days(tmp_path):
+    recorder = TravelDriftRecorder(str(tmp_path), batch_size=100)
+    now = time.time()
+    recorder.record("p1", 10.0, 11.0, ts=now - 86400)
+    recorder.record("p1", 10.0, 12.0, ts=now)
+    recorder.flush()
+    assert len(os.listdir(tmp_path)) == 2
+    assert recorder.drift_stats("p1")["p1"]["count"] == 1
+    assert recorder.drift_stats("p1", days=2)["p1"]["count"] == 2
+
+
+def test_enrichment_records_jupiter_travel_percent(tmp_path, monkeypatch):
+    recorder = TravelDriftRecorder(str(tmp_path), batch_size=100)
+    monkeypatch.setattr(travel_percent_logger, "_recorder", recorder)
+
+    locker = MagicMock()
+    locker.get_position_by_reference_id.return_value = {
+        "id": "pos-1", "asset_type": "BTC", "position_type": "LONG",
+        "entry_price": 100.0, "liquidation_price": 50.0, "jupiter_travel_percent": -12.0,
+    }
+    locker.get_latest_price.return_value = {"current_price": 90.0}
+    service = AlertEnrichmentService(locker)
+    alert = Alert(id="a1", alert_type=AlertType.TravelPercentLiquid, alert_class="Position",
+                  asset="BTC", trigger_value=-25.0, condition=Condition.BELOW,
+                  position_reference_id="pos-1")
+
+    enriched = asyncio.run(service._enrich_travel_percent(alert))
+
+    assert not os.listdir(tmp_path)
+    sample = recorder.samples()[0]
+    assert sample["jupiter"] == -12.0
+    assert sample["calculated"] == pytest.approx(enriched.evaluated_value)
+    assert sample["position_id"] == "pos-1" and sample["alert_id"] == "a1"
+
+
+def test_drift_after_sync_and_enrichment(tmp_path, monkeypatch):
+    recorder = TravelDriftRecorder(str(tmp_path / "drift"), batch_size=100)
+    monkeypatch.setattr(travel_percent_logger, "_recorder", recorder)
+    for name in ("_seed_modifiers_if_empty", "_seed_wallets_if_empty",
+                 "_seed_thresholds_if_empty", "_seed_alerts_if_empty"):
+        monkeypatch.setattr(DataLocker, name, lambda self: None)
+    dl = DataLocker(str(tmp_path / "drift.db"))
+    dl.insert_or_update_price("BTC", 90.0, "test")
+    monkeypatch.setattr(dl, "read_wallets", lambda: [{"name": "W", "public_address": "addr"}])
+
+    def jupiter(reported):
+        item = {"positionPubkey": "pos-1", "side": "long", "entryPrice": 100.0, "liquidationPrice": 50.0,
+                "collateral": 10.0, "size": 100.0, "leverage": 10.0, "value": 90.0,
+                "updatedTime": time.time(), "pnlChangePctAfterFees": reported, "markPrice": 90.0}
+        return lambda self, url: SimpleNamespace(status_code=200, text="", json=lambda: {"dataList": [item]})
+
+    # Cyclone order: Jupiter sync → position enrichment → alert enrichment;
+    # the second sync only refreshes the reported figure of the existing row
+    for reported in (-12.0, -15.0):
+        monkeypatch.setattr(PositionSyncService, "_request_with_retries", jupiter(reported))
+        PositionSyncService(dl).update_jupiter_positions()
+    asyncio.run(PositionCore(dl).enrich_positions())
+
+    alert = Alert(id="a1", alert_type=AlertType.TravelPercentLiquid, alert_class="Position",
+                  asset="BTC", trigger_value=-25.0, condition=Condition.BELOW,
+                  position_reference_id="pos-1")
+    enriched = asyncio.run(AlertEnrichmentService(dl)._enrich_travel_percent(alert))
+
+    sample = recorder.samples()[0]
+    assert sample["jupiter"] == -15.0
+    assert sample["calculated"] == pytest.approx(enriched.evaluated_value) == pytest.approx(-20.0)
+    assert sample["drift"] == pytest.approx(-5.0)
+    dl.db.close()
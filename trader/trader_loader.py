@@ -8,6 +8,7 @@ StrategyManager = importlib.import_module("oracle_core.strategy_manager").Strate
 PersonaManager = importlib.import_module("oracle_core.persona_manager").PersonaManager
 OracleDataService = importlib.import_module("oracle_core.oracle_data_service").OracleDataService
 CalcServices = importlib.import_module("calc_core.calc_services").CalcServices
+ContextSnapshotService = importlib.import_module("oracle_core.context_snapshot_service").ContextSnapshotService
 from .trader import Trader
 from .mood_engine import evaluate_mood
 
@@ -18,21 +19,38 @@ class TraderLoader:
         persona_manager: Optional[PersonaManager] = None,
         strategy_manager: Optional[StrategyManager] = None,
         data_locker: Optional[object] = None,
+        snapshots: Optional[ContextSnapshotService] = None,
     ):
         self.persona_manager = persona_manager or PersonaManager()
         self.strategy_manager = strategy_manager or StrategyManager()
         self.data_service = OracleDataService(data_locker)
         self.data_locker = data_locker
+        self.snapshots = snapshots or ContextSnapshotService.for_locker(data_locker)
+
+    def _shared_context(self) -> dict:
+        """Positions, portfolio and totals shared by every trader."""
+        positions = self.data_service.fetch_positions() or []
+        aggregates = getattr(self.data_locker, "portfolio_aggregates", None)
+        return {
+            "positions": positions,
+            "portfolio": self.data_service.fetch_portfolio() or {},
+            # ``positions`` is only the recent slice; totals cover every active position
+            "totals": aggregates.get_totals() if aggregates else CalcServices().calculate_totals(positions),
+        }
 
     def load_trader(self, name: str) -> Trader:
         persona = self.persona_manager.get(name)
         wallet_name = persona.name + "Vault"
         wallet_data = None
         if self.data_locker and getattr(self.data_locker, "wallets", None):
-            wallet_data = self.data_locker.wallets.get_wallet_by_name(wallet_name)
-        positions = self.data_service.fetch_positions() or []
-        portfolio = self.data_service.fetch_portfolio() or {}
-        totals = CalcServices().calculate_totals(positions)
+            wallet_data = self.snapshots.get(
+                ("wallet", wallet_name),
+                lambda: self.data_locker.wallets.get_wallet_by_name(wallet_name),
+            )
+        shared = self.snapshots.get(("trader_context",), self._shared_context)
+        positions = shared["positions"]
+        portfolio = shared["portfolio"]
+        totals = shared["totals"]
         avg_heat = totals.get("avg_heat_index", 0.0)
         mood = evaluate_mood(avg_heat, getattr(persona, "moods", {}))
         score = int(100 - abs(avg_heat - 30))
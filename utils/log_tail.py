@@ -0,0 +1,154 @@
+# utils/log_tail.py
+"""
+Helpers for reading the end of append-only log files without loading the
+whole file into memory.
+
+``tail_lines`` seeks backwards from EOF in fixed-size blocks, so its cost is
+proportional to the number of lines returned rather than the size of the
+log.  ``IncrementalLogReader`` remembers the byte offset it stopped at and
+only reads lines appended since the previous call, resetting when the file
+is truncated or rotated.  ``follow_lines`` builds on it to provide a simple
+polling generator suitable for server-sent events.
+"""
+
+import json
+import os
+import time
+from collections import deque
+
+DEFAULT_BLOCK_SIZE = 8192
+
+
+def tail_lines(path, count: int = 50, block_size: int = DEFAULT_BLOCK_SIZE,
+               encoding: str = "utf-8") -> list:
+    """Return the last ``count`` lines of ``path`` without trailing newlines."""
+    if count <= 0 or not os.path.exists(path):
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        chunks = []
+        newlines = 0
+        # One extra newline is needed to be sure the first returned line is whole
+        while pos > 0 and newlines <= count:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            chunk = f.read(read_size)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    data = b"".join(reversed(chunks))
+    lines = data.decode(encoding, errors="replace").splitlines()
+    return lines[-count:]
+
+
+class IncrementalLogReader:
+    """Read only the lines appended to a log file since the last call."""
+
+    def __init__(self, path, encoding: str = "utf-8"):
+        self.path = str(path)
+        self.encoding = encoding
+        self.offset = 0
+        self.resets = 0
+        self._inode = None
+
+    def seek_to_end(self):
+        """Skip existing content so the next read only returns new lines."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return
+        self.offset = st.st_size
+        self._inode = st.st_ino
+
+    def read_new_lines(self) -> list:
+        """Return complete lines written since the previous read."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            if self.offset:
+                self.resets += 1
+            self.offset = 0
+            self._inode = None
+            return []
+
+        # File truncated or replaced (log rotation) → start over
+        if st.st_size < self.offset or (self._inode is not None and st.st_ino != self._inode):
+            self.offset = 0
+            self.resets += 1
+        self._inode = st.st_ino
+
+        if st.st_size == self.offset:
+            return []
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(st.st_size - self.offset)
+
+        # Keep any partial trailing line for the next read
+        end = data.rfind(b"\n")
+        if end == -1:
+            return []
+        self.offset += end + 1
+        return data[: end + 1].decode(self.encoding, errors="replace").splitlines()
+
+
+class JsonLogDigest:
+    """Incrementally maintained summary of a JSON-lines log.
+
+    Keeps running counts per ``key`` and a bounded window of the most recent
+    records so reports never have to re-parse the full file.
+    """
+
+    def __init__(self, path, key: str = "operation_type", recent: int = 200):
+        self.reader = IncrementalLogReader(path)
+        self.key = key
+        self.counts = {}
+        self.recent = deque(maxlen=recent)
+
+    def refresh(self):
+        """Fold newly appended records into the digest and return ``self``."""
+        resets_before = self.reader.resets
+        lines = self.reader.read_new_lines()
+        if self.reader.resets != resets_before:
+            self.counts.clear()
+            self.recent.clear()
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            name = record.get(self.key, "Unknown")
+            self.counts[name] = self.counts.get(name, 0) + 1
+            self.recent.append(record)
+        return self
+
+
+def follow_lines(path, poll_interval: float = 1.0, from_start: bool = False,
+                 max_idle: float = None):
+    """Yield new lines appended to ``path`` as they arrive.
+
+    Yields ``None`` on every idle poll so callers (e.g. SSE handlers) can emit
+    keep-alives. Stops after ``max_idle`` seconds without new data if given.
+    """
+    reader = IncrementalLogReader(path)
+    if not from_start:
+        reader.seek_to_end()
+    idle = 0.0
+    while True:
+        lines = reader.read_new_lines()
+        if lines:
+            idle = 0.0
+            for line in lines:
+                yield line
+            continue
+        yield None
+        if max_idle is not None and idle >= max_idle:
+            return
+        time.sleep(poll_interval)
+        idle += poll_interval
@@ -161,6 +161,9 @@ class RichLogger:
             return
         elapsed = time.time() - self.timers.pop(label)
         self.success(f"Timer '{label}' completed in {elapsed:.2f}s", source)
+        from core.cycle_metrics import record_timer
+        record_timer(label, elapsed)
+        return elapsed
 
     # Suppression controls -------------------------------------------
     @classmethod
@@ -0,0 +1,174 @@
+"""
+Author: BubbaDiego
+Module: startup_profiler.py
+Description:
+    Cold-start profiler for ``sonic_app``, ``sonic_monitor`` and
+    ``launch_pad``.  Records wall time for named startup phases (imports,
+    backend init, blueprint registration, ...) and, when enabled, a per-module
+    import-time breakdown collected by a ``sys.meta_path`` hook.  The result
+    is written as a JSON report under ``reports/``.
+
+    Import timing is opt-in (``SONIC_PROFILE_IMPORTS=1``) because wrapping
+    every loader adds a little overhead of its own.  This module only uses the
+    standard library so it can be imported before anything else.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPORT_DIR = Path(__file__).resolve().parent.parent / "reports"
+
+
+class _TimedLoader:
+    """Loader proxy that times ``exec_module`` for one module."""
+
+    def __init__(self, loader, name: str, timer: "ImportTimer"):
+        self._loader = loader
+        self._name = name
+        self._timer = timer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        timer = self._timer
+        timer._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            total = time.perf_counter() - start
+            children = timer._stack.pop()
+            timer.records[self._name] = {
+                "cumulative_ms": round(total * 1000, 3),
+                "self_ms": round((total - children) * 1000, 3),
+            }
+            if timer._stack:
+                timer._stack[-1] += total
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+
+class ImportTimer:
+    """``sys.meta_path`` finder recording self and cumulative import time."""
+
+    def __init__(self):
+        self.records: Dict[str, Dict[str, float]] = {}
+        self._stack: List[float] = []
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find = getattr(finder, "find_spec", None)
+            if find is None:
+                continue
+            spec = find(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname, self)
+        return spec
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def top(self, count: int = 25, key: str = "cumulative_ms") -> List[Dict]:
+        rows = [{"module": name, **vals} for name, vals in self.records.items()]
+        rows.sort(key=lambda r: r[key], reverse=True)
+        return rows[:count]
+
+
+class StartupProfiler:
+    """Collect phase timings for one process start and write a report.
+
+    Usage::
+
+        profiler = StartupProfiler("sonic_app")
+        with profiler.phase("imports", kind="import"):
+            import heavy_stuff
+        with profiler.phase("backend"):
+            build_backend()
+        profiler.write_report()
+    """
+
+    def __init__(self, name: str, profile_imports: Optional[bool] = None):
+        self.name = name
+        self.started = time.perf_counter()
+        self.phases: List[Dict] = []
+        self._open = None
+        if profile_imports is None:
+            profile_imports = os.getenv("SONIC_PROFILE_IMPORTS", "").lower() in ("1", "true", "yes")
+        self.import_timer = ImportTimer() if profile_imports else None
+        if self.import_timer:
+            self.import_timer.install()
+
+    def begin(self, label: str, kind: str = "init"):
+        """Start timing a phase that spans module-level code."""
+        self._open = (label, kind, time.perf_counter(), len(sys.modules))
+
+    def end(self):
+        """Close the phase opened with :meth:`begin`."""
+        label, kind, start, modules_before = self._open
+        self._open = None
+        self.phases.append({
+            "phase": label,
+            "kind": kind,
+            "ms": round((time.perf_counter() - start) * 1000, 3),
+            "modules_loaded": len(sys.modules) - modules_before,
+        })
+
+    @contextmanager
+    def phase(self, label: str, kind: str = "init"):
+        """Time the enclosed block; ``kind`` is ``"import"`` or ``"init"``."""
+        self.begin(label, kind)
+        try:
+            yield
+        finally:
+            self.end()
+
+    def summary(self) -> Dict:
+        totals = {"import": 0.0, "init": 0.0}
+        for p in self.phases:
+            totals[p["kind"]] = totals.get(p["kind"], 0.0) + p["ms"]
+        report = {
+            "process": self.name,
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "import_ms": round(totals.get("import", 0.0), 3),
+            "init_ms": round(totals.get("init", 0.0), 3),
+            "phases": self.phases,
+            "modules_loaded": len(sys.modules),
+        }
+        if self.import_timer:
+            report["slowest_imports"] = self.import_timer.top()
+        return report
+
+    def write_report(self, directory: Optional[Path] = None) -> Optional[Path]:
+        """Write ``startup_profile_<name>.json`` and return its path."""
+        if self.import_timer:
+            self.import_timer.uninstall()
+        report = self.summary()
+        target_dir = Path(directory) if directory else REPORT_DIR
+        path = target_dir / f"startup_profile_{self.name}.json"
+        try:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except OSError:
+            return None
+        return path
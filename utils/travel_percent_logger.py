@@ -1,31 +1,180 @@
+# utils/travel_percent_logger.py
+"""
+Travel-percent drift telemetry.
+
+Enrichment compares the travel percent we calculate from prices against the
+``travel_percent`` Jupiter reported on the position.  Each comparison is a
+sample; ``TravelDriftRecorder`` buffers samples in memory and appends them in
+batches to one CSV file per day (``travel_drift_YYYY-MM-DD.csv``, one column
+per field), so the enrichment loop never touches the filesystem per alert.
+
+A batch is written once ``batch_size`` samples are buffered, when
+``flush_interval`` seconds have passed since the last write, or at exit.
+``drift_stats`` summarises the samples per position from the daily files
+plus whatever is still buffered.
+"""
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import atexit
+import csv
+import glob
+import threading
+import time
 from datetime import datetime
 from core.logging import log
+from core.constants import LOG_DIR as BASE_LOG_DIR
 
+# === Config ===
+LOG_DIR = str(BASE_LOG_DIR / "travel_percent")
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 30.0
 
+FIELDS = ("timestamp", "position_id", "alert_id", "asset", "jupiter", "calculated", "drift", "percent_diff")
 
 
-# === Config ===
-LOG_DIR = "logs/travel_percent"
-os.makedirs(LOG_DIR, exist_ok=True)
+def _day(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
 
-def _get_txt_path():
-    today = datetime.now().strftime("%Y-%m-%d")
-    return os.path.join(LOG_DIR, f"travel_drift_{today}.txt")
 
-def log_travel_percent_comparison(alert_id, jupiter_value, calculated_value, format="txt"):
-    try:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        variance = abs(jupiter_value - calculated_value)
-        percent_diff = (variance / max(abs(jupiter_value), 0.0001)) * 100
+class TravelDriftRecorder:
+    def __init__(self, log_dir: str = LOG_DIR, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.log_dir = log_dir
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self.flushes = 0
+
+    def path_for(self, day: str) -> str:
+        return os.path.join(self.log_dir, f"travel_drift_{day}.csv")
+
+    def record(self, position_id, jupiter_value, calculated_value, alert_id=None, asset=None, ts=None):
+        """Buffer one comparison; returns the sample or ``None`` if unusable."""
+        if jupiter_value is None or calculated_value is None:
+            return None
+        try:
+            jupiter = float(jupiter_value)
+            calculated = float(calculated_value)
+        except (TypeError, ValueError):
+            return None
+        drift = calculated - jupiter
+        sample = {
+            "timestamp": round(ts if ts is not None else time.time(), 3),
+            "position_id": position_id,
+            "alert_id": alert_id,
+            "asset": asset,
+            "jupiter": round(jupiter, 4),
+            "calculated": round(calculated, 4),
+            "drift": round(drift, 4),
+            "percent_diff": round(abs(drift) / max(abs(jupiter), 0.0001) * 100, 4),
+        }
+        with self._lock:
+            self._buffer.append(sample)
+            due = (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+        return sample
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._buffer)
 
-        log_line = f"[{timestamp}] Alert: {alert_id} | Jupiter: {jupiter_value:.2f} | Calc: {calculated_value:.2f} | Diff: {percent_diff:.2f}%\n"
+    def flush(self) -> int:
+        """Append buffered samples to their daily files; returns rows written."""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+        if not batch:
+            return 0
+        by_day = {}
+        for sample in batch:
+            by_day.setdefault(_day(sample["timestamp"]), []).append(sample)
+        try:
+            with self._write_lock:
+                os.makedirs(self.log_dir, exist_ok=True)
+                for day, rows in by_day.items():
+                    path = self.path_for(day)
+                    new_file = not os.path.exists(path)
+                    with open(path, "a", newline="") as f:
+                        writer = csv.DictWriter(f, fieldnames=FIELDS)
+                        if new_file:
+                            writer.writeheader()
+                        writer.writerows(rows)
+            self.flushes += 1
+        except Exception as e:
+            log.error(f"💥 TravelPercent drift flush error: {e}", source="TravelLogger")
+            with self._lock:
+                self._buffer[:0] = batch
+            return 0
+        log.debug(
+            "Travel drift samples flushed",
+            source="TravelLogger",
+            payload={"rows": len(batch), "days": sorted(by_day)},
+        )
+        return len(batch)
 
-        with open(_get_txt_path(), "a") as f:
-            f.write(log_line)
+    def samples(self, days: int = 1, position_id=None) -> list:
+        """Samples from the last ``days`` daily files plus the buffer."""
+        files = sorted(glob.glob(os.path.join(self.log_dir, "travel_drift_*.csv")))[-max(1, days):]
+        cutoff_day = os.path.basename(files[0])[13:23] if files else _day(time.time())
+        rows = []
+        for path in files:
+            with open(path, newline="") as f:
+                for row in csv.DictReader(f):
+                    if position_id is not None and row["position_id"] != str(position_id):
+                        continue
+                    for key in ("timestamp", "jupiter", "calculated", "drift", "percent_diff"):
+                        row[key] = float(row[key])
+                    rows.append(row)
+        with self._lock:
+            buffered = [
+                dict(s) for s in self._buffer
+                if (position_id is None or str(s["position_id"]) == str(position_id))
+                and _day(s["timestamp"]) >= cutoff_day
+            ]
+        return rows + buffered
 
+    def drift_stats(self, position_id=None, days: int = 1) -> dict:
+        """Per-position drift summary: count, mean/max absolute drift and last sample."""
+        stats = {}
+        for s in self.samples(days, position_id):
+            key = str(s["position_id"])
+            entry = stats.setdefault(key, {"count": 0, "sum_drift": 0.0, "sum_abs": 0.0,
+                                           "max_abs_drift": 0.0, "max_percent_diff": 0.0, "last": None})
+            drift = s["drift"]
+            entry["count"] += 1
+            entry["sum_drift"] += drift
+            entry["sum_abs"] += abs(drift)
+            entry["max_abs_drift"] = max(entry["max_abs_drift"], abs(drift))
+            entry["max_percent_diff"] = max(entry["max_percent_diff"], s["percent_diff"])
+            if entry["last"] is None or s["timestamp"] >= entry["last"]["timestamp"]:
+                entry["last"] = {k: s[k] for k in ("timestamp", "jupiter", "calculated", "drift")}
+        for entry in stats.values():
+            count = entry["count"]
+            entry["mean_drift"] = round(entry.pop("sum_drift") / count, 4)
+            entry["mean_abs_drift"] = round(entry.pop("sum_abs") / count, 4)
+        return stats
+
+
+_recorder = TravelDriftRecorder()
+atexit.register(_recorder.flush)
+
+
+def get_drift_recorder() -> TravelDriftRecorder:
+    return _recorder
+
+
+def log_travel_percent_comparison(alert_id, jupiter_value, calculated_value, format="csv", position_id=None, asset=None):
+    """Buffer a Jupiter vs calculated comparison (kept for existing callers)."""
+    try:
+        return _recorder.record(position_id or alert_id, jupiter_value, calculated_value,
+                                alert_id=alert_id, asset=asset)
     except Exception as e:
-        from core.logging import log
         log.error(f"💥 TravelPercent log error: {e}", source="TravelLogger")
@@ -2,9 +2,9 @@
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-import smtplib, ssl
 from email.mime.text import MIMEText
 from core.logging import log
+from xcom.smtp_transport import get_transport
 
 class EmailService:
     def __init__(self, config: dict):
@@ -26,11 +26,8 @@ class EmailService:
         try:
             msg = MIMEText(body, "plain")
             msg["Subject"], msg["From"], msg["To"] = subject, username, to
-            ctx = ssl.create_default_context()
-            with smtplib.SMTP(server, port) as smtp:
-                smtp.starttls(context=ctx)
-                smtp.login(username, password)
-                smtp.send_message(msg)
+            # Pooled, kept-alive session; concurrent sends share one batch
+            get_transport(smtp_cfg).send_message(msg)
             log.success("Email sent", source="EmailService", payload={"to": to})
             return True
         except Exception as e:
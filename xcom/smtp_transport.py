@@ -0,0 +1,266 @@
+# xcom/smtp_transport.py
+"""
+Pooled SMTP transport shared by EmailService and SMSService.
+
+One ``SMTPTransport`` exists per (server, port, username).  It keeps up to
+``pool_size`` authenticated sessions open between sends and checks them out
+per batch; a session idle for longer than ``idle_timeout`` is probed with
+``NOOP`` and reconnected when the server has dropped it.
+
+Sends are batched: the first caller to enqueue a message becomes the batch
+leader, waits ``batch_window`` seconds, then delivers everything queued so
+far over one session while the other callers wait for their result.  A
+burst of HIGH alerts therefore pays one TLS handshake and login instead of
+one per SMS.
+
+Delivery latency (enqueue → accepted by the server) is kept per transport
+in ``stats()`` and reported to the active Cyclone step via
+``record_timer("smtp_delivery", ...)``.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import smtplib
+import ssl
+import threading
+import time
+from collections import deque
+from core.logging import log
+
+DEFAULT_IDLE_TIMEOUT = 60.0
+DEFAULT_BATCH_WINDOW = 0.05
+DEFAULT_POOL_SIZE = 2
+LATENCY_HISTORY = 200
+
+
+class _Pending:
+    __slots__ = ("msg", "queued_at", "done", "ok", "error")
+
+    def __init__(self, msg):
+        self.msg = msg
+        self.queued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.ok = False
+        self.error = None
+
+
+class SMTPTransport:
+    def __init__(self, server: str, port: int, username: str = None, password: str = None,
+                 starttls: bool = True, timeout: float = 10.0,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 batch_window: float = DEFAULT_BATCH_WINDOW,
+                 pool_size: int = DEFAULT_POOL_SIZE):
+        self.server = server
+        self.port = int(port)
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.batch_window = batch_window
+        self.pool_size = max(1, int(pool_size))
+
+        self._idle = []  # [(smtp, last_used)]
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._pool_lock = threading.Lock()
+        self._queue = []
+        self._queue_lock = threading.Lock()
+        self._leader_active = False
+        self._latencies = deque(maxlen=LATENCY_HISTORY)
+        self._counters = {"sent": 0, "failed": 0, "batches": 0, "connects": 0, "reused": 0, "reconnects": 0}
+
+    # --- sessions --------------------------------------------------------
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self.server, self.port, timeout=self.timeout)
+        smtp.ehlo()
+        if self.starttls:
+            smtp.starttls(context=ssl.create_default_context())
+            smtp.ehlo()
+        if self.username and self.password and smtp.has_extn("auth"):
+            smtp.login(self.username, self.password)
+        self._counters["connects"] += 1
+        return smtp
+
+    @staticmethod
+    def _close(smtp):
+        try:
+            smtp.quit()
+        except Exception:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+    def _checkout(self) -> smtplib.SMTP:
+        self._slots.acquire()
+        try:
+            with self._pool_lock:
+                session = self._idle.pop() if self._idle else None
+            if session is not None:
+                smtp, last_used = session
+                if time.monotonic() - last_used < self.idle_timeout:
+                    self._counters["reused"] += 1
+                    return smtp
+                # Idle past the server's likely timeout: keep it only if it still answers
+                try:
+                    if smtp.noop()[0] == 250:
+                        self._counters["reused"] += 1
+                        return smtp
+                except Exception:
+                    pass
+                self._close(smtp)
+                self._counters["reconnects"] += 1
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _checkin(self, smtp, healthy: bool = True):
+        try:
+            if healthy:
+                with self._pool_lock:
+                    self._idle.append((smtp, time.monotonic()))
+            else:
+                self._close(smtp)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close all idle sessions."""
+        with self._pool_lock:
+            idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            self._close(smtp)
+
+    # --- sending ---------------------------------------------------------
+    def send_message(self, msg) -> bool:
+        """Queue ``msg`` for the current batch and wait for its delivery."""
+        pending = _Pending(msg)
+        with self._queue_lock:
+            self._queue.append(pending)
+            lead = not self._leader_active
+            if lead:
+                self._leader_active = True
+        if lead:
+            if self.batch_window:
+                time.sleep(self.batch_window)
+            with self._queue_lock:
+                batch, self._queue = self._queue, []
+                self._leader_active = False
+            self._deliver(batch)
+        pending.done.wait()
+        if pending.error:
+            raise pending.error
+        return pending.ok
+
+    def send_many(self, messages) -> list:
+        """Deliver ``messages`` as one batch; returns per-message success."""
+        batch = [_Pending(m) for m in messages]
+        if batch:
+            self._deliver(batch)
+        return [p.ok for p in batch]
+
+    def _deliver(self, batch: list):
+        started = time.perf_counter()
+        smtp = None
+        try:
+            for attempt in range(2):
+                try:
+                    smtp = self._checkout()
+                    for pending in batch:
+                        if pending.ok or pending.error:
+                            continue
+                        try:
+                            smtp.send_message(pending.msg)
+                        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused,
+                                smtplib.SMTPDataError) as e:
+                            pending.error = e  # this message only; the session is still usable
+                            continue
+                        pending.ok = True
+                        self._latencies.append(time.perf_counter() - pending.queued_at)
+                    break
+                except (smtplib.SMTPServerDisconnected, ConnectionError, OSError) as e:
+                    # Session dropped mid-batch: reconnect once and resend the rest
+                    if smtp is not None:
+                        self._checkin(smtp, healthy=False)
+                        smtp = None
+                    if attempt:
+                        raise
+                    self._counters["reconnects"] += 1
+                    log.debug(f"SMTP session dropped, reconnecting: {e}", source="SMTPTransport")
+        except Exception as e:
+            for pending in batch:
+                if not pending.ok and pending.error is None:
+                    pending.error = e
+            if smtp is not None:
+                self._checkin(smtp, healthy=False)
+                smtp = None
+        finally:
+            if smtp is not None:
+                self._checkin(smtp, healthy=True)
+            sent = sum(1 for p in batch if p.ok)
+            self._counters["sent"] += sent
+            self._counters["failed"] += len(batch) - sent
+            self._counters["batches"] += 1
+            elapsed = time.perf_counter() - started
+            try:
+                from core.cycle_metrics import record_timer
+                record_timer("smtp_delivery", elapsed)
+            except Exception:
+                pass
+            log.debug(
+                "SMTP batch delivered",
+                source="SMTPTransport",
+                payload={"messages": len(batch), "sent": sent, "ms": round(elapsed * 1000, 2)},
+            )
+            for pending in batch:
+                pending.done.set()
+
+    # --- metrics ---------------------------------------------------------
+    def stats(self) -> dict:
+        latencies = sorted(self._latencies)
+
+        def pct(p):
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000, 2)
+
+        return {
+            **self._counters,
+            "idle_sessions": len(self._idle),
+            "latency_ms": {"p50": pct(0.5), "p95": pct(0.95), "max": pct(1.0)},
+        }
+
+
+_transports = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(smtp_cfg: dict) -> SMTPTransport:
+    """Shared transport for an ``smtp`` provider config block."""
+    key = (smtp_cfg.get("server"), int(smtp_cfg.get("port")), smtp_cfg.get("username"))
+    with _transports_lock:
+        transport = _transports.get(key)
+        if transport is None or transport.password != smtp_cfg.get("password"):
+            if transport is not None:
+                transport.close()
+            transport = SMTPTransport(
+                smtp_cfg.get("server"),
+                smtp_cfg.get("port"),
+                smtp_cfg.get("username"),
+                smtp_cfg.get("password"),
+                starttls=smtp_cfg.get("starttls", True),
+                idle_timeout=float(smtp_cfg.get("idle_timeout", DEFAULT_IDLE_TIMEOUT)),
+                batch_window=float(smtp_cfg.get("batch_window", DEFAULT_BATCH_WINDOW)),
+                pool_size=int(smtp_cfg.get("pool_size", DEFAULT_POOL_SIZE)),
+            )
+            _transports[key] = transport
+        return transport
+
+
+def close_transports():
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()